@@ -9,6 +9,7 @@ import asyncio
 import logging
 import uuid
 import time
+from collections.abc import Callable
 from typing import Any
 
 from langchain.chat_models import init_chat_model
@@ -29,6 +30,14 @@ from .schema import (
     ClarificationQuestion,
 )
 from .registry import AgentRegistry
+from .scheduler import (
+    CriticalStepError,
+    ScheduleResult,
+    StepOutcome,
+    StepScheduler,
+    compute_parallel_groups,
+    resolve_dependencies,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -103,6 +112,9 @@ Determine the task type:
 - RESEARCH_AND_WRITE: Research first, then generate report
 
 Create a plan with ordered steps. Each step should specify which agent to use.
+Steps without a dependency between them run in parallel, so when the goal covers
+several distinct topics, use one research step per topic and make the writer
+step depend on all of them.
 
 Respond with a JSON object:
 {{
@@ -367,14 +379,22 @@ class Coordinator:
         plan: TaskPlan,
         user_goal: str,
         options: TaskOptions | None = None,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
     ) -> TaskResult:
         """
-        Execute the plan, handling parallel/sequential agents.
+        Execute the plan as a dependency graph.
+
+        Steps start as soon as their dependencies finish; independent steps
+        (e.g. research on separate sub-topics) run concurrently up to
+        ``options.max_parallel_steps``. Cancelling the caller cancels every
+        in-flight step.
 
         Args:
             plan: Execution plan
             user_goal: Original user goal
             options: Task options
+            progress_callback: Optional sync callback receiving a dict per
+                step start/finish (step, agent, status, message)
 
         Returns:
             TaskResult with all outputs
@@ -383,7 +403,7 @@ class Coordinator:
         start_time = time.time()
 
         execution_logs: list[ExecutionLog] = []
-        step_results: dict[str, Any] = {}
+        schedule: ScheduleResult | None = None
 
         # Track outputs
         findings = None
@@ -392,97 +412,107 @@ class Coordinator:
         error_message = None
         status = TaskStatus.EXECUTING
 
-        try:
-            for step in plan.steps:
-                step_start = time.time()
+        max_parallel = options.max_parallel_steps or getattr(
+            settings, "COORDINATOR_MAX_PARALLEL_STEPS", 3
+        )
 
-                logger.info(f"Executing step: {step.step_id} ({step.agent_name})")
+        # Research is critical when a report has to be written from it
+        critical_steps = set()
+        if plan.task_type == TaskType.RESEARCH_AND_WRITE:
+            critical_steps = {
+                step.step_id for step in plan.steps if step.agent_name == "research"
+            }
+
+        dependencies: dict[str, list[str]] = {}
+
+        async def run_step(step: TaskStep, completed: dict[str, Any]) -> Any:
+            upstream = {
+                dep: completed[dep]
+                for dep in dependencies.get(step.step_id, [])
+                if dep in completed
+            }
+            return await self._execute_step(
+                step, upstream, user_goal, options, progress_callback
+            )
 
-                try:
-                    if step.agent_name == "research":
-                        # Execute research
-                        from ..deep_researcher import run_research
+        def on_step_started(step: TaskStep):
+            progress_callback(
+                {
+                    "step": step.step_id,
+                    "agent": step.agent_name,
+                    "status": "running",
+                    "message": step.action,
+                }
+            )
 
-                        topic = step.inputs.get("topic", user_goal)
-                        result = await run_research(
-                            topic=topic,
-                            max_iterations=options.max_research_iterations,
-                            timeout=options.timeout,
-                        )
+        def on_step_finished(outcome: StepOutcome):
+            log = self._build_execution_log(outcome)
+            progress_callback(
+                {
+                    "step": log.step_id,
+                    "agent": log.agent_name,
+                    "status": log.status,
+                    "message": log.message or log.error,
+                    "duration_ms": log.duration_ms,
+                }
+            )
 
-                        findings = result.findings
-                        sources = [s.model_dump() for s in result.sources]
-                        step_results["research"] = result
-
-                    elif step.agent_name == "writer":
-                        # Execute writer
-                        from ..report_writer import run_writer
-
-                        # Get research results if available
-                        research_result = step_results.get("research")
-
-                        if research_result:
-                            result = await run_writer(
-                                research_brief=research_result.research_brief
-                                or user_goal,
-                                findings=research_result.findings,
-                                sources=[
-                                    s.model_dump() for s in research_result.sources
-                                ],
-                                style=options.style,
-                            )
-                        else:
-                            # Write from user-provided content
-                            result = await run_writer(
-                                research_brief=user_goal,
-                                findings=step.inputs.get("findings", ""),
-                                sources=step.inputs.get("sources", []),
-                                style=options.style,
-                            )
-
-                        final_report = result.final_report
-                        step_results["writer"] = result
-
-                    step_duration = (time.time() - step_start) * 1000
-                    execution_logs.append(
-                        ExecutionLog(
-                            step_id=step.step_id,
-                            agent_name=step.agent_name,
-                            status="completed",
-                            duration_ms=step_duration,
-                            message=f"Step completed successfully",
-                        )
-                    )
+        scheduler = StepScheduler(
+            run_step,
+            max_concurrency=max_parallel,
+            critical_steps=critical_steps,
+            on_step_started=on_step_started if progress_callback else None,
+            on_step_finished=on_step_finished if progress_callback else None,
+        )
 
-                except Exception as e:
-                    step_duration = (time.time() - step_start) * 1000
-                    error_msg = str(e)
-                    logger.error(f"Step {step.step_id} failed: {error_msg}")
-
-                    execution_logs.append(
-                        ExecutionLog(
-                            step_id=step.step_id,
-                            agent_name=step.agent_name,
-                            status="failed",
-                            duration_ms=step_duration,
-                            error=error_msg,
-                        )
-                    )
+        try:
+            dependencies = resolve_dependencies(plan.steps)
+            if not plan.parallel_groups:
+                plan.parallel_groups = compute_parallel_groups(
+                    plan.steps, dependencies
+                )
 
-                    # Continue to next step or fail based on step criticality
-                    if (
-                        step.agent_name == "research"
-                        and plan.task_type == TaskType.RESEARCH_AND_WRITE
-                    ):
-                        raise  # Can't continue without research
+            try:
+                schedule = await scheduler.run(plan.steps, dependencies)
+            except CriticalStepError as e:
+                logger.error(f"Step {e.step_id} failed, aborting plan: {e}")
+                schedule = e.schedule
+                raise
 
             status = TaskStatus.COMPLETED
 
+        except asyncio.CancelledError:
+            logger.warning(f"Plan {plan.task_id} cancelled")
+            raise
+
         except Exception as e:
             status = TaskStatus.FAILED
             error_message = str(e)
             logger.error(f"Plan execution failed: {error_message}")
 
+        if schedule is None:
+            schedule = ScheduleResult()
+
+        research_results = []
+        for step in plan.steps:
+            outcome = schedule.outcomes.get(step.step_id)
+            if outcome is None:
+                continue
+
+            execution_logs.append(self._build_execution_log(outcome))
+
+            if outcome.status != "completed":
+                continue
+            if step.agent_name == "research":
+                research_results.append(outcome.result)
+            elif step.agent_name == "writer":
+                final_report = outcome.result.final_report
+
+        if research_results:
+            merged = self._merge_research_results(research_results, user_goal)
+            findings = merged["findings"]
+            sources = merged["sources"]
+
         total_duration = (time.time() - start_time) * 1000
 
         return TaskResult(
@@ -494,9 +524,130 @@ class Coordinator:
             sources=sources,
             final_report=final_report,
             total_duration_ms=total_duration,
+            critical_path=schedule.critical_path,
+            critical_path_ms=schedule.critical_path_ms or None,
             error_message=error_message,
         )
 
+    async def _execute_step(
+        self,
+        step: TaskStep,
+        upstream: dict[str, Any],
+        user_goal: str,
+        options: TaskOptions,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> Any:
+        """Run a single plan step against the results of its dependencies."""
+        if step.agent_name == "research":
+            from ..deep_researcher import run_research
+
+            topic = step.inputs.get("topic", user_goal)
+            return await run_research(
+                topic=topic,
+                max_iterations=options.max_research_iterations,
+                timeout=options.timeout,
+            )
+
+        if step.agent_name == "writer":
+            from ..report_writer import run_writer
+
+            on_writer_progress = None
+            if progress_callback:
+
+                def on_writer_progress(event: dict[str, Any]):
+                    if event.get("phase") == "section":
+                        message = (
+                            f"Section {event['completed']}/{event['total']} "
+                            f"written: {event['section']}"
+                        )
+                    else:
+                        message = f"Outline ready: {event.get('total')} sections"
+                    progress_callback(
+                        {
+                            "step": step.step_id,
+                            "agent": step.agent_name,
+                            "status": "running",
+                            "message": message,
+                            "writer": event,
+                        }
+                    )
+
+            # Get research results from the steps this one depends on
+            research_results = [
+                result for result in upstream.values() if hasattr(result, "findings")
+            ]
+
+            if research_results:
+                merged = self._merge_research_results(research_results, user_goal)
+                return await run_writer(
+                    research_brief=merged["research_brief"],
+                    findings=merged["findings"],
+                    sources=merged["sources"],
+                    style=options.style,
+                    outline_first=options.outline_first,
+                    progress_callback=on_writer_progress,
+                )
+
+            # Write from user-provided content
+            return await run_writer(
+                research_brief=user_goal,
+                findings=step.inputs.get("findings", ""),
+                sources=step.inputs.get("sources", []),
+                style=options.style,
+                outline_first=options.outline_first,
+                progress_callback=on_writer_progress,
+            )
+
+        raise ValueError(f"Unknown agent: {step.agent_name}")
+
+    @staticmethod
+    def _merge_research_results(results: list[Any], user_goal: str) -> dict[str, Any]:
+        """Combine findings and de-duplicated sources from several research steps."""
+        if len(results) == 1:
+            result = results[0]
+            return {
+                "research_brief": result.research_brief or user_goal,
+                "findings": result.findings,
+                "sources": [s.model_dump() for s in result.sources],
+            }
+
+        sources = []
+        seen_urls = set()
+        for result in results:
+            for source in result.sources:
+                if source.url in seen_urls:
+                    continue
+                seen_urls.add(source.url)
+                sources.append(source.model_dump())
+
+        return {
+            "research_brief": user_goal,
+            "findings": "\n\n".join(r.findings for r in results if r.findings),
+            "sources": sources,
+        }
+
+    @staticmethod
+    def _build_execution_log(outcome: StepOutcome) -> ExecutionLog:
+        """Convert a scheduler outcome into an ExecutionLog entry."""
+        timing = outcome.timing
+        messages = {
+            "completed": "Step completed successfully",
+            "cancelled": "Step cancelled",
+            "skipped": "Step skipped because the plan was aborted",
+        }
+
+        return ExecutionLog(
+            step_id=outcome.step.step_id,
+            agent_name=outcome.step.agent_name,
+            status=outcome.status,
+            duration_ms=timing.duration_ms if timing else None,
+            started_at_ms=timing.started_at_ms if timing else None,
+            finished_at_ms=timing.finished_at_ms if timing else None,
+            critical_path_ms=timing.critical_path_ms if timing else None,
+            message=messages.get(outcome.status),
+            error=str(outcome.error) if outcome.error else None,
+        )
+
     def reset(self):
         """Reset coordinator state for new task."""
         self.conversation_history = []
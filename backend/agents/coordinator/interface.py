@@ -7,7 +7,7 @@ handling the complete flow from clarification to final output.
 
 import asyncio
 import logging
-from typing import Callable, Awaitable
+from typing import Any, Callable, Awaitable
 
 from .schema import TaskResult, TaskOptions, TaskStatus, ClarificationResult
 from .coordinator import Coordinator
@@ -21,6 +21,7 @@ async def execute_task(
     options: TaskOptions | None = None,
     clarification_callback: Callable[[ClarificationResult], Awaitable[str]]
     | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> TaskResult:
     """
     Main entry point for task execution.
@@ -38,6 +39,9 @@ async def execute_task(
         clarification_callback: Optional async callback for handling clarification.
                                Called with ClarificationResult, should return user response.
                                If None, clarification is skipped.
+        progress_callback: Optional sync callback called with a progress dict
+                           (step, agent, status, message) as planning and each
+                           plan step start and finish.
 
     Returns:
         TaskResult containing:
@@ -109,12 +113,26 @@ async def execute_task(
 
         # Phase 2: Planning
         logger.info("Creating execution plan...")
+        if progress_callback:
+            progress_callback(
+                {"step": "planning", "status": "running", "message": "Planning..."}
+            )
         plan = await coordinator.create_plan(user_goal, requirements, options)
         logger.info(f"Plan created: {plan.task_type}, {len(plan.steps)} steps")
+        if progress_callback:
+            progress_callback(
+                {
+                    "step": "planning",
+                    "status": "completed",
+                    "message": f"Plan created with {len(plan.steps)} steps",
+                }
+            )
 
         # Phase 3: Execution
         logger.info("Executing plan...")
-        result = await coordinator.execute_plan(plan, user_goal, options)
+        result = await coordinator.execute_plan(
+            plan, user_goal, options, progress_callback=progress_callback
+        )
 
         logger.info(
             f"Task completed: status={result.status}, "
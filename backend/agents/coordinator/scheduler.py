@@ -0,0 +1,368 @@
+"""
+Dependency-Aware Step Scheduler
+
+This module executes the steps of a TaskPlan as a DAG: each step is
+started as soon as all of its dependencies have finished, independent
+steps run concurrently (bounded by a concurrency cap), and cancellation
+is propagated to every in-flight step.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .schema import TaskStep
+
+logger = logging.getLogger(__name__)
+
+
+StepRunner = Callable[[TaskStep, dict[str, Any]], Awaitable[Any]]
+
+
+class PlanValidationError(ValueError):
+    """Raised when a plan's dependency graph cannot be scheduled."""
+
+
+class CriticalStepError(RuntimeError):
+    """Raised when a step the rest of the plan cannot do without fails."""
+
+    def __init__(self, step_id: str, error: BaseException):
+        super().__init__(str(error))
+        self.step_id = step_id
+        self.error = error
+        # Partial schedule (with cancelled/skipped steps), set by the scheduler
+        self.schedule: ScheduleResult | None = None
+
+
+@dataclass
+class StepTiming:
+    """Timing information for a single scheduled step (ms since plan start)."""
+
+    step_id: str
+    started_at_ms: float
+    finished_at_ms: float
+    critical_path_ms: float
+    critical_parent: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.finished_at_ms - self.started_at_ms
+
+
+@dataclass
+class StepOutcome:
+    """Outcome of a single scheduled step."""
+
+    step: TaskStep
+    status: str
+    result: Any = None
+    error: BaseException | None = None
+    timing: StepTiming | None = None
+
+
+@dataclass
+class ScheduleResult:
+    """Aggregate result of running a plan through the scheduler."""
+
+    outcomes: dict[str, StepOutcome] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_ms: float = 0.0
+
+
+# ============================================================================
+# GRAPH HELPERS
+# ============================================================================
+
+
+def resolve_dependencies(steps: list[TaskStep]) -> dict[str, list[str]]:
+    """
+    Build the dependency map for a list of steps.
+
+    Dependencies on unknown step IDs are dropped with a warning (plans are
+    LLM-generated and occasionally reference steps that do not exist).
+    Writer steps that declare no dependencies implicitly depend on every
+    research step that precedes them, preserving the sequential semantics
+    plans were written against.
+
+    Raises:
+        PlanValidationError: On duplicate step IDs or dependency cycles.
+    """
+    step_ids = [step.step_id for step in steps]
+    if len(step_ids) != len(set(step_ids)):
+        raise PlanValidationError(f"Duplicate step IDs in plan: {step_ids}")
+
+    known = set(step_ids)
+    dependencies: dict[str, list[str]] = {}
+    preceding_research: list[str] = []
+
+    for step in steps:
+        deps = []
+        for dep in step.depends_on:
+            if dep not in known:
+                logger.warning(
+                    f"Step {step.step_id} depends on unknown step {dep}; ignoring"
+                )
+            elif dep == step.step_id:
+                raise PlanValidationError(f"Step {step.step_id} depends on itself")
+            elif dep not in deps:
+                deps.append(dep)
+
+        if not deps and step.agent_name == "writer":
+            deps = list(preceding_research)
+
+        dependencies[step.step_id] = deps
+
+        if step.agent_name == "research":
+            preceding_research.append(step.step_id)
+
+    # Kahn's algorithm doubles as cycle detection
+    compute_parallel_groups(steps, dependencies)
+
+    return dependencies
+
+
+def compute_parallel_groups(
+    steps: list[TaskStep], dependencies: dict[str, list[str]]
+) -> list[list[str]]:
+    """
+    Group step IDs into topological levels.
+
+    Every step in a group only depends on steps from earlier groups, so
+    the steps of one group can run in parallel.
+
+    Raises:
+        PlanValidationError: If the dependency graph contains a cycle.
+    """
+    remaining = {
+        step.step_id: set(dependencies.get(step.step_id, [])) for step in steps
+    }
+    order = [step.step_id for step in steps]
+    groups: list[list[str]] = []
+
+    while remaining:
+        level = [sid for sid in order if sid in remaining and not remaining[sid]]
+        if not level:
+            raise PlanValidationError(
+                f"Dependency cycle between steps: {sorted(remaining)}"
+            )
+        groups.append(level)
+        for sid in level:
+            del remaining[sid]
+        for deps in remaining.values():
+            deps.difference_update(level)
+
+    return groups
+
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+
+class StepScheduler:
+    """
+    Runs plan steps as a DAG with a concurrency cap.
+
+    Usage:
+        scheduler = StepScheduler(run_step, max_concurrency=3)
+        result = await scheduler.run(plan.steps)
+
+    ``run_step`` is awaited with the step and a dict of results from the
+    steps that have already completed. A step listed in ``critical_steps``
+    that fails cancels every other in-flight step and raises
+    CriticalStepError; failures of other steps are recorded and their
+    dependents still run.
+
+    ``on_step_started`` / ``on_step_finished`` are optional synchronous
+    hooks for progress reporting.
+    """
+
+    def __init__(
+        self,
+        run_step: StepRunner,
+        max_concurrency: int = 3,
+        critical_steps: set[str] | None = None,
+        on_step_started: Callable[[TaskStep], None] | None = None,
+        on_step_finished: Callable[["StepOutcome"], None] | None = None,
+    ):
+        self.run_step = run_step
+        self.max_concurrency = max(1, max_concurrency)
+        self.critical_steps = critical_steps or set()
+        self.on_step_started = on_step_started
+        self.on_step_finished = on_step_finished
+
+    async def run(
+        self,
+        steps: list[TaskStep],
+        dependencies: dict[str, list[str]] | None = None,
+    ) -> ScheduleResult:
+        """
+        Execute steps honouring their dependencies.
+
+        Raises:
+            PlanValidationError: If the dependency graph is invalid.
+            CriticalStepError: If a critical step fails.
+            asyncio.CancelledError: If the caller is cancelled; in-flight
+                steps are cancelled before this propagates.
+        """
+        if dependencies is None:
+            dependencies = resolve_dependencies(steps)
+
+        steps_by_id = {step.step_id: step for step in steps}
+        remaining = {sid: set(deps) for sid, deps in dependencies.items()}
+        pending = [step.step_id for step in steps]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        plan_start = time.monotonic()
+        schedule = ScheduleResult()
+        results: dict[str, Any] = {}
+        running: dict[asyncio.Task, str] = {}
+
+        async def run_one(step: TaskStep) -> tuple[Any, Exception | None, float, float]:
+            async with semaphore:
+                started = (time.monotonic() - plan_start) * 1000
+                logger.info(f"Executing step: {step.step_id} ({step.agent_name})")
+                self._notify(self.on_step_started, step)
+                try:
+                    result, error = await self.run_step(step, dict(results)), None
+                except Exception as e:
+                    result, error = None, e
+                finished = (time.monotonic() - plan_start) * 1000
+                return result, error, started, finished
+
+        try:
+            while pending or running:
+                ready = [sid for sid in pending if not remaining[sid]]
+                for sid in ready:
+                    pending.remove(sid)
+                    task = asyncio.create_task(run_one(steps_by_id[sid]))
+                    running[task] = sid
+
+                if not running:
+                    # Only reachable if validation was bypassed with a cyclic graph
+                    raise PlanValidationError(
+                        f"Unschedulable steps remain: {sorted(pending)}"
+                    )
+
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    sid = running.pop(task)
+                    outcome = self._record(
+                        steps_by_id[sid], task, dependencies, schedule
+                    )
+                    self._notify(self.on_step_finished, outcome)
+                    if outcome.status == "completed":
+                        results[sid] = outcome.result
+                    elif sid in self.critical_steps:
+                        raise CriticalStepError(sid, outcome.error)
+
+                    for deps in remaining.values():
+                        deps.discard(sid)
+
+        except BaseException as e:
+            await self._cancel_running(running, steps_by_id, schedule)
+            for sid in pending:
+                schedule.outcomes[sid] = StepOutcome(
+                    step=steps_by_id[sid], status="skipped"
+                )
+            if isinstance(e, CriticalStepError):
+                self._compute_critical_path(schedule)
+                e.schedule = schedule
+            raise
+
+        self._compute_critical_path(schedule)
+        return schedule
+
+    @staticmethod
+    def _notify(hook: Callable | None, arg: Any):
+        """Call a progress hook; a failing hook never breaks the plan."""
+        if hook is None:
+            return
+        try:
+            hook(arg)
+        except Exception as e:
+            logger.warning(f"Step progress hook failed: {e}")
+
+    def _record(
+        self,
+        step: TaskStep,
+        task: asyncio.Task,
+        dependencies: dict[str, list[str]],
+        schedule: ScheduleResult,
+    ) -> StepOutcome:
+        """Turn a finished task into a StepOutcome with critical-path timing."""
+        result, error, started, finished = task.result()
+        if error is None:
+            status = "completed"
+        else:
+            status = "failed"
+            logger.error(f"Step {step.step_id} failed: {error}")
+
+        parent = None
+        parent_path_ms = 0.0
+        for dep in dependencies.get(step.step_id, []):
+            dep_outcome = schedule.outcomes.get(dep)
+            dep_timing = dep_outcome.timing if dep_outcome else None
+            if dep_timing and dep_timing.critical_path_ms >= parent_path_ms:
+                parent, parent_path_ms = dep, dep_timing.critical_path_ms
+
+        outcome = StepOutcome(
+            step=step,
+            status=status,
+            result=result,
+            error=error,
+            timing=StepTiming(
+                step_id=step.step_id,
+                started_at_ms=started,
+                finished_at_ms=finished,
+                critical_path_ms=parent_path_ms + (finished - started),
+                critical_parent=parent,
+            ),
+        )
+        schedule.outcomes[step.step_id] = outcome
+        return outcome
+
+    async def _cancel_running(
+        self,
+        running: dict[asyncio.Task, str],
+        steps_by_id: dict[str, TaskStep],
+        schedule: ScheduleResult,
+    ):
+        """Cancel all in-flight steps and wait for them to unwind."""
+        if not running:
+            return
+
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        for task, sid in running.items():
+            if task.cancelled():
+                schedule.outcomes[sid] = StepOutcome(
+                    step=steps_by_id[sid], status="cancelled"
+                )
+        running.clear()
+
+    @staticmethod
+    def _compute_critical_path(schedule: ScheduleResult):
+        """Walk back from the step with the longest chain to find the critical path."""
+        timed = [o.timing for o in schedule.outcomes.values() if o.timing]
+        if not timed:
+            return
+
+        tail = max(timed, key=lambda t: t.critical_path_ms)
+        schedule.critical_path_ms = tail.critical_path_ms
+
+        path = []
+        current: StepTiming | None = tail
+        while current is not None:
+            path.append(current.step_id)
+            parent = current.critical_parent
+            current = schedule.outcomes[parent].timing if parent else None
+        schedule.critical_path = list(reversed(path))
@@ -87,6 +87,15 @@ class TaskOptions(BaseModel):
     skip_clarification: bool = Field(
         default=False, description="Skip clarification phase"
     )
+    max_parallel_steps: int | None = Field(
+        default=None,
+        description="Max plan steps running concurrently. If None, uses settings.",
+    )
+    outline_first: bool | None = Field(
+        default=None,
+        description="Write report sections in parallel from an outline. "
+        "If None, uses settings.",
+    )
 
 
 class TaskStep(BaseModel):
@@ -126,6 +135,16 @@ class ExecutionLog(BaseModel):
     agent_name: str = Field(description="Agent executing")
     status: str = Field(description="Step status")
     duration_ms: float | None = Field(default=None)
+    started_at_ms: float | None = Field(
+        default=None, description="Start offset from plan start"
+    )
+    finished_at_ms: float | None = Field(
+        default=None, description="Finish offset from plan start"
+    )
+    critical_path_ms: float | None = Field(
+        default=None,
+        description="Length of the longest dependency chain ending at this step",
+    )
     message: str | None = Field(default=None)
     error: str | None = Field(default=None)
 
@@ -151,6 +170,10 @@ class TaskResult(BaseModel):
 
     # Metadata
     total_duration_ms: float | None = Field(default=None)
+    critical_path: list[str] = Field(
+        default_factory=list, description="Step IDs on the longest dependency chain"
+    )
+    critical_path_ms: float | None = Field(default=None)
     error_message: str | None = Field(default=None)
 
 
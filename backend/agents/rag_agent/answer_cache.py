@@ -0,0 +1,171 @@
+"""
+Semantic answer cache for the RAG agent.
+
+Stores final answers keyed by the notebook's RagFlow dataset(s), the
+dataset content version and the question embedding. A new question whose
+embedding is close enough to a cached one (cosine similarity above the
+configured threshold) is answered from the cache, skipping the
+plan/retrieve/grade/reorder/generate loop.
+
+The dataset content version is a core.cache namespace version that is
+bumped whenever a knowledge item finishes RagFlow processing or is removed,
+so cached answers never outlive the content they were generated from.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+from core.cache import CacheKeyGenerator, cache_manager
+from langchain_openai import OpenAIEmbeddings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedAnswer:
+    """A cache hit returned to the graph."""
+
+    question: str
+    answer: str
+    sources: list[str] = field(default_factory=list)
+    similarity: float = 1.0
+
+
+class SemanticAnswerCache:
+    """
+    Embedding-similarity cache of RAG answers per dataset content version.
+
+    Entries for one (datasets, version) pair live under a single cache key as
+    a bounded list, most recent last. Embeddings are stored L2-normalised as
+    float32 bytes so a lookup is one cache GET plus a matrix-vector product.
+    """
+
+    KEY_PREFIX = "rag_answer"
+    MAX_SOURCE_CHARS = 300
+    MAX_SOURCES = 10
+
+    def __init__(
+        self,
+        api_key: str | None,
+        embedding_model: str = "text-embedding-3-small",
+        embedding_dimensions: int = 256,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 200,
+        ttl_seconds: int = 86400,
+    ):
+        self.embeddings = OpenAIEmbeddings(
+            model=embedding_model,
+            api_key=api_key,
+            dimensions=embedding_dimensions,
+        )
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Recently embedded questions, so store() after lookup() is free
+        self._embedding_memo: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._memo_size = 256
+
+    def _cache_key(self, dataset_ids: list[str]) -> str:
+        parts = []
+        for dataset_id in sorted(dataset_ids):
+            version = cache_manager.get_namespace_version(
+                CacheKeyGenerator.ragflow_dataset_namespace(dataset_id)
+            )
+            parts.append(f"{dataset_id}@{version}")
+        return f"{self.KEY_PREFIX}:{'|'.join(parts)}"
+
+    async def _embed(self, question: str) -> np.ndarray:
+        normalized = " ".join(question.split()).lower()
+        cached = self._embedding_memo.get(normalized)
+        if cached is not None:
+            self._embedding_memo.move_to_end(normalized)
+            return cached
+
+        vector = np.asarray(
+            await self.embeddings.aembed_query(normalized), dtype=np.float32
+        )
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+
+        self._embedding_memo[normalized] = vector
+        if len(self._embedding_memo) > self._memo_size:
+            self._embedding_memo.popitem(last=False)
+        return vector
+
+    async def lookup(
+        self, dataset_ids: list[str], question: str
+    ) -> CachedAnswer | None:
+        """Return the most similar cached answer above threshold, if any."""
+        if not dataset_ids or not question:
+            return None
+
+        try:
+            entries = cache_manager.get(self._cache_key(dataset_ids)) or []
+            if not entries:
+                return None
+
+            query = await self._embed(question)
+            matrix = np.stack(
+                [np.frombuffer(e["embedding"], dtype=np.float32) for e in entries]
+            )
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+
+            if similarity < self.similarity_threshold:
+                logger.info(
+                    f"Answer cache miss (best similarity {similarity:.3f} "
+                    f"< {self.similarity_threshold})"
+                )
+                return None
+
+            entry = entries[best]
+            logger.info(
+                f"Answer cache hit (similarity {similarity:.3f}) for: {question[:80]}"
+            )
+            return CachedAnswer(
+                question=entry["question"],
+                answer=entry["answer"],
+                sources=entry.get("sources", []),
+                similarity=similarity,
+            )
+
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return None
+
+    async def store(
+        self,
+        dataset_ids: list[str],
+        question: str,
+        answer: str,
+        documents: list[str],
+    ) -> None:
+        """Cache an answer together with snippets of the documents behind it."""
+        if not dataset_ids or not question or not answer:
+            return
+
+        try:
+            vector = await self._embed(question)
+            key = self._cache_key(dataset_ids)
+            entries = cache_manager.get(key) or []
+            entries.append(
+                {
+                    "question": question,
+                    "embedding": vector.tobytes(),
+                    "answer": answer,
+                    "sources": [
+                        doc[: self.MAX_SOURCE_CHARS]
+                        for doc in documents[: self.MAX_SOURCES]
+                    ],
+                    "created_at": time.time(),
+                }
+            )
+            cache_manager.set(key, entries[-self.max_entries :], self.ttl_seconds)
+
+        except Exception as e:
+            logger.warning(f"Answer cache store failed: {e}")
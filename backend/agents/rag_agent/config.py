@@ -32,6 +32,11 @@ class RAGAgentConfig:
         top_k: Number of chunks to retrieve per query (10 for larger candidate set)
         keep_first_n_steps: Number of initial reasoning steps to preserve (for truncation)
         keep_last_n_steps: Number of recent reasoning steps to preserve (for truncation)
+        answer_cache_enabled: Answer first-turn questions from the semantic answer cache
+        answer_cache_threshold: Minimum cosine similarity for a cache hit
+        answer_cache_max_entries: Cached answers kept per dataset content version
+        answer_cache_ttl: Lifetime of cached answers in seconds
+        embedding_model_name: OpenAI embedding model used for cache lookups
     """
 
     # Model configuration
@@ -58,6 +63,13 @@ class RAGAgentConfig:
     # MCP Server configuration
     mcp_server_url: str = "http://localhost:9382/mcp/"  # RAGFlow MCP server URL
 
+    # Semantic answer cache (opt-in)
+    answer_cache_enabled: bool = False
+    answer_cache_threshold: float = 0.95
+    answer_cache_max_entries: int = 200
+    answer_cache_ttl: int = 86400  # 24 hours
+    embedding_model_name: str = "text-embedding-3-small"
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         # Validate temperature ranges
@@ -78,6 +90,9 @@ class RAGAgentConfig:
         if self.top_k < 1:
             raise ValueError("top_k must be at least 1")
 
+        if self.answer_cache_threshold <= 0.0 or self.answer_cache_threshold > 1.0:
+            raise ValueError("answer_cache_threshold must be in (0.0, 1.0]")
+
         # Warn if no datasets configured
         if not self.dataset_ids:
             import logging
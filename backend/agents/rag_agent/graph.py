@@ -11,6 +11,7 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import ToolNode
 from pydantic import BaseModel, Field
 
+from .answer_cache import SemanticAnswerCache
 from .config import RAGAgentConfig
 from .prompts import (
     format_synthesis_prompt,
@@ -100,6 +101,7 @@ class DeepSightRAGAgent:
     def __init__(self, config: RAGAgentConfig):
         self.config = config
         self._initialize_models()
+        self._initialize_answer_cache()
         self._build_workflow()
 
     def _initialize_models(self):
@@ -125,12 +127,28 @@ class DeepSightRAGAgent:
             temperature=self.config.synthesis_temperature,
         )
 
+    def _initialize_answer_cache(self):
+        """Initialize the semantic answer cache when enabled."""
+        self.answer_cache = None
+        if self.config.answer_cache_enabled:
+            logger.info(
+                f"Semantic answer cache enabled (threshold {self.config.answer_cache_threshold})"
+            )
+            self.answer_cache = SemanticAnswerCache(
+                api_key=self.config.api_key,
+                embedding_model=self.config.embedding_model_name,
+                similarity_threshold=self.config.answer_cache_threshold,
+                max_entries=self.config.answer_cache_max_entries,
+                ttl_seconds=self.config.answer_cache_ttl,
+            )
+
     def _build_workflow(self):
         """Build the workflow graph with nodes and edges."""
         workflow = StateGraph(RAGAgentState)
 
         # Define the nodes
         workflow.add_node("initialize_request", self.initialize_request)
+        workflow.add_node("check_answer_cache", self.check_answer_cache)
         workflow.add_node("planning", self.planning)
         workflow.add_node("retrieve", self.retrieve)
         workflow.add_node("grade_relevance", self.grade_relevance)
@@ -145,6 +163,13 @@ class DeepSightRAGAgent:
         workflow.add_conditional_edges(
             "initialize_request",
             self.check_initialization,
+            {"check_answer_cache": "check_answer_cache", "end": END},
+        )
+
+        # Semantically equivalent questions are answered from the cache
+        workflow.add_conditional_edges(
+            "check_answer_cache",
+            self.decide_after_cache,
             {"planning": "planning", "end": END},
         )
 
@@ -212,6 +237,7 @@ class DeepSightRAGAgent:
                 "synthesis_progress": None,
                 "total_tool_calls": None,
                 "semantic_groups": [],
+                "cache_hit": None,
             }
 
             # Emit state update to frontend
@@ -224,13 +250,65 @@ class DeepSightRAGAgent:
         # If no question is found, return empty to trigger check_initialization -> end
         return {}
 
-    def check_initialization(self, state: RAGAgentState) -> Literal["planning", "end"]:
+    def check_initialization(
+        self, state: RAGAgentState
+    ) -> Literal["check_answer_cache", "end"]:
         """Check if we have a valid question to start retrieval."""
         if state.get("question"):
-            return "planning"
+            return "check_answer_cache"
         logger.info("No question found, ending.")
         return "end"
 
+    def _dataset_ids(self, config: RunnableConfig) -> list[str]:
+        """Dataset IDs of the current request (set per notebook by the server)."""
+        configurable = (config or {}).get("configurable", {}) or {}
+        return configurable.get("dataset_ids") or self.config.dataset_ids
+
+    @staticmethod
+    def _is_first_turn(state: RAGAgentState) -> bool:
+        """Follow-up questions depend on chat history and are never cached."""
+        return not any(isinstance(m, AIMessage) for m in state.get("messages", []))
+
+    async def check_answer_cache(
+        self, state: RAGAgentState, config: RunnableConfig
+    ) -> dict:
+        """
+        Answer from the semantic answer cache when a near-identical question
+        was already answered against the same dataset content.
+        """
+        if not self.answer_cache or not self._is_first_turn(state):
+            return {"cache_hit": False}
+
+        logger.info("---CHECK ANSWER CACHE---")
+        cached = await self.answer_cache.lookup(
+            self._dataset_ids(config), state["question"]
+        )
+        if cached is None:
+            return {"cache_hit": False}
+
+        updated_state = {
+            "generation": cached.answer,
+            "messages": [AIMessage(content=cached.answer)],
+            # Snippets of the documents the cached answer was generated from
+            "documents": cached.sources,
+            "current_step": "completed",
+            "synthesis_progress": 100,
+            "cache_hit": True,
+        }
+
+        await adispatch_custom_event(
+            "manually_emit_state", {**state, **updated_state}, config=config
+        )
+
+        return updated_state
+
+    def decide_after_cache(self, state: RAGAgentState) -> Literal["planning", "end"]:
+        """End the run on a cache hit, otherwise start retrieval."""
+        if state.get("cache_hit"):
+            logger.info("---DECISION: ANSWERED FROM CACHE---")
+            return "end"
+        return "planning"
+
     async def planning(self, state: RAGAgentState, config: RunnableConfig) -> dict:
         """
         Generate multiple search queries from different angles.
@@ -515,6 +593,11 @@ class DeepSightRAGAgent:
             )
             generation = response.content
 
+            if self.answer_cache and self._is_first_turn(state):
+                await self.answer_cache.store(
+                    self._dataset_ids(config), question, generation, documents
+                )
+
         updated_state = {
             "generation": generation,
             "messages": [AIMessage(content=generation)],
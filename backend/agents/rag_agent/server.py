@@ -79,6 +79,11 @@ base_config = RAGAgentConfig(
     api_key=get_openai_api_key(),
     dataset_ids=[],  # Initial empty, will be set per request
     mcp_server_url=get_mcp_server_url(),
+    answer_cache_enabled=os.getenv("RAG_AGENT_ANSWER_CACHE", "false").lower()
+    in ("1", "true", "yes"),
+    answer_cache_threshold=float(
+        os.getenv("RAG_AGENT_ANSWER_CACHE_THRESHOLD", "0.95")
+    ),
 )
 
 # Initialize the agent once
@@ -259,6 +264,7 @@ class DynamicRAGAgent:
                     **configurable,
                     "notebook_id": notebook_id,
                     "user_id": user_id,
+                    "dataset_ids": dataset_ids,
                 }
             )
 
@@ -48,3 +48,4 @@ class RAGAgentState(CopilotKitState):
     synthesis_progress: int | None = None
     total_tool_calls: int | None = None
     agent_reasoning: str | None = None
+    cache_hit: bool | None = None  # Answer served from the semantic answer cache
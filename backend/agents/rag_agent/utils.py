@@ -6,6 +6,8 @@ Provides message windowing, text extraction, and other helper functions for ReAc
 
 import logging
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Any, Sequence
 
 import tiktoken
@@ -15,10 +17,133 @@ from langchain_core.messages import BaseMessage, SystemMessage
 logger = logging.getLogger(__name__)
 
 
+# Per-message token counts, keyed by encoding and message content. Chat
+# history is re-sent on every turn, so each message is tokenized only once.
+TOKEN_COUNT_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=32)
+def get_encoding(model_name: str = "gpt-4") -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, loaded once per process."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Fallback to cl100k_base if model not found
+        logger.warning(f"Model {model_name} not found, using cl100k_base encoding")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def _count_tokens(encoding_name: str, text: str) -> int:
+    try:
+        return len(tiktoken.get_encoding(encoding_name).encode(text))
+    except Exception as e:
+        logger.warning(f"Error encoding message: {e}")
+        # Rough estimate: 4 chars per token
+        return len(text) // 4
+
+
+def count_message_tokens(message: BaseMessage, model_name: str = "gpt-4") -> int:
+    """Token count of a message's content, memoized by content."""
+    return _count_tokens(get_encoding(model_name).name, str(message.content))
+
+
+class ChatHistoryWindow:
+    """
+    Incremental token window over a growing chat history.
+
+    Keeps the non-system messages seen so far together with a running
+    prefix sum of their token counts. When the next turn's history extends
+    the previous one, only the new messages are counted, and the oldest
+    message that still fits the budget is found by bisecting the prefix sum.
+    Reuse one instance per conversation to get the incremental behaviour;
+    a fresh instance still benefits from the shared per-message memo.
+    """
+
+    def __init__(self, model_name: str = "gpt-4"):
+        self.model_name = model_name
+        self._encoding_name = get_encoding(model_name).name
+        self._messages: list[BaseMessage] = []
+        # _prefix[i] is the token total of the first i tracked messages
+        self._prefix: list[int] = [0]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _sync(self, messages: Sequence[BaseMessage]):
+        """Track `messages`, appending to the existing prefix sum when possible."""
+        known = len(self._messages)
+        if len(messages) < known or (
+            known and not self._same_message(messages[known - 1], self._messages[-1])
+        ):
+            # History was edited or belongs to another conversation
+            self._messages = []
+            self._prefix = [0]
+            known = 0
+
+        total = self._prefix[-1]
+        for msg in messages[known:]:
+            total += _count_tokens(self._encoding_name, str(msg.content))
+            self._messages.append(msg)
+            self._prefix.append(total)
+
+    @staticmethod
+    def _same_message(a: BaseMessage, b: BaseMessage) -> bool:
+        if a is b:
+            return True
+        if a.id and b.id:
+            return a.id == b.id
+        return type(a) is type(b) and a.content == b.content
+
+    def select(
+        self, messages: Sequence[BaseMessage], max_tokens: int = 4000
+    ) -> list[BaseMessage]:
+        """Return the trimmed message list for `messages` (see get_chat_history_window)."""
+        system_msgs = [m for m in messages if isinstance(m, SystemMessage)]
+        other_msgs = [m for m in messages if not isinstance(m, SystemMessage)]
+
+        if not other_msgs:
+            # Only system messages, return as-is
+            return system_msgs
+
+        self._sync(other_msgs)
+
+        # Always keep last message (current user question)
+        last_msg = other_msgs[-1]
+        required_tokens = sum(
+            _count_tokens(self._encoding_name, str(m.content)) for m in system_msgs
+        ) + (self._prefix[-1] - self._prefix[-2])
+
+        if required_tokens >= max_tokens:
+            # Critical: Can only fit system messages + last message
+            logger.warning(
+                f"Required messages ({required_tokens} tokens) exceed budget ({max_tokens} tokens)"
+            )
+            return system_msgs + [last_msg]
+
+        # The most recent messages before the last one that fit in the budget
+        # form a suffix; find where it starts: prefix[start] >= total - budget
+        budget = max_tokens - required_tokens
+        last_index = len(other_msgs) - 1
+        before_last = self._prefix[last_index]
+        start = bisect_left(self._prefix, before_last - budget, 0, last_index + 1)
+        used = required_tokens + before_last - self._prefix[start]
+
+        final_messages = system_msgs + other_msgs[start:]
+
+        logger.info(
+            f"Windowed {len(messages)} messages to {len(final_messages)} "
+            f"(budget: {max_tokens} tokens, used: ~{used} tokens)"
+        )
+
+        return final_messages
+
+
 def get_chat_history_window(
     messages: Sequence[BaseMessage],
     max_tokens: int = 4000,
     model_name: str = "gpt-4",
+    window: ChatHistoryWindow | None = None,
 ) -> list[BaseMessage]:
     """
     Trim message history to fit within token budget.
@@ -37,6 +162,7 @@ def get_chat_history_window(
         messages: Full message history
         max_tokens: Maximum token budget for messages
         model_name: Model name for tokenization (e.g., "gpt-4", "gpt-4.1-mini")
+        window: Optional per-conversation ChatHistoryWindow to reuse across turns
 
     Returns:
         Trimmed message list that fits within token budget
@@ -51,68 +177,9 @@ def get_chat_history_window(
         >>> windowed = get_chat_history_window(messages, max_tokens=100)
         >>> # Returns: [SystemMessage, HumanMessage("Tell me more")]
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model_name)
-    except KeyError:
-        # Fallback to cl100k_base if model not found
-        logger.warning(f"Model {model_name} not found, using cl100k_base encoding")
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    # Separate system messages from others
-    system_msgs = [m for m in messages if isinstance(m, SystemMessage)]
-    other_msgs = [m for m in messages if not isinstance(m, SystemMessage)]
-
-    if not other_msgs:
-        # Only system messages, return as-is
-        return system_msgs
-
-    # Always keep last message (current user question)
-    last_msg = other_msgs[-1]
-    remaining_msgs = other_msgs[:-1]
-
-    # Count tokens for required messages (system + last)
-    required_tokens = 0
-    for msg in [*system_msgs, last_msg]:
-        try:
-            required_tokens += len(encoding.encode(str(msg.content)))
-        except Exception as e:
-            logger.warning(f"Error encoding message: {e}")
-            # Rough estimate: 4 chars per token
-            required_tokens += len(str(msg.content)) // 4
-
-    if required_tokens >= max_tokens:
-        # Critical: Can only fit system messages + last message
-        logger.warning(
-            f"Required messages ({required_tokens} tokens) exceed budget ({max_tokens} tokens)"
-        )
-        return system_msgs + [last_msg]
-
-    # Add messages from recent to old within remaining budget
-    budget = max_tokens - required_tokens
-    windowed = []
-
-    for msg in reversed(remaining_msgs):
-        try:
-            msg_tokens = len(encoding.encode(str(msg.content)))
-        except Exception as e:
-            logger.warning(f"Error encoding message: {e}")
-            msg_tokens = len(str(msg.content)) // 4
-
-        if msg_tokens <= budget:
-            windowed.insert(0, msg)
-            budget -= msg_tokens
-        else:
-            # Can't fit this message, stop
-            break
-
-    final_messages = system_msgs + windowed + [last_msg]
-
-    logger.info(
-        f"Windowed {len(messages)} messages to {len(final_messages)} "
-        f"(budget: {max_tokens} tokens, used: ~{max_tokens - budget} tokens)"
-    )
-
-    return final_messages
+    if window is None or window.model_name != model_name:
+        window = ChatHistoryWindow(model_name)
+    return window.select(messages, max_tokens)
 
 
 def estimate_token_count(text: str, model_name: str = "gpt-4") -> int:
@@ -126,13 +193,7 @@ def estimate_token_count(text: str, model_name: str = "gpt-4") -> int:
     Returns:
         Estimated token count
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model_name)
-        return len(encoding.encode(text))
-    except Exception as e:
-        logger.warning(f"Error estimating tokens: {e}")
-        # Rough estimate: 4 chars per token
-        return len(text) // 4
+    return _count_tokens(get_encoding(model_name).name, text)
 
 
 def format_chunks(chunks: list[dict[str, Any]], max_content_length: int = 500) -> str:
@@ -7,6 +7,8 @@ suitable for use by the coordinator or direct API calls.
 
 import asyncio
 import logging
+from collections.abc import Callable
+from typing import Any
 
 from .states import WriterResult
 from .writer import write_report
@@ -23,6 +25,9 @@ async def run_writer(
     style: str = "academic",
     polish: bool = True,
     timeout: float | None = None,
+    outline_first: bool | None = None,
+    max_concurrency: int | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> WriterResult:
     """
     Generate a polished report from research findings.
@@ -45,6 +50,11 @@ async def run_writer(
         polish: Whether to run a polishing pass. Default True.
         timeout: Maximum time in seconds to wait for completion.
                  If None, no timeout is applied.
+        outline_first: Generate an outline, then write sections concurrently
+                 and polish each one. If None, uses settings.WRITER_OUTLINE_FIRST.
+        max_concurrency: Max sections written at once in outline-first mode.
+        progress_callback: Optional sync callback receiving outline and
+                 section-completed events in outline-first mode.
 
     Returns:
         WriterResult containing:
@@ -81,31 +91,25 @@ async def run_writer(
 
     logger.info(
         f"Starting report writing: brief='{research_brief[:50]}...', "
-        f"style={style}, polish={polish}"
+        f"style={style}, polish={polish}, outline_first={outline_first}"
     )
 
     try:
+        writing = write_report(
+            research_brief=research_brief,
+            findings=findings,
+            sources=sources,
+            style=style,
+            draft_outline=draft_outline,
+            polish=polish,
+            outline_first=outline_first,
+            max_concurrency=max_concurrency,
+            progress_callback=progress_callback,
+        )
         if timeout:
-            result = await asyncio.wait_for(
-                write_report(
-                    research_brief=research_brief,
-                    findings=findings,
-                    sources=sources,
-                    style=style,
-                    draft_outline=draft_outline,
-                    polish=polish,
-                ),
-                timeout=timeout,
-            )
+            result = await asyncio.wait_for(writing, timeout=timeout)
         else:
-            result = await write_report(
-                research_brief=research_brief,
-                findings=findings,
-                sources=sources,
-                style=style,
-                draft_outline=draft_outline,
-                polish=polish,
-            )
+            result = await writing
 
         logger.info(
             f"Report writing completed: "
@@ -130,6 +134,7 @@ def run_writer_sync(
     style: str = "academic",
     polish: bool = True,
     timeout: float | None = None,
+    outline_first: bool | None = None,
 ) -> WriterResult:
     """
     Synchronous wrapper for run_writer.
@@ -152,5 +157,6 @@ def run_writer_sync(
             style=style,
             polish=polish,
             timeout=timeout,
+            outline_first=outline_first,
         )
     )
@@ -181,3 +181,85 @@ Create a detailed outline with:
 
 Return the outline in markdown format.
 """
+
+
+# ============================================================================
+# OUTLINE-FIRST (SECTIONED) PROMPTS
+# ============================================================================
+
+structured_outline_prompt = """Plan the structure of a comprehensive report answering the research brief below.
+
+<Research Brief>
+{research_brief}
+</Research Brief>
+
+Today's date is {date}.
+
+<Findings>
+{findings}
+</Findings>
+
+Return a report title and an ordered list of body sections. For each section give:
+- a concise heading, without any '#' characters
+- the key points, specific findings and source numbers the section must cover
+
+Guidelines:
+- Use between {min_sections} and {max_sections} sections; each must be self-contained enough to be written independently
+- Avoid overlap: every finding should belong to exactly one section
+- Do NOT include a Sources or References section, it is added automatically
+- Write the title and headings in the same language as the research brief
+"""
+
+
+section_generation_prompt = """You are writing ONE section of a larger report. Other sections are written in parallel by other writers, following the same outline.
+
+<Research Brief>
+{research_brief}
+</Research Brief>
+
+Today's date is {date}.
+
+<Report Outline>
+{outline}
+</Report Outline>
+
+<Findings>
+{findings}
+</Findings>
+
+<Numbered Sources>
+{sources}
+</Numbered Sources>
+
+Write the section "{section_title}" (section {section_number} of {section_count}). It must cover:
+{key_points}
+
+Rules:
+- Start with the heading line "## {section_title}" and use ### for subsections
+- Only cover this section's points; other sections handle the rest of the outline
+- Do not write an introduction to the whole report or a conclusion unless this section is one
+- Cite sources inline with their number from the numbered list, e.g. [3]; never invent new numbers
+- Do NOT add a Sources section, it is added automatically
+- Write in the same language as the research brief, in paragraph form by default
+- Do not refer to yourself or describe what you are doing
+"""
+
+
+polish_section_prompt = """Review and polish the following section of a larger report to improve clarity, coherence, and professionalism.
+
+<Research Brief>
+{research_brief}
+</Research Brief>
+
+<Section>
+{section}
+</Section>
+
+Please improve the section by:
+1. Fixing any grammatical or spelling errors
+2. Improving sentence flow and transitions
+3. Removing redundant or repetitive content
+
+Keep the heading, the structure, and every numbered citation exactly as they are.
+Return only the improved section.
+"""
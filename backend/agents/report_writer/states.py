@@ -16,6 +16,25 @@ class Section(BaseModel):
     level: int = Field(default=2, description="Heading level (1-4)")
 
 
+class SectionPlan(BaseModel):
+    """A planned section of an outline-first report."""
+
+    title: str = Field(description="Section heading, without '#' characters")
+    key_points: list[str] = Field(
+        default_factory=list,
+        description="Points, findings and sources this section should cover",
+    )
+
+
+class ReportOutline(BaseModel):
+    """Structured outline used to write sections in parallel."""
+
+    title: str = Field(description="Report title, without '#' characters")
+    sections: list[SectionPlan] = Field(
+        description="Ordered body sections; do not include a Sources section"
+    )
+
+
 class WriterResult(BaseModel):
     """
     Output contract from the writer agent.
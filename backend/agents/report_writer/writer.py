@@ -5,16 +5,19 @@ This module implements the writing workflow that transforms
 research findings into polished reports.
 """
 
+import asyncio
 import logging
 import re
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from django.conf import settings
 
-from .states import WriterResult, Section
+from .states import ReportOutline, Section, SectionPlan, WriterResult
 
 
 logger = logging.getLogger(__name__)
@@ -38,6 +41,11 @@ def get_writer_model():
     )
 
 
+def get_max_section_concurrency() -> int:
+    """Maximum number of sections written at the same time."""
+    return max(1, getattr(settings, "WRITER_MAX_SECTION_CONCURRENCY", 4))
+
+
 def get_today_str() -> str:
     """Get current date in human-readable format."""
     return datetime.now().strftime("%B %d, %Y")
@@ -226,6 +234,277 @@ async def polish_report(
         return draft_report  # Return original if polishing fails
 
 
+# ============================================================================
+# OUTLINE-FIRST (SECTIONED) WRITING
+# ============================================================================
+
+
+def format_numbered_sources(sources: list[dict]) -> str:
+    """Format sources as a numbered list shared by all section writers."""
+    if not sources:
+        return "No sources available."
+    return "\n".join(
+        f"[{i}] {s.get('title', 'Source')}: {s.get('url', '')} - {s.get('snippet', '')[:200]}"
+        for i, s in enumerate(sources, 1)
+    )
+
+
+def format_outline(outline: ReportOutline) -> str:
+    """Render an outline as markdown for the section prompts."""
+    lines = [f"# {outline.title}"]
+    for i, section in enumerate(outline.sections, 1):
+        lines.append(f"{i}. {section.title}")
+        lines.extend(f"   - {point}" for point in section.key_points)
+    return "\n".join(lines)
+
+
+def build_sources_section(sources: list[dict]) -> str:
+    """Build the final Sources list matching the numbered citations."""
+    if not sources:
+        return ""
+    lines = [
+        f"[{i}] {s.get('title', 'Source')}: {s.get('url', '')}"
+        for i, s in enumerate(sources, 1)
+    ]
+    return "### Sources\n\n" + "\n".join(f"- {line}" for line in lines)
+
+
+def _strip_code_fence(text: str) -> str:
+    text = text.strip()
+    if text.startswith("```"):
+        text = re.sub(r"^```[a-zA-Z]*\n?", "", text)
+        text = re.sub(r"\n?```$", "", text)
+    return text.strip()
+
+
+async def generate_outline(
+    research_brief: str,
+    findings: str,
+    sources: list[dict],
+    draft_outline: str | None = None,
+    min_sections: int = 3,
+    max_sections: int = 8,
+) -> ReportOutline:
+    """
+    Plan the report as a title plus ordered section headings.
+
+    Args:
+        research_brief: Original research question
+        findings: Compressed research findings
+        sources: List of source information
+        draft_outline: Optional outline to follow
+        min_sections: Minimum number of body sections
+        max_sections: Maximum number of body sections
+
+    Returns:
+        ReportOutline with the sections to write
+    """
+    from .prompts import structured_outline_prompt
+
+    model = get_writer_model().with_structured_output(ReportOutline)
+
+    prompt = structured_outline_prompt.format(
+        research_brief=research_brief,
+        findings=f"{findings}\n\n### Numbered Sources:\n{format_numbered_sources(sources)}",
+        date=get_today_str(),
+        min_sections=min_sections,
+        max_sections=max_sections,
+    )
+    if draft_outline:
+        prompt = f"Follow this outline:\n{draft_outline}\n\n{prompt}"
+
+    outline = await model.ainvoke([HumanMessage(content=prompt)])
+    outline.sections = [
+        section
+        for section in outline.sections[:max_sections]
+        if section.title.strip().lower() not in ("sources", "references")
+    ]
+    return outline
+
+
+async def write_section(
+    section: SectionPlan,
+    section_number: int,
+    outline: ReportOutline,
+    research_brief: str,
+    findings: str,
+    sources: list[dict],
+    style: str = "academic",
+) -> str:
+    """
+    Write one section of an outline-first report.
+
+    Every section sees the same findings, numbered sources and full outline,
+    so sections written concurrently stay consistent with each other.
+
+    Returns:
+        Section markdown starting with its ## heading
+    """
+    from .prompts import get_style_instructions, section_generation_prompt
+
+    model = get_writer_model()
+
+    key_points = (
+        "\n".join(f"- {point}" for point in section.key_points)
+        or "- Whatever the outline implies for this section"
+    )
+    prompt = section_generation_prompt.format(
+        research_brief=research_brief,
+        date=get_today_str(),
+        outline=format_outline(outline),
+        findings=findings,
+        sources=format_numbered_sources(sources),
+        section_title=section.title,
+        section_number=section_number,
+        section_count=len(outline.sections),
+        key_points=key_points,
+    )
+
+    response = await model.ainvoke(
+        [HumanMessage(content=f"{get_style_instructions(style)}\n\n{prompt}")]
+    )
+    content = _strip_code_fence(response.content)
+    if not content.lstrip().startswith("#"):
+        content = f"## {section.title}\n\n{content}"
+    return content
+
+
+async def polish_section(section: str, research_brief: str) -> str:
+    """
+    Polish a single section.
+
+    Returns:
+        Polished section, or the original if polishing fails
+    """
+    from .prompts import polish_section_prompt
+
+    model = get_writer_model()
+
+    prompt = polish_section_prompt.format(
+        section=section,
+        research_brief=research_brief,
+    )
+
+    try:
+        response = await model.ainvoke([HumanMessage(content=prompt)])
+        return _strip_code_fence(response.content) or section
+    except Exception as e:
+        logger.error(f"Section polishing failed: {e}")
+        return section
+
+
+async def generate_report_by_sections(
+    research_brief: str,
+    findings: str,
+    sources: list[dict],
+    style: str = "academic",
+    draft_outline: str | None = None,
+    polish: bool = True,
+    max_concurrency: int | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> str:
+    """
+    Generate a report outline-first, writing sections concurrently.
+
+    The outline is generated first; sections are then written (and
+    optionally polished) in parallel, at most ``max_concurrency`` at a time,
+    and stitched back together in outline order with a single Sources list.
+    Each finished section is reported through ``progress_callback``.
+
+    Args:
+        research_brief: Original research question
+        findings: Compressed research findings
+        sources: List of source information
+        style: Writing style
+        draft_outline: Optional outline to follow
+        polish: Whether to polish each section
+        max_concurrency: Max sections in flight. If None, uses settings.
+        progress_callback: Optional sync callback receiving a dict per
+            outline/section event (phase, section, index, completed, total)
+
+    Returns:
+        Generated report in markdown format
+    """
+
+    def notify(event: dict[str, Any]):
+        if progress_callback is None:
+            return
+        try:
+            progress_callback(event)
+        except Exception as e:
+            logger.warning(f"Writer progress callback failed: {e}")
+
+    outline = await generate_outline(
+        research_brief=research_brief,
+        findings=findings,
+        sources=sources,
+        draft_outline=draft_outline,
+    )
+    if not outline.sections:
+        raise ValueError("Outline generation returned no sections")
+
+    total = len(outline.sections)
+    logger.info(f"Outline ready: {total} sections for '{outline.title}'")
+    notify(
+        {
+            "phase": "outline",
+            "title": outline.title,
+            "sections": [section.title for section in outline.sections],
+            "total": total,
+        }
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrency or get_max_section_concurrency())
+    completed = 0
+
+    async def produce(index: int, section: SectionPlan) -> str:
+        nonlocal completed
+        async with semaphore:
+            content = await write_section(
+                section=section,
+                section_number=index + 1,
+                outline=outline,
+                research_brief=research_brief,
+                findings=findings,
+                sources=sources,
+                style=style,
+            )
+            if polish:
+                content = await polish_section(content, research_brief)
+
+        completed += 1
+        notify(
+            {
+                "phase": "section",
+                "section": section.title,
+                "index": index,
+                "completed": completed,
+                "total": total,
+                "word_count": count_words(content),
+            }
+        )
+        return content
+
+    tasks = [
+        asyncio.ensure_future(produce(i, section))
+        for i, section in enumerate(outline.sections)
+    ]
+    try:
+        section_texts = await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't leave sibling sections generating after a failure or cancel
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    parts = [f"# {outline.title}", *section_texts]
+    sources_section = build_sources_section(sources)
+    if sources_section:
+        parts.append(sources_section)
+    return "\n\n".join(parts)
+
+
 # ============================================================================
 # MAIN WRITING WORKFLOW
 # ============================================================================
@@ -238,6 +517,9 @@ async def write_report(
     style: str = "academic",
     draft_outline: str | None = None,
     polish: bool = True,
+    outline_first: bool | None = None,
+    max_concurrency: int | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> WriterResult:
     """
     Execute the complete writing workflow.
@@ -249,25 +531,51 @@ async def write_report(
         style: Writing style
         draft_outline: Optional outline to follow
         polish: Whether to polish the report
+        outline_first: Write sections concurrently from an outline instead of
+            in a single call. If None, uses settings.WRITER_OUTLINE_FIRST.
+        max_concurrency: Max sections written at once in outline-first mode
+        progress_callback: Optional sync callback for section progress events
 
     Returns:
         WriterResult with final report and metadata
     """
     logger.info(f"Starting report generation for: {research_brief[:50]}...")
 
-    # Generate initial report
-    report = await generate_report(
-        research_brief=research_brief,
-        findings=findings,
-        sources=sources,
-        style=style,
-        draft_outline=draft_outline,
-    )
+    if outline_first is None:
+        outline_first = getattr(settings, "WRITER_OUTLINE_FIRST", False)
+
+    report = None
+    if outline_first:
+        try:
+            report = await generate_report_by_sections(
+                research_brief=research_brief,
+                findings=findings,
+                sources=sources,
+                style=style,
+                draft_outline=draft_outline,
+                polish=polish,
+                max_concurrency=max_concurrency,
+                progress_callback=progress_callback,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Outline-first generation failed, falling back to single pass: {e}"
+            )
+
+    if report is None:
+        # Generate initial report
+        report = await generate_report(
+            research_brief=research_brief,
+            findings=findings,
+            sources=sources,
+            style=style,
+            draft_outline=draft_outline,
+        )
 
-    # Polish if requested
-    if polish:
-        logger.info("Polishing report...")
-        report = await polish_report(report, research_brief)
+        # Polish if requested
+        if polish:
+            logger.info("Polishing report...")
+            report = await polish_report(report, research_brief)
 
     # Parse sections
     sections = parse_sections(report)
@@ -32,6 +32,7 @@ app.autodiscover_tasks(
         "notebooks.tasks.processing_tasks",
         "notebooks.tasks.ragflow_tasks",
         "notebooks.tasks.maintenance_tasks",
+        "notebooks.tasks.coordinator_tasks",
     ]
 )
 
@@ -50,6 +51,7 @@ app.conf.update(
         "podcast.tasks.cleanup_old_podcast_jobs": {"queue": "maintenance"},
         "reports.tasks.process_report_generation": {"queue": "reports"},
         "reports.tasks.cleanup_old_reports": {"queue": "maintenance"},
+        "reports.tasks.reconcile_report_job_statuses": {"queue": "maintenance"},
         "reports.tasks.validate_report_configuration": {"queue": "validation"},
         # Notebooks processing tasks (after refactoring to package structure)
         "notebooks.tasks.processing_tasks.parse_url_task": {
@@ -83,6 +85,8 @@ app.conf.update(
         "notebooks.tasks.ragflow_tasks.check_ragflow_status_task": {
             "queue": "notebook_processing"
         },
+        # Studio coordinator tasks run long research/writing pipelines
+        "notebooks.tasks.coordinator_tasks.execute_studio_task": {"queue": "studio"},
         # Notebooks maintenance tasks
         "notebooks.tasks.maintenance_tasks.test_caption_generation_task": {
             "queue": "notebook_processing"
@@ -90,6 +94,9 @@ app.conf.update(
         "notebooks.tasks.maintenance_tasks.cleanup_old_batch_jobs": {
             "queue": "maintenance"
         },
+        "notebooks.tasks.maintenance_tasks.reconcile_notebook_stats_task": {
+            "queue": "maintenance"
+        },
         # Semantic search tasks
         "semantic_search.stream_search": {"queue": "semantic_search"},
     },
@@ -102,6 +109,10 @@ app.conf.update(
     # Task time limits
     task_time_limit=3600,  # 1 hour
     task_soft_time_limit=3300,  # 55 minutes
+    # Unacknowledged (acks_late) tasks are redelivered after the visibility
+    # timeout; keep it above the hard time limit so a long run is not handed
+    # to a second worker while the first is still working on it
+    broker_transport_options={"visibility_timeout": 7200},
     # Worker settings
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=50,
@@ -117,6 +128,14 @@ app.conf.update(
             "task": "reports.tasks.cleanup_old_reports",
             "schedule": 86400.0,  # Run daily
         },
+        "reconcile-notebook-stats": {
+            "task": "notebooks.tasks.maintenance_tasks.reconcile_notebook_stats_task",
+            "schedule": 3600.0,  # Run hourly
+        },
+        "reconcile-report-job-statuses": {
+            "task": "reports.tasks.reconcile_report_job_statuses",
+            "schedule": 60.0,  # Run every minute
+        },
     },
 )
 
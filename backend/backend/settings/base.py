@@ -96,12 +96,14 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    "core.middleware.RequestTimingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.RateLimitMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -387,6 +389,30 @@ HIGGS_TTS_MODEL = os.getenv("HIGGS_TTS_MODEL")
 
 MINERU_BASE_URL = os.getenv("MINERU_BASE_URL")
 
+# ==============================================================================
+# RATE LIMITING
+# ==============================================================================
+
+# RateLimitMiddleware is installed but only limits requests when enabled;
+# limits are per hour (see core.rate_limit for per-route rules)
+RATE_LIMIT_ENABLED = get_env_bool("RATE_LIMIT_ENABLED", False)
+USER_RATE_LIMIT = int(os.getenv("USER_RATE_LIMIT", "5000"))
+ANONYMOUS_RATE_LIMIT = int(os.getenv("ANONYMOUS_RATE_LIMIT", "1000"))
+
+# ==============================================================================
+# METRICS
+# ==============================================================================
+
+# Bearer token required by /metrics/; without one the endpoint only serves
+# when DEBUG is on
+METRICS_AUTH_TOKEN = os.getenv("METRICS_AUTH_TOKEN")
+
+# Web and worker processes add their samples to one Redis hash so /metrics/
+# reports totals across processes (METRICS_REDIS_URL defaults to the broker)
+METRICS_SHARED_ENABLED = get_env_bool("METRICS_SHARED_ENABLED", True)
+METRICS_REDIS_URL = os.getenv("METRICS_REDIS_URL")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "10"))
+
 # ==============================================================================
 # LOGGING CONFIGURATION
 # ==============================================================================
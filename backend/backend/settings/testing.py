@@ -62,6 +62,25 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 
+# Rate limiting is off except in its own tests, which use in-process counters
+RATE_LIMIT_ENABLED = False
+RATE_LIMIT_BACKEND = "local"
+
+# Notebook stats are computed from the database instead of Redis counters
+NOTEBOOK_STATS_COUNTERS_ENABLED = False
+
+# Image derivatives are resized in-process instead of in a worker pool
+IMAGE_DERIVATIVE_WORKERS = 0
+
+# Podcast TTS chunks are always synthesized (no Redis/MinIO chunk cache)
+PODCAST_TTS_CACHE_ENABLED = False
+
+# Report job status is read from the database (no Redis status snapshots)
+REPORT_STATUS_STORE_ENABLED = False
+
+# Metrics stay in the test process (no shared Redis hash)
+METRICS_SHARED_ENABLED = False
+
 # Test-specific CORS settings
 CORS_ALLOW_ALL_ORIGINS = True
 
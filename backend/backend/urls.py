@@ -12,8 +12,10 @@ API Structure:
 - /api/v1/podcasts/ -> Podcast generation and management
 - /api/v1/reports/ -> Report generation and management
 - /api/v1/conferences/ -> Conference data and analytics
+- /metrics/ -> Prometheus metrics
 """
 
+from core.views import metrics_view
 from django.contrib import admin
 from django.urls import include, path, re_path
 from drf_spectacular.views import (
@@ -43,6 +45,10 @@ urlpatterns = [
     # Semantic search operations
     path("api/v1/semantic-search/", include("semantic_search.urls")),
     # ========================================
+    # Monitoring
+    # ========================================
+    path("metrics/", metrics_view, name="metrics"),
+    # ========================================
     # API Documentation
     # ========================================
     # OpenAPI schema and documentation (drf-spectacular)
@@ -1,7 +1,8 @@
 from datetime import date
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -208,6 +209,32 @@ class PublicationViewSetTest(ConferencesAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Deep Learning for Computer Vision")
 
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "publication-cache-test",
+            }
+        }
+    )
+    def test_publication_list_cache_invalidated_on_save(self):
+        """Test cached publication lists are refreshed when a publication changes"""
+        cache.clear()
+        self.authenticate()
+        url = reverse("publication-list")
+        params = {"instance": self.instance.instance_id}
+
+        self.assertEqual(self.client.get(url, params).data["count"], 2)
+
+        # Bypassing signals leaves the cached response in place
+        Publication.objects.filter(pk=self.publication1.pk).update(session="reject")
+        self.assertEqual(self.client.get(url, params).data["count"], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.publication1.refresh_from_db()
+            self.publication1.save()
+        self.assertEqual(self.client.get(url, params).data["count"], 1)
+
 
 class DashboardViewSetTest(ConferencesAPITestCase):
     """Test DashboardViewSet"""
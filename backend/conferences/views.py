@@ -12,6 +12,8 @@ from rest_framework.response import Response
 
 from django.core.exceptions import ValidationError
 
+from core.cache import CacheKeyGenerator, CachedResponseMixin, cache_manager
+
 from .models import Event, Instance, Publication, Session, Venue
 from .serializers import (
     ActiveImportSerializer,
@@ -40,20 +42,33 @@ class StandardPageNumberPagination(PageNumberPagination):
     max_page_size = 1000  # Increased to allow bulk retrieval for semantic search
 
 
-class VenueViewSet(viewsets.ModelViewSet):
+class VenueViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for Venue model"""
 
     queryset = Venue.objects.all()
     serializer_class = VenueSerializer
     permission_classes = [IsAuthenticated]
+    cache_per_user = False
+    cache_timeout = cache_manager.long_timeout
+
+    def get_cache_namespaces(self):
+        return [CacheKeyGenerator.model_namespace("conferences.venue")]
 
 
-class InstanceViewSet(viewsets.ModelViewSet):
+class InstanceViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for Instance model"""
 
     queryset = Instance.objects.select_related("venue").all()
     serializer_class = InstanceSerializer
     permission_classes = [IsAuthenticated]
+    cache_per_user = False
+    cache_timeout = cache_manager.long_timeout
+
+    def get_cache_namespaces(self):
+        return [
+            CacheKeyGenerator.model_namespace("conferences.venue"),
+            CacheKeyGenerator.model_namespace("conferences.instance"),
+        ]
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -63,13 +78,32 @@ class InstanceViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class PublicationViewSet(viewsets.ModelViewSet):
+class PublicationViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for Publication model"""
 
     queryset = Publication.objects.select_related("instance__venue").all()
     serializer_class = PublicationTableSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = StandardPageNumberPagination
+    cache_per_user = False
+    cache_timeout = cache_manager.long_timeout
+
+    def get_cache_namespaces(self):
+        namespaces = [
+            CacheKeyGenerator.model_namespace("conferences.venue"),
+            CacheKeyGenerator.model_namespace("conferences.instance"),
+        ]
+        instance_id = self.request.query_params.get("instance")
+        if instance_id and self.action == "list":
+            # Lists scoped to one instance only change with its publications
+            namespaces.append(
+                CacheKeyGenerator.conference_instance_namespace(instance_id)
+            )
+        else:
+            namespaces.append(
+                CacheKeyGenerator.model_namespace("conferences.publication")
+            )
+        return namespaces
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -5,3 +5,10 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
     verbose_name = "Core Utilities"
+
+    def ready(self):
+        """Connect cache invalidation and performance instrumentation."""
+        from . import cache_signals  # noqa: F401  (import for side effects)
+        from .instrumentation import install
+
+        install()
@@ -6,13 +6,19 @@ Provides:
 - Cache decorators for views and functions
 - Cache invalidation patterns
 - Performance monitoring for cache operations
+
+Invalidation uses versioned namespaces: keys embed the namespace's current
+version (see CacheManager.versioned_key), and core.cache_signals bumps the
+version when the underlying rows change, so no pattern deletes are needed.
 """
 
 import hashlib
 import json
 import logging
+import threading
 import time
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from functools import wraps
 from typing import Any
 
@@ -22,6 +28,9 @@ from django.http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing a cache miss from a cached None
+_MISSING = object()
+
 
 class CacheKeyGenerator:
     """Utility class for generating consistent cache keys."""
@@ -50,6 +59,26 @@ class CacheKeyGenerator:
             key += f":{suffix}"
         return key
 
+    @staticmethod
+    def model_namespace(model_label: str) -> str:
+        """Namespace whose version tracks all rows of a model."""
+        return f"model:{model_label}"
+
+    @staticmethod
+    def conference_instance_namespace(instance_id) -> str:
+        """Namespace whose version tracks one conference instance's publications."""
+        return f"conference_instance:{instance_id}"
+
+    @staticmethod
+    def user_notebooks_namespace(user_id) -> str:
+        """Namespace whose version tracks a user's notebook list."""
+        return CacheKeyGenerator.user_key(user_id, "notebooks")
+
+    @staticmethod
+    def ragflow_dataset_namespace(dataset_id: str) -> str:
+        """Namespace whose version tracks a RagFlow dataset's content."""
+        return f"ragflow_dataset:{dataset_id}"
+
     @staticmethod
     def query_key(model_name: str, query_params: dict) -> str:
         """Generate cache key for database queries."""
@@ -75,6 +104,13 @@ class CacheManager:
         )  # 5 minutes
         self.long_timeout = getattr(settings, "CACHE_LONG_TIMEOUT", 3600)  # 1 hour
         self.short_timeout = getattr(settings, "CACHE_SHORT_TIMEOUT", 60)  # 1 minute
+        # Stampede protection: how long a rebuild lock lives and how long
+        # other requests wait for the rebuilt value before computing it too
+        self.lock_timeout = getattr(settings, "CACHE_LOCK_TIMEOUT", 30)
+        self.lock_wait = getattr(settings, "CACHE_LOCK_WAIT", 2.0)
+
+        self._metrics: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._metrics_lock = threading.Lock()
 
     def get(self, key: str, default=None, timeout: int | None = None) -> Any:
         """Get value from cache with monitoring."""
@@ -92,6 +128,7 @@ class CacheManager:
 
             # Log cache metrics
             self._log_cache_operation("get", key, hit, response_time)
+            self._record(key, "hits" if hit else "misses")
 
             return value
 
@@ -190,11 +227,131 @@ class CacheManager:
         except Exception as e:
             logger.exception(f"Cache pattern invalidation failed for {pattern}: {e}")
 
+    def get_namespace_version(self, namespace: str) -> int:
+        """
+        Get the current version of a cache namespace.
+
+        Keys built with versioned_key() embed this version, so bumping it
+        invalidates every key in the namespace without pattern deletes.
+        """
+        try:
+            return cache.get(f"nsver:{namespace}", 0)
+        except Exception as e:
+            logger.exception(f"Cache version lookup failed for {namespace}: {e}")
+            return 0
+
+    def bump_namespace_version(self, namespace: str) -> int:
+        """Increment a namespace version, invalidating all its versioned keys."""
+        version_key = f"nsver:{namespace}"
+        try:
+            try:
+                version = cache.incr(version_key)
+            except ValueError:
+                # Key missing (or expired): start a new version sequence
+                version = int(time.time())
+                cache.set(version_key, version, None)
+            logger.debug(f"Bumped cache namespace {namespace} to version {version}")
+            return version
+        except Exception as e:
+            logger.exception(f"Cache version bump failed for {namespace}: {e}")
+            return 0
+
+    def versioned_key(self, namespace: str, *parts: Any) -> str:
+        """Build a cache key scoped to the current version of a namespace."""
+        version = self.get_namespace_version(namespace)
+        suffix = ":".join(str(part) for part in parts)
+        return (
+            f"{namespace}:v{version}:{suffix}" if suffix else f"{namespace}:v{version}"
+        )
+
+    def multi_versioned_key(self, namespaces: Iterable[str], *parts: Any) -> str:
+        """
+        Build a key scoped to the versions of several namespaces.
+
+        Bumping any of the namespaces invalidates the key. All versions are
+        fetched with a single GET_MANY. The first part should be a stable
+        label, as metrics are grouped by it.
+        """
+        namespaces = list(namespaces)
+        try:
+            versions = cache.get_many([f"nsver:{ns}" for ns in namespaces])
+        except Exception as e:
+            logger.exception(f"Cache version lookup failed for {namespaces}: {e}")
+            versions = {}
+
+        tag = ",".join(f"{ns}@{versions.get(f'nsver:{ns}', 0)}" for ns in namespaces)
+        digest = hashlib.md5(tag.encode()).hexdigest()[:12]
+        return ":".join([*(str(part) for part in parts), f"ns{digest}"])
+
+    def get_or_set(
+        self,
+        key: str,
+        producer: Callable[[], Any],
+        timeout: int | None = None,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Read-through lookup with stampede protection.
+
+        On a miss only one caller (holding a short-lived ``lock:<key>``) runs
+        the producer; concurrent callers poll briefly for its result and only
+        compute the value themselves if it does not appear in time.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock_key = f"lock:{key}"
+        try:
+            have_lock = cache.add(lock_key, 1, self.lock_timeout)
+        except Exception as e:
+            logger.warning(f"Cache lock failed for key {key}: {e}")
+            have_lock = False
+
+        if not have_lock:
+            self._record(key, "lock_waits")
+            deadline = time.monotonic() + self.lock_wait
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                try:
+                    value = cache.get(key, _MISSING)
+                except Exception:
+                    break
+                if value is not _MISSING:
+                    return value
+            self._record(key, "lock_timeouts")
+
+        try:
+            value = producer()
+            if cacheable is None or cacheable(value):
+                self.set(key, value, timeout)
+            return value
+        finally:
+            if have_lock:
+                self.delete(lock_key)
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        """Hit/miss counters per key prefix for this process."""
+        with self._metrics_lock:
+            metrics = {prefix: dict(counts) for prefix, counts in self._metrics.items()}
+
+        for counts in metrics.values():
+            lookups = counts.get("hits", 0) + counts.get("misses", 0)
+            counts["hit_rate"] = counts.get("hits", 0) / lookups if lookups else 0.0
+        return metrics
+
+    def _record(self, key: str, counter: str):
+        prefix = key.split(":", 1)[0]
+        with self._metrics_lock:
+            self._metrics[prefix][counter] += 1
+
     def _log_cache_operation(
         self, operation: str, key: str, success: bool, response_time: float
     ):
-        """Log cache operation metrics."""
-        # This could be enhanced to send metrics to monitoring systems
+        """Record cache operation timing and log slow or failed operations."""
+        from .instrumentation import record
+
+        record("cache", response_time / 1000)
         if response_time > 100 or not success:
             logger.info(
                 f"Cache {operation.upper()}: key={key}, success={success}, "
@@ -322,36 +479,100 @@ class CacheInvalidator:
     @staticmethod
     def invalidate_user_caches(user_id: int):
         """Invalidate all caches for a specific user."""
-        patterns = [
-            f"user:{user_id}:*",
-            f"*:user:{user_id}:*",
-            f"api:*:user:{user_id}:*",
-        ]
-
-        for pattern in patterns:
-            cache_manager.invalidate_pattern(pattern)
+        cache_manager.bump_namespace_version(CacheKeyGenerator.user_key(user_id))
+        cache_manager.bump_namespace_version(
+            CacheKeyGenerator.user_notebooks_namespace(user_id)
+        )
 
         logger.info(f"Invalidated user caches for user {user_id}")
 
+    @staticmethod
+    def invalidate_user_notebooks(user_id: int):
+        """Invalidate cached notebook lists for a user."""
+        cache_manager.bump_namespace_version(
+            CacheKeyGenerator.user_notebooks_namespace(user_id)
+        )
+
     @staticmethod
     def invalidate_notebook_caches(notebook_id: str):
         """Invalidate all caches for a specific notebook."""
-        patterns = [f"notebook:{notebook_id}:*", f"*:notebook:{notebook_id}:*"]
-
-        for pattern in patterns:
-            cache_manager.invalidate_pattern(pattern)
+        cache_manager.bump_namespace_version(
+            CacheKeyGenerator.notebook_key(notebook_id)
+        )
 
         logger.info(f"Invalidated notebook caches for notebook {notebook_id}")
 
+    @staticmethod
+    def invalidate_file_caches(file_id: str):
+        """Invalidate all caches for a specific knowledge base item."""
+        cache_manager.bump_namespace_version(CacheKeyGenerator.file_key(file_id))
+
     @staticmethod
     def invalidate_model_caches(model_name: str):
         """Invalidate all caches for a specific model."""
-        patterns = [f"query:{model_name}:*", f"queryset:{model_name}:*"]
-
-        for pattern in patterns:
-            cache_manager.invalidate_pattern(pattern)
-
-        logger.info(f"Invalidated model caches for {model_name}")
+        cache_manager.bump_namespace_version(
+            CacheKeyGenerator.model_namespace(model_name)
+        )
+
+        logger.debug(f"Invalidated model caches for {model_name}")
+
+
+class CachedResponseMixin:
+    """
+    Serve DRF ``list``/``retrieve`` responses through the cache.
+
+    Subclasses return the namespaces their responses depend on from
+    get_cache_namespaces(); core.cache_signals bumps those namespaces when
+    the underlying rows change. Only 200 responses are cached.
+    """
+
+    cache_actions = ("list", "retrieve")
+    cache_timeout: int | None = None
+    # Whether responses differ per user (e.g. owner-filtered querysets)
+    cache_per_user = True
+
+    def get_cache_namespaces(self) -> list[str]:
+        raise NotImplementedError
+
+    def _cache_key(self, request) -> str:
+        user_part = (
+            f"user:{request.user.pk}"
+            if self.cache_per_user and request.user.is_authenticated
+            else "shared"
+        )
+        # Absolute URI: paginated responses embed next/previous links
+        uri_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()[:16]
+        return cache_manager.multi_versioned_key(
+            self.get_cache_namespaces(),
+            f"api_{self.basename}",
+            self.action,
+            user_part,
+            uri_hash,
+        )
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        from rest_framework.response import Response
+
+        if self.action not in self.cache_actions:
+            return handler(request, *args, **kwargs)
+
+        def produce():
+            response = handler(request, *args, **kwargs)
+            return response.status_code, response.data
+
+        status_code, data = cache_manager.get_or_set(
+            self._cache_key(request),
+            produce,
+            self.cache_timeout,
+            cacheable=lambda result: result[0] == 200,
+        )
+        return Response(data, status=status_code)
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
 
 
 def warm_cache():
@@ -0,0 +1,106 @@
+"""
+Cache invalidation for the read-through response caches.
+
+Cached responses (see core.cache.CachedResponseMixin) embed the versions of
+the namespaces they depend on. The receivers below bump those namespaces
+after the transaction that changed a row commits. They are connected from
+CoreConfig.ready() on their own, without the rest of core.signals, and do
+no extra work on writes to models that no cached response depends on.
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import CacheInvalidator, CacheKeyGenerator, cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _after_commit(func, *args):
+    """Run a cache invalidation once the current transaction commits.
+
+    Invalidating earlier would let a concurrent request re-cache the
+    pre-commit state under the new namespace version.
+    """
+    transaction.on_commit(lambda: func(*args))
+
+
+# Conference models whose responses are cached under their model namespace
+CONFERENCE_CACHED_MODELS = {
+    "conferences.venue",
+    "conferences.instance",
+    "conferences.publication",
+}
+
+# Notebook content shown in the (cached) notebook list counts
+NOTEBOOK_LIST_MODELS = {
+    "notebooks.knowledgebaseitem",
+    "notebooks.chatsession",
+    "notebooks.sessionchatmessage",
+}
+
+
+def _notebook_owner_id(notebook_id):
+    from notebooks.models import Notebook
+
+    return (
+        Notebook.objects.filter(pk=notebook_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+
+
+def _invalidate_cached_responses(model_name: str, instance):
+    """Bump the cache namespaces that depend on a changed row."""
+    if model_name in CONFERENCE_CACHED_MODELS:
+        _after_commit(CacheInvalidator.invalidate_model_caches, model_name)
+        if model_name == "conferences.publication":
+            _after_commit(
+                cache_manager.bump_namespace_version,
+                CacheKeyGenerator.conference_instance_namespace(instance.instance_id),
+            )
+
+    elif model_name == "notebooks.notebook":
+        _after_commit(CacheInvalidator.invalidate_user_notebooks, instance.user_id)
+        _after_commit(CacheInvalidator.invalidate_notebook_caches, str(instance.pk))
+
+    elif model_name in NOTEBOOK_LIST_MODELS:
+        notebook = instance._meta.get_field("notebook").get_cached_value(
+            instance, default=None
+        )
+        user_id = (
+            notebook.user_id
+            if notebook is not None
+            else _notebook_owner_id(instance.notebook_id)
+        )
+        if user_id:
+            _after_commit(CacheInvalidator.invalidate_user_notebooks, user_id)
+        if model_name == "notebooks.knowledgebaseitem":
+            _after_commit(CacheInvalidator.invalidate_file_caches, str(instance.pk))
+
+    elif model_name == "notebooks.knowledgebaseimage":
+        _after_commit(
+            CacheInvalidator.invalidate_file_caches,
+            str(instance.knowledge_base_item_id),
+        )
+
+
+@receiver(post_save, dispatch_uid="core.cache_signals.post_save")
+def invalidate_on_save(sender, instance, **kwargs):
+    model_name = sender._meta.label_lower
+    try:
+        _invalidate_cached_responses(model_name, instance)
+    except Exception as e:
+        logger.exception(f"Cache invalidation failed for {model_name}: {e}")
+
+
+@receiver(post_delete, dispatch_uid="core.cache_signals.post_delete")
+def invalidate_on_delete(sender, instance, **kwargs):
+    model_name = sender._meta.label_lower
+    try:
+        _invalidate_cached_responses(model_name, instance)
+    except Exception as e:
+        logger.exception(f"Cache invalidation failed for {model_name}: {e}")
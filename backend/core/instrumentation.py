@@ -0,0 +1,478 @@
+"""
+Request- and task-level performance instrumentation.
+
+Each request (via RequestTimingMiddleware) or Celery task runs inside a
+``Profile`` held in a context variable. While it is active, the time spent in
+each dependency is counted and accumulated:
+
+- ``db``: SQL queries, through ``connection.execute_wrapper``
+- ``cache``: CacheManager operations
+- ``minio``: MinIO client calls (see ``InstrumentedClient``)
+- ``http``: outgoing httpx/requests calls (RagFlow, LLM providers, fetchers)
+
+The breakdown is returned to browsers as a ``Server-Timing`` header and
+aggregated into Prometheus metrics. Each process (web or Celery worker)
+periodically adds its new samples to a shared Redis hash, so
+``metrics_view`` exposes the totals of every process, not just its own.
+Repeated executions of the same parametrized SQL within one profile are
+reported as likely N+1 query patterns.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+
+import redis
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEPENDENCIES = ("db", "cache", "minio", "http")
+
+# Histogram buckets in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+# ==============================================================================
+# PER-REQUEST PROFILE
+# ==============================================================================
+
+
+@dataclass
+class Profile:
+    """Dependency timings accumulated for one request or task."""
+
+    name: str
+    started: float = field(default_factory=time.perf_counter)
+    counts: Counter = field(default_factory=Counter)
+    durations: defaultdict = field(default_factory=lambda: defaultdict(float))
+    queries: Counter = field(default_factory=Counter)
+
+    def record(self, dependency: str, seconds: float) -> None:
+        self.counts[dependency] += 1
+        self.durations[dependency] += seconds
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def repeated_queries(self, threshold: int) -> list[tuple[str, int]]:
+        """Parametrized SQL executed at least ``threshold`` times."""
+        return [(sql, n) for sql, n in self.queries.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        """Render the breakdown as a Server-Timing header value."""
+        parts = [
+            f"{dep};dur={self.durations[dep] * 1000:.1f};"
+            f'desc="{self.counts[dep]} calls"'
+            for dep in DEPENDENCIES
+            if self.counts[dep]
+        ]
+        parts.append(f"total;dur={self.elapsed * 1000:.1f}")
+        return ", ".join(parts)
+
+
+_current_profile: ContextVar[Profile | None] = ContextVar(
+    "instrumentation_profile", default=None
+)
+
+
+def current_profile() -> Profile | None:
+    return _current_profile.get()
+
+
+def record(dependency: str, seconds: float) -> None:
+    """Attribute time spent in a dependency to the active profile and metrics."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record(dependency, seconds)
+    metrics.observe(
+        "deepsight_dependency_duration_seconds", seconds, dependency=dependency
+    )
+
+
+@contextmanager
+def timed(dependency: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(dependency, time.perf_counter() - start)
+
+
+def _sql_wrapper(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record("db", time.perf_counter() - start)
+        profile = _current_profile.get()
+        if profile is not None:
+            # Django passes parametrized SQL, so repeats share one template
+            profile.queries[sql] += 1
+
+
+@contextmanager
+def profiled(name: str) -> Iterator[Profile]:
+    """Collect dependency timings for the enclosed block."""
+    profile = Profile(name=name)
+    token = _current_profile.set(profile)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_sql_wrapper))
+            yield profile
+    finally:
+        _current_profile.reset(token)
+        _check_n_plus_one(profile)
+
+
+def _check_n_plus_one(profile: Profile) -> None:
+    threshold = getattr(settings, "N_PLUS_ONE_THRESHOLD", 10)
+    repeated = profile.repeated_queries(threshold)
+    if not repeated:
+        return
+
+    metrics.inc("deepsight_n_plus_one_total", target=profile.name)
+    sql, n = repeated[0]
+    logger.warning(
+        f"Possible N+1 queries in {profile.name}: {n} executions of "
+        f"{sql[:300]!r} ({len(repeated)} repeated statement(s))"
+    )
+
+
+# ==============================================================================
+# CLIENT WRAPPERS
+# ==============================================================================
+
+
+class InstrumentedClient:
+    """
+    Transparent proxy that times every method call on a client object.
+
+    Used for the MinIO client, so storage time is attributed without touching
+    each call site. Calls returning streams are timed until the response
+    headers arrive.
+    """
+
+    def __init__(self, client, dependency: str):
+        self._client = client
+        self._dependency = dependency
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+
+        @wraps(attr)
+        def call(*args, **kwargs):
+            with timed(self._dependency):
+                return attr(*args, **kwargs)
+
+        return call
+
+
+def _wrap_send(send: Callable, dependency: str) -> Callable:
+    @wraps(send)
+    def instrumented_send(*args, **kwargs):
+        with timed(dependency):
+            return send(*args, **kwargs)
+
+    return instrumented_send
+
+
+def _wrap_async_send(send: Callable, dependency: str) -> Callable:
+    @wraps(send)
+    async def instrumented_send(*args, **kwargs):
+        with timed(dependency):
+            return await send(*args, **kwargs)
+
+    return instrumented_send
+
+
+_installed = False
+
+
+def install() -> None:
+    """Hook outgoing HTTP clients and Celery tasks (idempotent)."""
+    global _installed
+    if _installed or not getattr(settings, "INSTRUMENTATION_ENABLED", True):
+        return
+    _installed = True
+
+    try:
+        import requests
+
+        requests.Session.send = _wrap_send(requests.Session.send, "http")
+    except ImportError:
+        pass
+
+    try:
+        import httpx
+
+        httpx.Client.send = _wrap_send(httpx.Client.send, "http")
+        httpx.AsyncClient.send = _wrap_async_send(httpx.AsyncClient.send, "http")
+    except ImportError:
+        pass
+
+    _connect_celery_signals()
+
+
+# ==============================================================================
+# CELERY TASKS
+# ==============================================================================
+
+_task_profiles: dict[str, tuple] = {}
+
+
+def _connect_celery_signals() -> None:
+    from celery.signals import task_postrun, task_prerun
+
+    @task_prerun.connect(weak=False)
+    def _start_task_profile(task_id=None, task=None, **kwargs):
+        cm = profiled(task.name if task else "celery")
+        _task_profiles[task_id] = (cm, cm.__enter__())
+
+    @task_postrun.connect(weak=False)
+    def _finish_task_profile(task_id=None, task=None, state=None, **kwargs):
+        entry = _task_profiles.pop(task_id, None)
+        if entry is None:
+            return
+        cm, profile = entry
+        cm.__exit__(None, None, None)
+        metrics.observe(
+            "deepsight_celery_task_duration_seconds",
+            profile.elapsed,
+            task=profile.name,
+            state=state or "UNKNOWN",
+        )
+        logger.debug(f"Task {profile.name} timings: {profile.server_timing()}")
+        shared_metrics.maybe_flush()
+
+
+# ==============================================================================
+# PROMETHEUS METRICS
+# ==============================================================================
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms in Prometheus text format."""
+
+    def __init__(self, buckets: tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._counters: dict[tuple, float] = defaultdict(float)
+        self._histograms: dict[tuple, list[float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        with self._lock:
+            self._counters[self._key(name, labels)] += amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            # Per-bucket counts, then sum and count
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[i] += 1
+                    break
+            hist[-2] += value
+            hist[-1] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> tuple[dict[tuple, float], dict[tuple, list[float]]]:
+        """Copies of the counters and histograms, keyed by (name, labels)."""
+        with self._lock:
+            return dict(self._counters), {
+                key: list(values) for key, values in self._histograms.items()
+            }
+
+    @staticmethod
+    def _labels(labels: tuple, extra: tuple = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return ""
+        escaped = (
+            (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in pairs
+        )
+        return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+    def render(self) -> str:
+        return self.render_values(*self.snapshot())
+
+    def render_values(
+        self, counters: dict[tuple, float], histograms: dict[tuple, list[float]]
+    ) -> str:
+        counters = sorted(counters.items())
+        histograms = sorted(histograms.items())
+
+        lines: list[str] = []
+        typed: set[str] = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{self._labels(labels)} {value:g}")
+
+        for (name, labels), values in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values, strict=False):
+                cumulative += count
+                le = (("le", f"{bound:g}"),)
+                lines.append(f"{name}_bucket{self._labels(labels, le)} {cumulative:g}")
+            inf = (("le", "+Inf"),)
+            lines.append(f"{name}_bucket{self._labels(labels, inf)} {values[-1]:g}")
+            lines.append(f"{name}_sum{self._labels(labels)} {values[-2]:g}")
+            lines.append(f"{name}_count{self._labels(labels)} {values[-1]:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+class SharedMetricsStore:
+    """
+    Totals of every process's metrics in one Redis hash.
+
+    Processes add the samples recorded since their last flush with
+    HINCRBYFLOAT, at most every METRICS_FLUSH_INTERVAL seconds (after a
+    request or a Celery task) and before rendering a scrape. Each hash field
+    is one counter or one histogram component, encoded as JSON.
+    """
+
+    KEY = "deepsight:metrics"
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._client = None
+        self._flushed: tuple[dict, dict] = ({}, {})
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "METRICS_SHARED_ENABLED", True)
+
+    @property
+    def flush_interval(self) -> float:
+        return getattr(settings, "METRICS_FLUSH_INTERVAL", 10)
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            url = getattr(settings, "METRICS_REDIS_URL", None) or (
+                settings.CELERY_BROKER_URL
+            )
+            self._client = redis.Redis.from_url(
+                url, decode_responses=True, socket_timeout=0.5
+            )
+        return self._client
+
+    def maybe_flush(self) -> None:
+        if self.enabled and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Add this process's samples since the last flush to the shared totals."""
+        if not self._lock.acquire(blocking=False):
+            return  # Another thread is flushing
+        try:
+            self._last_flush = time.monotonic()
+            counters, histograms = self.registry.snapshot()
+            prev_counters, prev_histograms = self._flushed
+
+            pipe = self.client.pipeline(transaction=False)
+            for (name, labels), value in counters.items():
+                delta = value - prev_counters.get((name, labels), 0.0)
+                if delta:
+                    pipe.hincrbyfloat(self.KEY, self._field("c", name, labels), delta)
+            for (name, labels), values in histograms.items():
+                prev = prev_histograms.get((name, labels)) or [0.0] * len(values)
+                for i, (value, before) in enumerate(zip(values, prev, strict=True)):
+                    if value != before:
+                        field_name = self._field("h", name, labels, i)
+                        pipe.hincrbyfloat(self.KEY, field_name, value - before)
+            pipe.execute()
+            # Only advance once written, so failed deltas go out next time
+            self._flushed = (counters, histograms)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to flush metrics to Redis: {e}")
+        finally:
+            self._lock.release()
+
+    def read(self) -> tuple[dict, dict] | None:
+        """The shared totals, or None when Redis is unavailable."""
+        try:
+            raw = self.client.hgetall(self.KEY)
+        except redis.RedisError as e:
+            logger.warning(f"Shared metrics unavailable from Redis: {e}")
+            return None
+
+        counters: dict[tuple, float] = {}
+        histograms: dict[tuple, list[float]] = {}
+        size = len(self.registry.buckets) + 2
+        for field_name, value in raw.items():
+            kind, name, labels, *index = json.loads(field_name)
+            key = (name, tuple(tuple(pair) for pair in labels))
+            if kind == "c":
+                counters[key] = float(value)
+            elif index and index[0] < size:
+                histograms.setdefault(key, [0.0] * size)[index[0]] = float(value)
+        return counters, histograms
+
+    @staticmethod
+    def _field(kind: str, name: str, labels: tuple, *index: int) -> str:
+        return json.dumps([kind, name, [list(pair) for pair in labels], *index])
+
+
+shared_metrics = SharedMetricsStore(metrics)
+
+
+def render_metrics() -> str:
+    """Render all processes' metrics plus this process's cache hit/miss counters."""
+    from .cache import cache_manager
+
+    shared = None
+    if shared_metrics.enabled:
+        shared_metrics.flush()
+        shared = shared_metrics.read()
+    # Without Redis only this process's own metrics are available
+    body = metrics.render_values(*shared) if shared else metrics.render()
+
+    lines = [body.rstrip("\n")]
+    cache_metrics = cache_manager.get_metrics()
+    if cache_metrics:
+        lines.append("# TYPE deepsight_cache_lookups_total counter")
+        for prefix, counts in sorted(cache_metrics.items()):
+            for result in ("hits", "misses"):
+                labels = MetricsRegistry._labels(
+                    (("namespace", prefix), ("result", result))
+                )
+                lines.append(
+                    f"deepsight_cache_lookups_total{labels} {counts.get(result, 0):g}"
+                )
+    return "\n".join(line for line in lines if line) + "\n"
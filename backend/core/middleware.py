@@ -11,6 +11,7 @@ Provides middleware for:
 
 import json
 import logging
+import re
 import time
 import uuid
 from collections.abc import Callable
@@ -20,6 +21,15 @@ from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils import timezone
 
+from .instrumentation import metrics, profiled, shared_metrics
+from .rate_limit import (
+    DEFAULT_EXEMPT_READ_PATTERNS,
+    DEFAULT_RATE_LIMIT_RULES,
+    EXEMPT_PATH_PATTERNS,
+    RateLimitRule,
+    get_rate_limiter,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +40,10 @@ class RequestTimingMiddleware:
     Adds response headers:
     - X-Request-Time: Processing time in milliseconds
     - X-Request-ID: Unique request identifier
+    - Server-Timing: Time spent in the database, cache, MinIO and outgoing
+      HTTP calls (see core.instrumentation)
+
+    Also records request counts and durations for the metrics endpoint.
     """
 
     def __init__(self, get_response: Callable):
@@ -40,28 +54,49 @@ class RequestTimingMiddleware:
         request_id = str(uuid.uuid4())[:8]
         request.request_id = request_id
 
-        # Record start time
-        start_time = time.time()
-
-        # Process request
-        response = self.get_response(request)
+        with profiled(f"{request.method} {request.path}") as profile:
+            response = self.get_response(request)
+            # Name the profile by route so N+1 reports group across ids
+            route = self._route(request)
+            profile.name = f"{request.method} {route}"
 
         # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = profile.elapsed * 1000
 
         # Add headers
         response["X-Request-Time"] = f"{processing_time:.2f}ms"
         response["X-Request-ID"] = request_id
+        response["Server-Timing"] = profile.server_timing()
+
+        metrics.inc(
+            "deepsight_http_requests_total",
+            method=request.method,
+            route=route,
+            status=response.status_code,
+        )
+        metrics.observe(
+            "deepsight_http_request_duration_seconds",
+            profile.elapsed,
+            method=request.method,
+            route=route,
+        )
+        shared_metrics.maybe_flush()
 
         # Log slow requests
         if processing_time > getattr(settings, "SLOW_REQUEST_THRESHOLD_MS", 1000):
             logger.warning(
                 f"Slow request detected: {request.method} {request.path} "
-                f"took {processing_time:.2f}ms (ID: {request_id})"
+                f"took {processing_time:.2f}ms (ID: {request_id}) "
+                f"[{profile.server_timing()}]"
             )
 
         return response
 
+    @staticmethod
+    def _route(request: HttpRequest) -> str:
+        match = getattr(request, "resolver_match", None)
+        return match.route if match and match.route else "unmatched"
+
 
 class RequestLoggingMiddleware:
     """
@@ -114,9 +149,9 @@ class RequestLoggingMiddleware:
             "request_id": getattr(request, "request_id", "unknown"),
             "status_code": response.status_code,
             "content_type": response.get("Content-Type", ""),
-            "response_size": len(response.content)
-            if hasattr(response, "content")
-            else 0,
+            "response_size": (
+                len(response.content) if hasattr(response, "content") else 0
+            ),
         }
 
         # Log response body for errors (sanitized)
@@ -172,67 +207,108 @@ class RequestLoggingMiddleware:
 
 class RateLimitMiddleware:
     """
-    Simple rate limiting middleware.
+    Sliding-window rate limiting middleware.
 
     Implements per-IP and per-user rate limiting with configurable limits.
+    Each request costs one unit of the "default" bucket unless it matches a
+    RATE_LIMIT_RULES entry, which assigns its own cost and bucket (see
+    core.rate_limit). Checks are a single atomic Redis round-trip.
+
+    Opt-in via RATE_LIMIT_ENABLED. Health checks, /metrics/ and the read
+    paths clients poll (job status, SSE, file and image fetches) are exempt.
     """
 
+    SAFE_METHODS = ("GET", "HEAD")
+
     def __init__(self, get_response: Callable):
         self.get_response = get_response
         self.default_rate_limit = getattr(
             settings, "DEFAULT_RATE_LIMIT", 1000
         )  # requests per hour
-        self.rate_limit_period = 3600  # 1 hour in seconds
+        self.rate_limit_period = getattr(
+            settings, "RATE_LIMIT_PERIOD", 3600
+        )  # 1 hour in seconds
+        self.rules = [
+            RateLimitRule.from_config(config)
+            for config in getattr(
+                settings, "RATE_LIMIT_RULES", DEFAULT_RATE_LIMIT_RULES
+            )
+        ]
+        self.exempt_paths = [re.compile(p) for p in EXEMPT_PATH_PATTERNS]
+        self.exempt_read_paths = [
+            re.compile(p)
+            for p in getattr(
+                settings, "RATE_LIMIT_EXEMPT_READ_PATHS", DEFAULT_EXEMPT_READ_PATTERNS
+            )
+        ]
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Skip rate limiting for certain paths
-        if (
-            request.path.startswith("/static/")
-            or request.path.startswith("/media/")
-            or request.path == "/health/"
-        ):
+        if not getattr(settings, "RATE_LIMIT_ENABLED", False):
+            return self.get_response(request)
+        if self._is_exempt(request):
             return self.get_response(request)
 
         # Get rate limit key
         if request.user.is_authenticated:
-            rate_key = f"rate_limit:user:{request.user.id}"
+            identity = f"user:{request.user.id}"
             rate_limit = getattr(settings, "USER_RATE_LIMIT", self.default_rate_limit)
         else:
-            ip = self._get_client_ip(request)
-            rate_key = f"rate_limit:ip:{ip}"
+            identity = f"ip:{self._get_client_ip(request)}"
             rate_limit = getattr(
                 settings, "ANONYMOUS_RATE_LIMIT", self.default_rate_limit // 10
             )
 
-        # Check current count
-        current_count = cache.get(rate_key, 0)
+        cost, scope, period = 1, "default", self.rate_limit_period
+        rule = self._match_rule(request)
+        if rule is not None:
+            cost, scope = rule.cost, rule.scope
+            rate_limit = rule.limit or rate_limit
+            period = rule.period or period
+
+        rate_key = f"rate_limit:{scope}:{identity}"
+        result = get_rate_limiter().hit(rate_key, rate_limit, period, cost)
 
-        if current_count >= rate_limit:
+        if not result.allowed:
             logger.warning(
-                f"Rate limit exceeded for {rate_key}: {current_count}/{rate_limit}"
+                f"Rate limit exceeded for {rate_key}: cost {cost}, limit {rate_limit}"
             )
-            return JsonResponse(
+            response = JsonResponse(
                 {
                     "error": "Rate limit exceeded",
                     "limit": rate_limit,
-                    "period": self.rate_limit_period,
-                    "retry_after": self.rate_limit_period,
+                    "period": period,
+                    "scope": scope,
+                    "retry_after": result.retry_after,
                 },
                 status=429,
             )
-
-        # Increment count
-        cache.set(rate_key, current_count + 1, self.rate_limit_period)
+            response["Retry-After"] = str(result.retry_after)
+            self._add_headers(response, result)
+            return response
 
         # Process request
         response = self.get_response(request)
+        self._add_headers(response, result)
+        return response
 
-        # Add rate limit headers
-        response["X-RateLimit-Limit"] = str(rate_limit)
-        response["X-RateLimit-Remaining"] = str(max(0, rate_limit - current_count - 1))
-        response["X-RateLimit-Reset"] = str(int(time.time()) + self.rate_limit_period)
+    def _is_exempt(self, request: HttpRequest) -> bool:
+        path = request.path
+        if any(pattern.search(path) for pattern in self.exempt_paths):
+            return True
+        return request.method in self.SAFE_METHODS and any(
+            pattern.search(path) for pattern in self.exempt_read_paths
+        )
 
-        return response
+    def _match_rule(self, request: HttpRequest):
+        for rule in self.rules:
+            if rule.matches(request.method, request.path):
+                return rule
+        return None
+
+    def _add_headers(self, response: HttpResponse, result):
+        response["X-RateLimit-Limit"] = str(result.limit)
+        response["X-RateLimit-Remaining"] = str(result.remaining)
+        response["X-RateLimit-Reset"] = str(int(time.time()) + result.reset_after)
 
     def _get_client_ip(self, request: HttpRequest) -> str:
         """Get the client's IP address."""
@@ -0,0 +1,277 @@
+"""
+Sliding-window rate limiting for RateLimitMiddleware.
+
+Uses the sliding window counter algorithm: each bucket keeps a counter for
+the current and the previous fixed window, and the usage at time ``t`` is
+
+    previous * (1 - elapsed_fraction) + current
+
+Requests carry a cost, so expensive endpoints consume more of a bucket.
+
+Two backends share the algorithm:
+- RedisRateLimiter: a Lua script performs the check-and-increment
+  atomically in one round-trip, using the Redis server clock
+- LocalRateLimiter: in-process counters, used in tests/development and as
+  the fallback when Redis is unavailable
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the request would be allowed (0 when allowed)
+    retry_after: int
+    # Seconds until the current window rolls over
+    reset_after: int
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Cost and bucket for requests matching a path pattern.
+
+    Requests matching a rule are counted against the rule's ``scope`` bucket,
+    so expensive endpoints can be limited separately from cheap reads.
+    ``limit``/``period`` of None fall back to the middleware defaults.
+    """
+
+    name: str
+    pattern: re.Pattern
+    methods: frozenset[str] | None = None
+    cost: int = 1
+    scope: str = "default"
+    limit: int | None = None
+    period: int | None = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "RateLimitRule":
+        methods = config.get("methods")
+        return cls(
+            name=config["name"],
+            pattern=re.compile(config["pattern"]),
+            methods=frozenset(m.upper() for m in methods) if methods else None,
+            cost=int(config.get("cost", 1)),
+            scope=config.get("scope", config["name"]),
+            limit=config.get("limit"),
+            period=config.get("period"),
+        )
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return bool(self.pattern.match(path))
+
+
+# Expensive endpoints; override with the RATE_LIMIT_RULES setting
+DEFAULT_RATE_LIMIT_RULES = [
+    {
+        "name": "semantic_search",
+        "pattern": r"^/api/v1/semantic-search/publications/stream/$",
+        "methods": ["POST"],
+        "limit": 120,
+    },
+    {
+        "name": "report_generation",
+        "pattern": r"^/api/v1/reports/$",
+        "methods": ["POST"],
+        "scope": "generation",
+        "cost": 5,
+        "limit": 100,
+    },
+    {
+        "name": "podcast_generation",
+        "pattern": r"^/api/v1/podcasts/$",
+        "methods": ["POST"],
+        "scope": "generation",
+        "cost": 5,
+        "limit": 100,
+    },
+    {
+        "name": "studio_execute",
+        "pattern": r"^/api/v1/notebooks/[^/]+/studio/execute/$",
+        "scope": "generation",
+        "cost": 5,
+        "limit": 100,
+    },
+]
+
+
+# Never limited: probes, scrapers and static files
+EXEMPT_PATH_PATTERNS = [
+    r"^/(static|media)/",
+    r"^/health/$",
+    r"^/metrics/$",
+]
+
+# Reads issued by polling and rendering (job status, SSE streams, inline
+# images, file and segment fetches); exempt for GET/HEAD only. Override with
+# the RATE_LIMIT_EXEMPT_READ_PATHS setting.
+DEFAULT_EXEMPT_READ_PATTERNS = [
+    r"^/api/v1/(reports|podcasts)/[^/]+/$",
+    r"/stream/$",
+    r"/inline/$",
+    r"/files/",
+    r"^/api/v1/reports/[^/]+/(content|download|download-pdf)/$",
+    r"^/api/v1/podcasts/[^/]+/(audio/|playlist\.m3u8|segments/\d+/)$",
+]
+
+
+# KEYS[1]: bucket key; ARGV: limit, cost, period (seconds)
+# Returns {allowed, remaining, retry_after_ms, reset_ms}
+SLIDING_WINDOW_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local period_ms = tonumber(ARGV[3]) * 1000
+
+local window = math.floor(now_ms / period_ms)
+local cur_key = KEYS[1] .. ':' .. window
+local prev_key = KEYS[1] .. ':' .. (window - 1)
+local cur = tonumber(redis.call('GET', cur_key) or '0')
+local prev = tonumber(redis.call('GET', prev_key) or '0')
+
+local into_window = now_ms % period_ms
+local used = prev * (1 - into_window / period_ms) + cur
+local reset_ms = period_ms - into_window
+
+if used + cost > limit then
+    local retry_ms = reset_ms
+    if cur + cost <= limit and prev > 0 then
+        -- The previous window's weight decays by prev/period per ms
+        retry_ms = math.ceil((used + cost - limit) * period_ms / prev)
+    end
+    return {0, math.floor(limit - used), retry_ms, reset_ms}
+end
+
+redis.call('INCRBY', cur_key, cost)
+redis.call('PEXPIRE', cur_key, period_ms * 2)
+return {1, math.floor(limit - used - cost), 0, reset_ms}
+"""
+
+
+class LocalRateLimiter:
+    """In-process sliding window counters (per worker process)."""
+
+    MAX_BUCKETS = 10000
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, period: int, cost: int = 1) -> RateLimitResult:
+        now = time.time()
+        window = int(now // period)
+        into_window = now - window * period
+        reset_after = period - into_window
+
+        with self._lock:
+            bucket_window, cur, prev = self._buckets.get(key, (window, 0, 0))
+            if bucket_window != window:
+                # Roll forward; anything older than one window has expired
+                prev = cur if bucket_window == window - 1 else 0
+                cur = 0
+
+            used = prev * (1 - into_window / period) + cur
+            if used + cost > limit:
+                retry_after = reset_after
+                if cur + cost <= limit and prev > 0:
+                    retry_after = (used + cost - limit) * period / prev
+                self._buckets[key] = (window, cur, prev)
+                return RateLimitResult(
+                    allowed=False,
+                    limit=limit,
+                    remaining=0,
+                    retry_after=math.ceil(retry_after),
+                    reset_after=math.ceil(reset_after),
+                )
+
+            self._buckets[key] = (window, cur + cost, prev)
+            if len(self._buckets) > self.MAX_BUCKETS:
+                self._prune(window)
+
+        return RateLimitResult(
+            allowed=True,
+            limit=limit,
+            remaining=max(0, math.floor(limit - used - cost)),
+            retry_after=0,
+            reset_after=math.ceil(reset_after),
+        )
+
+    def _prune(self, window: int):
+        stale = [k for k, (w, _, _) in self._buckets.items() if w < window - 1]
+        for key in stale:
+            del self._buckets[key]
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class RedisRateLimiter:
+    """Atomic sliding window counters in Redis, one round-trip per check."""
+
+    def __init__(self, url: str, fallback: LocalRateLimiter | None = None):
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.script = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+        self.fallback = fallback or LocalRateLimiter()
+
+    def hit(self, key: str, limit: int, period: int, cost: int = 1) -> RateLimitResult:
+        try:
+            # Hash tag keeps both window keys in one cluster slot
+            allowed, remaining, retry_ms, reset_ms = self.script(
+                keys=[f"{{{key}}}"], args=[limit, cost, period]
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Rate limiter falling back to local counters: {e}")
+            return self.fallback.hit(key, limit, period, cost)
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=max(0, int(remaining)),
+            retry_after=math.ceil(int(retry_ms) / 1000),
+            reset_after=math.ceil(int(reset_ms) / 1000),
+        )
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> LocalRateLimiter | RedisRateLimiter:
+    """
+    Return the process-wide rate limiter.
+
+    RATE_LIMIT_BACKEND selects "redis" (default) or "local". The Redis URL
+    is RATE_LIMIT_REDIS_URL, falling back to the Celery broker.
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                backend = getattr(settings, "RATE_LIMIT_BACKEND", "redis")
+                if backend == "local":
+                    _limiter = LocalRateLimiter()
+                else:
+                    url = getattr(settings, "RATE_LIMIT_REDIS_URL", None) or (
+                        settings.CELERY_BROKER_URL
+                    )
+                    _limiter = RedisRateLimiter(url)
+    return _limiter
@@ -23,6 +23,9 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 
+from .cache import CacheInvalidator
+from .cache_signals import _after_commit
+
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
@@ -121,7 +124,7 @@ class SignalHandlers:
         )
 
         # Invalidate user's notebook list cache
-        cache.delete(f"user_notebooks:{user.id}")
+        _after_commit(CacheInvalidator.invalidate_user_notebooks, user.id)
 
         # Initialize notebook-specific resources if needed
         try:
@@ -142,8 +145,8 @@ class SignalHandlers:
         )
 
         # Invalidate related caches
-        cache.delete(f"user_notebooks:{user.id}")
-        cache.delete(f"notebook_stats:{notebook.id}")
+        _after_commit(CacheInvalidator.invalidate_user_notebooks, user.id)
+        _after_commit(CacheInvalidator.invalidate_notebook_caches, str(notebook.id))
 
     @staticmethod
     @receiver(notebook_deleted)
@@ -152,8 +155,8 @@ class SignalHandlers:
         logger.info(f"Notebook deleted: ID {notebook_id} by user {user.id}")
 
         # Cleanup related caches
-        cache.delete(f"user_notebooks:{user.id}")
-        cache.delete(f"notebook_stats:{notebook_id}")
+        _after_commit(CacheInvalidator.invalidate_user_notebooks, user.id)
+        _after_commit(CacheInvalidator.invalidate_notebook_caches, notebook_id)
 
         # Note: External resource cleanup is now handled in NotebookService.delete_notebook()
         # This signal handler only manages cross-cutting concerns like cache invalidation
@@ -291,16 +294,9 @@ class SignalHandlers:
 # Model-specific signal handlers using dynamic imports to avoid circular dependencies
 @receiver(post_save)
 def generic_model_post_save(sender, instance, created, **kwargs):
-    """Generic post-save handler for cache invalidation."""
+    """Generic post-save handler dispatching the custom model signals."""
     model_name = sender._meta.label_lower
 
-    # Invalidate model-specific caches
-    if hasattr(instance, "id"):
-        cache.delete(f"{model_name}:{instance.id}")
-
-    # Invalidate list caches
-    cache.delete(f"{model_name}_list")
-
     # Handle specific models
     if model_name == "notebooks.notebook":
         if created:
@@ -326,16 +322,9 @@ def generic_model_post_save(sender, instance, created, **kwargs):
 
 @receiver(post_delete)
 def generic_model_post_delete(sender, instance, **kwargs):
-    """Generic post-delete handler for cache invalidation."""
+    """Generic post-delete handler dispatching the custom model signals."""
     model_name = sender._meta.label_lower
 
-    # Invalidate model-specific caches
-    if hasattr(instance, "id"):
-        cache.delete(f"{model_name}:{instance.id}")
-
-    # Invalidate list caches
-    cache.delete(f"{model_name}_list")
-
     # Handle specific models
     if model_name == "notebooks.notebook":
         notebook_deleted.send(
@@ -384,8 +373,8 @@ class AuditLogHandler:
         fields = [f.name for f in new_instance._meta.fields]
 
         for field in fields:
-            # Skip certain fields
-            if field in ["updated_at", "last_login"]:
+            # Skip certain fields (content bodies are too large to log)
+            if field in ["updated_at", "last_login", "content"]:
                 continue
 
             old_value = getattr(old_instance, field, None)
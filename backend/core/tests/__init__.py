@@ -0,0 +1,11 @@
+"""
+Tests package for the core module.
+
+This package contains focused test modules:
+- test_instrumentation.py: Request profiling and metrics tests
+- test_rate_limit.py: Rate limiter and RateLimitMiddleware tests
+"""
+
+# Import all test modules for test discovery
+from .test_instrumentation import *
+from .test_rate_limit import *
@@ -0,0 +1,139 @@
+"""
+Instrumentation tests for the core module.
+"""
+
+from django.contrib.auth import get_user_model
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from ..instrumentation import (
+    MetricsRegistry,
+    SharedMetricsStore,
+    metrics,
+    profiled,
+    timed,
+)
+from ..middleware import RequestTimingMiddleware
+from ..views import metrics_view
+
+User = get_user_model()
+
+
+class ProfileTests(TestCase):
+    """Test cases for per-request dependency profiles."""
+
+    def test_counts_queries_and_dependencies(self):
+        """Test that SQL and timed blocks are attributed to the active profile."""
+        with profiled("test") as profile:
+            User.objects.count()
+            with timed("minio"):
+                pass
+
+        self.assertEqual(profile.counts["db"], 1)
+        self.assertEqual(profile.counts["minio"], 1)
+        self.assertIn("db;dur=", profile.server_timing())
+        self.assertIn("total;dur=", profile.server_timing())
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=3)
+    def test_flags_repeated_queries(self):
+        """Test that the same parametrized query repeated in a loop is flagged."""
+        with self.assertLogs("core.instrumentation", level="WARNING") as logs:
+            with profiled("loop") as profile:
+                for pk in range(3):
+                    User.objects.filter(pk=pk).exists()
+
+        self.assertEqual(len(profile.repeated_queries(3)), 1)
+        self.assertIn("Possible N+1 queries in loop", logs.output[0])
+
+
+class MetricsTests(TestCase):
+    """Test cases for the metrics registry and middleware integration."""
+
+    def test_render_histogram(self):
+        """Test Prometheus text rendering of cumulative histogram buckets."""
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe("latency_seconds", 0.05, route="a")
+        registry.observe("latency_seconds", 0.5, route="a")
+        registry.observe("latency_seconds", 5.0, route="a")
+
+        text = registry.render()
+
+        self.assertIn('latency_seconds_bucket{route="a",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="a",le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="a",le="+Inf"} 3', text)
+        self.assertIn('latency_seconds_count{route="a"} 3', text)
+
+    def test_shared_store_sums_processes(self):
+        """Test that flushed samples from separate registries are totalled once."""
+        worker, web = MetricsRegistry(buckets=(1.0,)), MetricsRegistry(buckets=(1.0,))
+        client = FakeRedis()
+        stores = [SharedMetricsStore(worker), SharedMetricsStore(web)]
+        for store in stores:
+            store._client = client
+
+        worker.inc("tasks_total", task="a")
+        worker.observe("task_seconds", 0.5, task="a")
+        stores[0].flush()
+        worker.inc("tasks_total", task="a")
+        stores[0].flush()
+        stores[0].flush()  # Nothing new: must not double count
+        web.inc("tasks_total", task="a")
+        stores[1].flush()
+
+        text = web.render_values(*stores[1].read())
+
+        self.assertIn('tasks_total{task="a"} 3', text)
+        self.assertIn('task_seconds_bucket{task="a",le="1"} 1', text)
+        self.assertIn('task_seconds_count{task="a"} 1', text)
+
+    def test_middleware_sets_server_timing_and_counts_request(self):
+        """Test that RequestTimingMiddleware emits Server-Timing and metrics."""
+        metrics.reset()
+
+        def view(request):
+            User.objects.count()
+            return HttpResponse("ok")
+
+        response = RequestTimingMiddleware(view)(RequestFactory().get("/x/"))
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        labels = 'method="GET",route="unmatched",status="200"'
+        self.assertIn(f"deepsight_http_requests_total{{{labels}}} 1", metrics.render())
+
+    @override_settings(METRICS_AUTH_TOKEN=None, DEBUG=False)
+    def test_metrics_view_requires_token_outside_debug(self):
+        """Test that /metrics/ is not served without a configured token."""
+        with self.assertRaises(Http404):
+            metrics_view(RequestFactory().get("/metrics/"))
+
+    @override_settings(METRICS_AUTH_TOKEN="secret")
+    def test_metrics_view_checks_bearer_token(self):
+        """Test that scrapers must send the configured bearer token."""
+        factory = RequestFactory()
+
+        response = metrics_view(factory.get("/metrics/"))
+        self.assertEqual(response.status_code, 401)
+
+        response = metrics_view(
+            factory.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class FakeRedis:
+    """The hash commands SharedMetricsStore uses, backed by a dict."""
+
+    def __init__(self):
+        self.hash = {}
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def hincrbyfloat(self, key, field, amount):
+        self.hash[field] = self.hash.get(field, 0.0) + amount
+
+    def execute(self):
+        pass
+
+    def hgetall(self, key):
+        return {field: str(value) for field, value in self.hash.items()}
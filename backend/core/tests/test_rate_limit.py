@@ -0,0 +1,142 @@
+"""
+Rate limiting tests for the core module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import redis
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from ..middleware import RateLimitMiddleware
+from ..rate_limit import LocalRateLimiter, RedisRateLimiter, get_rate_limiter
+
+
+class LocalRateLimiterTests(SimpleTestCase):
+    """Test cases for the in-process sliding window limiter."""
+
+    def test_cost_consumes_bucket(self):
+        """Test that request costs are charged against the limit."""
+        limiter = LocalRateLimiter()
+
+        results = [
+            limiter.hit("bucket", limit=10, period=3600, cost=3) for _ in range(4)
+        ]
+
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertEqual(results[2].remaining, 1)
+        self.assertGreater(results[3].retry_after, 0)
+
+    def test_buckets_are_independent(self):
+        """Test that separate keys do not share counters."""
+        limiter = LocalRateLimiter()
+
+        self.assertTrue(limiter.hit("a", limit=1, period=60).allowed)
+        self.assertFalse(limiter.hit("a", limit=1, period=60).allowed)
+        self.assertTrue(limiter.hit("b", limit=1, period=60).allowed)
+
+
+class RedisRateLimiterTests(SimpleTestCase):
+    """Test cases for the Redis/Lua sliding window limiter."""
+
+    def setUp(self):
+        self.script = MagicMock()
+        client = MagicMock()
+        client.register_script.return_value = self.script
+        with patch("core.rate_limit.redis.Redis.from_url", return_value=client):
+            self.limiter = RedisRateLimiter("redis://localhost:6379/0")
+
+    def test_script_result_is_converted(self):
+        """Test that one script call checks and charges the bucket."""
+        self.script.return_value = [0, 2, 1500, 30000]
+
+        result = self.limiter.hit("rate_limit:default:ip:1", 10, 60, cost=3)
+
+        self.script.assert_called_once_with(
+            keys=["{rate_limit:default:ip:1}"], args=[10, 3, 60]
+        )
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.remaining, 2)
+        self.assertEqual(result.retry_after, 2)
+        self.assertEqual(result.reset_after, 30)
+
+    def test_falls_back_to_local_counters(self):
+        """Test that Redis errors fall back to in-process counters."""
+        self.script.side_effect = redis.ConnectionError("down")
+
+        self.assertTrue(self.limiter.hit("bucket", limit=1, period=60).allowed)
+        self.assertFalse(self.limiter.hit("bucket", limit=1, period=60).allowed)
+
+
+@override_settings(
+    RATE_LIMIT_ENABLED=True,
+    RATE_LIMIT_BACKEND="local",
+    ANONYMOUS_RATE_LIMIT=100,
+    RATE_LIMIT_RULES=[
+        {
+            "name": "search",
+            "pattern": r"^/api/v1/search/$",
+            "methods": ["POST"],
+            "cost": 2,
+            "limit": 3,
+        }
+    ],
+)
+class RateLimitMiddlewareTests(SimpleTestCase):
+    """Test cases for RateLimitMiddleware."""
+
+    def setUp(self):
+        get_rate_limiter().reset()
+        self.factory = RequestFactory()
+        self.middleware = RateLimitMiddleware(lambda request: HttpResponse("ok"))
+
+    def _call(self, method, path):
+        request = getattr(self.factory, method)(path)
+        request.user = AnonymousUser()
+        return self.middleware(request)
+
+    def test_expensive_route_has_own_bucket(self):
+        """Test that rule-matched routes are limited separately from reads."""
+        self.assertEqual(self._call("post", "/api/v1/search/").status_code, 200)
+
+        response = self._call("post", "/api/v1/search/")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+        # Cheap reads are unaffected by the exhausted search bucket
+        response = self._call("get", "/api/v1/search/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-RateLimit-Limit"], "100")
+        self.assertEqual(response["X-RateLimit-Remaining"], "99")
+
+    @override_settings(ANONYMOUS_RATE_LIMIT=1)
+    def test_scrapes_and_status_polls_are_exempt(self):
+        """Test that /metrics/ and polled read paths are never limited."""
+        for _ in range(3):
+            self.assertEqual(self._call("get", "/metrics/").status_code, 200)
+            response = self._call("get", "/api/v1/reports/r1/")
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("X-RateLimit-Limit", response)
+
+        # Writes to the same path are still counted
+        self.assertEqual(self._call("delete", "/api/v1/reports/r1/").status_code, 200)
+        self.assertEqual(self._call("delete", "/api/v1/reports/r1/").status_code, 429)
+
+
+class RateLimitOptInTests(SimpleTestCase):
+    """Test that rate limiting is opt-in."""
+
+    @override_settings(ANONYMOUS_RATE_LIMIT=1)
+    def test_disabled_unless_configured(self):
+        """Test that requests pass when RATE_LIMIT_ENABLED is not set."""
+        middleware = RateLimitMiddleware(lambda request: HttpResponse("ok"))
+        request = RequestFactory().post("/api/v1/search/")
+        request.user = AnonymousUser()
+
+        with override_settings():
+            del settings.RATE_LIMIT_ENABLED
+            responses = [middleware(request) for _ in range(3)]
+
+        self.assertEqual([r.status_code for r in responses], [200, 200, 200])
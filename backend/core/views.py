@@ -0,0 +1,33 @@
+"""
+Operational endpoints shared across apps.
+"""
+
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from .instrumentation import render_metrics
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Expose this process's metrics in the Prometheus text format.
+
+    Scrapers must send METRICS_AUTH_TOKEN as a bearer token. Without a
+    configured token the endpoint is only served when DEBUG is on.
+    """
+    token = getattr(settings, "METRICS_AUTH_TOKEN", None)
+    if not token:
+        if not settings.DEBUG:
+            raise Http404
+    else:
+        supplied = request.META.get("HTTP_AUTHORIZATION", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied, token):
+            return HttpResponse(status=401)
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
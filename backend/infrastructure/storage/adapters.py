@@ -133,6 +133,25 @@ class StorageAdapter:
             self.logger.error(f"Failed to generate URL for {object_key}: {e}")
             return None
 
+    def get_file_urls(
+        self, object_keys: list[str], expires: int = 3600
+    ) -> dict[str, str]:
+        """
+        Get pre-signed URLs for many files in one batch.
+
+        Args:
+            object_keys: Keys of the files
+            expires: URL expiration time in seconds
+
+        Returns:
+            Dict mapping object key to pre-signed URL, omitting failures
+        """
+        try:
+            return self.storage.get_file_urls(object_keys, expires)
+        except Exception as e:
+            self.logger.error(f"Failed to generate URLs: {e}")
+            return {}
+
     def delete_user_file(self, object_key: str, user_id: str) -> bool:
         """
         Delete a file belonging to a specific user.
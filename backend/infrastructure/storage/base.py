@@ -88,6 +88,26 @@ class StorageInterface(ABC):
         """
         pass
 
+    def get_file_urls(
+        self, object_keys: list[str], expires: int = 3600
+    ) -> dict[str, str]:
+        """
+        Get URLs for many files at once.
+
+        Args:
+            object_keys: Keys/paths of the files
+            expires: URL expiration time in seconds
+
+        Returns:
+            Dict mapping object key to URL, omitting files without one
+        """
+        urls = {}
+        for object_key in object_keys:
+            url = self.get_file_url(object_key, expires)
+            if url:
+                urls[object_key] = url
+        return urls
+
     @abstractmethod
     def get_file_metadata(self, object_key: str) -> dict | None:
         """
@@ -0,0 +1,209 @@
+"""
+Resized image derivatives (thumbnails) stored alongside their originals.
+
+Galleries and report previews only need small renditions, so instead of
+proxying full-resolution extractions the inline image endpoints can serve a
+named size (``?size=thumb``). Derivatives are generated lazily on first
+request, stored in MinIO next to the original under ``derivatives/`` and
+reused afterwards:
+
+    {dir}/derivatives/{name}.{source_etag[:12]}.{size}.{webp|jpg}
+
+The source ETag in the key means a rewritten original never serves a stale
+derivative. Decoding and resizing are CPU-bound, so they run in a process
+pool rather than on the request thread's GIL.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import posixpath
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+
+from core.cache import cache_manager
+from django.conf import settings
+
+from .adapters import get_storage_backend
+
+try:
+    from PIL import Image, ImageOps
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Named sizes: longest edge in pixels
+DEFAULT_DERIVATIVE_SIZES = {"thumb": 256, "small": 512, "medium": 1024}
+
+FORMAT_CONTENT_TYPES = {"webp": "image/webp", "jpg": "image/jpeg"}
+
+
+def get_derivative_sizes() -> dict[str, int]:
+    return getattr(settings, "IMAGE_DERIVATIVE_SIZES", DEFAULT_DERIVATIVE_SIZES)
+
+
+def choose_format(accept_header: str | None) -> str:
+    """WebP for clients that accept it, JPEG otherwise."""
+    return "webp" if "image/webp" in (accept_header or "") else "jpg"
+
+
+def derivative_key(object_key: str, source_etag: str, size: str, fmt: str) -> str:
+    directory, filename = posixpath.split(object_key)
+    name = os.path.splitext(filename)[0]
+    version = (source_etag or "0").strip('"')[:12]
+    return posixpath.join(directory, "derivatives", f"{name}.{version}.{size}.{fmt}")
+
+
+def resize_image(data: bytes, max_edge: int, fmt: str, quality: int = 80) -> bytes:
+    """
+    Downscale an encoded image so its longest edge is at most max_edge.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        # Let the JPEG decoder skip detail we are about to throw away
+        img.draft("RGB", (max_edge, max_edge))
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+        if fmt == "jpg":
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            save_kwargs = {"format": "JPEG", "quality": quality, "optimize": True}
+        else:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+            save_kwargs = {"format": "WEBP", "quality": quality, "method": 4}
+
+        out = io.BytesIO()
+        img.save(out, **save_kwargs)
+        return out.getvalue()
+
+
+@dataclass(frozen=True)
+class ImageDerivative:
+    """A stored derivative, described well enough to stream it."""
+
+    object_key: str
+    content_type: str
+    size: int
+    etag: str | None
+
+
+class ImageDerivativeService:
+    """Look up or generate resized image derivatives in object storage."""
+
+    def __init__(self):
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def cache_timeout(self) -> int:
+        return getattr(settings, "IMAGE_DERIVATIVE_CACHE_TIMEOUT", 24 * 3600)
+
+    def _resize(self, data: bytes, max_edge: int, fmt: str) -> bytes:
+        workers = getattr(settings, "IMAGE_DERIVATIVE_WORKERS", 2)
+        quality = getattr(settings, "IMAGE_DERIVATIVE_QUALITY", 80)
+        if workers <= 0:
+            return resize_image(data, max_edge, fmt, quality)
+
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=workers)
+        future = self._pool.submit(resize_image, data, max_edge, fmt, quality)
+        return future.result(timeout=getattr(settings, "IMAGE_DERIVATIVE_TIMEOUT", 30))
+
+    def get_derivative(
+        self, object_key: str, size: str, fmt: str = "webp"
+    ) -> ImageDerivative | None:
+        """
+        Return the derivative of an image at a named size, generating it if needed.
+
+        Returns None when the size is unknown, Pillow is unavailable or the
+        original cannot be read or decoded; callers then serve the original.
+        """
+        if not PIL_AVAILABLE or size not in get_derivative_sizes():
+            return None
+        if fmt not in FORMAT_CONTENT_TYPES:
+            fmt = "webp"
+
+        storage = get_storage_backend()
+        source = storage.get_file_metadata(object_key)
+        if not source:
+            return None
+
+        # Versioned like the stored derivative, so a rewritten original
+        # misses the cache instead of serving the old rendition
+        digest = hashlib.md5(object_key.encode("utf-8")).hexdigest()
+        version = self._source_version(source)
+        info = cache_manager.get_or_set(
+            f"image_derivative:{digest}:{version}:{size}:{fmt}",
+            lambda: self._get_or_create(storage, object_key, version, size, fmt),
+            self.cache_timeout,
+            cacheable=lambda value: value is not None,
+        )
+        return ImageDerivative(**info) if info else None
+
+    def generate_all(self, object_key: str, fmt: str = "webp") -> None:
+        """Pre-generate every named size, e.g. right after an image is stored."""
+        for size in get_derivative_sizes():
+            self.get_derivative(object_key, size, fmt)
+
+    @staticmethod
+    def _source_version(source: dict) -> str:
+        """The source's ETag, or its modification time when it has none."""
+        etag = (source.get("etag") or "").strip('"')
+        if etag:
+            return etag
+        last_modified = source.get("last_modified")
+        return str(int(last_modified.timestamp())) if last_modified else "0"
+
+    def _get_or_create(
+        self, storage, object_key: str, version: str, size: str, fmt: str
+    ) -> dict | None:
+        key = derivative_key(object_key, version, size, fmt)
+        existing = storage.get_file_metadata(key)
+        if existing:
+            return self._describe(key, fmt, existing)
+
+        data = storage.get_file(object_key)
+        if not data:
+            return None
+        try:
+            resized = self._resize(data, get_derivative_sizes()[size], fmt)
+        except Exception as e:
+            logger.warning(f"Failed to resize {object_key} to {size}: {e}")
+            return None
+
+        storage.save_file(
+            resized,
+            key,
+            content_type=FORMAT_CONTENT_TYPES[fmt],
+            metadata={"source_key": object_key, "derivative_size": size},
+        )
+        logger.debug(
+            f"Generated {size} derivative of {object_key}: "
+            f"{len(data)} -> {len(resized)} bytes"
+        )
+        stored = storage.get_file_metadata(key)
+        return self._describe(key, fmt, stored) if stored else None
+
+    @staticmethod
+    def _describe(key: str, fmt: str, meta: dict) -> dict:
+        return asdict(
+            ImageDerivative(
+                object_key=key,
+                content_type=FORMAT_CONTENT_TYPES[fmt],
+                size=meta["size"],
+                etag=(meta.get("etag") or "").strip('"') or None,
+            )
+        )
+
+
+image_derivatives = ImageDerivativeService()
@@ -4,11 +4,13 @@ MinIO storage implementation following the storage interface.
 
 import logging
 
+from core.instrumentation import InstrumentedClient
 from django.conf import settings
 from minio import Minio
 from minio.error import S3Error
 
 from .base import StorageInterface
+from .presigned import PresignedURLCache
 
 
 class MinIOStorage(StorageInterface):
@@ -24,6 +26,7 @@ class MinIOStorage(StorageInterface):
         self._client = None
         self._bucket_name = None
         self._initialize_client()
+        self._url_cache = PresignedURLCache(self._sign_url)
 
     def _initialize_client(self):
         """Initialize MinIO client with settings from Django configuration."""
@@ -44,11 +47,14 @@ class MinIOStorage(StorageInterface):
                 else getattr(settings, "MINIO_USE_SSL", False)
             )
 
-            self._client = Minio(
-                endpoint=endpoint,
-                access_key=getattr(settings, "MINIO_ACCESS_KEY", "minioadmin"),
-                secret_key=getattr(settings, "MINIO_SECRET_KEY", "minioadmin"),
-                secure=secure,
+            self._client = InstrumentedClient(
+                Minio(
+                    endpoint=endpoint,
+                    access_key=getattr(settings, "MINIO_ACCESS_KEY", "minioadmin"),
+                    secret_key=getattr(settings, "MINIO_SECRET_KEY", "minioadmin"),
+                    secure=secure,
+                ),
+                "minio",
             )
 
             self._bucket_name = getattr(
@@ -158,23 +164,26 @@ class MinIOStorage(StorageInterface):
                 self.logger.error(f"Failed to check file existence {object_key}: {e}")
                 return False
 
-    def get_file_url(self, object_key: str, expires: int = 3600) -> str | None:
-        """Get a pre-signed URL for accessing the file."""
-        try:
-            from datetime import timedelta
-
-            url = self._client.presigned_get_object(
-                bucket_name=self._bucket_name,
-                object_name=object_key,
-                expires=timedelta(seconds=expires),
-            )
+    def _sign_url(self, object_key, expires, request_date, response_headers):
+        from datetime import timedelta
 
-            self.logger.debug(f"Pre-signed URL generated for: {object_key}")
-            return url
+        return self._client.presigned_get_object(
+            bucket_name=self._bucket_name,
+            object_name=object_key,
+            expires=timedelta(seconds=expires),
+            response_headers=response_headers,
+            request_date=request_date,
+        )
 
-        except S3Error as e:
-            self.logger.error(f"Failed to generate URL for {object_key}: {e}")
-            return None
+    def get_file_url(self, object_key: str, expires: int = 3600) -> str | None:
+        """Get a pre-signed URL for accessing the file (cached per expiry bucket)."""
+        return self._url_cache.get(object_key, expires)
+
+    def get_file_urls(
+        self, object_keys: list[str], expires: int = 3600
+    ) -> dict[str, str]:
+        """Get pre-signed URLs for many files at once (cached per expiry bucket)."""
+        return self._url_cache.get_many(object_keys, expires)
 
     def get_file_metadata(self, object_key: str) -> dict | None:
         """Get metadata for a file in MinIO storage."""
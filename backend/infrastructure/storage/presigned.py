@@ -0,0 +1,131 @@
+"""
+Presigned URL cache with expiry-bucket signing.
+
+Presigned URLs embed their signing time, so signing on every call produces a
+new URL each time: browsers cannot cache the object and list endpoints pay
+for hundreds of signatures per response.
+
+Instead, the signing time is aligned to the start of an expiry bucket and the
+signed lifetime is extended by one bucket. Every call within the same bucket
+(in any process, for the same credentials) yields a byte-identical URL that
+is still valid for at least the requested ``expires`` seconds. Signed URLs
+are kept in a bounded in-process LRU until their bucket ends.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# S3 SigV4 presigned URLs are valid for at most 7 days
+MAX_PRESIGNED_EXPIRES = 7 * 24 * 3600
+
+# sign(object_key, expires_seconds, request_date, response_headers) -> url
+SignFunction = Callable[[str, int, datetime, dict | None], str | None]
+
+
+def expiry_bucket(expires: int, now: float | None = None) -> tuple[int, int, int]:
+    """
+    Return (bucket_start, signed_expires, bucket_end) for a requested lifetime.
+
+    The bucket is a quarter of the requested lifetime (bounded by the
+    PRESIGNED_URL_BUCKET_SECONDS setting), so a URL handed out at any point in
+    the bucket still has at least ``expires`` seconds left.
+    """
+    now = time.time() if now is None else now
+    max_bucket = getattr(settings, "PRESIGNED_URL_BUCKET_SECONDS", 3600)
+    bucket = max(1, min(max_bucket, expires // 4))
+    start = int(now // bucket) * bucket
+    signed_expires = min(expires + bucket, MAX_PRESIGNED_EXPIRES)
+    return start, signed_expires, start + bucket
+
+
+class PresignedURLCache:
+    """Bounded LRU of presigned URLs, reused until their expiry bucket ends."""
+
+    def __init__(self, sign: SignFunction, max_entries: int | None = None):
+        self._sign = sign
+        self._max_entries = max_entries or getattr(
+            settings, "PRESIGNED_URL_CACHE_SIZE", 10000
+        )
+        self._entries: OrderedDict[tuple, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        object_key: str,
+        expires: int = 3600,
+        response_headers: dict[str, str] | None = None,
+    ) -> str | None:
+        """Return a presigned URL for an object, signing only on a cache miss."""
+        return self.get_many([object_key], expires, response_headers).get(object_key)
+
+    def get_many(
+        self,
+        object_keys: Iterable[str],
+        expires: int = 3600,
+        response_headers: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """
+        Return presigned URLs for many objects in one pass.
+
+        Objects that fail to sign are left out of the result.
+        """
+        now = time.time()
+        start, signed_expires, bucket_end = expiry_bucket(expires, now)
+        headers_key = tuple(sorted((response_headers or {}).items()))
+
+        urls: dict[str, str] = {}
+        missing: list[str] = []
+        with self._lock:
+            for object_key in dict.fromkeys(object_keys):
+                if not object_key:
+                    continue
+                entry = self._entries.get((object_key, expires, headers_key))
+                if entry and entry[1] > now:
+                    self._entries.move_to_end((object_key, expires, headers_key))
+                    urls[object_key] = entry[0]
+                else:
+                    missing.append(object_key)
+            self.hits += len(urls)
+            self.misses += len(missing)
+
+        if not missing:
+            return urls
+
+        request_date = datetime.fromtimestamp(start, tz=UTC)
+        signed: dict[str, str] = {}
+        for object_key in missing:
+            try:
+                url = self._sign(
+                    object_key, signed_expires, request_date, response_headers
+                )
+            except Exception as e:
+                logger.error(f"Failed to presign {object_key}: {e}")
+                url = None
+            if url:
+                signed[object_key] = url
+
+        with self._lock:
+            for object_key, url in signed.items():
+                self._entries[(object_key, expires, headers_key)] = (url, bucket_end)
+                self._entries.move_to_end((object_key, expires, headers_key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        urls.update(signed)
+        return urls
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
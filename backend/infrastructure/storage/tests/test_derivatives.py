@@ -0,0 +1,93 @@
+"""
+Tests for image derivative generation.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infrastructure.storage.derivatives import (
+    ImageDerivativeService,
+    choose_format,
+    derivative_key,
+)
+
+
+class TestDerivativeNaming:
+    """Test derivative keys and format negotiation."""
+
+    def test_derivative_key_is_versioned_by_source_etag(self):
+        key = derivative_key(
+            "1/kb/abc/images/fig1.png", '"0123456789abcdef"', "thumb", "webp"
+        )
+        assert key == "1/kb/abc/images/derivatives/fig1.0123456789ab.thumb.webp"
+
+    def test_choose_format_prefers_webp(self):
+        assert choose_format("image/avif,image/webp,*/*") == "webp"
+        assert choose_format("*/*") == "jpg"
+        assert choose_format(None) == "jpg"
+
+
+class TestImageDerivativeService:
+    """Test lazy generation and reuse of stored derivatives."""
+
+    @pytest.fixture
+    def png_bytes(self):
+        Image = pytest.importorskip("PIL.Image")
+        out = io.BytesIO()
+        Image.new("RGBA", (2000, 1000), (255, 0, 0, 128)).save(out, format="PNG")
+        return out.getvalue()
+
+    def test_generates_and_stores_resized_image(self, png_bytes):
+        from PIL import Image
+
+        storage = MagicMock()
+        stored = {}
+        storage.get_file_metadata.side_effect = lambda key: (
+            {"etag": "src", "size": len(png_bytes)}
+            if key == "1/images/fig.png"
+            else ({"etag": "d", "size": len(stored[key])} if key in stored else None)
+        )
+        storage.get_file.return_value = png_bytes
+        storage.save_file.side_effect = lambda data, key, **kw: stored.update(
+            {key: data}
+        )
+
+        with patch(
+            "infrastructure.storage.derivatives.get_storage_backend",
+            return_value=storage,
+        ):
+            derivative = ImageDerivativeService().get_derivative(
+                "1/images/fig.png", "thumb", "webp"
+            )
+
+        assert derivative.object_key == "1/images/derivatives/fig.src.thumb.webp"
+        assert derivative.content_type == "image/webp"
+        with Image.open(io.BytesIO(stored[derivative.object_key])) as img:
+            assert img.size == (256, 128)
+
+    def test_unknown_size_returns_none(self):
+        assert ImageDerivativeService().get_derivative("1/a.png", "huge") is None
+
+    def test_cache_key_changes_with_source_etag(self):
+        storage = MagicMock()
+        storage.get_file_metadata.side_effect = [{"etag": '"v1"'}, {"etag": '"v2"'}]
+        cache = MagicMock()
+        cache.get_or_set.return_value = None
+
+        with (
+            patch(
+                "infrastructure.storage.derivatives.get_storage_backend",
+                return_value=storage,
+            ),
+            patch("infrastructure.storage.derivatives.cache_manager", cache),
+            patch("infrastructure.storage.derivatives.PIL_AVAILABLE", True),
+        ):
+            service = ImageDerivativeService()
+            service.get_derivative("1/images/fig.png", "thumb", "webp")
+            service.get_derivative("1/images/fig.png", "thumb", "webp")
+
+        first, second = (call.args[0] for call in cache.get_or_set.call_args_list)
+        assert ":v1:thumb:webp" in first
+        assert ":v2:thumb:webp" in second
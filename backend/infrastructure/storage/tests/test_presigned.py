@@ -0,0 +1,78 @@
+"""
+Tests for the presigned URL cache.
+"""
+
+from unittest.mock import patch
+
+from infrastructure.storage.presigned import PresignedURLCache, expiry_bucket
+
+
+def _signer(calls):
+    def sign(object_key, expires, request_date, response_headers):
+        calls.append(object_key)
+        return f"https://minio/{object_key}?date={request_date.timestamp():.0f}&expires={expires}"
+
+    return sign
+
+
+class TestExpiryBucket:
+    """Test expiry bucket alignment."""
+
+    def test_url_outlives_requested_expiry(self):
+        start, signed_expires, end = expiry_bucket(3600, now=10_000)
+        assert start <= 10_000 < end
+        # Handed out at the very end of the bucket, still valid for 3600s
+        assert start + signed_expires - end >= 3600
+
+    def test_signed_expiry_capped_at_seven_days(self):
+        _, signed_expires, _ = expiry_bucket(7 * 24 * 3600, now=0)
+        assert signed_expires == 7 * 24 * 3600
+
+
+class TestPresignedURLCache:
+    """Test presigned URL reuse and batching."""
+
+    def test_reuses_url_within_bucket(self):
+        calls = []
+        cache = PresignedURLCache(_signer(calls))
+
+        with patch("infrastructure.storage.presigned.time.time", return_value=10_000):
+            first = cache.get("1/a.png", 3600)
+        with patch("infrastructure.storage.presigned.time.time", return_value=10_500):
+            second = cache.get("1/a.png", 3600)
+
+        assert first == second
+        assert calls == ["1/a.png"]
+
+    def test_resigns_after_bucket_ends(self):
+        calls = []
+        cache = PresignedURLCache(_signer(calls))
+
+        with patch("infrastructure.storage.presigned.time.time", return_value=10_000):
+            first = cache.get("1/a.png", 3600)
+        with patch("infrastructure.storage.presigned.time.time", return_value=20_000):
+            second = cache.get("1/a.png", 3600)
+
+        assert first != second
+        assert calls == ["1/a.png", "1/a.png"]
+
+    def test_get_many_signs_only_misses(self):
+        calls = []
+        cache = PresignedURLCache(_signer(calls))
+        cache.get("1/a.png", 3600)
+
+        urls = cache.get_many(["1/a.png", "1/b.png", "1/b.png", None], 3600)
+
+        assert set(urls) == {"1/a.png", "1/b.png"}
+        assert calls == ["1/a.png", "1/b.png"]
+
+    def test_evicts_least_recently_used(self):
+        calls = []
+        cache = PresignedURLCache(_signer(calls), max_entries=2)
+        cache.get_many(["1/a.png", "1/b.png"], 3600)
+        cache.get("1/a.png", 3600)
+        cache.get("1/c.png", 3600)
+
+        cache.get("1/b.png", 3600)
+
+        assert calls == ["1/a.png", "1/b.png", "1/c.png", "1/b.png"]
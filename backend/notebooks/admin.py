@@ -7,6 +7,7 @@ from .models import (
     Note,
     Notebook,
     SessionChatMessage,
+    StudioTask,
 )
 
 
@@ -202,3 +203,13 @@ class NoteAdmin(admin.ModelAdmin):
             .get_queryset(request)
             .select_related("notebook", "created_by", "notebook__user")
         )
+
+
+@admin.register(StudioTask)
+class StudioTaskAdmin(admin.ModelAdmin):
+    """Admin configuration for StudioTask model."""
+
+    list_display = ("id", "notebook", "status", "created_at", "completed_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("goal", "notebook__name", "user__username")
+    readonly_fields = ("created_at", "updated_at", "celery_task_id")
@@ -47,5 +47,6 @@ class SseStatus:
 
 # Default timing parameters
 DEFAULT_SIGNED_URL_EXPIRES = 3600  # seconds
+MODEL_FILE_URL_EXPIRES = 86400  # seconds, default for model get_*_url helpers
 JOB_SSE_MAX_DURATION_SECONDS = 600
 JOB_SSE_HEARTBEAT_SECONDS = 30
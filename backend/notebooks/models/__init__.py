@@ -10,6 +10,7 @@ from .chat_session import ChatSession, SessionChatMessage
 from .knowledge_item import KnowledgeBaseImage, KnowledgeBaseItem
 from .note import Note
 from .notebook import Notebook
+from .studio_task import StudioTask
 
 # Maintain backward compatibility
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "ChatSession",
     "SessionChatMessage",
     "Note",
+    "StudioTask",
 ]
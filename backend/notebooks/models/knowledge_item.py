@@ -4,12 +4,13 @@ Knowledge base item and image models for processed content storage.
 
 import uuid
 
+from core.cache import CacheKeyGenerator, cache_manager
 from core.mixins import BaseModel
 from django.core.exceptions import ValidationError
 from django.db import models
 
 from .managers import KnowledgeBaseItemManager
-from ..constants import RagflowDocStatus
+from ..constants import MODEL_FILE_URL_EXPIRES, RagflowDocStatus
 
 
 class KnowledgeBaseItem(BaseModel):
@@ -180,7 +181,7 @@ class KnowledgeBaseItem(BaseModel):
         self.full_clean()
         super().save(*args, **kwargs)
 
-    def get_file_url(self, expires=86400):
+    def get_file_url(self, expires=MODEL_FILE_URL_EXPIRES):
         """Get pre-signed URL for processed file."""
         if self.file_object_key:
             try:
@@ -192,7 +193,7 @@ class KnowledgeBaseItem(BaseModel):
                 return None
         return None
 
-    def get_original_file_url(self, expires=86400):
+    def get_original_file_url(self, expires=MODEL_FILE_URL_EXPIRES):
         """Get pre-signed URL for original file."""
         if self.original_file_object_key:
             try:
@@ -286,6 +287,15 @@ class KnowledgeBaseItem(BaseModel):
                 "updated_at",
             ]
         )
+        self.bump_ragflow_dataset_version()
+
+    def bump_ragflow_dataset_version(self):
+        """Invalidate caches derived from the notebook's RagFlow dataset content."""
+        dataset_id = self.notebook.ragflow_dataset_id
+        if dataset_id:
+            cache_manager.bump_namespace_version(
+                CacheKeyGenerator.ragflow_dataset_namespace(dataset_id)
+            )
 
     def mark_ragflow_failed(self, error_message: str = ""):
         """Mark RagFlow processing as failed."""
@@ -381,7 +391,7 @@ class KnowledgeBaseImage(BaseModel):
         self.full_clean()
         super().save(*args, **kwargs)
 
-    def get_image_url(self, expires=86400):
+    def get_image_url(self, expires=MODEL_FILE_URL_EXPIRES):
         """Get pre-signed URL for image access."""
         if self.minio_object_key:
             try:
@@ -8,7 +8,8 @@ and common query patterns.
 import logging
 
 from django.db import models
-from django.db.models import Count, Q
+from django.db.models import Count, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Length
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -22,11 +23,68 @@ class NotebookQuerySet(models.QuerySet):
         return self.filter(user=user)
 
     def with_stats(self):
-        """Annotate notebooks with source and knowledge item counts."""
+        """
+        Annotate the counts and activity timestamps shown by notebook serializers.
+
+        Knowledge item aggregates share a single join; chat aggregates use
+        correlated subqueries so the joins don't multiply each other's rows.
+        Everything is computed in the same SQL statement as the notebooks.
+        """
+        from ..constants import ParsingStatus, RagflowDocStatus
+        from .chat_session import ChatSession, SessionChatMessage
+
+        message_count = (
+            SessionChatMessage.objects.filter(notebook=OuterRef("pk"))
+            .order_by()
+            .values("notebook")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        session_last_activity = (
+            ChatSession.objects.filter(notebook=OuterRef("pk"))
+            .order_by()
+            .values("notebook")
+            .annotate(latest=Max("last_activity"))
+            .values("latest")
+        )
+
         return self.annotate(
-            source_count=Count("sources", distinct=True),
-            knowledge_item_count=Count("knowledge_base_items", distinct=True),
-            chat_message_count=Count("chat_messages", distinct=True),
+            stats_source_count=Count("knowledge_base_items", distinct=True),
+            stats_parsed_count=Count(
+                "knowledge_base_items",
+                filter=Q(knowledge_base_items__parsing_status=ParsingStatus.DONE),
+                distinct=True,
+            ),
+            stats_ragflow_document_count=Count(
+                "knowledge_base_items",
+                filter=Q(
+                    knowledge_base_items__ragflow_processing_status=RagflowDocStatus.COMPLETED
+                ),
+                distinct=True,
+            ),
+            stats_ragflow_processing_count=Count(
+                "knowledge_base_items",
+                filter=Q(
+                    knowledge_base_items__ragflow_processing_status__in=[
+                        RagflowDocStatus.PENDING,
+                        RagflowDocStatus.UPLOADING,
+                        RagflowDocStatus.PARSING,
+                    ]
+                ),
+                distinct=True,
+            ),
+            stats_ragflow_failed_count=Count(
+                "knowledge_base_items",
+                filter=Q(
+                    knowledge_base_items__ragflow_processing_status=RagflowDocStatus.FAILED
+                ),
+                distinct=True,
+            ),
+            stats_kb_last_updated=Max("knowledge_base_items__updated_at"),
+            stats_chat_message_count=Coalesce(
+                Subquery(message_count, output_field=IntegerField()), 0
+            ),
+            stats_session_last_activity=Subquery(session_last_activity),
         )
 
     def with_recent_activity(self, days=30):
@@ -112,6 +170,10 @@ class KnowledgeBaseItemQuerySet(models.QuerySet):
         """Filter items that have associated images."""
         return self.filter(images__isnull=False).distinct()
 
+    def summaries(self):
+        """Skip loading the (often huge) content column, annotating its length."""
+        return self.defer("content").annotate(content_length=Length("content"))
+
 
 class KnowledgeBaseItemManager(models.Manager):
     """Enhanced manager for KnowledgeBaseItem model."""
@@ -152,6 +214,9 @@ class KnowledgeBaseItemManager(models.Manager):
     def with_images(self):
         return self.get_queryset().with_images()
 
+    def summaries(self):
+        return self.get_queryset().summaries()
+
     def bulk_update_status(self, item_ids, status):
         """Bulk update processing status for multiple items."""
         return self.filter(id__in=item_ids).update(
@@ -0,0 +1,102 @@
+"""
+Studio task model for coordinator (research + writing) executions.
+"""
+
+from core.mixins import BaseModel
+from django.db import models
+from django.utils import timezone
+
+
+class StudioTask(BaseModel):
+    """
+    Durable state of a coordinator task started from Studio mode.
+
+    The coordinator runs in a Celery worker; this row is the single source
+    of truth for status and results so that any web replica can serve it.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("executing", "Executing"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+        ("cancelled", "Cancelled"),
+    ]
+
+    TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+    notebook = models.ForeignKey(
+        "notebooks.Notebook",
+        on_delete=models.CASCADE,
+        related_name="studio_tasks",
+        help_text="Notebook this task belongs to",
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="studio_tasks",
+        help_text="User who started the task",
+    )
+    goal = models.TextField(help_text="The user's research goal or question")
+    options = models.JSONField(
+        default=dict, blank=True, help_text="Task execution options"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="pending",
+        help_text="Current status of the task",
+    )
+    celery_task_id = models.CharField(max_length=255, null=True, blank=True)
+
+    # Progress and results
+    progress = models.JSONField(
+        default=dict, blank=True, help_text="Latest progress event for the task"
+    )
+    result = models.JSONField(
+        null=True, blank=True, help_text="Findings, report and sources"
+    )
+    error_message = models.TextField(blank=True, default="")
+
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Studio Task"
+        verbose_name_plural = "Studio Tasks"
+        indexes = [
+            models.Index(fields=["notebook", "-created_at"]),
+            models.Index(fields=["status", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"StudioTask {self.id} - {self.status}"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in self.TERMINAL_STATUSES
+
+    def mark_finished(self, status: str, error_message: str = ""):
+        """Move the task to a terminal status."""
+        self.status = status
+        self.error_message = error_message
+        self.completed_at = timezone.now()
+        self.save(
+            update_fields=["status", "error_message", "completed_at", "updated_at"]
+        )
+
+    def to_dict(self):
+        return {
+            "task_id": str(self.id),
+            "notebook_id": str(self.notebook_id),
+            "goal": self.goal,
+            "status": self.status,
+            "progress": self.progress or {},
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "has_result": self.result is not None,
+            "error": self.error_message or None,
+        }
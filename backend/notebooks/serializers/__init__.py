@@ -16,6 +16,7 @@ from .file_serializers import (
     BatchFileUploadSerializer,
     FileUploadSerializer,
     KnowledgeBaseImageSerializer,
+    KnowledgeBaseItemListSerializer,
     KnowledgeBaseItemSerializer,
     VideoImageExtractionSerializer,
 )
@@ -62,6 +63,7 @@ __all__ = [
     "VideoImageExtractionSerializer",
     "BatchFileUploadSerializer",
     "KnowledgeBaseItemSerializer",
+    "KnowledgeBaseItemListSerializer",
     "KnowledgeBaseImageSerializer",
     # URL processing
     "URLParseSerializer",
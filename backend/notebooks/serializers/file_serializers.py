@@ -2,8 +2,10 @@
 File upload and processing serializers for the notebooks module.
 """
 
+from infrastructure.storage.adapters import get_storage_adapter
 from rest_framework import serializers
 
+from ..constants import MODEL_FILE_URL_EXPIRES
 from ..models import (
     KnowledgeBaseImage,
     KnowledgeBaseItem,
@@ -245,14 +247,126 @@ class KnowledgeBaseItemSerializer(serializers.ModelSerializer):
         return obj.get_original_file_url() if obj.original_file_object_key else None
 
 
+class SelectableFieldsMixin:
+    """
+    Let clients pick serializer fields with ``?fields=a,b,c``.
+
+    Without the parameter, ``Meta.default_fields`` (or all fields) are
+    returned. Unknown names are ignored so old clients keep working.
+    """
+
+    fields_param = "fields"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        requested = request.query_params.get(self.fields_param) if request else None
+        if requested:
+            allowed = {name.strip() for name in requested.split(",") if name.strip()}
+            allowed.add("id")
+        else:
+            allowed = set(getattr(self.Meta, "default_fields", self.fields))
+
+        for name in list(self.fields):
+            if name not in allowed:
+                self.fields.pop(name)
+
+
+class PresignedURLListSerializer(serializers.ListSerializer):
+    """
+    Sign every presigned URL a page needs in one batch before rendering it.
+
+    The child serializer declares ``presigned_url_fields`` as a mapping of
+    serializer field -> model attribute holding the object key. The batch
+    warms the shared presigned URL cache, so the per-object model helpers
+    called by the child's method fields are cache hits.
+    """
+
+    def to_representation(self, data):
+        items = data.all() if hasattr(data, "all") else data
+        url_fields = getattr(self.child, "presigned_url_fields", {})
+        object_keys = [
+            getattr(obj, attr)
+            for field, attr in url_fields.items()
+            if field in self.child.fields
+            for obj in items
+            if getattr(obj, attr, None)
+        ]
+        if object_keys:
+            get_storage_adapter().get_file_urls(
+                object_keys, expires=MODEL_FILE_URL_EXPIRES
+            )
+        return super().to_representation(items)
+
+
+class KnowledgeBaseItemListSerializer(
+    SelectableFieldsMixin, serializers.ModelSerializer
+):
+    """
+    Compact knowledge base item representation for list endpoints.
+
+    Never includes ``content`` (fetch it from the ``content`` action); exposes
+    ``content_length`` instead, which the queryset annotates in the database.
+    Presigned URLs are only generated when requested via ``?fields=``.
+    """
+
+    content_length = serializers.IntegerField(read_only=True, default=0)
+    file_url = serializers.SerializerMethodField()
+    original_file_url = serializers.SerializerMethodField()
+
+    presigned_url_fields = {
+        "file_url": "file_object_key",
+        "original_file_url": "original_file_object_key",
+    }
+
+    class Meta:
+        model = KnowledgeBaseItem
+        list_serializer_class = PresignedURLListSerializer
+        fields = [
+            "id",
+            "title",
+            "content_type",
+            "content_length",
+            "file_object_key",
+            "file_url",
+            "original_file_object_key",
+            "original_file_url",
+            "metadata",
+            "tags",
+            "parsing_status",
+            "captioning_status",
+            "ragflow_document_id",
+            "ragflow_processing_status",
+            "notes",
+            "created_at",
+            "updated_at",
+        ]
+        default_fields = [
+            name for name in fields if name not in ("file_url", "original_file_url")
+        ]
+        read_only_fields = fields
+
+    def get_file_url(self, obj):
+        """Get pre-signed URL for processed file."""
+        return obj.get_file_url() if obj.file_object_key else None
+
+    def get_original_file_url(self, obj):
+        """Get pre-signed URL for original file."""
+        return obj.get_original_file_url() if obj.original_file_object_key else None
+
+
 class KnowledgeBaseImageSerializer(serializers.ModelSerializer):
     """Serializer for knowledge base images with MinIO storage support."""
 
     image_url = serializers.SerializerMethodField()
     figure_data_dict = serializers.SerializerMethodField()
 
+    presigned_url_fields = {"image_url": "minio_object_key"}
+
     class Meta:
         model = KnowledgeBaseImage
+        list_serializer_class = PresignedURLListSerializer
         fields = [
             "id",
             "knowledge_base_item",
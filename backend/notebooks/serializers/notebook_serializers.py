@@ -3,19 +3,31 @@ Notebook-related serializers for the notebooks module following DRF best practic
 """
 
 from django.contrib.auth import get_user_model
+from django.db.models import Count, Max, Q
 from rest_framework import serializers
 
+from ..constants import ParsingStatus, RagflowDocStatus
 from ..models import Notebook
-from ..constants import ParsingStatus
 
 
 class NotebookCountMixin:
-    """Mixin providing common computed count fields for notebooks."""
+    """
+    Mixin providing common computed count fields for notebooks.
+
+    Reads the annotations added by ``Notebook.objects.with_stats()`` and only
+    falls back to per-notebook queries for un-annotated instances.
+    """
 
     def get_source_count(self, obj):
+        count = getattr(obj, "stats_source_count", None)
+        if count is not None:
+            return count
         return obj.knowledge_base_items.count()
 
     def get_knowledge_item_count(self, obj):
+        count = getattr(obj, "stats_parsed_count", None)
+        if count is not None:
+            return count
         return obj.knowledge_base_items.filter(
             parsing_status=ParsingStatus.DONE
         ).count()
@@ -26,6 +38,9 @@ class NotebookCountMixin:
 
     def get_has_parsed_files(self, obj):
         """Check if notebook has at least one successfully parsed file."""
+        count = getattr(obj, "stats_parsed_count", None)
+        if count is not None:
+            return count > 0
         return obj.knowledge_base_items.filter(
             parsing_status=ParsingStatus.DONE
         ).exists()
@@ -109,37 +124,30 @@ class NotebookSerializer(NotebookCountMixin, serializers.ModelSerializer):
 
     def get_chat_message_count(self, obj):
         """Get count of chat messages in the notebook (across all sessions)."""
+        count = getattr(obj, "stats_chat_message_count", None)
+        if count is not None:
+            return count
         return obj.session_chat_messages.count()
 
     def get_last_activity(self, obj):
         """Get the timestamp of the last activity in the notebook."""
-        latest_kb_item = obj.knowledge_base_items.order_by("-updated_at").first()
-        latest_session = obj.chat_sessions.order_by("-last_activity").first()
-
-        last_activity = obj.updated_at
-
-        if latest_kb_item and latest_kb_item.updated_at > last_activity:
-            last_activity = latest_kb_item.updated_at
-
-        if latest_session and latest_session.last_activity > last_activity:
-            last_activity = latest_session.last_activity
-
-        return last_activity
+        if hasattr(obj, "stats_kb_last_updated"):
+            kb_updated = obj.stats_kb_last_updated
+            session_activity = obj.stats_session_last_activity
+        else:
+            kb_updated = obj.knowledge_base_items.aggregate(
+                latest=Max("updated_at")
+            )["latest"]
+            session_activity = obj.chat_sessions.aggregate(
+                latest=Max("last_activity")
+            )["latest"]
+
+        candidates = [obj.updated_at, kb_updated, session_activity]
+        return max(ts for ts in candidates if ts is not None)
 
     def get_ragflow_dataset_info(self, obj):
         """Get RagFlow dataset information for the notebook."""
-        try:
-            ragflow_dataset = obj.ragflow_dataset
-            return {
-                "id": ragflow_dataset.ragflow_dataset_id,
-                "status": ragflow_dataset.status,
-                "is_ready": ragflow_dataset.is_ready(),
-                "document_count": ragflow_dataset.get_document_count()
-                if ragflow_dataset.is_ready()
-                else 0,
-                "error_message": ragflow_dataset.error_message or None,
-            }
-        except AttributeError:
+        if not obj.ragflow_dataset_id:
             # No RagFlow dataset exists yet
             return {
                 "id": None,
@@ -149,6 +157,58 @@ class NotebookSerializer(NotebookCountMixin, serializers.ModelSerializer):
                 "error_message": None,
             }
 
+        counts = self._ragflow_document_counts(obj)
+        if counts["processing"]:
+            status = "processing"
+        elif counts["completed"]:
+            status = "ready"
+        elif counts["failed"]:
+            status = "error"
+        else:
+            # Nothing has been indexed, so the dataset's state is not known here
+            status = "unknown"
+
+        return {
+            "id": obj.ragflow_dataset_id,
+            "status": status,
+            "is_ready": status == "ready",
+            "document_count": counts["completed"],
+            "error_message": (
+                f"{counts['failed']} document(s) failed to process"
+                if counts["failed"]
+                else None
+            ),
+        }
+
+    def _ragflow_document_counts(self, obj) -> dict[str, int]:
+        """Count the notebook's documents by RagFlow processing state."""
+        annotated = {
+            "completed": getattr(obj, "stats_ragflow_document_count", None),
+            "processing": getattr(obj, "stats_ragflow_processing_count", None),
+            "failed": getattr(obj, "stats_ragflow_failed_count", None),
+        }
+        if None not in annotated.values():
+            return annotated
+
+        return obj.knowledge_base_items.aggregate(
+            completed=Count(
+                "id", filter=Q(ragflow_processing_status=RagflowDocStatus.COMPLETED)
+            ),
+            processing=Count(
+                "id",
+                filter=Q(
+                    ragflow_processing_status__in=[
+                        RagflowDocStatus.PENDING,
+                        RagflowDocStatus.UPLOADING,
+                        RagflowDocStatus.PARSING,
+                    ]
+                ),
+            ),
+            failed=Count(
+                "id", filter=Q(ragflow_processing_status=RagflowDocStatus.FAILED)
+            ),
+        )
+
     def validate_name(self, value):
         """Validate notebook name."""
         if not value or not value.strip():
@@ -0,0 +1,230 @@
+"""
+Token-budgeted assembly of knowledge base item content for generation inputs.
+
+Podcast and report generation both feed the parsed content of selected
+knowledge base items to an LLM with a limited context. Rather than loading
+every item's full content and truncating the concatenation afterwards, the
+budget is apportioned across the items up front and only the allotted prefix
+of each item is read from the database:
+
+1. One query fetches each item's metadata and ``Length(content)``.
+2. The budget is split max-min fairly (optionally weighted by relevance):
+   items shorter than their share are kept whole and the remainder is
+   redistributed among the longer ones.
+3. One streamed query reads ``Substr(content, 1, allotment)`` per item, and
+   items are yielded one at a time in selection order.
+
+Budgets are in tokens, estimated at CHARS_PER_TOKEN characters per token.
+"""
+
+import logging
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db.models import Case, TextField, Value, When
+from django.db.models.functions import Length, Substr
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Items streamed from the database per round-trip
+ITERATOR_CHUNK_SIZE = 20
+
+
+@dataclass
+class AssembledItem:
+    """One knowledge base item's content, cut to its share of the budget."""
+
+    id: str
+    title: str
+    content: str
+    content_length: int
+    content_type: str = "unknown"
+    metadata: dict[str, Any] = field(default_factory=dict)
+    original_file_object_key: str | None = None
+
+    @property
+    def truncated(self) -> bool:
+        return len(self.content) < self.content_length
+
+
+def allocate_budget(
+    lengths: dict[str, int],
+    budget: int | None,
+    weights: dict[str, float] | None = None,
+) -> dict[str, int]:
+    """
+    Split a character budget across items by weighted max-min fairness.
+
+    Each item gets at most its own length; what short items leave unused is
+    shared among the remaining ones in proportion to their weights (default
+    1). A budget of None keeps every item whole.
+    """
+    if budget is None:
+        return dict(lengths)
+
+    allocation = dict.fromkeys(lengths, 0)
+    open_items = {key for key, length in lengths.items() if length > 0}
+    remaining = max(0, budget)
+    while open_items and remaining > 0:
+        total_weight = sum((weights or {}).get(key, 1.0) for key in open_items)
+        if total_weight <= 0:
+            break
+        satisfied = set()
+        for key in open_items:
+            share = int(remaining * (weights or {}).get(key, 1.0) / total_weight)
+            if lengths[key] - allocation[key] <= share:
+                satisfied.add(key)
+        if not satisfied:
+            # Every open item wants more than its share: hand out the shares
+            for key in open_items:
+                allocation[key] += int(
+                    remaining * (weights or {}).get(key, 1.0) / total_weight
+                )
+            break
+        for key in satisfied:
+            remaining -= lengths[key] - allocation[key]
+            allocation[key] = lengths[key]
+        open_items -= satisfied
+    return allocation
+
+
+def _normalize_ids(item_ids: Iterable[Any]) -> list[str]:
+    """Valid UUID strings in selection order, without duplicates."""
+    normalized: list[str] = []
+    for item_id in item_ids:
+        try:
+            normalized.append(str(uuid.UUID(str(item_id))))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid UUID file ID: {item_id}")
+    return list(dict.fromkeys(normalized))
+
+
+class KnowledgeInputAssembler:
+    """Fetch selected knowledge base items within a token budget."""
+
+    def __init__(
+        self,
+        token_budget: int | None = None,
+        weights: dict[str, float] | None = None,
+    ):
+        self.token_budget = token_budget
+        self.weights = weights
+
+    @property
+    def char_budget(self) -> int | None:
+        if self.token_budget is None:
+            return None
+        return self.token_budget * CHARS_PER_TOKEN
+
+    def iter_items(
+        self,
+        item_ids: Iterable[Any],
+        user_id: int | None = None,
+        non_empty: bool = True,
+    ) -> Iterator[AssembledItem]:
+        """
+        Yield the selected items' budgeted content in selection order.
+
+        Args:
+            item_ids: KnowledgeBaseItem IDs, most relevant first
+            user_id: Only include items in this user's notebooks
+            non_empty: Skip items without (budgeted) content
+        """
+        from ..models import KnowledgeBaseItem
+
+        ids = _normalize_ids(item_ids)
+        if not ids:
+            return
+
+        queryset = KnowledgeBaseItem.objects.filter(id__in=ids)
+        if user_id is not None:
+            queryset = queryset.filter(notebook__user_id=user_id)
+
+        rows = {
+            str(row["id"]): row
+            for row in queryset.annotate(content_length=Length("content")).values(
+                "id",
+                "title",
+                "content_type",
+                "metadata",
+                "original_file_object_key",
+                "content_length",
+            )
+        }
+        lengths = {key: row["content_length"] or 0 for key, row in rows.items()}
+        allocation = allocate_budget(lengths, self.char_budget, self.weights)
+        wanted = {key: n for key, n in allocation.items() if n > 0}
+        truncated = sum(1 for key, n in wanted.items() if n < lengths[key])
+        if truncated or len(wanted) < len(rows):
+            logger.info(
+                f"Input budget of {self.token_budget} tokens: {truncated} of "
+                f"{len(rows)} items truncated, {len(rows) - len(wanted)} omitted"
+            )
+
+        excerpts: dict[str, str] = {}
+        if wanted:
+            excerpt = Case(
+                *[
+                    When(id=key, then=Substr("content", 1, Value(n)))
+                    for key, n in wanted.items()
+                ],
+                default=Value(""),
+                output_field=TextField(),
+            )
+            # Stream the excerpts; at most one batch of text is in flight
+            stream = (
+                queryset.filter(id__in=list(wanted))
+                .annotate(excerpt=excerpt)
+                .values_list("id", "excerpt")
+                .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+            )
+        else:
+            stream = iter(())
+
+        # Rows arrive in database order; yield each item once it and every
+        # item selected before it are available
+        order = [key for key in ids if key in rows]
+        position = 0
+        for item_id, text in stream:
+            excerpts[str(item_id)] = text or ""
+            while position < len(order) and (
+                order[position] in excerpts or order[position] not in wanted
+            ):
+                item = self._build(rows[order[position]], excerpts)
+                position += 1
+                if item.content.strip() or not non_empty:
+                    yield item
+        for key in order[position:]:
+            item = self._build(rows[key], excerpts)
+            if item.content.strip() or not non_empty:
+                yield item
+
+    @staticmethod
+    def _build(row: dict, excerpts: dict[str, str]) -> AssembledItem:
+        key = str(row["id"])
+        return AssembledItem(
+            id=key,
+            title=row["title"] or f"file_{key}",
+            content=excerpts.pop(key, ""),
+            content_length=row["content_length"] or 0,
+            content_type=row["content_type"] or "unknown",
+            metadata=row["metadata"] or {},
+            original_file_object_key=row["original_file_object_key"],
+        )
+
+    def assemble_text(
+        self,
+        item_ids: Iterable[Any],
+        template: str = "{content}",
+        separator: str = "\n\n",
+        user_id: int | None = None,
+    ) -> str:
+        """Format each budgeted item with ``template`` and join them."""
+        return separator.join(
+            template.format(title=item.title, content=item.content)
+            for item in self.iter_items(item_ids, user_id=user_id)
+        )
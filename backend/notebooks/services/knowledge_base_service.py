@@ -11,6 +11,7 @@ import tempfile
 from typing import Any
 from urllib.parse import urlparse
 
+from core.cache import CacheKeyGenerator, cache_manager
 from core.services import NotebookBaseService
 from django.db import transaction
 from django.shortcuts import get_object_or_404
@@ -331,10 +332,15 @@ class KnowledgeBaseService(NotebookBaseService):
                 knowledge_base_item=kb_item
             ).order_by("created_at")
 
+            # Sign all image URLs in one batch
+            image_urls = self.storage_adapter.get_file_urls(
+                [image.minio_object_key for image in images], expires=3600
+            )
+
             # Serialize image data
             image_data = []
             for image in images:
-                image_url = image.get_image_url(expires=3600)  # 1 hour
+                image_url = image_urls.get(image.minio_object_key)
                 if image_url:
                     # Get the original filename from metadata for display
                     original_filename = "unknown"
@@ -376,48 +382,68 @@ class KnowledgeBaseService(NotebookBaseService):
                 "details": {"error": str(e)},
             }
 
+    # Image lists embed presigned URLs, so cache them well inside their expiry
+    IMAGE_URL_EXPIRES = 3600
+    IMAGE_LIST_CACHE_TIMEOUT = 600
+
     def get_images(self, kb_item: KnowledgeBaseItem) -> list[dict[str, Any]]:
         """Compatibility helper for views: return list of images for a KB item.
 
         Mirrors get_knowledge_base_images but returns just the images list, as
-        expected by FileViewSet.images view.
+        expected by FileViewSet.images view. Results are cached per item and
+        invalidated by core.cache_signals when the item's images change.
         """
         try:
-            images = KnowledgeBaseImage.objects.filter(
-                knowledge_base_item=kb_item
-            ).order_by("created_at")
-
-            image_data: list[dict[str, Any]] = []
-            for image in images:
-                image_url = image.get_image_url(expires=3600)
-                if not image_url:
-                    continue
-                original_filename = "unknown"
-                if image.image_metadata and "original_filename" in image.image_metadata:
-                    original_filename = image.image_metadata["original_filename"]
-
-                image_data.append(
-                    {
-                        "id": str(image.id),
-                        "figure_id": str(image.figure_id),
-                        "name": str(image.figure_id),
-                        "image_caption": image.image_caption,
-                        "image_url": image_url,
-                        "imageUrl": image_url,
-                        "content_type": image.content_type,
-                        "file_size": image.file_size,
-                        "created_at": image.created_at.isoformat(),
-                        "original_filename": original_filename,
-                    }
-                )
-
-            return image_data
+            key = cache_manager.versioned_key(
+                CacheKeyGenerator.file_key(str(kb_item.id)), "images"
+            )
+            return cache_manager.get_or_set(
+                key,
+                lambda: self._build_images_list(kb_item),
+                self.IMAGE_LIST_CACHE_TIMEOUT,
+            )
         except Exception as e:
             logger.exception(
                 f"Failed to retrieve images list for KB item {kb_item.id}: {e}"
             )
             return []
 
+    def _build_images_list(self, kb_item: KnowledgeBaseItem) -> list[dict[str, Any]]:
+        images = KnowledgeBaseImage.objects.filter(
+            knowledge_base_item=kb_item
+        ).order_by("created_at")
+
+        image_urls = self.storage_adapter.get_file_urls(
+            [image.minio_object_key for image in images],
+            expires=self.IMAGE_URL_EXPIRES,
+        )
+
+        image_data: list[dict[str, Any]] = []
+        for image in images:
+            image_url = image_urls.get(image.minio_object_key)
+            if not image_url:
+                continue
+            original_filename = "unknown"
+            if image.image_metadata and "original_filename" in image.image_metadata:
+                original_filename = image.image_metadata["original_filename"]
+
+            image_data.append(
+                {
+                    "id": str(image.id),
+                    "figure_id": str(image.figure_id),
+                    "name": str(image.figure_id),
+                    "image_caption": image.image_caption,
+                    "image_url": image_url,
+                    "imageUrl": image_url,
+                    "content_type": image.content_type,
+                    "file_size": image.file_size,
+                    "created_at": image.created_at.isoformat(),
+                    "original_filename": original_filename,
+                }
+            )
+
+        return image_data
+
     def get_batch_job_status(self, batch_job_id, notebook):
         """Get status of a batch job"""
         try:
@@ -910,6 +936,85 @@ class KnowledgeBaseService(NotebookBaseService):
             )
             return None
 
+    def describe_raw_file(self, kb_item: KnowledgeBaseItem) -> dict[str, Any]:
+        """
+        Resolve what get_raw_file would serve for an item, without fetching it.
+
+        Lets views answer conditional requests from object metadata alone.
+
+        Args:
+            kb_item: KnowledgeBaseItem instance
+
+        Returns:
+            Dict with object_key (None when served from the content field),
+            content_type and filename
+
+        Raises:
+            Exception: If the item has nothing to download
+        """
+        # Try to get original file first
+        if kb_item.original_file_object_key:
+            # Get filename from metadata or generate from title
+            filename = kb_item.title
+            if kb_item.metadata and isinstance(kb_item.metadata, dict):
+                filename = kb_item.metadata.get("original_filename", kb_item.title)
+
+            # Ensure filename has proper extension
+            if "." not in filename and kb_item.metadata:
+                file_ext = kb_item.metadata.get("file_extension", "")
+                if file_ext and not file_ext.startswith("."):
+                    file_ext = f".{file_ext}"
+                filename = f"{filename}{file_ext}"
+
+            # Determine content type
+            # First try to get from metadata
+            content_type = None
+            if kb_item.metadata and isinstance(kb_item.metadata, dict):
+                content_type = kb_item.metadata.get("content_type")
+
+            # If not in metadata or is default fallback, determine from file extension
+            if not content_type or content_type == "application/octet-stream":
+                from notebooks.utils.helpers import get_mime_type_from_extension
+
+                # Extract file extension from metadata or filename
+                file_ext = ""
+                if kb_item.metadata and isinstance(kb_item.metadata, dict):
+                    file_ext = kb_item.metadata.get("file_extension", "")
+
+                if not file_ext:
+                    # Extract from filename as fallback
+                    _, file_ext = os.path.splitext(filename)
+
+                # Get MIME type from extension
+                if file_ext:
+                    content_type = get_mime_type_from_extension(file_ext)
+                else:
+                    content_type = "application/octet-stream"
+
+            return {
+                "object_key": kb_item.original_file_object_key,
+                "content_type": content_type,
+                "filename": filename,
+            }
+
+        # If no original file, try processed file
+        if kb_item.file_object_key:
+            return {
+                "object_key": kb_item.file_object_key,
+                "content_type": "text/plain",  # Processed files are usually text
+                "filename": f"{kb_item.title}.txt",
+            }
+
+        # If no files in storage, return content as text file
+        if kb_item.content:
+            return {
+                "object_key": None,
+                "content_type": "text/plain; charset=utf-8",
+                "filename": f"{kb_item.title}.txt",
+            }
+
+        raise Exception("No file content available for download")
+
     def get_raw_file(
         self, kb_item: KnowledgeBaseItem, user_id: int = None
     ) -> dict[str, Any]:
@@ -931,87 +1036,18 @@ class KnowledgeBaseService(NotebookBaseService):
             if user_id is None:
                 user_id = kb_item.notebook.user.id
 
-            # Try to get original file first
-            if kb_item.original_file_object_key:
-                # Use infrastructure storage adapter for direct MinIO access
-                file_data = self.storage_adapter.get_file_content(
-                    kb_item.original_file_object_key, str(user_id)
-                )
-
-                # Get filename from metadata or generate from title
-                filename = kb_item.title
-                if kb_item.metadata and isinstance(kb_item.metadata, dict):
-                    filename = kb_item.metadata.get("original_filename", kb_item.title)
-
-                # Ensure filename has proper extension
-                if "." not in filename and kb_item.metadata:
-                    file_ext = kb_item.metadata.get("file_extension", "")
-                    if file_ext and not file_ext.startswith("."):
-                        file_ext = f".{file_ext}"
-                    filename = f"{filename}{file_ext}"
-
-                # Determine content type
-                # First try to get from metadata
-                content_type = None
-                if kb_item.metadata and isinstance(kb_item.metadata, dict):
-                    content_type = kb_item.metadata.get("content_type")
-
-                # If not in metadata or is default fallback, determine from file extension
-                if not content_type or content_type == "application/octet-stream":
-                    from notebooks.utils.helpers import get_mime_type_from_extension
+            file_info = self.describe_raw_file(kb_item)
+            object_key = file_info.pop("object_key")
 
-                    # Extract file extension from metadata or filename
-                    file_ext = ""
-                    if kb_item.metadata and isinstance(kb_item.metadata, dict):
-                        file_ext = kb_item.metadata.get("file_extension", "")
-
-                    if not file_ext:
-                        # Extract from filename as fallback
-                        import os
-
-                        _, file_ext = os.path.splitext(filename)
-
-                    # Get MIME type from extension
-                    if file_ext:
-                        content_type = get_mime_type_from_extension(file_ext)
-                    else:
-                        content_type = "application/octet-stream"
-
-                return {
-                    "data": file_data,
-                    "content_type": content_type,
-                    "filename": filename,
-                }
-
-            # If no original file, try processed file
-            elif kb_item.file_object_key:
+            if object_key:
                 # Use infrastructure storage adapter for direct MinIO access
                 file_data = self.storage_adapter.get_file_content(
-                    kb_item.file_object_key, str(user_id)
+                    object_key, str(user_id)
                 )
-
-                filename = f"{kb_item.title}.txt"  # Processed files are usually text
-                content_type = "text/plain"
-
-                return {
-                    "data": file_data,
-                    "content_type": content_type,
-                    "filename": filename,
-                }
-
-            # If no files in storage, return content as text file
-            elif kb_item.content:
-                content_bytes = kb_item.content.encode("utf-8")
-                filename = f"{kb_item.title}.txt"
-
-                return {
-                    "data": content_bytes,
-                    "content_type": "text/plain; charset=utf-8",
-                    "filename": filename,
-                }
-
             else:
-                raise Exception("No file content available for download")
+                file_data = kb_item.content.encode("utf-8")
+
+            return {"data": file_data, **file_info}
 
         except Exception as e:
             logger.exception(f"Failed to get raw file for KB item {kb_item.id}: {e}")
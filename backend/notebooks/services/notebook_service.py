@@ -285,6 +285,9 @@ class NotebookService(ModelService):
         """
         Get comprehensive statistics for a notebook.
 
+        Counts come from the incremental Redis counters maintained by the
+        notebooks signals (see services.notebook_stats), read in one round-trip.
+
         Args:
             notebook_id: ID of the notebook
             user: User who owns the notebook
@@ -292,34 +295,11 @@ class NotebookService(ModelService):
         Returns:
             Dict with notebook statistics
         """
-        from datetime import timedelta
-
-        from django.utils import timezone
+        from .notebook_stats import notebook_stats
 
         # Get notebook with permission check
         notebook = self.get_object_for_user(notebook_id, user)
 
-        # Get processing status summary
-        processing_status = notebook.get_processing_status_summary()
-
-        # Get content type summary
-        content_types = notebook.get_content_types_summary()
-
-        # Get recent activity
-        last_week = timezone.now() - timedelta(days=7)
-        recent_items = notebook.knowledge_base_items.filter(
-            created_at__gte=last_week
-        ).count()
-
-        # Count recent messages across all sessions
-        from ..models import SessionChatMessage
-
-        recent_messages = SessionChatMessage.objects.filter(
-            notebook=notebook, timestamp__gte=last_week
-        ).count()
-
-        total_messages = SessionChatMessage.objects.filter(notebook=notebook).count()
-
         stats = {
             "basic_info": {
                 "name": notebook.name,
@@ -327,23 +307,7 @@ class NotebookService(ModelService):
                 "created_at": notebook.created_at,
                 "updated_at": notebook.updated_at,
             },
-            "content_counts": {
-                "knowledge_items": notebook.knowledge_base_items.count(),
-                "chat_sessions": notebook.chat_sessions.count(),
-                "chat_messages": total_messages,
-                "batch_jobs": notebook.batch_jobs.count(),
-                "images": notebook.knowledge_base_items.with_images().count(),
-            },
-            "parsing_status": processing_status,
-            "content_types": content_types,
-            "recent_activity": {
-                "items_last_week": recent_items,
-                "messages_last_week": recent_messages,
-            },
-            "storage_info": {
-                "has_processed_content": notebook.has_processed_content(),
-                "items_with_files": notebook.knowledge_base_items.with_files().count(),
-            },
+            **notebook_stats.summarize(notebook_stats.get(notebook.id)),
         }
 
         self.log_operation(
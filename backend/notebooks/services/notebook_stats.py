@@ -0,0 +1,261 @@
+"""
+Incremental per-notebook statistics counters stored in Redis.
+
+Each notebook has one Redis hash, ``notebook_stats:{notebook_id}``, holding
+counters that model signals keep up to date as rows are created, change
+status or are deleted:
+
+- ``items``, ``items_with_files``, ``sessions``, ``messages``, ``images``,
+  ``batch_jobs``: totals
+- ``parsing:<status>`` and ``content_type:<type>``: knowledge item breakdowns
+- ``items_day:<YYYY-MM-DD>`` and ``messages_day:<YYYY-MM-DD>``: daily
+  buckets used for "last week" activity
+- ``reconciled_at``: when the hash was last rebuilt from the database
+
+Counters are updated after the surrounding transaction commits, and a
+periodic task (``reconcile_notebook_stats_task``) rebuilds them from the
+database to correct drift from queryset ``update()``/bulk operations that
+bypass signals. The stats endpoint reads everything with a single HGETALL.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "notebook_stats"
+
+# Daily activity buckets kept in the hash (the stats endpoint reports 7 days)
+ACTIVITY_WINDOW_DAYS = 7
+
+
+def stats_key(notebook_id) -> str:
+    return f"{KEY_PREFIX}:{notebook_id}"
+
+
+def _day_field(prefix: str, when) -> str | None:
+    if when is None:
+        return None
+    if hasattr(when, "date"):
+        when = timezone.localdate(when) if timezone.is_aware(when) else when.date()
+    return f"{prefix}:{when.isoformat()}"
+
+
+class NotebookStatsCounters:
+    """Read and update the Redis counters behind the notebook stats endpoint."""
+
+    def __init__(self):
+        self._client = None
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "NOTEBOOK_STATS_COUNTERS_ENABLED", True)
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            url = getattr(settings, "NOTEBOOK_STATS_REDIS_URL", None) or (
+                settings.CELERY_BROKER_URL
+            )
+            self._client = redis.Redis.from_url(url, decode_responses=True)
+        return self._client
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def apply(self, notebook_id, deltas: dict[str, int]) -> None:
+        """Apply counter deltas once the current transaction commits."""
+        deltas = {field: n for field, n in deltas.items() if field and n}
+        if not self.enabled or not notebook_id or not deltas:
+            return
+
+        key = stats_key(notebook_id)
+
+        def _do_apply():
+            try:
+                # Only touch hashes that exist; a missing hash is rebuilt
+                # from the database on the next read anyway
+                if not self.client.exists(key):
+                    return
+                pipe = self.client.pipeline(transaction=True)
+                for field, n in deltas.items():
+                    pipe.hincrby(key, field, n)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to update notebook stats {key}: {e}")
+
+        transaction.on_commit(_do_apply)
+
+    def discard(self, notebook_id) -> None:
+        """Drop a notebook's counters (e.g. after the notebook is deleted)."""
+        if not self.enabled or not notebook_id:
+            return
+
+        def _do_discard():
+            try:
+                self.client.delete(stats_key(notebook_id))
+            except Exception as e:
+                logger.warning(f"Failed to delete notebook stats {notebook_id}: {e}")
+
+        transaction.on_commit(_do_discard)
+
+    # ------------------------------------------------------------------
+    # Reads and reconciliation
+    # ------------------------------------------------------------------
+
+    def get(self, notebook_id) -> dict[str, int]:
+        """
+        Return the raw counters for a notebook in one round-trip.
+
+        Missing hashes are rebuilt from the database. When Redis is unavailable
+        the counters are computed from the database without being stored.
+        """
+        if self.enabled:
+            try:
+                counters = self.client.hgetall(stats_key(notebook_id))
+                if counters:
+                    return {field: int(value) for field, value in counters.items()}
+                return self.reconcile(notebook_id)
+            except redis.RedisError as e:
+                logger.warning(f"Notebook stats unavailable from Redis: {e}")
+
+        return self.compute_from_db(notebook_id)
+
+    def reconcile(self, notebook_id) -> dict[str, int]:
+        """Rebuild a notebook's counters from the database."""
+        counters = self.compute_from_db(notebook_id)
+        if not self.enabled:
+            return counters
+
+        key = stats_key(notebook_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, mapping=counters)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to store notebook stats {key}: {e}")
+        return counters
+
+    def compute_from_db(self, notebook_id) -> dict[str, int]:
+        """Compute all counters with grouped queries."""
+        from ..models import (
+            BatchJob,
+            ChatSession,
+            KnowledgeBaseImage,
+            KnowledgeBaseItem,
+            SessionChatMessage,
+        )
+
+        since = timezone.now() - timedelta(days=ACTIVITY_WINDOW_DAYS + 1)
+        counters: dict[str, int] = defaultdict(int)
+
+        items = KnowledgeBaseItem.objects.filter(notebook_id=notebook_id).order_by()
+        for row in items.values("parsing_status").annotate(n=Count("id")):
+            counters[f"parsing:{row['parsing_status']}"] = row["n"]
+        for row in items.values("content_type").annotate(n=Count("id")):
+            counters[f"content_type:{row['content_type']}"] = row["n"]
+        for row in (
+            items.filter(created_at__gte=since)
+            .annotate(day=TruncDate("created_at"))
+            .values("day")
+            .annotate(n=Count("id"))
+        ):
+            counters[_day_field("items_day", row["day"])] = row["n"]
+
+        totals = items.aggregate(
+            items=Count("id"),
+            items_with_files=Count(
+                "id",
+                filter=Q(file_object_key__isnull=False)
+                | Q(original_file_object_key__isnull=False),
+            ),
+        )
+        counters.update(totals)
+
+        messages = SessionChatMessage.objects.filter(notebook_id=notebook_id).order_by()
+        counters["messages"] = messages.count()
+        for row in (
+            messages.filter(timestamp__gte=since)
+            .annotate(day=TruncDate("timestamp"))
+            .values("day")
+            .annotate(n=Count("id"))
+        ):
+            counters[_day_field("messages_day", row["day"])] = row["n"]
+
+        counters["sessions"] = ChatSession.objects.filter(
+            notebook_id=notebook_id
+        ).count()
+        counters["images"] = KnowledgeBaseImage.objects.filter(
+            knowledge_base_item__notebook_id=notebook_id
+        ).count()
+        counters["batch_jobs"] = BatchJob.objects.filter(
+            notebook_id=notebook_id
+        ).count()
+        counters["reconciled_at"] = int(time.time())
+
+        return dict(counters)
+
+    # ------------------------------------------------------------------
+    # Presentation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def summarize(counters: dict[str, int], today: date | None = None) -> dict:
+        """Shape raw counters into the stats endpoint's sections."""
+        today = today or timezone.localdate()
+        window = {
+            (today - timedelta(days=offset)).isoformat()
+            for offset in range(ACTIVITY_WINDOW_DAYS)
+        }
+
+        parsing_status: dict[str, int] = {}
+        content_types: dict[str, int] = {}
+        items_last_week = 0
+        messages_last_week = 0
+
+        for field, value in counters.items():
+            prefix, _, suffix = field.partition(":")
+            if not suffix or value <= 0:
+                continue
+            if prefix == "parsing":
+                parsing_status[suffix] = value
+            elif prefix == "content_type":
+                content_types[suffix] = value
+            elif prefix == "items_day" and suffix in window:
+                items_last_week += value
+            elif prefix == "messages_day" and suffix in window:
+                messages_last_week += value
+
+        return {
+            "content_counts": {
+                "knowledge_items": counters.get("items", 0),
+                "chat_sessions": counters.get("sessions", 0),
+                "chat_messages": counters.get("messages", 0),
+                "batch_jobs": counters.get("batch_jobs", 0),
+                "images": counters.get("images", 0),
+            },
+            "parsing_status": parsing_status,
+            "content_types": content_types,
+            "recent_activity": {
+                "items_last_week": items_last_week,
+                "messages_last_week": messages_last_week,
+            },
+            "storage_info": {
+                "has_processed_content": parsing_status.get("done", 0) > 0,
+                "items_with_files": counters.get("items_with_files", 0),
+            },
+        }
+
+
+notebook_stats = NotebookStatsCounters()
@@ -4,16 +4,27 @@ Signals for notebooks app: ensure MinIO objects are deleted when DB rows are rem
 Best practice: collect object keys in pre_delete and perform deletions after
 the database transaction commits (transaction.on_commit) to avoid deleting
 files when a transaction is rolled back.
+
+Also keeps the incremental notebook stats counters (services.notebook_stats)
+in step with knowledge items, chat sessions/messages, images and batch jobs.
 """
 
 import logging
 
 from django.db import transaction
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
 from django.dispatch import receiver
 from infrastructure.storage.adapters import get_storage_backend
 
-from .models import KnowledgeBaseImage, KnowledgeBaseItem
+from .models import (
+    BatchJob,
+    ChatSession,
+    KnowledgeBaseImage,
+    KnowledgeBaseItem,
+    Notebook,
+    SessionChatMessage,
+)
+from .services.notebook_stats import _day_field, notebook_stats
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +111,7 @@ def delete_kb_files_on_pre_delete(sender, instance: KnowledgeBaseItem, using, **
                     logger.info(
                         f"Successfully deleted RagFlow document '{instance.title}' (ID: {instance.ragflow_document_id}) from dataset {instance.notebook.ragflow_dataset_id}"
                     )
+                    instance.bump_ragflow_dataset_version()
 
                     # Trigger dataset update to refresh embeddings after document deletion
                     try:
@@ -159,3 +171,163 @@ def delete_kb_files_on_pre_delete(sender, instance: KnowledgeBaseItem, using, **
 
     except Exception as e:
         logger.error(f"Error during KB item deletion for {instance.id}: {e}")
+
+
+# ==============================================================================
+# NOTEBOOK STATS COUNTERS
+# ==============================================================================
+
+# KnowledgeBaseItem fields whose transitions move stats counters
+_KB_STATS_FIELDS = (
+    "notebook_id",
+    "parsing_status",
+    "content_type",
+    "file_object_key",
+    "original_file_object_key",
+)
+
+
+def _kb_stats_snapshot(instance: KnowledgeBaseItem) -> dict:
+    # Read from __dict__ so deferred fields are not loaded just for stats
+    return {field: instance.__dict__.get(field) for field in _KB_STATS_FIELDS}
+
+
+def _kb_stats_fields(snapshot: dict) -> dict[str, int]:
+    has_files = (
+        snapshot.get("file_object_key") is not None
+        or snapshot.get("original_file_object_key") is not None
+    )
+    return {
+        f"parsing:{snapshot.get('parsing_status')}": 1,
+        f"content_type:{snapshot.get('content_type')}": 1,
+        "items_with_files": int(has_files),
+    }
+
+
+@receiver(post_init, sender=KnowledgeBaseItem)
+def remember_kb_item_stats_state(sender, instance: KnowledgeBaseItem, **kwargs):
+    """Snapshot counter-relevant fields so post_save can compute deltas."""
+    instance._stats_snapshot = _kb_stats_snapshot(instance)
+
+
+@receiver(post_save, sender=KnowledgeBaseItem)
+def update_stats_on_kb_item_save(
+    sender, instance: KnowledgeBaseItem, created, update_fields=None, **kwargs
+):
+    try:
+        previous = getattr(instance, "_stats_snapshot", None) or {}
+        current = _kb_stats_snapshot(instance)
+        # Fields left out of a partial save (or deferred) keep their old values
+        for field, value in previous.items():
+            if field not in instance.__dict__:
+                current[field] = value
+        instance._stats_snapshot = current
+
+        if created:
+            deltas = _kb_stats_fields(current)
+            deltas["items"] = 1
+            deltas[_day_field("items_day", instance.created_at)] = 1
+            notebook_stats.apply(current["notebook_id"], deltas)
+            return
+
+        if current == previous:
+            return
+
+        old_fields = _kb_stats_fields(previous)
+        new_fields = _kb_stats_fields(current)
+        if previous.get("notebook_id") != current["notebook_id"]:
+            # Item moved between notebooks
+            day = _day_field("items_day", instance.created_at)
+            notebook_stats.apply(
+                previous.get("notebook_id"),
+                {**{f: -n for f, n in old_fields.items()}, "items": -1, day: -1},
+            )
+            notebook_stats.apply(
+                current["notebook_id"], {**new_fields, "items": 1, day: 1}
+            )
+            return
+
+        deltas: dict[str, int] = {}
+        for field, n in old_fields.items():
+            deltas[field] = deltas.get(field, 0) - n
+        for field, n in new_fields.items():
+            deltas[field] = deltas.get(field, 0) + n
+        notebook_stats.apply(current["notebook_id"], deltas)
+    except Exception as e:
+        logger.warning(f"Failed to update notebook stats for KB item {instance.pk}: {e}")
+
+
+@receiver(post_delete, sender=KnowledgeBaseItem)
+def update_stats_on_kb_item_delete(sender, instance: KnowledgeBaseItem, **kwargs):
+    try:
+        snapshot = getattr(instance, "_stats_snapshot", None) or _kb_stats_snapshot(
+            instance
+        )
+        deltas = {field: -n for field, n in _kb_stats_fields(snapshot).items()}
+        deltas["items"] = -1
+        deltas[_day_field("items_day", instance.created_at)] = -1
+        notebook_stats.apply(snapshot.get("notebook_id"), deltas)
+    except Exception as e:
+        logger.warning(f"Failed to update notebook stats for KB item {instance.pk}: {e}")
+
+
+@receiver(post_save, sender=SessionChatMessage)
+def update_stats_on_message_save(sender, instance, created, **kwargs):
+    if created:
+        notebook_stats.apply(
+            instance.notebook_id,
+            {"messages": 1, _day_field("messages_day", instance.timestamp): 1},
+        )
+
+
+@receiver(post_delete, sender=SessionChatMessage)
+def update_stats_on_message_delete(sender, instance, **kwargs):
+    notebook_stats.apply(
+        instance.notebook_id,
+        {"messages": -1, _day_field("messages_day", instance.timestamp): -1},
+    )
+
+
+@receiver(post_save, sender=ChatSession)
+@receiver(post_save, sender=BatchJob)
+def update_stats_on_notebook_child_save(sender, instance, created, **kwargs):
+    if created:
+        field = "sessions" if sender is ChatSession else "batch_jobs"
+        notebook_stats.apply(instance.notebook_id, {field: 1})
+
+
+@receiver(post_delete, sender=ChatSession)
+@receiver(post_delete, sender=BatchJob)
+def update_stats_on_notebook_child_delete(sender, instance, **kwargs):
+    field = "sessions" if sender is ChatSession else "batch_jobs"
+    notebook_stats.apply(instance.notebook_id, {field: -1})
+
+
+def _image_notebook_id(instance: KnowledgeBaseImage):
+    item = KnowledgeBaseImage.knowledge_base_item.field.get_cached_value(
+        instance, default=None
+    )
+    if item is not None:
+        return item.notebook_id
+    return (
+        KnowledgeBaseItem.objects.filter(pk=instance.knowledge_base_item_id)
+        .values_list("notebook_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=KnowledgeBaseImage)
+def update_stats_on_image_save(sender, instance: KnowledgeBaseImage, created, **kwargs):
+    if created:
+        notebook_stats.apply(_image_notebook_id(instance), {"images": 1})
+
+
+@receiver(pre_delete, sender=KnowledgeBaseImage)
+def update_stats_on_image_delete(sender, instance: KnowledgeBaseImage, **kwargs):
+    # Resolved before deletion: a cascading item delete removes the parent row
+    notebook_stats.apply(_image_notebook_id(instance), {"images": -1})
+
+
+@receiver(post_delete, sender=Notebook)
+def discard_stats_on_notebook_delete(sender, instance: Notebook, **kwargs):
+    notebook_stats.discard(instance.pk)
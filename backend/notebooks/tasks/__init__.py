@@ -6,6 +6,7 @@ This package has been refactored into modules for better organization:
 - ragflow_tasks.py: RAGFlow upload and status checking tasks
 - processing_tasks.py: URL/file processing and parsing tasks (TODO)
 - maintenance_tasks.py: Cleanup, health check, and testing tasks
+- coordinator_tasks.py: Studio coordinator (research + writing) execution
 
 All tasks are re-exported here for backward compatibility.
 """
@@ -25,6 +26,7 @@ from ._helpers import (
 from .maintenance_tasks import (
     cleanup_old_batch_jobs,
     health_check_task,
+    reconcile_notebook_stats_task,
     test_caption_generation_task,
 )
 
@@ -34,6 +36,9 @@ from .ragflow_tasks import (
     check_ragflow_status_task,
 )
 
+# Import coordinator tasks
+from .coordinator_tasks import execute_studio_task
+
 # Import processing tasks
 from .processing_tasks import (
     parse_url_task,
@@ -67,8 +72,11 @@ __all__ = [
     "process_url_document_task",
     "process_file_upload_task",
     "generate_image_captions_task",
+    # Coordinator tasks
+    "execute_studio_task",
     # Maintenance tasks
     "cleanup_old_batch_jobs",
+    "reconcile_notebook_stats_task",
     "test_caption_generation_task",
     "health_check_task",
 ]
@@ -0,0 +1,165 @@
+"""
+Coordinator (Studio mode) tasks for notebooks app.
+
+Runs the research-plus-writing coordinator pipeline in a dedicated worker
+queue. Task state lives on the StudioTask row and progress is published to
+the notebook SSE channel, so web workers only relay events.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import shared_task
+from core.utils.sse import publish_notebook_event
+from django.utils import timezone
+
+from ..models import StudioTask
+
+logger = logging.getLogger(__name__)
+
+STUDIO_TASK_ENTITY = "studio_task"
+
+# How often the running task checks whether it has been cancelled
+CANCEL_POLL_INTERVAL_SECONDS = 5
+
+
+def publish_studio_event(task: StudioTask, status: str, payload: dict | None = None):
+    """Publish a studio task event on the notebook SSE channel."""
+    publish_notebook_event(
+        notebook_id=str(task.notebook_id),
+        entity=STUDIO_TASK_ENTITY,
+        entity_id=str(task.id),
+        status=status,
+        payload=payload,
+    )
+
+
+def _build_task_options(options: dict):
+    from agents.coordinator.schema import TaskOptions
+
+    return TaskOptions(
+        style=options.get("style", "academic"),
+        # Nobody can answer clarification questions from inside a worker
+        skip_clarification=True,
+        max_research_iterations=options.get("max_research_iterations"),
+        outline_first=options.get("outline_first"),
+        timeout=options.get("timeout"),
+    )
+
+
+async def _run_until_cancelled(task_id: str, coro):
+    """
+    Run the coordinator coroutine, cancelling it if the task is cancelled.
+
+    Cancellation propagates through the coordinator's step scheduler, so
+    in-flight research and writing steps are cancelled as well.
+    """
+    from asgiref.sync import sync_to_async
+
+    @sync_to_async
+    def is_cancelled() -> bool:
+        return StudioTask.objects.filter(id=task_id, status="cancelled").exists()
+
+    main = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({main}, timeout=CANCEL_POLL_INTERVAL_SECONDS)
+        if done:
+            return main.result()
+        if await is_cancelled():
+            main.cancel()
+            try:
+                await main
+            except asyncio.CancelledError:
+                pass
+            return None
+
+
+@shared_task(bind=True)
+def execute_studio_task(self, task_id: str):
+    """
+    Execute a coordinator task for Studio mode.
+
+    Args:
+        task_id: UUID of the StudioTask to execute
+    """
+    try:
+        task = StudioTask.objects.get(id=task_id)
+    except StudioTask.DoesNotExist:
+        logger.warning(f"Studio task {task_id} not found, skipping")
+        return {"status": "missing"}
+
+    if task.status == "cancelled":
+        logger.info(f"Studio task {task_id} was cancelled before processing started")
+        return {"status": "cancelled"}
+
+    task.status = "executing"
+    task.started_at = timezone.now()
+    task.save(update_fields=["status", "started_at", "updated_at"])
+    publish_studio_event(task, "STARTED", {"goal": task.goal})
+
+    # The ORM refuses to run inside the coordinator's event loop, so progress
+    # rows are written from a single background thread (which keeps order)
+    progress_writer = ThreadPoolExecutor(max_workers=1)
+
+    def on_progress(progress: dict):
+        progress_writer.submit(
+            StudioTask.objects.filter(id=task.id).update, progress=progress
+        )
+        publish_studio_event(task, "PROGRESS", progress)
+
+    try:
+        from agents.coordinator import execute_task
+
+        options = _build_task_options(task.options or {})
+        result = asyncio.run(
+            _run_until_cancelled(
+                task_id,
+                execute_task(task.goal, options, progress_callback=on_progress),
+            )
+        )
+
+        progress_writer.shutdown(wait=True)
+        task.refresh_from_db()
+        if result is None or task.status == "cancelled":
+            logger.info(f"Studio task {task_id} cancelled during execution")
+            publish_studio_event(task, "CANCELLED")
+            return {"status": "cancelled"}
+
+        if result.status.value != "completed":
+            error_message = result.error_message or "Task failed"
+            task.mark_finished("failed", error_message)
+            publish_studio_event(task, "FAILURE", {"error": error_message})
+            return {"status": "failed", "error": error_message}
+
+        task.result = {
+            "findings": result.findings,
+            "final_report": result.final_report,
+            "sources": result.sources,
+            "critical_path": result.critical_path,
+            "total_duration_ms": result.total_duration_ms,
+        }
+        task.save(update_fields=["result", "updated_at"])
+        task.mark_finished("completed")
+
+        publish_studio_event(
+            task,
+            "SUCCESS",
+            {
+                "findings": result.findings[:500] if result.findings else None,
+                "report_preview": (
+                    result.final_report[:1000] if result.final_report else None
+                ),
+                "source_count": len(result.sources) if result.sources else 0,
+            },
+        )
+        return {"status": "completed"}
+
+    except Exception as e:
+        logger.exception(f"Studio task {task_id} failed: {e}")
+        task.mark_finished("failed", str(e))
+        publish_studio_event(task, "FAILURE", {"error": str(e)})
+        return {"status": "failed", "error": str(e)}
+
+    finally:
+        progress_writer.shutdown(wait=True)
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 from celery import shared_task
 from django.utils import timezone
 
-from ..models import BatchJob, KnowledgeBaseItem
+from ..models import BatchJob, Notebook
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,40 @@ def cleanup_old_batch_jobs():
         raise
 
 
+@shared_task
+def reconcile_notebook_stats_task(batch_size: int = 500):
+    """
+    Rebuild cached notebook stats counters from the database.
+
+    Signals keep the counters current, but queryset update()/bulk operations
+    bypass them; this periodic pass corrects any drift. Only notebooks with a
+    live counter hash are reconciled, the rest are rebuilt lazily on read.
+    """
+    from ..services.notebook_stats import KEY_PREFIX, notebook_stats
+
+    if not notebook_stats.enabled:
+        return {"reconciled": 0}
+
+    reconciled = 0
+    try:
+        for key in notebook_stats.client.scan_iter(
+            match=f"{KEY_PREFIX}:*", count=batch_size
+        ):
+            notebook_id = key.split(":", 1)[1]
+            if not Notebook.objects.filter(pk=notebook_id).exists():
+                notebook_stats.client.delete(key)
+                continue
+            notebook_stats.reconcile(notebook_id)
+            reconciled += 1
+
+        logger.info(f"Reconciled stats counters for {reconciled} notebooks")
+        return {"reconciled": reconciled}
+
+    except Exception as e:
+        logger.error(f"Error reconciling notebook stats: {e}")
+        raise
+
+
 @shared_task
 def test_caption_generation_task(kb_item_id: str):
     """Test task to verify caption generation works."""
@@ -6,14 +6,7 @@ This package contains focused test modules:
 - test_serializers.py: Serializer tests
 - test_views.py: View tests
 - test_services.py: Service tests
+- test_services_input_assembly.py: Input assembly tests
 - test_tasks.py: Task tests
 - test_validators.py: Validator tests
 """
-
-# Import all test modules for test discovery
-from .test_models import *
-from .test_serializers import *
-from .test_services import *
-from .test_tasks import *
-from .test_validators import *
-from .test_views import *
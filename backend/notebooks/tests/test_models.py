@@ -5,7 +5,7 @@ Model tests for the notebooks module.
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from ..models import BatchJob, BatchJobItem, KnowledgeBaseItem, Notebook, Source
+from ..models import BatchJob, BatchJobItem, KnowledgeBaseItem, Notebook
 
 User = get_user_model()
 
@@ -55,42 +55,6 @@ class NotebookModelTests(TestCase):
         self.assertEqual(user2_notebooks.first(), notebook2)
 
 
-class SourceModelTests(TestCase):
-    """Test cases for Source model."""
-
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-        self.notebook = Notebook.objects.create(user=self.user, name="Test Notebook")
-
-    def test_source_creation(self):
-        """Test source creation."""
-        source = Source.objects.create(
-            notebook=self.notebook, source_type="file", title="test.pdf"
-        )
-
-        self.assertEqual(source.notebook, self.notebook)
-        self.assertEqual(source.source_type, "file")
-        self.assertEqual(source.title, "test.pdf")
-        self.assertEqual(source.parsing_status, "pending")
-
-    def test_source_str_representation(self):
-        """Test source string representation."""
-        source = Source.objects.create(
-            notebook=self.notebook, source_type="url", title="https://example.com"
-        )
-
-        self.assertEqual(str(source), "https://example.com")
-
-        # Test without title
-        source_no_title = Source.objects.create(
-            notebook=self.notebook, source_type="file"
-        )
-
-        self.assertTrue(str(source_no_title).startswith("Source"))
-
-
 class KnowledgeBaseItemModelTests(TestCase):
     """Test cases for KnowledgeBaseItem model."""
 
@@ -0,0 +1,58 @@
+"""
+Input assembly tests for the notebooks module.
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ..models import KnowledgeBaseItem, Notebook
+from ..services.input_assembly import KnowledgeInputAssembler, allocate_budget
+
+User = get_user_model()
+
+
+class KnowledgeInputAssemblerTests(TestCase):
+    """Test cases for token-budgeted input assembly."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.notebook = Notebook.objects.create(user=self.user, name="Notebook")
+
+    def _item(self, title, content):
+        return KnowledgeBaseItem.objects.create(
+            notebook=self.notebook, title=title, content=content, metadata={}
+        )
+
+    def test_allocate_budget_keeps_short_items_whole(self):
+        """Test that unused share of short items goes to longer ones."""
+        allocation = allocate_budget({"a": 10, "b": 100, "c": 100}, budget=110)
+
+        self.assertEqual(allocation, {"a": 10, "b": 50, "c": 50})
+        self.assertEqual(allocate_budget({"a": 10}, budget=None), {"a": 10})
+
+    def test_iter_items_truncates_in_database_and_keeps_order(self):
+        """Test that items come back budgeted, owned and in selection order."""
+        long_item = self._item("Long", "x" * 400)
+        short_item = self._item("Short", "short text")
+        empty_item = self._item("Empty", "")
+        other = User.objects.create_user(username="other", password="pass")
+        foreign = KnowledgeBaseItem.objects.create(
+            notebook=Notebook.objects.create(user=other, name="Other"),
+            title="Foreign",
+            content="secret",
+            metadata={},
+        )
+
+        items = list(
+            KnowledgeInputAssembler(token_budget=25).iter_items(
+                [short_item.id, empty_item.id, foreign.id, long_item.id],
+                user_id=self.user.id,
+            )
+        )
+
+        self.assertEqual([item.title for item in items], ["Short", "Long"])
+        self.assertEqual(items[0].content, "short text")
+        self.assertEqual(len(items[1].content), 100 - len("short text"))
+        self.assertTrue(items[1].truncated)
@@ -5,6 +5,8 @@ View tests for the notebooks module.
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -14,6 +16,12 @@ from ..models import KnowledgeBaseItem, Notebook
 User = get_user_model()
 
 
+def load_urlconf():
+    """Load the URLconf, whose report views connect to MinIO on import."""
+    with patch("notebooks.utils.storage.get_minio_backend"):
+        reverse("notebooks:notebook-list")
+
+
 class NotebookViewTests(APITestCase):
     """Test cases for Notebook API views."""
 
@@ -22,10 +30,11 @@ class NotebookViewTests(APITestCase):
             username="testuser", email="test@example.com", password="testpass123"
         )
         self.client.force_authenticate(user=self.user)
+        load_urlconf()
 
     def test_create_notebook(self):
         """Test notebook creation via API."""
-        url = reverse("notebook-list-create")
+        url = reverse("notebooks:notebook-list")
         data = {"name": "Test Notebook", "description": "Test description"}
 
         response = self.client.post(url, data, format="json")
@@ -48,18 +57,75 @@ class NotebookViewTests(APITestCase):
         )
         Notebook.objects.create(user=other_user, name="Other Notebook")
 
-        url = reverse("notebook-list-create")
+        url = reverse("notebooks:notebook-list")
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
         self.assertEqual(response.data[0]["name"], "Notebook 2")  # Most recent first
 
+    def _create_notebook_with_items(self, name, item_count=3):
+        notebook = Notebook.objects.create(user=self.user, name=name)
+        for i in range(item_count):
+            KnowledgeBaseItem.objects.create(
+                notebook=notebook,
+                title=f"{name} item {i}",
+                content_type="document",
+                parsing_status="done" if i % 2 == 0 else "parsing",
+            )
+        return notebook
+
+    def _count_list_queries(self):
+        url = reverse("notebooks:notebook-list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_notebooks_query_count_is_constant(self):
+        """Test that listing notebooks doesn't issue per-notebook queries."""
+        self._create_notebook_with_items("Notebook 1")
+        few = self._count_list_queries()
+
+        for i in range(2, 8):
+            self._create_notebook_with_items(f"Notebook {i}")
+        many = self._count_list_queries()
+
+        self.assertEqual(few, many)
+        self.assertLessEqual(many, 3)
+
+    def test_list_notebooks_counts_from_annotations(self):
+        """Test that annotated counts match the notebook contents."""
+        self._create_notebook_with_items("Counted", item_count=3)
+
+        url = reverse("notebooks:notebook-list")
+        response = self.client.get(url)
+
+        rows = response.data["results"] if "results" in response.data else response.data
+        row = rows[0]
+        self.assertEqual(row["source_count"], 3)
+        self.assertEqual(row["knowledge_item_count"], 2)
+        self.assertTrue(row["has_parsed_files"])
+
+    def test_notebook_stats(self):
+        """Test the notebook stats endpoint counts."""
+        notebook = self._create_notebook_with_items("Stats", item_count=3)
+
+        url = reverse("notebooks:notebook-stats", kwargs={"pk": str(notebook.id)})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["content_counts"]["knowledge_items"], 3)
+        self.assertEqual(response.data["parsing_status"], {"done": 2, "parsing": 1})
+        self.assertEqual(response.data["content_types"], {"document": 3})
+        self.assertEqual(response.data["recent_activity"]["items_last_week"], 3)
+        self.assertTrue(response.data["storage_info"]["has_processed_content"])
+
     def test_retrieve_notebook(self):
         """Test notebook retrieval via API."""
         notebook = Notebook.objects.create(user=self.user, name="Test Notebook")
 
-        url = reverse("notebook-detail", kwargs={"pk": str(notebook.id)})
+        url = reverse("notebooks:notebook-detail", kwargs={"pk": str(notebook.id)})
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -69,7 +135,7 @@ class NotebookViewTests(APITestCase):
         """Test that unauthorized users cannot access notebooks."""
         self.client.force_authenticate(user=None)
 
-        url = reverse("notebook-list-create")
+        url = reverse("notebooks:notebook-list")
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -82,7 +148,9 @@ class NotebookViewTests(APITestCase):
         other_notebook = Notebook.objects.create(user=other_user, name="Other Notebook")
 
         # Try to access other user's notebook
-        url = reverse("notebook-detail", kwargs={"pk": str(other_notebook.id)})
+        url = reverse(
+            "notebooks:notebook-detail", kwargs={"pk": str(other_notebook.id)}
+        )
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -108,21 +176,32 @@ class FileViewSetTests(APITestCase):
         self.file_item = KnowledgeBaseItem.objects.create(
             notebook=self.notebook,
             title="test_file.pdf",
-            content_type="application/pdf",
-            file_path="/path/to/test_file.pdf",
+            content_type="document",
+            original_file_object_key=f"{self.user.id}/kb/test_file.pdf",
         )
         self.other_file_item = KnowledgeBaseItem.objects.create(
             notebook=self.other_notebook,
             title="other_file.pdf",
-            content_type="application/pdf",
-            file_path="/path/to/other_file.pdf",
+            content_type="document",
+            original_file_object_key=f"{self.other_user.id}/kb/other_file.pdf",
         )
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_raw_action_returns_attachment(self, mock_kb_service):
+        # The viewset builds its service per request, so patch the class
+        patcher = patch("notebooks.views.file_views.KnowledgeBaseService")
+        self.kb_service = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        # Without an object key the file body comes from get_raw_file
+        self.kb_service.describe_raw_file.return_value = {
+            "object_key": None,
+            "content_type": "application/pdf",
+            "filename": "test_file.pdf",
+        }
+        load_urlconf()
+
+    def test_raw_action_returns_attachment(self):
         """Test that the raw action returns Content-Disposition: attachment."""
         # Mock the service response
-        mock_kb_service.get_raw_file.return_value = {
+        self.kb_service.get_raw_file.return_value = {
             "data": b"fake file content",
             "content_type": "application/pdf",
             "filename": "test_file.pdf",
@@ -139,11 +218,10 @@ class FileViewSetTests(APITestCase):
         self.assertNotIn("X-Content-Type-Options", response)
         self.assertEqual(response.content, b"fake file content")
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_inline_action_returns_inline(self, mock_kb_service):
+    def test_inline_action_returns_inline(self):
         """Test that the inline action returns Content-Disposition: inline with security headers."""
         # Mock the service response
-        mock_kb_service.get_raw_file.return_value = {
+        self.kb_service.get_raw_file.return_value = {
             "data": b"fake file content",
             "content_type": "application/pdf",
             "filename": "test_file.pdf",
@@ -160,25 +238,94 @@ class FileViewSetTests(APITestCase):
         self.assertEqual(response["X-Content-Type-Options"], "nosniff")
         self.assertEqual(response.content, b"fake file content")
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_inline_action_permission_check(self, mock_kb_service):
+    @patch("notebooks.views.FileViewSet.stat_storage_object")
+    def test_inline_action_not_modified_skips_fetch(self, mock_stat):
+        """Test that a matching If-None-Match returns 304 without fetching the body."""
+        self.kb_service.describe_raw_file.return_value = {
+            "object_key": "1/kb/test_file.pdf",
+            "content_type": "application/pdf",
+            "filename": "test_file.pdf",
+        }
+        mock_stat.return_value = ("abc123", None, 17)
+
+        url = f"/api/v1/notebooks/{self.notebook.id}/files/{self.file_item.id}/inline/"
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"abc123"')
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], '"abc123"')
+        mock_stat.assert_called_once_with("1/kb/test_file.pdf")
+        self.kb_service.get_raw_file.assert_not_called()
+
+    @patch("notebooks.utils.storage.get_minio_backend")
+    @patch("notebooks.views.FileViewSet.stat_storage_object")
+    def test_inline_action_range_request_streams_partial_content(
+        self, mock_stat, mock_get_backend
+    ):
+        """Test that a Range request streams only the requested bytes as a 206."""
+        object_key = f"{self.user.id}/kb/test_file.pdf"
+        self.kb_service.describe_raw_file.return_value = {
+            "object_key": object_key,
+            "content_type": "application/pdf",
+            "filename": "test_file.pdf",
+        }
+        mock_stat.return_value = ("abc123", None, 17)
+        mock_get_backend.return_value.stream_file.return_value = (
+            iter([b"fake "]),
+            5,
+            "application/pdf",
+        )
+
+        url = f"/api/v1/notebooks/{self.notebook.id}/files/{self.file_item.id}/inline/"
+        response = self.client.get(url, HTTP_RANGE="bytes=0-4")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response["Content-Range"], "bytes 0-4/17")
+        self.assertEqual(response["Content-Length"], "5")
+        self.assertEqual(b"".join(response.streaming_content), b"fake ")
+        mock_get_backend.return_value.stream_file.assert_called_once_with(
+            object_key, offset=0, length=5
+        )
+        self.kb_service.get_raw_file.assert_not_called()
+
+    @patch("notebooks.utils.storage.get_minio_backend")
+    @patch("notebooks.views.FileViewSet.stat_storage_object")
+    def test_inline_action_suffix_range_of_empty_file_is_unsatisfiable(
+        self, mock_stat, mock_get_backend
+    ):
+        """Test that a suffix Range on a 0-byte object returns 416."""
+        self.kb_service.describe_raw_file.return_value = {
+            "object_key": f"{self.user.id}/kb/test_file.pdf",
+            "content_type": "application/pdf",
+            "filename": "test_file.pdf",
+        }
+        mock_stat.return_value = ("abc123", None, 0)
+
+        url = f"/api/v1/notebooks/{self.notebook.id}/files/{self.file_item.id}/inline/"
+        response = self.client.get(url, HTTP_RANGE="bytes=-5")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */0")
+        mock_get_backend.return_value.stream_file.assert_not_called()
+
+    def test_inline_action_permission_check(self):
         """Test that the inline action enforces permission checks."""
         # Try to access another user's file
         url = f"/api/v1/notebooks/{self.other_notebook.id}/files/{self.other_file_item.id}/inline/"
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        mock_kb_service.get_raw_file.assert_not_called()
+        self.kb_service.get_raw_file.assert_not_called()
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_raw_action_permission_check(self, mock_kb_service):
+    def test_raw_action_permission_check(self):
         """Test that the raw action enforces permission checks."""
         # Try to access another user's file
         url = f"/api/v1/notebooks/{self.other_notebook.id}/files/{self.other_file_item.id}/raw/"
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        mock_kb_service.get_raw_file.assert_not_called()
+        self.kb_service.get_raw_file.assert_not_called()
 
     def test_inline_action_unauthenticated(self):
         """Test that the inline action requires authentication."""
@@ -189,11 +336,10 @@ class FileViewSetTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_inline_action_service_error(self, mock_kb_service):
+    def test_inline_action_service_error(self):
         """Test that the inline action handles service errors gracefully."""
         # Mock the service to raise an exception
-        mock_kb_service.get_raw_file.side_effect = Exception("Service error")
+        self.kb_service.get_raw_file.side_effect = Exception("Service error")
 
         url = f"/api/v1/notebooks/{self.notebook.id}/files/{self.file_item.id}/inline/"
         response = self.client.get(url)
@@ -202,8 +348,7 @@ class FileViewSetTests(APITestCase):
         self.assertIn("detail", response.data)
         self.assertEqual(response.data["detail"], "Service error")
 
-    @patch("notebooks.views.FileViewSet.kb_service")
-    def test_inline_action_handles_different_content_types(self, mock_kb_service):
+    def test_inline_action_handles_different_content_types(self):
         """Test that the inline action preserves content types correctly."""
         test_cases = [
             {
@@ -225,7 +370,7 @@ class FileViewSetTests(APITestCase):
 
         for case in test_cases:
             with self.subTest(content_type=case["content_type"]):
-                mock_kb_service.get_raw_file.return_value = case
+                self.kb_service.get_raw_file.return_value = case
 
                 url = f"/api/v1/notebooks/{self.notebook.id}/files/{self.file_item.id}/inline/"
                 response = self.client.get(url)
@@ -238,3 +383,30 @@ class FileViewSetTests(APITestCase):
                 )
                 self.assertEqual(response["X-Content-Type-Options"], "nosniff")
                 self.assertEqual(response.content, case["data"])
+
+    def test_list_omits_content_and_reports_length(self):
+        """Test that the file list defers content and exposes its length."""
+        self.file_item.content = "x" * 1234
+        self.file_item.save(update_fields=["content"])
+
+        url = reverse(
+            "notebooks:notebook-files-list", kwargs={"notebook_pk": self.notebook.id}
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = response.data["results"][0]
+        self.assertNotIn("content", row)
+        self.assertNotIn("file_url", row)
+        self.assertEqual(row["content_length"], 1234)
+
+    def test_list_supports_field_selection(self):
+        """Test that ?fields= limits the returned fields."""
+        url = reverse(
+            "notebooks:notebook-files-list", kwargs={"notebook_pk": self.notebook.id}
+        )
+        response = self.client.get(url, {"fields": "title,parsing_status"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"id", "title", "parsing_status"})
@@ -9,7 +9,9 @@ import os
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from core.instrumentation import InstrumentedClient
 from django.conf import settings
+from infrastructure.storage.presigned import PresignedURLCache
 
 from .helpers import calculate_content_hash, calculate_source_hash
 
@@ -43,6 +45,8 @@ class MinIOBackend:
         # Ensure bucket exists
         self._ensure_bucket_exists()
 
+        self._url_cache = PresignedURLCache(self._sign_url)
+
         self.logger.info(f"MinIO backend initialized with bucket: {self.bucket_name}")
 
     def _initialize_client(self) -> Minio:
@@ -66,12 +70,13 @@ class MinIOBackend:
         access_key = getattr(settings, "MINIO_ACCESS_KEY", "minioadmin")
         secret_key = getattr(settings, "MINIO_SECRET_KEY", "minioadmin")
 
-        return Minio(
+        client = Minio(
             endpoint=endpoint,
             access_key=access_key,
             secret_key=secret_key,
             secure=secure,
         )
+        return InstrumentedClient(client, "minio")
 
     def _ensure_bucket_exists(self):
         """Ensure the bucket exists, create if it doesn't."""
@@ -118,13 +123,43 @@ class MinIOBackend:
             self.logger.error(f"Error retrieving file {object_key}: {e}")
             return None
 
-    def stream_file(self, object_key: str, chunk_size: int = 64 * 1024):
+    def stat_file(self, object_key: str) -> dict[str, Any] | None:
+        """Get object size, ETag, Last-Modified and content type without its body.
+
+        Returns None if the object does not exist or cannot be stat'ed.
+        """
+        try:
+            stat = self.client.stat_object(self.bucket_name, object_key)
+        except S3Error as e:
+            if getattr(e, "code", None) != "NoSuchKey":
+                self.logger.error(f"Error stat'ing file {object_key}: {e}")
+            return None
+
+        return {
+            "size": stat.size,
+            "etag": (stat.etag or "").strip('"') or None,
+            "last_modified": stat.last_modified,
+            "content_type": stat.content_type,
+        }
+
+    def stream_file(
+        self,
+        object_key: str,
+        chunk_size: int = 64 * 1024,
+        offset: int = 0,
+        length: int | None = None,
+    ):
         """Stream file content from MinIO without loading into memory.
 
+        offset/length select a byte range (a ranged GET); length None reads to
+        the end of the object.
+
         Returns a tuple of (iterator, content_length, content_type) or (None, None, None) on error.
         """
         try:
-            resp = self.client.get_object(self.bucket_name, object_key)
+            resp = self.client.get_object(
+                self.bucket_name, object_key, offset=offset, length=length or 0
+            )
 
             def file_iter():
                 try:
@@ -225,40 +260,53 @@ class MinIOBackend:
             self.logger.error(f"Unexpected error deleting folder {folder_prefix}: {e}")
             return False
 
+    def _sign_url(
+        self,
+        object_key: str,
+        expires: int,
+        request_date: datetime,
+        response_headers: dict[str, str] | None,
+    ) -> str | None:
+        kwargs = {
+            "bucket_name": self.bucket_name,
+            "object_name": object_key,
+            "expires": timedelta(seconds=expires),
+            "request_date": request_date,
+        }
+
+        if response_headers:
+            kwargs["response_headers"] = response_headers
+
+        url = self.client.presigned_get_object(**kwargs)
+
+        # Replace internal endpoint with public endpoint for browser access
+        if url and self.endpoint != self.public_endpoint:
+            protocol = "https" if self.use_ssl else "http"
+            internal_url = f"{protocol}://{self.endpoint}"
+            public_protocol = "https" if self.use_ssl else "http"
+            public_url = f"{public_protocol}://{self.public_endpoint}"
+            url = url.replace(internal_url, public_url)
+
+        return url
+
     def get_presigned_url(
         self,
         object_key: str,
         expires: int = 3600,
         response_headers: dict[str, str] = None,
     ) -> str | None:
-        """Get pre-signed URL for file access."""
-        try:
-            kwargs = {
-                "bucket_name": self.bucket_name,
-                "object_name": object_key,
-                "expires": timedelta(seconds=expires),
-            }
-
-            if response_headers:
-                kwargs["response_headers"] = response_headers
+        """Get pre-signed URL for file access.
 
-            url = self.client.presigned_get_object(**kwargs)
-
-            # Replace internal endpoint with public endpoint for browser access
-            if url and self.endpoint != self.public_endpoint:
-                protocol = "https" if self.use_ssl else "http"
-                internal_url = f"{protocol}://{self.endpoint}"
-                public_protocol = "https" if self.use_ssl else "http"
-                public_url = f"{public_protocol}://{self.public_endpoint}"
-                url = url.replace(internal_url, public_url)
-                self.logger.debug(
-                    f"Replaced endpoint in presigned URL: {internal_url} -> {public_url}"
-                )
+        URLs are signed per expiry bucket and cached, so repeated calls return
+        the same URL (browser-cacheable) until shortly before it would expire.
+        """
+        return self._url_cache.get(object_key, expires, response_headers)
 
-            return url
-        except S3Error as e:
-            self.logger.error(f"Error generating presigned URL for {object_key}: {e}")
-            return None
+    def get_presigned_urls(
+        self, object_keys: list[str], expires: int = 3600
+    ) -> dict[str, str]:
+        """Get pre-signed URLs for many files at once, omitting failures."""
+        return self._url_cache.get_many(object_keys, expires)
 
     def copy_file(self, source_key: str, dest_key: str) -> bool:
         """
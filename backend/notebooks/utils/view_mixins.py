@@ -3,17 +3,24 @@ Common view mixins and utilities for notebooks app.
 """
 
 import logging
+import re
+from collections.abc import Callable, Iterator
+from datetime import datetime
 from typing import Any
 
 from django.shortcuts import get_object_or_404
+from django.utils.http import http_date, parse_http_date_safe
 from rest_framework import authentication, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from ..models import KnowledgeBaseItem, Notebook
 from ..constants import DEFAULT_SIGNED_URL_EXPIRES
 
+# Cache lifetime for responses of write-once objects (one year)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,7 +191,9 @@ class ETagCacheMixin:
     """Reusable helpers for setting ETag/Cache headers and handling conditional requests.
 
     Views can call `build_inline_file_response` with a content resolver to get a
-    properly cached response (or 304 if client cache is fresh).
+    properly cached response (or 304 if client cache is fresh). For storage
+    objects, `stat_storage_object` + `not_modified_response` answer conditional
+    requests from object metadata before any body is fetched.
     """
 
     def _compute_storage_etag(self, storage, object_key: str) -> str | None:
@@ -198,6 +207,20 @@ class ETagCacheMixin:
             return None
         return None
 
+    def stat_storage_object(
+        self, object_key: str
+    ) -> tuple[str | None, datetime | None, int | None]:
+        """Return (etag, last_modified, size) for a storage object via a stat call only."""
+        from .storage import get_minio_backend
+
+        try:
+            stat = get_minio_backend().stat_file(object_key)
+        except Exception:
+            return None, None, None
+        if not stat:
+            return None, None, None
+        return stat["etag"], stat["last_modified"], stat["size"]
+
     def _client_etag_matches(self, request, etag: str | None) -> bool:
         if not etag:
             return False
@@ -208,6 +231,38 @@ class ETagCacheMixin:
         client_etag = client_etag.strip().strip("W/").strip('"')
         return client_etag == etag
 
+    def _client_cache_fresh(
+        self, request, etag: str | None, last_modified: datetime | None
+    ) -> bool:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        if request.META.get("HTTP_IF_NONE_MATCH"):
+            return self._client_etag_matches(request, etag)
+        if last_modified is None:
+            return False
+        since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+        return since is not None and int(last_modified.timestamp()) <= since
+
+    def not_modified_response(
+        self,
+        request,
+        *,
+        etag: str | None,
+        last_modified: datetime | None = None,
+        max_age: int = 3600,
+    ) -> HttpResponse | None:
+        """Return a 304 response if the client's cached copy is fresh, else None."""
+        if not self._client_cache_fresh(request, etag, last_modified):
+            return None
+
+        resp = HttpResponse(status=304)
+        if etag:
+            resp["ETag"] = f'"{etag}"'
+        if last_modified is not None:
+            resp["Last-Modified"] = http_date(last_modified.timestamp())
+        resp["Cache-Control"] = f"private, max-age={max_age}"
+        resp["X-Content-Type-Options"] = "nosniff"
+        return resp
+
     def build_file_response(
         self,
         request,
@@ -218,18 +273,18 @@ class ETagCacheMixin:
         etag: str | None = None,
         max_age: int = 3600,
         disposition: str = "inline",
+        last_modified: datetime | None = None,
     ) -> HttpResponse:
         """Return HttpResponse with proper caching headers or 304 if ETag matches.
 
         disposition: "inline" or "attachment".
         """
 
-        if self._client_etag_matches(request, etag):
-            resp = HttpResponse(status=304)
-            resp["ETag"] = f'"{etag}"'
-            resp["Cache-Control"] = f"private, max-age={max_age}"
-            resp["X-Content-Type-Options"] = "nosniff"
-            return resp
+        not_modified = self.not_modified_response(
+            request, etag=etag, last_modified=last_modified, max_age=max_age
+        )
+        if not_modified is not None:
+            return not_modified
 
         resp = HttpResponse(content_bytes, content_type=content_type)
         if disposition not in {"inline", "attachment"}:
@@ -238,12 +293,221 @@ class ETagCacheMixin:
         resp["X-Content-Type-Options"] = "nosniff"
         if etag:
             resp["ETag"] = f'"{etag}"'
+        if last_modified is not None:
+            resp["Last-Modified"] = http_date(last_modified.timestamp())
         resp["Cache-Control"] = f"private, max-age={max_age}"
         return resp
 
+    def build_streaming_file_response(
+        self,
+        request,
+        *,
+        object_key: str,
+        size: int,
+        filename: str,
+        content_type: str,
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+        max_age: int = 3600,
+        disposition: str = "inline",
+        cache_control: str | None = None,
+    ) -> HttpResponse:
+        """Stream a storage object in chunks, honouring Range requests.
+
+        Callers answer conditional requests first (see not_modified_response).
+        cache_control overrides the default ``private, max-age=<max_age>``.
+        """
+        from .storage import get_minio_backend
+
+        if disposition not in {"inline", "attachment"}:
+            disposition = "inline"
+        minio_backend = get_minio_backend()
+
+        def open_stream(offset: int, length: int | None):
+            file_iter, _, _ = minio_backend.stream_file(
+                object_key, offset=offset, length=length
+            )
+            return file_iter
+
+        return build_range_response(
+            request,
+            open_stream=open_stream,
+            size=size,
+            content_type=content_type,
+            content_disposition=f'{disposition}; filename="{filename}"',
+            etag=etag,
+            last_modified=last_modified,
+            cache_control=cache_control or f"private, max-age={max_age}",
+        )
+
+    def image_derivative_response(
+        self, request, *, object_key: str, filename: str
+    ) -> HttpResponse | None:
+        """Serve a resized derivative when the request asks for ``?size=<name>``.
+
+        Returns None (serve the original) when no size was requested or no
+        derivative could be produced. Image objects are write-once (a new
+        extraction creates new image rows), so responses are marked immutable.
+        """
+        from infrastructure.storage.derivatives import (
+            choose_format,
+            get_derivative_sizes,
+            image_derivatives,
+        )
+
+        size = request.GET.get("size")
+        if not size:
+            return None
+        if size not in get_derivative_sizes():
+            return Response(
+                {
+                    "detail": f"Unknown size '{size}'. "
+                    f"Choose from: {', '.join(get_derivative_sizes())}"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fmt = choose_format(request.META.get("HTTP_ACCEPT"))
+        derivative = image_derivatives.get_derivative(object_key, size, fmt)
+        if derivative is None:
+            return None
+
+        cache_control = f"private, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        resp = self.not_modified_response(request, etag=derivative.etag)
+        if resp is None:
+            stem = filename.rsplit(".", 1)[0] or "image"
+            resp = self.build_streaming_file_response(
+                request,
+                object_key=derivative.object_key,
+                size=derivative.size,
+                filename=f"{stem}.{fmt}",
+                content_type=derivative.content_type,
+                etag=derivative.etag,
+                cache_control=cache_control,
+            )
+        resp["Cache-Control"] = cache_control
+        resp["Vary"] = "Accept"
+        return resp
+
     def get_signed_url_expires(self, request) -> int:
         try:
             expires = int(request.GET.get("expires", "0"))
             return expires if expires > 0 else DEFAULT_SIGNED_URL_EXPIRES
         except Exception:
             return DEFAULT_SIGNED_URL_EXPIRES
+
+
+# ==============================================================================
+# HTTP RANGE STREAMING
+# ==============================================================================
+
+_BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested byte range lies outside the object."""
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range ``Range`` header into an inclusive (start, end).
+
+    Returns None when the whole object should be served: no header, a
+    malformed header or a multi-range request (which servers may ignore).
+    Raises RangeNotSatisfiable for ranges starting past the end, including
+    any range of an empty object.
+    """
+    if not header:
+        return None
+    match = _BYTE_RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the final N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable()
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def build_range_response(
+    request,
+    *,
+    open_stream: Callable[[int, int | None], Iterator[bytes] | None],
+    size: int,
+    content_type: str,
+    content_disposition: str | None = None,
+    etag: str | None = None,
+    last_modified: datetime | None = None,
+    cache_control: str | None = None,
+) -> HttpResponse:
+    """
+    Build a streaming 200/206/416 response for an object of known size.
+
+    open_stream(offset, length) must return a chunk iterator for that byte
+    window (length None meaning "to the end"), so memory use per download is
+    constant and seeking only transfers the requested bytes.
+    """
+    byte_range = None
+    try:
+        byte_range = parse_byte_range(request.META.get("HTTP_RANGE"), size)
+    except RangeNotSatisfiable:
+        resp = HttpResponse(status=416)
+        resp["Content-Range"] = f"bytes */{size}"
+        resp["Accept-Ranges"] = "bytes"
+        return resp
+
+    # If-Range: only honour the range if the client's validator still matches
+    if_range = (request.META.get("HTTP_IF_RANGE") or "").strip()
+    if byte_range and if_range:
+        if if_range.startswith(('"', "W/")):
+            still_valid = bool(etag) and if_range.strip('"') == etag
+        else:
+            since = parse_http_date_safe(if_range)
+            still_valid = (
+                since is not None
+                and last_modified is not None
+                and int(last_modified.timestamp()) <= since
+            )
+        if not still_valid:
+            byte_range = None
+
+    if byte_range:
+        start, end = byte_range
+        file_iter = open_stream(start, end - start + 1)
+    else:
+        file_iter = open_stream(0, None)
+    if file_iter is None:
+        return HttpResponse(status=404)
+
+    resp = StreamingHttpResponse(file_iter, content_type=content_type)
+    if byte_range:
+        resp.status_code = 206
+        resp["Content-Range"] = f"bytes {start}-{end}/{size}"
+        resp["Content-Length"] = str(end - start + 1)
+    else:
+        resp["Content-Length"] = str(size)
+
+    resp["Accept-Ranges"] = "bytes"
+    resp["X-Content-Type-Options"] = "nosniff"
+    if content_disposition:
+        resp["Content-Disposition"] = content_disposition
+    if etag:
+        resp["ETag"] = f'"{etag}"'
+    if last_modified is not None:
+        resp["Last-Modified"] = http_date(last_modified.timestamp())
+    if cache_control:
+        resp["Cache-Control"] = cache_control
+    return resp
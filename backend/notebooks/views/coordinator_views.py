@@ -8,31 +8,29 @@ Endpoints:
 - POST /notebooks/{id}/studio/execute/    - Execute task with SSE streaming
 - GET  /notebooks/{id}/studio/tasks/      - List studio tasks
 - GET  /notebooks/{id}/studio/tasks/{id}/ - Get task details
-- POST /notebooks/{id}/studio/tasks/{id}/respond/ - Respond to clarification
 - DELETE /notebooks/{id}/studio/tasks/{id}/ - Cancel task
 """
 
 import json
 import logging
 import time
-import uuid
-from typing import Generator
+from collections.abc import Generator
 
+import redis
+from core.permissions import IsNotebookOwner
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.core.exceptions import ValidationError
 from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from django.contrib.auth.decorators import login_required
 from django.views import View
-
-from rest_framework import viewsets, serializers, status, permissions
-from rest_framework.decorators import action
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.response import Response
-from rest_framework.views import APIView
-
-from ..models import Notebook
-from core.permissions import IsNotebookOwner
 
+from ..models import Notebook, StudioTask
+from ..tasks.coordinator_tasks import STUDIO_TASK_ENTITY
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +56,6 @@ class TaskOptionsSerializer(serializers.Serializer):
         max_value=1800,  # 1 min to 30 min
         required=False,
     )
-    skip_clarification = serializers.BooleanField(default=False, required=False)
 
 
 class ExecuteTaskSerializer(serializers.Serializer):
@@ -70,14 +67,6 @@ class ExecuteTaskSerializer(serializers.Serializer):
     options = TaskOptionsSerializer(required=False)
 
 
-class ClarificationResponseSerializer(serializers.Serializer):
-    """Request serializer for responding to clarification."""
-
-    response = serializers.CharField(
-        max_length=2000, help_text="User's response to clarification questions"
-    )
-
-
 class TaskSerializer(serializers.Serializer):
     """Task response serializer."""
 
@@ -90,56 +79,32 @@ class TaskSerializer(serializers.Serializer):
 
 
 # ============================================================================
-# TASK STORAGE (In-memory for now, could be moved to database)
+# TASK STORAGE
 # ============================================================================
 
-# In-memory task storage - in production, use database model
-_active_tasks = {}
-
-
-class TaskState:
-    """Represents an active task state."""
-
-    def __init__(self, task_id: str, notebook_id: str, goal: str, options: dict = None):
-        self.task_id = task_id
-        self.notebook_id = notebook_id
-        self.goal = goal
-        self.options = options or {}
-        self.status = "pending"
-        self.created_at = time.time()
-        self.completed_at = None
-        self.result = None
-        self.error = None
-        self.clarification_questions = []
-        self.clarification_responses = []
-        self.coordinator = None
-
-    def to_dict(self):
-        return {
-            "task_id": self.task_id,
-            "notebook_id": self.notebook_id,
-            "goal": self.goal,
-            "status": self.status,
-            "created_at": self.created_at,
-            "completed_at": self.completed_at,
-            "has_result": self.result is not None,
-            "error": self.error,
-        }
-
+# Tasks are StudioTask rows; the coordinator itself runs in the "studio"
+# Celery queue (see notebooks.tasks.coordinator_tasks).
 
-def get_task(task_id: str) -> TaskState:
-    """Get task by ID."""
-    return _active_tasks.get(task_id)
 
+def get_task(notebook: Notebook, task_id: str) -> StudioTask | None:
+    """Get a notebook's task by ID."""
+    try:
+        return StudioTask.objects.filter(notebook=notebook).get(pk=task_id)
+    except (StudioTask.DoesNotExist, ValueError, ValidationError):
+        return None
 
-def save_task(task: TaskState):
-    """Save task to storage."""
-    _active_tasks[task.task_id] = task
 
+def revoke_task(task: StudioTask):
+    """Stop a task's Celery job if it has not started yet."""
+    if not task.celery_task_id:
+        return
+    try:
+        from backend.celery import app as celery_app
 
-def delete_task(task_id: str):
-    """Delete task from storage."""
-    _active_tasks.pop(task_id, None)
+        # Running tasks notice the cancelled status and unwind cooperatively
+        celery_app.control.revoke(task.celery_task_id)
+    except Exception as e:
+        logger.warning(f"Failed to revoke Celery task {task.celery_task_id}: {e}")
 
 
 # ============================================================================
@@ -173,7 +138,6 @@ class CoordinatorViewSet(viewsets.ViewSet):
 
     Provides endpoints for:
     - Creating and executing research/writing tasks
-    - Handling multi-turn clarification
     - Streaming task progress via SSE
     - Retrieving task results
     """
@@ -190,24 +154,21 @@ class CoordinatorViewSet(viewsets.ViewSet):
         """List all tasks for a notebook."""
         notebook = self.get_notebook(request, notebook_pk)
 
-        # Filter tasks for this notebook
         tasks = [
             task.to_dict()
-            for task in _active_tasks.values()
-            if task.notebook_id == str(notebook.id)
+            for task in StudioTask.objects.filter(notebook=notebook)
+            .defer("result")
+            .order_by("-created_at")
         ]
 
-        # Sort by created_at descending
-        tasks.sort(key=lambda t: t["created_at"], reverse=True)
-
         return Response({"success": True, "tasks": tasks, "count": len(tasks)})
 
     def retrieve(self, request, notebook_pk=None, pk=None):
         """Get task details."""
         notebook = self.get_notebook(request, notebook_pk)
-        task = get_task(pk)
+        task = get_task(notebook, pk)
 
-        if not task or task.notebook_id != str(notebook.id):
+        if not task:
             return Response(
                 {"detail": "Task not found"}, status=status.HTTP_404_NOT_FOUND
             )
@@ -227,48 +188,24 @@ class CoordinatorViewSet(viewsets.ViewSet):
     def destroy(self, request, notebook_pk=None, pk=None):
         """Cancel/delete a task."""
         notebook = self.get_notebook(request, notebook_pk)
-        task = get_task(pk)
+        task = get_task(notebook, pk)
 
-        if not task or task.notebook_id != str(notebook.id):
+        if not task:
             return Response(
                 {"detail": "Task not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Update status and remove
-        task.status = "cancelled"
-        delete_task(pk)
+        if task.is_finished:
+            task.delete()
+        else:
+            # The worker polls for this status and cancels in-flight steps
+            task.mark_finished("cancelled", "Task cancelled by user")
+            revoke_task(task)
 
         logger.info(f"Task {pk} cancelled for notebook {notebook.id}")
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    @action(detail=True, methods=["post"], url_path="respond")
-    def respond_to_clarification(self, request, notebook_pk=None, pk=None):
-        """Respond to clarification questions."""
-        notebook = self.get_notebook(request, notebook_pk)
-        task = get_task(pk)
-
-        if not task or task.notebook_id != str(notebook.id):
-            return Response(
-                {"detail": "Task not found"}, status=status.HTTP_404_NOT_FOUND
-            )
-
-        if task.status != "clarifying":
-            return Response(
-                {"detail": "Task is not awaiting clarification"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        serializer = ClarificationResponseSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        response_text = serializer.validated_data["response"]
-        task.clarification_responses.append(response_text)
-
-        logger.info(f"Received clarification response for task {pk}")
-
-        return Response({"success": True, "message": "Response received"})
-
 
 # ============================================================================
 # SSE EXECUTION VIEW
@@ -285,20 +222,25 @@ class StudioExecuteSSEView(View):
         {
             "goal": "Research LLM agents and write a report",
             "options": {
-                "style": "academic",
-                "skip_clarification": false
+                "style": "academic"
             }
         }
 
+    The task is executed by a Celery worker ("studio" queue); this view
+    enqueues it and relays its events from the notebook SSE channel.
+
     SSE Response events:
         - type: "started" - Task started
-        - type: "clarification" - Clarification questions
         - type: "progress" - Task progress update
         - type: "result" - Partial or final result
         - type: "done" - Task completed
         - type: "error" - Error occurred
     """
 
+    MAX_DURATION_SECONDS = 1800  # Matches the maximum task timeout
+    HEARTBEAT_INTERVAL = 30
+    TERMINAL_EVENTS = ("SUCCESS", "FAILURE", "CANCELLED")
+
     @method_decorator(csrf_exempt)
     @method_decorator(login_required)
     def dispatch(self, request, *args, **kwargs):
@@ -342,23 +284,29 @@ class StudioExecuteSSEView(View):
             goal = serializer.validated_data["goal"]
             options = serializer.validated_data.get("options", {})
 
-            # Create task
-            task_id = str(uuid.uuid4())
-            task = TaskState(
-                task_id=task_id,
-                notebook_id=str(notebook.id),
+            task = StudioTask.objects.create(
+                notebook=notebook,
+                user=request.user,
                 goal=goal,
                 options=options,
             )
-            save_task(task)
 
             logger.info(
-                f"Starting task {task_id} for notebook {notebook.id}: {goal[:100]}"
+                f"Starting task {task.id} for notebook {notebook.id}: {goal[:100]}"
             )
 
+            # Subscribe before enqueueing so no early events are missed
+            pubsub = self.subscribe(notebook)
+
+            from ..tasks import execute_studio_task
+
+            async_result = execute_studio_task.delay(str(task.id))
+            task.celery_task_id = async_result.id
+            task.save(update_fields=["celery_task_id", "updated_at"])
+
             # Create streaming response
             response = StreamingHttpResponse(
-                self.generate_execution_stream(task, notebook),
+                self.generate_execution_stream(task, pubsub),
                 content_type="text/event-stream",
             )
             response["Cache-Control"] = "no-cache"
@@ -377,190 +325,110 @@ class StudioExecuteSSEView(View):
                 f"Error: {str(e)}", status=500, content_type="text/plain"
             )
 
+    @staticmethod
+    def subscribe(notebook: Notebook):
+        """Subscribe to the notebook's SSE channel."""
+        redis_client = redis.Redis.from_url(
+            settings.CELERY_BROKER_URL, decode_responses=True
+        )
+        pubsub = redis_client.pubsub()
+        pubsub.subscribe(f"sse:notebook:{notebook.id}")
+        return pubsub
+
     def generate_execution_stream(
-        self, task: TaskState, notebook: Notebook
+        self, task: StudioTask, pubsub
     ) -> Generator[str, None, None]:
         """
-        Generate SSE stream for task execution.
+        Relay the task's events from the notebook channel as SSE.
 
-        This is a simplified implementation that simulates the coordinator.
-        In production, this would call the actual Coordinator agent.
+        The coordinator runs in a Celery worker; this generator only forwards
+        its events. A client disconnect does not stop the task; its state can
+        be fetched from any replica via the tasks endpoint.
         """
-        import asyncio
-
         try:
-            task.status = "executing"
+            yield sse_event("started", {"task_id": str(task.id), "goal": task.goal})
+
+            start_time = time.time()
+            last_heartbeat = start_time
+
+            while time.time() - start_time < self.MAX_DURATION_SECONDS:
+                message = pubsub.get_message(timeout=1.0)
+
+                if message and message["type"] == "message":
+                    event = json.loads(message["data"])
+                    if (
+                        event.get("entity") != STUDIO_TASK_ENTITY
+                        or event.get("id") != str(task.id)
+                    ):
+                        continue
+
+                    last_heartbeat = time.time()
+                    yield from self._translate_event(task, event)
+                    if event.get("status") in self.TERMINAL_EVENTS:
+                        return
+
+                elif time.time() - last_heartbeat > self.HEARTBEAT_INTERVAL:
+                    # The worker may have finished while we were not looking
+                    task.refresh_from_db()
+                    if task.is_finished:
+                        yield from self._final_events(task)
+                        return
+                    yield ": heartbeat\n\n"
+                    last_heartbeat = time.time()
 
-            # Send started event
-            yield sse_event("started", {"task_id": task.task_id, "goal": task.goal})
-
-            # Import coordinator
-            try:
-                from agents.coordinator import execute_task
-                from agents.coordinator.schema import TaskOptions, TaskType
-            except ImportError as e:
-                logger.warning(f"Coordinator not available: {e}")
-                # Fallback to simulation mode
-                yield from self._simulate_execution(task)
-                return
-
-            # Build task options
-            options = TaskOptions(
-                style=task.options.get("style", "academic"),
-                skip_clarification=task.options.get("skip_clarification", False),
-                max_research_iterations=task.options.get("max_research_iterations"),
-                timeout=task.options.get("timeout"),
-            )
-
-            # Progress callback for SSE updates
-            last_update_time = time.time()
-
-            # Send progress updates
             yield sse_event(
-                "progress",
-                {
-                    "step": "research",
-                    "status": "starting",
-                    "message": "Starting research...",
-                },
+                "timeout",
+                {"task_id": str(task.id), "message": "Stream timeout, task continues"},
             )
 
-            # Execute coordinator task
-            try:
-                # Run async coordinator in sync context
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                try:
-                    result = loop.run_until_complete(execute_task(task.goal, options))
-                finally:
-                    loop.close()
-
-                # Process result
-                if result.status.value == "completed":
-                    task.status = "completed"
-                    task.completed_at = time.time()
-                    task.result = {
-                        "findings": result.findings,
-                        "final_report": result.final_report,
-                        "sources": result.sources,
-                    }
-
-                    yield sse_event(
-                        "result",
-                        {
-                            "task_id": task.task_id,
-                            "findings": result.findings[:500]
-                            if result.findings
-                            else None,
-                            "report_preview": result.final_report[:1000]
-                            if result.final_report
-                            else None,
-                            "source_count": len(result.sources)
-                            if result.sources
-                            else 0,
-                        },
-                    )
-
-                    yield sse_done({"task_id": task.task_id, "status": "completed"})
-
-                else:
-                    task.status = "failed"
-                    task.error = result.error_message
-
-                    yield sse_error(result.error_message or "Task failed")
-
-            except Exception as e:
-                logger.exception(f"Coordinator execution failed: {e}")
-                task.status = "failed"
-                task.error = str(e)
-                yield sse_error(str(e))
-
         except GeneratorExit:
-            logger.info(f"Client disconnected from task {task.task_id}")
-            task.status = "cancelled"
+            logger.info(f"Client disconnected from task {task.id}")
 
         except Exception as e:
             logger.exception(f"Error in execution stream: {e}")
             yield sse_error(str(e))
 
         finally:
-            save_task(task)
-
-    def _simulate_execution(self, task: TaskState) -> Generator[str, None, None]:
-        """
-        Simulate execution when coordinator is not available.
-        Used for development/testing.
-        """
-        import time
+            try:
+                pubsub.unsubscribe()
+                pubsub.close()
+            except Exception:
+                pass
 
-        # Simulate clarification
-        if not task.options.get("skip_clarification"):
+    def _translate_event(
+        self, task: StudioTask, event: dict
+    ) -> Generator[str, None, None]:
+        """Map worker events onto the SSE event types the frontend expects."""
+        status_value = event.get("status")
+        payload = event.get("payload") or {}
+
+        if status_value == "PROGRESS":
+            yield sse_event("progress", payload)
+        elif status_value == "SUCCESS":
+            yield sse_event("result", {"task_id": str(task.id), **payload})
+            yield sse_done({"task_id": str(task.id), "status": "completed"})
+        elif status_value == "FAILURE":
+            yield sse_error(payload.get("error") or "Task failed")
+        elif status_value == "CANCELLED":
+            yield sse_done({"task_id": str(task.id), "status": "cancelled"})
+
+    def _final_events(self, task: StudioTask) -> Generator[str, None, None]:
+        """Build closing events from a finished task's stored state."""
+        if task.status == "completed":
+            result = task.result or {}
+            findings = result.get("findings")
+            final_report = result.get("final_report")
             yield sse_event(
-                "clarification",
+                "result",
                 {
-                    "task_id": task.task_id,
-                    "questions": [
-                        {
-                            "question": "What specific aspects would you like me to focus on?",
-                            "purpose": "To narrow down the research scope",
-                            "required": False,
-                        }
-                    ],
-                    "message": "I have a few clarifying questions before proceeding.",
+                    "task_id": str(task.id),
+                    "findings": findings[:500] if findings else None,
+                    "report_preview": final_report[:1000] if final_report else None,
+                    "source_count": len(result.get("sources") or []),
                 },
             )
-
-            # Wait briefly for response (in real impl, would wait for user)
-            time.sleep(1)
-
-        # Simulate research progress
-        yield sse_event(
-            "progress",
-            {
-                "step": "research",
-                "status": "running",
-                "message": "Conducting web research...",
-            },
-        )
-        time.sleep(2)
-
-        yield sse_event(
-            "progress",
-            {
-                "step": "research",
-                "status": "completed",
-                "message": "Research completed",
-            },
-        )
-
-        # Simulate writing progress
-        yield sse_event(
-            "progress",
-            {"step": "writing", "status": "running", "message": "Generating report..."},
-        )
-        time.sleep(2)
-
-        # Simulate result
-        task.status = "completed"
-        task.completed_at = time.time()
-        task.result = {
-            "findings": f"Research findings for: {task.goal}",
-            "final_report": f"# Report\n\nThis is a simulated report for: {task.goal}\n\n## Key Findings\n\n- Finding 1\n- Finding 2\n- Finding 3",
-            "sources": [
-                {"url": "https://example.com/1", "title": "Example Source 1"},
-                {"url": "https://example.com/2", "title": "Example Source 2"},
-            ],
-        }
-
-        yield sse_event(
-            "result",
-            {
-                "task_id": task.task_id,
-                "findings": task.result["findings"],
-                "report_preview": task.result["final_report"][:500],
-                "source_count": len(task.result["sources"]),
-            },
-        )
-
-        yield sse_done({"task_id": task.task_id, "status": "completed"})
+            yield sse_done({"task_id": str(task.id), "status": "completed"})
+        elif task.status == "failed":
+            yield sse_error(task.error_message or "Task failed")
+        else:
+            yield sse_done({"task_id": str(task.id), "status": task.status})
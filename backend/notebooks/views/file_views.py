@@ -35,6 +35,7 @@ from ..serializers import (
     BatchURLParseDocumentSerializer,
     BatchURLParseSerializer,
     BatchURLParseWithMediaSerializer,
+    KnowledgeBaseItemListSerializer,
     KnowledgeBaseItemSerializer,
     URLParseDocumentSerializer,
     URLParseSerializer,
@@ -74,8 +75,17 @@ logger = logging.getLogger(__name__)
                 description="Filter by content type",
                 required=False,
             ),
+            OpenApiParameter(
+                name="fields",
+                type=str,
+                description=(
+                    "Comma-separated fields to return. Presigned URLs "
+                    "(file_url, original_file_url) are only included when listed"
+                ),
+                required=False,
+            ),
         ],
-        responses={200: KnowledgeBaseItemSerializer(many=True)},
+        responses={200: KnowledgeBaseItemListSerializer(many=True)},
     ),
     retrieve=extend_schema(
         summary="Get file details",
@@ -136,6 +146,9 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
             Notebook.objects.filter(user=self.request.user), pk=notebook_id
         )
         qs = KnowledgeBaseItem.objects.filter(notebook=notebook).order_by("-created_at")
+        if self.action == "list":
+            # Full content is only served by the `content` action
+            qs = qs.summaries()
 
         # Show all sources regardless of processing status
         # Users should see uploaded files immediately, including those still processing
@@ -151,6 +164,11 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
 
         return qs
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return KnowledgeBaseItemListSerializer
+        return super().get_serializer_class()
+
     def list(self, request, notebook_pk=None, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -225,32 +243,61 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
             logger.exception(f"Failed to get content for {pk}: {e}")
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-    @action(detail=True, methods=["get"], url_path="raw")
-    def raw(self, request, notebook_pk=None, pk=None):
-        item = self.get_object()
-        try:
-            file_obj = self.kb_service.get_raw_file(item, request.user.id)
-            from infrastructure.storage.adapters import get_storage_adapter
-
-            storage = get_storage_adapter()
-            etag_value = None
-            object_key = item.original_file_object_key or item.file_object_key
-            if object_key:
-                etag_value = self._compute_storage_etag(storage, object_key)
-            if not etag_value:
-                base = f"{item.id}-{item.updated_at.timestamp()}"
-                etag_value = hashlib.sha1(base.encode("utf-8")).hexdigest()
+    def _serve_raw_file(self, request, item):
+        """
+        Serve an item's raw file, answering conditional requests first.
 
-            max_age = self.get_signed_url_expires(request)
-            return self.build_file_response(
+        The ETag/Last-Modified come from a storage stat, so a revalidating
+        client gets a 304 without the object body being fetched from MinIO.
+        Stored objects are streamed in chunks and honour Range requests.
+        """
+        file_info = self.kb_service.describe_raw_file(item)
+        object_key = file_info["object_key"]
+
+        etag_value, last_modified, size = (None, None, None)
+        if object_key:
+            etag_value, last_modified, size = self.stat_storage_object(object_key)
+        if not etag_value:
+            base = f"{item.id}-{item.updated_at.timestamp()}"
+            etag_value = hashlib.sha1(base.encode("utf-8")).hexdigest()
+
+        max_age = self.get_signed_url_expires(request)
+        not_modified = self.not_modified_response(
+            request, etag=etag_value, last_modified=last_modified, max_age=max_age
+        )
+        if not_modified is not None:
+            return not_modified
+
+        # Stream straight from MinIO (with Range support) for the owner's objects
+        if size is not None and object_key.startswith(f"{request.user.id}/"):
+            return self.build_streaming_file_response(
                 request,
-                filename=file_obj["filename"],
-                content_type=file_obj["content_type"],
-                content_bytes=file_obj["data"],
+                object_key=object_key,
+                size=size,
+                filename=file_info["filename"],
+                content_type=file_info["content_type"],
                 etag=etag_value,
+                last_modified=last_modified,
                 max_age=max_age,
-                disposition="inline",
             )
+
+        file_obj = self.kb_service.get_raw_file(item, request.user.id)
+        return self.build_file_response(
+            request,
+            filename=file_obj["filename"],
+            content_type=file_obj["content_type"],
+            content_bytes=file_obj["data"],
+            etag=etag_value,
+            max_age=max_age,
+            disposition="inline",
+            last_modified=last_modified,
+        )
+
+    @action(detail=True, methods=["get"], url_path="raw")
+    def raw(self, request, notebook_pk=None, pk=None):
+        item = self.get_object()
+        try:
+            return self._serve_raw_file(request, item)
         except Exception as e:
             logger.exception(f"Failed to get raw file for {pk}: {e}")
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -259,28 +306,7 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
     def inline(self, request, notebook_pk=None, pk=None):
         item = self.get_object()
         try:
-            file_obj = self.kb_service.get_raw_file(item, request.user.id)
-            from infrastructure.storage.adapters import get_storage_adapter
-
-            storage = get_storage_adapter()
-            etag_value = None
-            object_key = item.original_file_object_key or item.file_object_key
-            if object_key:
-                etag_value = self._compute_storage_etag(storage, object_key)
-            if not etag_value:
-                base = f"{item.id}-{item.updated_at.timestamp()}"
-                etag_value = hashlib.sha1(base.encode("utf-8")).hexdigest()
-
-            max_age = self.get_signed_url_expires(request)
-            return self.build_file_response(
-                request,
-                filename=file_obj["filename"],
-                content_type=file_obj["content_type"],
-                content_bytes=file_obj["data"],
-                etag=etag_value,
-                max_age=max_age,
-                disposition="inline",
-            )
+            return self._serve_raw_file(request, item)
         except Exception as e:
             logger.exception(f"Failed to get inline file for {pk}: {e}")
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -297,33 +323,60 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
 
     @action(detail=True, methods=["get"], url_path=r"image/(?P<image_id>[^/]+)/inline")
     def image_inline(self, request, notebook_pk=None, pk=None, image_id: str = None):
-        """Serve an image via API as an inline response (MinIO proxy)."""
+        """Serve an image via API as an inline response (MinIO proxy).
+
+        ``?size=thumb|small|medium`` serves a resized WebP/JPEG derivative.
+        """
         item = self.get_object()
         try:
-            from infrastructure.storage.adapters import get_storage_backend
-            from .models import KnowledgeBaseImage
+            from ..models import KnowledgeBaseImage
 
             image = get_object_or_404(
                 KnowledgeBaseImage, id=image_id, knowledge_base_item=item
             )
 
-            storage = get_storage_backend()
-            etag_value = self._compute_storage_etag(storage, image.minio_object_key)
+            filename = (
+                image.image_metadata.get("original_filename", "image")
+                if isinstance(image.image_metadata, dict)
+                else "image"
+            )
+            derivative = self.image_derivative_response(
+                request, object_key=image.minio_object_key, filename=filename
+            )
+            if derivative is not None:
+                return derivative
+
+            etag_value, last_modified, size = self.stat_storage_object(
+                image.minio_object_key
+            )
             if not etag_value:
                 base = f"{image.id}-{getattr(image, 'updated_at', None) or getattr(image, 'created_at', None)}"
                 etag_value = hashlib.sha1(base.encode("utf-8")).hexdigest()
 
+            not_modified = self.not_modified_response(
+                request, etag=etag_value, last_modified=last_modified, max_age=300
+            )
+            if not_modified is not None:
+                return not_modified
+
+            if size is not None:
+                return self.build_streaming_file_response(
+                    request,
+                    object_key=image.minio_object_key,
+                    size=size,
+                    filename=filename,
+                    content_type=image.content_type or "application/octet-stream",
+                    etag=etag_value,
+                    last_modified=last_modified,
+                    max_age=300,
+                )
+
             content = image.get_image_content()
             if content is None:
                 return Response(
                     {"detail": "Image not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            filename = (
-                image.image_metadata.get("original_filename", "image")
-                if isinstance(image.image_metadata, dict)
-                else "image"
-            )
             return self.build_file_response(
                 request,
                 filename=filename,
@@ -332,6 +385,7 @@ class FileViewSet(ETagCacheMixin, viewsets.ModelViewSet):
                 etag=etag_value,
                 max_age=300,
                 disposition="inline",
+                last_modified=last_modified,
             )
         except Exception as e:
             logger.exception(
@@ -22,6 +22,7 @@ from drf_spectacular.utils import (
     OpenApiExample,
 )
 
+from core.cache import CacheKeyGenerator, CachedResponseMixin
 from core.pagination import NotebookPagination
 from core.permissions import IsNotebookOwner, IsOwnerPermission
 from ..models import Notebook, KnowledgeBaseItem, BatchJob
@@ -30,6 +31,7 @@ from ..serializers import (
     NotebookListSerializer,
     NotebookSerializer,
     NotebookUpdateSerializer,
+    KnowledgeBaseItemListSerializer,
     KnowledgeBaseItemSerializer,
     BatchJobSerializer,
 )
@@ -73,7 +75,7 @@ logger = logging.getLogger(__name__)
         responses={204: None},
     ),
 )
-class NotebookViewSet(viewsets.ModelViewSet):
+class NotebookViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerPermission]
     authentication_classes = [
         authentication.SessionAuthentication,
@@ -94,17 +96,21 @@ class NotebookViewSet(viewsets.ModelViewSet):
         super().__init__(*args, **kwargs)
         self.notebook_service = NotebookService()
 
+    def get_cache_namespaces(self):
+        return [CacheKeyGenerator.user_notebooks_namespace(self.request.user.pk)]
+
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Notebook.objects.none()
         if not self.request.user.is_authenticated:
             return Notebook.objects.none()
-        return (
-            Notebook.objects.filter(user=self.request.user)
-            .select_related("user")
-            .prefetch_related("knowledge_base_items", "batch_jobs", "chat_sessions")
-            .order_by("-updated_at")
+        queryset = Notebook.objects.for_user(self.request.user).order_by(
+            "-updated_at"
         )
+        if self.action in ("list", "retrieve"):
+            # Counts and activity timestamps come from annotations, not per-row queries
+            queryset = queryset.with_stats()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -182,7 +188,9 @@ class NotebookViewSet(viewsets.ModelViewSet):
     def stats(self, request, pk=None):
         notebook = self.get_object()
         try:
-            stats = self.notebook_service.get_notebook_stats(notebook)
+            stats = self.notebook_service.get_notebook_stats(
+                str(notebook.id), request.user
+            )
             return Response(stats)
         except Exception as e:
             logger.exception(f"Failed to get notebook stats for {pk}: {e}")
@@ -226,9 +234,17 @@ class KnowledgeBaseViewSet(viewsets.ReadOnlyModelViewSet):
             return KnowledgeBaseItem.objects.none()
 
         notebook_id = self.kwargs.get("notebook_pk") or self.kwargs.get("notebook_id")
-        return KnowledgeBaseItem.objects.filter(
+        qs = KnowledgeBaseItem.objects.filter(
             notebook__id=notebook_id, notebook__user=self.request.user
         ).order_by("-created_at")
+        if self.action == "list":
+            qs = qs.summaries()
+        return qs
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return KnowledgeBaseItemListSerializer
+        return super().get_serializer_class()
 
 
 class BatchJobViewSet(viewsets.ReadOnlyModelViewSet):
@@ -0,0 +1,314 @@
+"""
+In-memory podcast audio assembly.
+
+TTS providers return WAV bytes per chunk. Instead of writing every chunk to
+disk and merging them with ffmpeg (once per turn, then again for the whole
+episode), chunks are decoded straight into NumPy PCM buffers, converted to a
+common format (mono, PODCAST_SAMPLE_RATE, loudness-matched per turn), joined
+with configurable silence between turns and written out in a single pass.
+
+Only non-PCM inputs (e.g. float WAV or MP3 from a fallback provider) and
+compressed outputs (MP3/Opus, and the AAC streaming segments) go through
+ffmpeg, via pipes and at most once.
+"""
+
+import io
+import logging
+import subprocess
+import wave
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 24000
+
+# Target loudness per turn, so voices from different providers match
+DEFAULT_TARGET_DBFS = -20.0
+
+# ffmpeg encoder arguments for compressed outputs
+ENCODERS = {
+    "mp3": ["-c:a", "libmp3lame", "-q:a", "4"],
+    "opus": ["-c:a", "libopus", "-b:a", "48k"],
+    "aac": ["-c:a", "aac", "-b:a", "96k"],
+}
+
+# Progressive streaming segments: AAC in MPEG-TS, which every HLS client plays
+SEGMENT_ENCODER = "aac"
+
+
+class AudioDecodeError(Exception):
+    """Raised when TTS output cannot be decoded to PCM."""
+
+
+def _ffmpeg_decode(data: bytes, sample_rate: int) -> np.ndarray:
+    """Decode any ffmpeg-readable audio to mono float32 PCM via pipes."""
+    try:
+        proc = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                "pipe:0",
+                "-f",
+                "f32le",
+                "-ac",
+                "1",
+                "-ar",
+                str(sample_rate),
+                "pipe:1",
+            ],
+            input=data,
+            capture_output=True,
+            check=True,
+            timeout=120,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        raise AudioDecodeError(f"ffmpeg could not decode audio: {e}") from e
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def decode_wav(data: bytes) -> tuple[np.ndarray, int]:
+    """
+    Decode PCM WAV bytes to a mono float32 array in [-1, 1].
+
+    Returns:
+        (samples, sample_rate)
+
+    Raises:
+        AudioDecodeError: If the bytes are not 8/16/24/32-bit PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise AudioDecodeError(str(e)) from e
+
+    if width == 1:
+        samples = np.frombuffer(frames, dtype=np.uint8).astype(np.float32)
+        samples = (samples - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        ints = (
+            raw[:, 0].astype(np.int32)
+            | (raw[:, 1].astype(np.int32) << 8)
+            | (raw[:, 2].astype(np.int32) << 16)
+        )
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise AudioDecodeError(f"Unsupported sample width: {width}")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, rate
+
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Linear-interpolation resampling (speech-grade, no extra dependencies)."""
+    if src_rate == dst_rate or samples.size == 0:
+        return samples
+    duration = samples.size / src_rate
+    n_out = max(1, int(round(duration * dst_rate)))
+    src_t = np.arange(samples.size) / src_rate
+    dst_t = np.arange(n_out) / dst_rate
+    return np.interp(dst_t, src_t, samples).astype(np.float32)
+
+
+def normalize_loudness(samples: np.ndarray, target_dbfs: float) -> np.ndarray:
+    """Scale to a target RMS level without letting peaks clip."""
+    if samples.size == 0:
+        return samples
+    rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+    if rms < 1e-6:
+        return samples
+    gain = 10 ** (target_dbfs / 20) / rms
+    peak = float(np.max(np.abs(samples)))
+    if peak * gain > 0.99:
+        gain = 0.99 / peak
+    return (samples * gain).astype(np.float32)
+
+
+class AudioAssembler:
+    """
+    Accumulate decoded turns as 16-bit PCM and write them out in one pass.
+
+    Turns are stored already converted to the output format, so peak memory
+    is about 2 bytes per output sample.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int | None = None,
+        silence_ms: int | None = None,
+        target_dbfs: float | None = None,
+    ):
+        self.sample_rate = sample_rate or getattr(
+            settings, "PODCAST_SAMPLE_RATE", DEFAULT_SAMPLE_RATE
+        )
+        self.silence_ms = (
+            silence_ms
+            if silence_ms is not None
+            else getattr(settings, "PODCAST_TURN_SILENCE_MS", 300)
+        )
+        self.target_dbfs = (
+            target_dbfs
+            if target_dbfs is not None
+            else getattr(settings, "PODCAST_TARGET_DBFS", DEFAULT_TARGET_DBFS)
+        )
+        self._parts: list[np.ndarray] = []
+        self.turn_count = 0
+
+    @property
+    def frames(self) -> int:
+        return sum(part.size for part in self._parts)
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """Decode one TTS chunk to float32 mono PCM at the output sample rate."""
+        try:
+            samples, rate = decode_wav(data)
+        except AudioDecodeError:
+            # Not plain PCM WAV; let ffmpeg convert it straight to our format
+            return _ffmpeg_decode(data, self.sample_rate)
+        return resample(samples, rate, self.sample_rate)
+
+    def render_turn(self, chunks: list[bytes]) -> np.ndarray:
+        """Decode, join and loudness-normalize one turn's chunks to int16 PCM."""
+        samples = np.concatenate([self.decode(chunk) for chunk in chunks])
+        samples = normalize_loudness(samples, self.target_dbfs)
+        return (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+
+    def add_turn(self, chunks: list[bytes]) -> list[np.ndarray]:
+        """
+        Append a turn (preceded by silence unless it is the first).
+
+        Returns:
+            The PCM parts appended for this turn, leading silence included
+        """
+        added: list[np.ndarray] = []
+        pcm = self.render_turn(chunks)
+        if self._parts and self.silence_ms > 0:
+            silence_frames = int(self.sample_rate * self.silence_ms / 1000)
+            added.append(np.zeros(silence_frames, dtype="<i2"))
+        added.append(pcm)
+        self._parts.extend(added)
+        self.turn_count += 1
+        return added
+
+    def _write_wav_frames(self, target, parts: list[np.ndarray] | None) -> None:
+        with wave.open(target, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            for part in self._parts if parts is None else parts:
+                wav.writeframes(part.tobytes())
+
+    def write_wav(
+        self, output_file: Path, parts: list[np.ndarray] | None = None
+    ) -> Path:
+        """Write PCM parts (default: everything added so far) as one WAV file."""
+        self._write_wav_frames(str(output_file), parts)
+        return output_file
+
+    def wav_bytes(self, parts: list[np.ndarray] | None = None) -> bytes:
+        """Encode PCM parts (default: everything added so far) as WAV bytes."""
+        out = io.BytesIO()
+        self._write_wav_frames(out, parts)
+        return out.getvalue()
+
+    def parts_duration(self, parts: list[np.ndarray]) -> float:
+        return sum(part.size for part in parts) / self.sample_rate
+
+    def _pcm_input_args(self) -> list[str]:
+        return [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            "s16le",
+            "-ar",
+            str(self.sample_rate),
+            "-ac",
+            "1",
+            "-i",
+            "pipe:0",
+        ]
+
+    def encode_segment(self, parts: list[np.ndarray], start_time: float) -> bytes:
+        """
+        Encode PCM parts as one HLS media segment (AAC in MPEG-TS).
+
+        Timestamps start at ``start_time`` so consecutive segments play back
+        as one continuous stream.
+
+        Raises:
+            subprocess.CalledProcessError: If encoding fails
+        """
+        proc = subprocess.run(
+            [
+                *self._pcm_input_args(),
+                *ENCODERS[SEGMENT_ENCODER],
+                "-output_ts_offset",
+                f"{start_time:.3f}",
+                "-f",
+                "mpegts",
+                "pipe:1",
+            ],
+            input=b"".join(part.tobytes() for part in parts),
+            capture_output=True,
+            check=True,
+            timeout=120,
+        )
+        return proc.stdout
+
+    def write(self, output_file: Path, audio_format: str = "wav") -> Path:
+        """
+        Write the assembled audio, encoding MP3/Opus with one ffmpeg pass.
+
+        Raises:
+            ValueError: For unsupported formats
+            subprocess.CalledProcessError: If encoding fails
+        """
+        if audio_format == "wav":
+            return self.write_wav(output_file)
+        if audio_format not in ENCODERS:
+            raise ValueError(f"Unsupported podcast audio format: {audio_format}")
+
+        proc = subprocess.Popen(
+            [
+                *self._pcm_input_args(),
+                *ENCODERS[audio_format],
+                str(output_file),
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            for part in self._parts:
+                proc.stdin.write(part.tobytes())
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = proc.stderr.read()
+        if proc.wait(timeout=600) != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, "ffmpeg", stderr=stderr
+            )
+        return output_file
@@ -9,9 +9,11 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.utils import timezone
 
 from .storage import PodcastStorageService
+from .streaming import PodcastSegmentPublisher
 from .utils import (
     extract_selected_content,
     generate_conversation_audio_optimized,
@@ -94,9 +96,21 @@ class PodcastService:
             podcast_title = title if title else "Panel Conversation"
             logger.info(f"Using podcast title: {podcast_title}")
 
+            # Progressive mode: upload and announce segments as they finish
+            segment_publisher = None
+            if getattr(settings, "PODCAST_PROGRESSIVE_STREAMING", True):
+                segment_publisher = PodcastSegmentPublisher(
+                    self.storage_service, user_id, podcast_id, notebook_id
+                )
+
             # Convert to audio and store in MinIO
             audio_object_key = self._process_conversation_to_audio(
-                conversation_turns, user_id, podcast_id, notebook_id, language
+                conversation_turns,
+                user_id,
+                podcast_id,
+                notebook_id,
+                language,
+                segment_publisher=segment_publisher,
             )
 
             # If audio generation/storage failed, treat as failure
@@ -108,6 +122,7 @@ class PodcastService:
                 "conversation_turns": conversation_turns,
                 "crew_result": str(result),  # Convert crew result to string
                 "audio_object_key": audio_object_key,
+                "segments": segment_publisher.segments if segment_publisher else [],
                 "title": podcast_title,
                 "metadata": {
                     "total_turns": len(conversation_turns),
@@ -139,6 +154,7 @@ class PodcastService:
         podcast_id: str,
         notebook_id: int | None = None,
         language: str = "en",
+        segment_publisher: PodcastSegmentPublisher | None = None,
     ) -> str | None:
         """
         Main orchestration method for converting conversation to audio and storing in MinIO.
@@ -149,6 +165,7 @@ class PodcastService:
             podcast_id: Podcast ID for the podcast
             notebook_id: Notebook ID (optional)
             language: Language for the podcast (en or zh), default 'en'
+            segment_publisher: Optional hook that streams segments as they finish
 
         Returns:
             MinIO object key for the stored audio file, or None if failed
@@ -162,7 +179,10 @@ class PodcastService:
             try:
                 # Generate audio file using optimized approach from utils
                 audio_file_path = generate_conversation_audio_optimized(
-                    conversation_turns, temp_dir, language
+                    conversation_turns,
+                    temp_dir,
+                    language,
+                    on_segment=segment_publisher,
                 )
 
                 # Store in MinIO using storage service
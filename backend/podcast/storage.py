@@ -5,6 +5,7 @@ This service handles audio file storage operations for podcasts,
 providing a clean interface between the podcast service and MinIO storage.
 """
 
+import json
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -13,6 +14,22 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Supported podcast audio formats (file extension -> content type)
+AUDIO_CONTENT_TYPES = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg",
+}
+
+# Progressive streaming segments are AAC in MPEG-TS (see audio.SEGMENT_ENCODER)
+SEGMENT_CONTENT_TYPE = "video/mp2t"
+
+
+def audio_format_for(path: str | Path) -> str:
+    """Audio format of a file or object key, from its extension (default wav)."""
+    suffix = Path(str(path)).suffix.lstrip(".").lower()
+    return suffix if suffix in AUDIO_CONTENT_TYPES else "wav"
+
 
 class PodcastStorageService:
     """Service responsible for managing podcast audio file storage operations"""
@@ -51,15 +68,16 @@ class PodcastStorageService:
             audio_content = self._read_audio_file(audio_file_path)
 
             # Generate object key for podcast storage following reports pattern
+            audio_format = audio_format_for(audio_file_path)
             object_key = self._generate_audio_object_key(
-                user_id, podcast_id, notebook_id
+                user_id, podcast_id, notebook_id, extension=audio_format
             )
 
             # Store in MinIO
             storage_success = backend.store_file(
                 object_key=object_key,
                 file_content=audio_content,
-                content_type="audio/wav",
+                content_type=AUDIO_CONTENT_TYPES[audio_format],
             )
 
             # Clean up temporary file and directory
@@ -97,6 +115,95 @@ class PodcastStorageService:
                 "error": str(e),
             }
 
+    # ==========================================================================
+    # PROGRESSIVE SEGMENTS
+    # ==========================================================================
+
+    def store_podcast_segment(
+        self,
+        user_id: int,
+        podcast_id: str,
+        notebook_id: int | None,
+        index: int,
+        audio_content: bytes,
+    ) -> str | None:
+        """
+        Store one finished segment of a podcast that is still being generated.
+
+        Returns:
+            MinIO object key of the segment, or None if storing failed
+        """
+        object_key = (
+            f"{self._segments_prefix(user_id, podcast_id, notebook_id)}"
+            f"segment_{index:03d}.ts"
+        )
+        try:
+            if self._get_minio_backend().store_file(
+                object_key=object_key,
+                file_content=audio_content,
+                content_type=SEGMENT_CONTENT_TYPE,
+            ):
+                return object_key
+            logger.error(f"Failed to store podcast segment: {object_key}")
+        except Exception as e:
+            logger.error(f"Error storing podcast segment {object_key}: {e}")
+        return None
+
+    def store_segment_manifest(
+        self,
+        user_id: int,
+        podcast_id: str,
+        notebook_id: int | None,
+        segments: list[dict[str, Any]],
+    ) -> bool:
+        """Store the list of segments published so far, for playlist requests."""
+        try:
+            return self._get_minio_backend().store_file(
+                object_key=self._manifest_key(user_id, podcast_id, notebook_id),
+                file_content=json.dumps({"segments": segments}).encode("utf-8"),
+                content_type="application/json",
+            )
+        except Exception as e:
+            logger.error(f"Error storing segment manifest for {podcast_id}: {e}")
+            return False
+
+    def load_segment_manifest(
+        self, user_id: int, podcast_id: str, notebook_id: int | None
+    ) -> list[dict[str, Any]]:
+        """Segments published so far (empty if generation has not produced any)."""
+        try:
+            content = self._get_minio_backend().get_file(
+                self._manifest_key(user_id, podcast_id, notebook_id)
+            )
+            if not content:
+                return []
+            return json.loads(content).get("segments", [])
+        except Exception as e:
+            logger.warning(f"Could not load segment manifest for {podcast_id}: {e}")
+            return []
+
+    def delete_podcast_segments(
+        self, user_id: int, podcast_id: str, notebook_id: int | None
+    ) -> bool:
+        """Delete all progressive segments (and their manifest) of a podcast."""
+        try:
+            return self._get_minio_backend().delete_folder(
+                self._segments_prefix(user_id, podcast_id, notebook_id)
+            )
+        except Exception as e:
+            logger.error(f"Error deleting segments for podcast {podcast_id}: {e}")
+            return False
+
+    def _segments_prefix(
+        self, user_id: int, podcast_id: str, notebook_id: int | None
+    ) -> str:
+        return f"{self._podcast_prefix(user_id, podcast_id, notebook_id)}/segments/"
+
+    def _manifest_key(
+        self, user_id: int, podcast_id: str, notebook_id: int | None
+    ) -> str:
+        return f"{self._segments_prefix(user_id, podcast_id, notebook_id)}manifest.json"
+
     def delete_podcast_audio(self, object_key: str) -> bool:
         """
         Delete podcast audio file from storage.
@@ -163,7 +270,11 @@ class PodcastStorageService:
             raise Exception(f"Failed to read audio file {audio_file_path}: {e}")
 
     def _generate_audio_object_key(
-        self, user_id: int, podcast_id: str, notebook_id: int | None = None
+        self,
+        user_id: int,
+        podcast_id: str,
+        notebook_id: int | None = None,
+        extension: str = "wav",
     ) -> str:
         """
         Generate unique object key for audio file storage following reports pattern.
@@ -172,20 +283,26 @@ class PodcastStorageService:
             user_id: User ID for the podcast
             podcast_id: Podcast ID for the podcast
             notebook_id: Notebook ID (optional)
+            extension: Audio file extension (wav, mp3 or opus)
 
         Returns:
             MinIO object key string
         """
         timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
         unique_id = str(uuid.uuid4()).replace("-", "")[:8]
-        filename = f"podcast_{timestamp}_{unique_id}.wav"
+        filename = f"podcast_{timestamp}_{unique_id}.{extension}"
+
+        return f"{self._podcast_prefix(user_id, podcast_id, notebook_id)}/{filename}"
 
+    def _podcast_prefix(
+        self, user_id: int, podcast_id: str, notebook_id: int | None = None
+    ) -> str:
         # Follow reports pattern but use 'podcast' instead of 'report':
         # {user_id}/notebook/{notebook_id}/podcast/{podcast_id}/filename
         notebook_path = (
             f"notebook/{notebook_id}" if notebook_id else "notebook/standalone"
         )
-        return f"{user_id}/{notebook_path}/podcast/{podcast_id}/{filename}"
+        return f"{user_id}/{notebook_path}/podcast/{podcast_id}"
 
     def _get_audio_file_metadata(
         self, audio_content: bytes, object_key: str, metadata: dict[str, Any] = None
@@ -201,12 +318,13 @@ class PodcastStorageService:
         Returns:
             File metadata dictionary
         """
+        audio_format = audio_format_for(object_key)
         file_metadata = {
             "filename": object_key.split("/")[-1],
             "object_key": object_key,
             "file_size": len(audio_content),
-            "content_type": "audio/wav",
-            "format": "wav",
+            "content_type": AUDIO_CONTENT_TYPES[audio_format],
+            "format": audio_format,
             "stored_at": datetime.now(UTC).isoformat(),
         }
 
@@ -267,14 +385,22 @@ class PodcastStorageService:
             # Note: This would need to be implemented in the MinIO backend
             # For now, return basic info based on object key
 
+            audio_format = audio_format_for(object_key)
             return {
                 "object_key": object_key,
                 "filename": object_key.split("/")[-1],
-                "content_type": "audio/wav",
-                "format": "wav",
+                "content_type": AUDIO_CONTENT_TYPES[audio_format],
+                "format": audio_format,
                 "exists": True,  # Assume exists for now
             }
 
         except Exception as e:
             logger.error(f"Error getting file info for {object_key}: {e}")
             return {"object_key": object_key, "exists": False, "error": str(e)}
+
+
+def delete_job_segments(job) -> bool:
+    """Delete the streaming segments and manifest a podcast job published."""
+    return PodcastStorageService().delete_podcast_segments(
+        job.user_id, str(job.id), job.notebook_id
+    )
@@ -0,0 +1,123 @@
+"""
+Progressive podcast streaming.
+
+While a podcast is still being synthesized, every assembled turn is encoded
+once as an HLS media segment (AAC in MPEG-TS, with timestamps continuing from
+the previous segment), uploaded and announced to the notebook over SSE, so
+listeners can start playback within seconds of the script being written
+instead of waiting for the whole episode:
+
+    {podcast prefix}/segments/segment_000.ts, segment_001.ts, ...
+    {podcast prefix}/segments/manifest.json
+
+The manifest lists the segments published so far and backs the HLS-style
+playlist served by ``PodcastPlaylistView`` until the job completes and the
+segment list is saved on the podcast itself.
+"""
+
+import logging
+import math
+from typing import Any
+
+from core.utils.sse import publish_notebook_event
+
+from .storage import PodcastStorageService
+
+logger = logging.getLogger(__name__)
+
+PLAYLIST_CONTENT_TYPE = "application/vnd.apple.mpegurl"
+
+
+def playlist_url(podcast_id: str) -> str:
+    return f"/api/v1/podcasts/{podcast_id}/playlist.m3u8"
+
+
+def segment_url(podcast_id: str, index: int) -> str:
+    return f"/api/v1/podcasts/{podcast_id}/segments/{index}/"
+
+
+class PodcastSegmentPublisher:
+    """
+    ``on_segment`` hook for ``generate_conversation_audio_optimized``.
+
+    Called in script order from the generation thread; uploads each segment,
+    refreshes the manifest and publishes a SEGMENT_READY notebook event.
+    """
+
+    def __init__(
+        self,
+        storage_service: PodcastStorageService,
+        user_id: int,
+        podcast_id: str,
+        notebook_id: int | None = None,
+    ):
+        self.storage_service = storage_service
+        self.user_id = user_id
+        self.podcast_id = str(podcast_id)
+        self.notebook_id = notebook_id
+        self.segments: list[dict[str, Any]] = []
+
+    @property
+    def duration(self) -> float:
+        return round(sum(segment["duration"] for segment in self.segments), 3)
+
+    def __call__(self, index: int, audio_content: bytes, duration: float) -> None:
+        object_key = self.storage_service.store_podcast_segment(
+            self.user_id, self.podcast_id, self.notebook_id, index, audio_content
+        )
+        if not object_key:
+            return
+
+        segment = {
+            "index": index,
+            "object_key": object_key,
+            "duration": round(duration, 3),
+            "file_size": len(audio_content),
+        }
+        self.segments.append(segment)
+        self.storage_service.store_segment_manifest(
+            self.user_id, self.podcast_id, self.notebook_id, self.segments
+        )
+        logger.info(
+            f"Published segment {index} ({duration:.1f}s) of podcast {self.podcast_id}"
+        )
+
+        if self.notebook_id:
+            publish_notebook_event(
+                notebook_id=str(self.notebook_id),
+                entity="podcast",
+                entity_id=self.podcast_id,
+                status="SEGMENT_READY",
+                payload={
+                    "segment": index,
+                    "duration": segment["duration"],
+                    "segment_count": len(self.segments),
+                    "segment_url": segment_url(self.podcast_id, index),
+                    "playlist_url": playlist_url(self.podcast_id),
+                },
+            )
+
+
+def render_playlist(
+    podcast_id: str, segments: list[dict[str, Any]], complete: bool
+) -> str:
+    """
+    Render an HLS media playlist for the segments published so far.
+
+    Incomplete playlists are EVENT playlists without an end tag, so players
+    keep polling for new segments.
+    """
+    target = max((math.ceil(s["duration"]) for s in segments), default=1)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        f"#EXT-X-TARGETDURATION:{max(1, target)}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        f"#EXT-X-PLAYLIST-TYPE:{'VOD' if complete else 'EVENT'}",
+    ]
+    for segment in segments:
+        lines.append(f"#EXTINF:{segment['duration']:.3f},")
+        lines.append(segment_url(podcast_id, segment["index"]))
+    if complete:
+        lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
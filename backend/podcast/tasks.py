@@ -12,6 +12,7 @@ from django.utils import timezone
 
 from .models import Podcast
 from .service import PodcastService
+from .storage import AUDIO_CONTENT_TYPES, audio_format_for, delete_job_segments
 
 logger = logging.getLogger(__name__)
 
@@ -99,13 +100,21 @@ def process_podcast_generation(self, job_id: str):
 
             # Store file metadata
             if result.get("audio_object_key"):
+                audio_format = audio_format_for(result["audio_object_key"])
+                segments = result.get("segments") or []
                 job.file_metadata = {
-                    "filename": f"podcast_{job.id}.wav",
-                    "content_type": "audio/wav",
+                    "filename": f"podcast_{job.id}.{audio_format}",
+                    "content_type": AUDIO_CONTENT_TYPES[audio_format],
                     "object_key": result["audio_object_key"],
                     "participants": result["metadata"]["participants"],
                     "conversation_turns": result["metadata"]["total_turns"],
                 }
+                if segments:
+                    # Keep the progressive playlist valid after completion
+                    job.file_metadata["segments"] = segments
+                    job.file_metadata["duration_seconds"] = round(
+                        sum(segment["duration"] for segment in segments), 3
+                    )
 
             # Store conversation text for search/display
             conversation_text = "\n\n".join(
@@ -158,6 +167,7 @@ def process_podcast_generation(self, job_id: str):
             job.status = "error"
             job.processing_completed_at = timezone.now()
             job.save()
+            delete_job_segments(job)
 
             # Publish FAILURE event via SSE
             if job.notebook:
@@ -185,6 +195,7 @@ def process_podcast_generation(self, job_id: str):
             job.status = "error"
             job.processing_completed_at = timezone.now()
             job.save()
+            delete_job_segments(job)
 
             # Publish FAILURE event via SSE
             if job.notebook:
@@ -228,6 +239,7 @@ def cancel_podcast_generation(self, job_id: str):
         job.status = "cancelled"
         job.error_message = "Job cancelled by user"
         job.save()
+        delete_job_segments(job)
 
         # Publish CANCELLED event via SSE
         if job.notebook:
@@ -276,6 +288,9 @@ def cleanup_old_podcast_jobs():
                     except Exception as e:
                         logger.error(f"Error deleting audio file from MinIO: {e}")
 
+                # Failed and cancelled runs may have published segments too
+                delete_job_segments(job)
+
                 job.delete()
                 deleted_count += 1
 
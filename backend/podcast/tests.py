@@ -1 +1,261 @@
-# Create your tests here.
+"""
+Tests for podcast audio generation utilities.
+"""
+
+import io
+import struct
+import tempfile
+import threading
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from .audio import AudioAssembler
+from .streaming import render_playlist
+from .utils import synthesize_turn_chunks
+
+
+def make_wav(samples: list[int], rate: int, channels: int = 1) -> bytes:
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return out.getvalue()
+
+
+class FakeHiggsSession:
+    """Higgs stand-in that returns the text it was asked to speak."""
+
+    def __init__(self, fail_smart_voice: set[str] | None = None):
+        self.fail_smart_voice = fail_smart_voice or set()
+        self.smart_calls: list[str] = []
+        self.clone_calls: list[tuple[bytes, str]] = []
+        self._lock = threading.Lock()
+
+    def smart_voice(self, text, system_prompt=None):
+        with self._lock:
+            self.smart_calls.append(text)
+        if text in self.fail_smart_voice:
+            return None
+        return f"smart:{text}".encode()
+
+    def voice_clone(self, seed_audio_wav, seed_text, new_text):
+        with self._lock:
+            self.clone_calls.append((seed_audio_wav, new_text))
+        return f"clone:{new_text}".encode()
+
+
+class FakeTTSCache:
+    """In-memory stand-in for TTSChunkCache."""
+
+    def __init__(self):
+        self.entries: dict[str, bytes] = {}
+        self.hits = 0
+        self.misses = 0
+        self.hit_rate = 0.0
+
+    def get(self, digest):
+        if digest in self.entries:
+            self.hits += 1
+            return self.entries[digest]
+        self.misses += 1
+        return None
+
+    def put(self, digest, audio):
+        self.entries[digest] = audio
+
+
+class SynthesizeTurnChunksTests(SimpleTestCase):
+    """Test cases for the two-phase concurrent TTS schedule."""
+
+    def test_seeds_each_speaker_then_clones_in_order(self):
+        """Test that only first chunks are seeded and results keep script order."""
+        session = FakeHiggsSession()
+        speaker_state = {}
+        turns = [("A", ["a1", "a2"]), ("B", ["b1"]), ("A", ["a3", "a4"])]
+
+        results = synthesize_turn_chunks(
+            turns, speaker_state, higgs_session=session, max_workers=3
+        )
+
+        self.assertEqual(
+            results,
+            [
+                [b"smart:a1", b"clone:a2"],
+                [b"smart:b1"],
+                [b"clone:a3", b"clone:a4"],
+            ],
+        )
+        self.assertEqual(session.smart_calls, ["a1", "b1"])
+        self.assertEqual(speaker_state["A"]["seed_text"], "a1")
+        a_seeds = {seed for seed, text in session.clone_calls if text.startswith("a")}
+        self.assertEqual(a_seeds, {b"smart:a1"})
+
+    @patch("podcast.utils._openai_tts", return_value=b"openai")
+    def test_failed_seed_falls_back_and_next_chunk_seeds(self, mock_openai):
+        """Test that a failed seed uses OpenAI TTS and the next chunk seeds."""
+        session = FakeHiggsSession(fail_smart_voice={"a1"})
+        speaker_state = {}
+
+        results = synthesize_turn_chunks(
+            [("A", ["a1", "a2", "a3"])], speaker_state, higgs_session=session
+        )
+
+        self.assertEqual(results, [[b"openai", b"smart:a2", b"clone:a3"]])
+        self.assertEqual(speaker_state["A"]["seed_text"], "a2")
+        mock_openai.assert_called_once_with("a1")
+
+    def test_reports_each_turn_once_when_complete(self):
+        """Test that on_turn_complete fires once per turn with all its chunks."""
+        completed = {}
+
+        synthesize_turn_chunks(
+            [("A", ["a1", "a2"]), ("B", ["b1"]), ("A", ["a3"])],
+            {},
+            higgs_session=FakeHiggsSession(),
+            max_workers=2,
+            on_turn_complete=lambda ti, audio: completed.setdefault(ti, list(audio)),
+        )
+
+        self.assertEqual(
+            completed,
+            {0: [b"smart:a1", b"clone:a2"], 1: [b"smart:b1"], 2: [b"clone:a3"]},
+        )
+
+    def test_rerender_is_served_from_tts_cache(self):
+        """Test that an unchanged script is synthesized from the chunk cache."""
+        cache = FakeTTSCache()
+        turns = [("A", ["a1", "a2"]), ("B", ["b1", "b2"])]
+        first = synthesize_turn_chunks(
+            turns, {}, higgs_session=FakeHiggsSession(), tts_cache=cache
+        )
+
+        session = FakeHiggsSession()
+        second = synthesize_turn_chunks(
+            turns + [("A", ["a3"])], {}, higgs_session=session, tts_cache=cache
+        )
+
+        self.assertEqual(second[:2], first)
+        self.assertEqual(session.smart_calls, [])
+        self.assertEqual([text for _, text in session.clone_calls], ["a3"])
+        self.assertEqual(cache.hits, 4)
+
+
+class PlaylistTests(SimpleTestCase):
+    """Test cases for the progressive segment playlist."""
+
+    def test_open_playlist_until_complete(self):
+        """Test that only completed podcasts get an end tag."""
+        segments = [{"index": 0, "duration": 4.2}, {"index": 1, "duration": 7.5}]
+
+        playlist = render_playlist("p1", segments, complete=False)
+
+        self.assertIn("#EXT-X-TARGETDURATION:8", playlist)
+        self.assertIn("#EXT-X-PLAYLIST-TYPE:EVENT", playlist)
+        self.assertIn("#EXTINF:4.200,\n/api/v1/podcasts/p1/segments/0/", playlist)
+        self.assertNotIn("#EXT-X-ENDLIST", playlist)
+        self.assertTrue(
+            render_playlist("p1", segments, complete=True).endswith("#EXT-X-ENDLIST\n")
+        )
+
+
+class AudioAssemblerTests(SimpleTestCase):
+    """Test cases for in-memory PCM assembly."""
+
+    def test_resamples_and_inserts_silence_between_turns(self):
+        """Test that mixed-rate chunks are joined at one rate with turn gaps."""
+        assembler = AudioAssembler(sample_rate=8000, silence_ms=100, target_dbfs=-20)
+        # 0.1s at 16 kHz stereo, then 0.1s + 0.05s at 8 kHz mono
+        assembler.add_turn([make_wav([1000, -1000] * 1600, 16000, channels=2)])
+        assembler.add_turn([make_wav([2000] * 800, 8000), make_wav([2000] * 400, 8000)])
+
+        self.assertEqual(assembler.turn_count, 2)
+        self.assertEqual(assembler.frames, 800 + 800 + 1200)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = assembler.write_wav(Path(tmp) / "out.wav")
+            with wave.open(str(path), "rb") as wav:
+                self.assertEqual(wav.getframerate(), 8000)
+                self.assertEqual(wav.getnchannels(), 1)
+                self.assertEqual(wav.getnframes(), 2800)
+
+    def test_segments_are_encoded_as_continuous_aac_transport_streams(self):
+        """Test that streaming segments are AAC/MPEG-TS offset by prior audio."""
+        assembler = AudioAssembler(sample_rate=8000, silence_ms=100, target_dbfs=-20)
+        assembler.add_turn([make_wav([1000] * 800, 8000)])
+        parts = assembler.add_turn([make_wav([1000] * 1600, 8000)])
+
+        with patch("podcast.audio.subprocess.run") as run:
+            run.return_value.stdout = b"ts-bytes"
+            segment = assembler.encode_segment(
+                parts, start_time=assembler.duration - assembler.parts_duration(parts)
+            )
+
+        self.assertEqual(segment, b"ts-bytes")
+        args = run.call_args.args[0]
+        self.assertEqual(args[args.index("-c:a") + 1], "aac")
+        self.assertEqual(args[args.index("-f", args.index("-c:a")) + 1], "mpegts")
+        self.assertEqual(args[args.index("-output_ts_offset") + 1], "0.100")
+        self.assertEqual(len(run.call_args.kwargs["input"]), (800 + 1600) * 2)
+
+
+class SegmentCleanupTests(TestCase):
+    """Test that published segments are removed for every finished job."""
+
+    def test_cleanup_deletes_segments_of_cancelled_jobs(self):
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from notebooks.models import Notebook
+
+        from .models import Podcast
+        from .tasks import cleanup_old_podcast_jobs
+
+        user = get_user_model().objects.create_user(username="u", password="p")
+        notebook = Notebook.objects.create(user=user, name="nb")
+        job = Podcast.objects.create(user=user, notebook=notebook, status="cancelled")
+        Podcast.objects.filter(id=job.id).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+
+        deleted = []
+        with patch(
+            "podcast.tasks.delete_job_segments",
+            side_effect=lambda job: deleted.append(job.id),
+        ):
+            self.assertEqual(cleanup_old_podcast_jobs(), 1)
+
+        # No segments were recorded in file_metadata, yet they are removed
+        self.assertEqual(deleted, [job.id])
+
+
+class PodcastFilesViewTests(TestCase):
+    """Test the download listing of finished podcasts."""
+
+    def test_filename_uses_stored_audio_format(self):
+        from notebooks.models import Notebook
+        from rest_framework.test import APIRequestFactory, force_authenticate
+
+        from .models import Podcast
+        from .views import PodcastFilesView
+
+        user = get_user_model().objects.create_user(username="u", password="p")
+        notebook = Notebook.objects.create(user=user, name="nb")
+        job = Podcast.objects.create(
+            user=user,
+            notebook=notebook,
+            title="Weekly digest",
+            status="completed",
+            audio_object_key=f"{user.id}/podcast/abc/podcast.mp3",
+        )
+
+        request = APIRequestFactory().get(f"/api/v1/podcasts/{job.id}/files/")
+        force_authenticate(request, user=user)
+        response = PodcastFilesView.as_view()(request, podcast_id=job.id)
+
+        self.assertEqual(response.data["files"][0]["filename"], "Weekly digest.mp3")
@@ -0,0 +1,180 @@
+"""
+Content-addressed cache for synthesized TTS chunks.
+
+A chunk's audio is determined by the voice it is spoken in, its text, the
+language and the TTS model, so re-rendering a podcast after a small script
+edit (or rendering a shared intro again) can reuse almost every chunk. Audio
+is stored once per digest of that tuple in MinIO:
+
+    tts-cache/{digest[:2]}/{digest}.wav
+
+and indexed in Redis, which also drives size-bounded LRU eviction:
+
+- ``podcast_tts_cache:lru``: sorted set of digests scored by last access
+- ``podcast_tts_cache:sizes``: hash of digest -> stored bytes
+- ``podcast_tts_cache:bytes``: total stored bytes
+
+Voices are identified by the speaker name for seed (smart voice) chunks and
+by a hash of the speaker's seed audio for cloned chunks, so a cached seed
+keeps every chunk cloned from it cacheable too. Fallback (OpenAI) audio is
+never cached. Lookups are counted in ``deepsight_tts_cache_lookups_total``.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+import redis
+from core.instrumentation import metrics
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "podcast_tts_cache"
+LRU_KEY = f"{KEY_PREFIX}:lru"
+SIZES_KEY = f"{KEY_PREFIX}:sizes"
+TOTAL_BYTES_KEY = f"{KEY_PREFIX}:bytes"
+
+OBJECT_PREFIX = "tts-cache"
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+# Entries evicted per round-trip once the cache is over its size limit
+EVICTION_BATCH = 50
+
+
+def speaker_voice(speaker: str) -> str:
+    """Voice identity of a speaker's not-yet-seeded (smart voice) chunks."""
+    return f"speaker:{speaker}"
+
+
+def seed_voice(seed_audio: bytes) -> str:
+    """Voice identity of chunks cloned from a seed recording."""
+    return f"seed:{hashlib.sha256(seed_audio).hexdigest()}"
+
+
+def chunk_digest(voice: str, text: str, language: str, model: str | None) -> str:
+    payload = json.dumps([voice, text, language, model or ""], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def object_key(digest: str) -> str:
+    return f"{OBJECT_PREFIX}/{digest[:2]}/{digest}.wav"
+
+
+class TTSChunkCache:
+    """Look up and store synthesized chunk audio, evicting least recently used."""
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "PODCAST_TTS_CACHE_ENABLED", True)
+
+    @property
+    def max_bytes(self) -> int:
+        return getattr(settings, "PODCAST_TTS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            url = getattr(settings, "PODCAST_TTS_CACHE_REDIS_URL", None) or (
+                settings.CELERY_BROKER_URL
+            )
+            self._client = redis.Redis.from_url(url, decode_responses=True)
+        return self._client
+
+    def _backend(self):
+        from notebooks.utils.storage import get_minio_backend
+
+        return get_minio_backend()
+
+    def _count(self, result: str) -> None:
+        with self._lock:
+            if result == "hit":
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.inc("deepsight_tts_cache_lookups_total", result=result)
+
+    def get(self, digest: str) -> bytes | None:
+        """Return cached audio for a chunk digest, or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            if self.client.zscore(LRU_KEY, digest) is None:
+                self._count("miss")
+                return None
+            audio = self._backend().get_file(object_key(digest))
+            if not audio:
+                # Object evicted or lost behind the index's back
+                self._forget([digest])
+                self._count("miss")
+                return None
+            self.client.zadd(LRU_KEY, {digest: time.time()})
+        except Exception as e:
+            logger.warning(f"TTS cache lookup failed for {digest}: {e}")
+            self._count("error")
+            return None
+
+        self._count("hit")
+        return audio
+
+    def put(self, digest: str, audio: bytes) -> None:
+        """Store a chunk's audio and evict old entries if over the size limit."""
+        if not self.enabled or not audio:
+            return
+        try:
+            if not self._backend().store_file(
+                object_key(digest), audio, content_type="audio/wav"
+            ):
+                return
+            previous = self.client.hget(SIZES_KEY, digest)
+            pipe = self.client.pipeline(transaction=True)
+            pipe.zadd(LRU_KEY, {digest: time.time()})
+            pipe.hset(SIZES_KEY, digest, len(audio))
+            pipe.incrby(TOTAL_BYTES_KEY, len(audio) - int(previous or 0))
+            total = pipe.execute()[-1]
+            if total > self.max_bytes:
+                self._evict(total)
+        except Exception as e:
+            logger.warning(f"TTS cache store failed for {digest}: {e}")
+
+    def _evict(self, total: int) -> None:
+        evicted = 0
+        while total > self.max_bytes:
+            popped = self.client.zpopmin(LRU_KEY, EVICTION_BATCH)
+            oldest = [digest for digest, _ in popped]
+            if not oldest:
+                break
+            total = self._forget(oldest)
+            backend = self._backend()
+            for digest in oldest:
+                backend.delete_file(object_key(digest))
+            evicted += len(oldest)
+        if evicted:
+            metrics.inc("deepsight_tts_cache_evictions_total", evicted)
+            logger.info(f"Evicted {evicted} TTS cache entries ({total} bytes left)")
+
+    def _forget(self, digests: list[str]) -> int:
+        """Drop digests from the index; returns the new total size."""
+        sizes = self.client.hmget(SIZES_KEY, digests)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(LRU_KEY, *digests)
+        pipe.hdel(SIZES_KEY, *digests)
+        pipe.decrby(TOTAL_BYTES_KEY, sum(int(size or 0) for size in sizes))
+        return pipe.execute()[-1]
+
+
+tts_chunk_cache = TTSChunkCache()
@@ -33,6 +33,16 @@ urlpatterns = [
         views.PodcastAudioRedirectView.as_view(),
         name="podcast-audio",
     ),
+    path(
+        "<uuid:podcast_id>/playlist.m3u8",
+        views.PodcastPlaylistView.as_view(),
+        name="podcast-playlist",
+    ),
+    path(
+        "<uuid:podcast_id>/segments/<int:index>/",
+        views.PodcastSegmentView.as_view(),
+        name="podcast-segment",
+    ),
     path(
         "<uuid:podcast_id>/files/",
         views.PodcastFilesView.as_view(),
@@ -53,5 +63,7 @@ Generated URL Patterns (canonical only):
 - DEL  /api/v1/podcasts/{podcast_id}/
 - POST /api/v1/podcasts/{podcast_id}/cancel/
 - GET  /api/v1/podcasts/{podcast_id}/audio/
+- GET  /api/v1/podcasts/{podcast_id}/playlist.m3u8
+- GET  /api/v1/podcasts/{podcast_id}/segments/{index}/
 - GET  /api/v1/podcasts/{podcast_id}/files/
 """
@@ -4,23 +4,34 @@ Podcast generation utilities.
 This module provides utilities for:
 - Bracket-format conversation parsing
 - Content extraction from knowledge base items
-- Text-to-speech generation via Higgs (primary) and OpenAI (fallback)
-- Audio processing and concatenation (WAV output)
+- Text-to-speech generation via Higgs (primary) and OpenAI (fallback),
+  with speaker seeding followed by concurrent chunk synthesis
+- In-memory PCM assembly of the final audio (see podcast.audio)
 """
 
 import base64
 import logging
 import os
 import re
-import subprocess
 import unicodedata
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 import requests
 from django.conf import settings
 
+from .audio import AudioAssembler, AudioDecodeError
+from .tts_cache import (
+    TTSChunkCache,
+    chunk_digest,
+    seed_voice,
+    speaker_voice,
+    tts_chunk_cache,
+)
+
 # =============================================================================
 # CONSTANTS AND CONFIGURATION
 # =============================================================================
@@ -118,6 +129,9 @@ async def extract_selected_content(selected_item_ids: list[int]) -> str:
     """
     Extract content from selected knowledge base items.
 
+    Only each item's share of PODCAST_INPUT_TOKEN_BUDGET (by default
+    MAX_CONTENT_LENGTH characters) is read from the database.
+
     Args:
         selected_item_ids: List of KnowledgeBaseItem IDs selected by frontend
 
@@ -129,31 +143,21 @@ async def extract_selected_content(selected_item_ids: list[int]) -> str:
 
     try:
         from asgiref.sync import sync_to_async
-        from notebooks.models import KnowledgeBaseItem
-
-        content_parts = []
-
-        # Get selected knowledge base items asynchronously
-        kb_items = await sync_to_async(list)(
-            KnowledgeBaseItem.objects.filter(id__in=selected_item_ids)
+        from notebooks.services.input_assembly import (
+            CHARS_PER_TOKEN,
+            KnowledgeInputAssembler,
         )
 
-        for item in kb_items:
-            # Add main content
-            if hasattr(item, "content") and item.content:
-                content_parts.append(f"Content: {item.content}")
-            elif hasattr(item, "summary") and item.summary:
-                content_parts.append(f"Summary: {item.summary}")
-
-            # Add separator between items
-            content_parts.append("---")
-
-        # Join all content
-        full_content = "\n\n".join(content_parts)
-
-        # Return truncated content if too long
-        if len(full_content) > MAX_CONTENT_LENGTH:
-            return full_content[:MAX_CONTENT_LENGTH] + "..."
+        assembler = KnowledgeInputAssembler(
+            token_budget=getattr(
+                settings,
+                "PODCAST_INPUT_TOKEN_BUDGET",
+                MAX_CONTENT_LENGTH // CHARS_PER_TOKEN,
+            )
+        )
+        full_content = await sync_to_async(assembler.assemble_text)(
+            selected_item_ids, template="Content: {content}\n\n---"
+        )
 
         return full_content if full_content else "No content found for selected items."
 
@@ -507,107 +511,240 @@ def _openai_tts(text: str) -> bytes | None:
         return None
 
 
-def _synthesize_and_merge_turn_chunks(
-    chunks: list[str],
-    speaker: str,
-    segment_index: int,
-    audio_output_dir: Path,
+# =============================================================================
+# CONCURRENT CHUNK SYNTHESIS
+# =============================================================================
+
+
+def _synthesize_chunk(
+    session: HiggsTTSSession,
+    chunk_text: str,
+    seed: dict[str, Any] | None,
+    system_prompt: str,
+    tts_cache: TTSChunkCache | None = None,
+    language: str = "en",
+) -> bytes | None:
+    """
+    Synthesize one chunk: clone the speaker's seed voice when available (from
+    the TTS cache if this exact chunk was cloned before), then retry with
+    smart voice, then fall back to OpenAI TTS.
+    """
+    audio_bytes: bytes | None = None
+    if seed:
+        seed_audio = seed.get("seed_audio", b"")
+        digest = None
+        if tts_cache is not None:
+            digest = chunk_digest(
+                seed_voice(seed_audio),
+                chunk_text,
+                language,
+                getattr(session, "model", None),
+            )
+            audio_bytes = tts_cache.get(digest)
+        if not audio_bytes:
+            audio_bytes = session.voice_clone(
+                seed_audio, seed.get("seed_text", ""), chunk_text
+            )
+            if audio_bytes and digest:
+                tts_cache.put(digest, audio_bytes)
+    if not audio_bytes:
+        audio_bytes = session.smart_voice(chunk_text, system_prompt=system_prompt)
+    if not audio_bytes:
+        audio_bytes = _openai_tts(chunk_text)
+    return audio_bytes
+
+
+def synthesize_turn_chunks(
+    turns: list[tuple[str, list[str]]],
     speaker_state: dict[str, dict[str, Any]],
     higgs_session: HiggsTTSSession | None = None,
     language: str = "en",
-) -> Path | None:
+    max_workers: int | None = None,
+    on_turn_complete: Callable[[int, list[bytes | None]], None] | None = None,
+    tts_cache: TTSChunkCache | None = None,
+) -> list[list[bytes | None]]:
     """
-    Given pre-chunked text for a single speaker turn, synthesize each chunk to audio,
-    then concatenate into a single segment file. Manages per-speaker cloning seed.
-    """
-    try:
-        if not chunks:
-            return None
+    Synthesize the chunks of many speaker turns with a two-phase schedule.
 
-        # Ensure we have a session; prefer caller-provided (one per job)
-        session = higgs_session or HiggsTTSSession()
+    Phase 1 runs sequentially and only until every speaker has a cloning seed:
+    each speaker's chunks are synthesized with smart voice, in script order,
+    until one succeeds and becomes that speaker's seed (as before, a chunk
+    whose smart voice fails falls back to OpenAI TTS and the next chunk tries
+    again). Phase 2 synthesizes every remaining chunk concurrently with at most
+    ``max_workers`` (PODCAST_TTS_CONCURRENCY) requests in flight.
 
-        # Build system prompt based on language
-        system_prompt = build_tts_system_prompt(language=language)
+    Args:
+        turns: (speaker, chunks) per turn, in script order
+        speaker_state: Per-speaker seed audio/text; seeds are added in phase 1
+        higgs_session: Shared Higgs session for the job
+        language: Language for the smart voice system prompt
+        max_workers: Concurrent TTS requests in phase 2
+        on_turn_complete: Called on the calling thread with (turn index,
+            chunk audio) as soon as every chunk of a turn is done, in
+            completion order rather than script order
+        tts_cache: Chunk audio cache consulted before every Higgs request
+            (default: the shared cache, when PODCAST_TTS_CACHE_ENABLED)
 
-        chunk_files: list[Path] = []
+    Returns:
+        Audio bytes per chunk, shaped like ``turns`` (None where every
+        fallback failed)
+    """
+    session = higgs_session or HiggsTTSSession()
+    system_prompt = build_tts_system_prompt(language=language)
+    if max_workers is None:
+        max_workers = getattr(settings, "PODCAST_TTS_CONCURRENCY", 4)
+    if tts_cache is None and tts_chunk_cache.enabled:
+        tts_cache = tts_chunk_cache
+    hits_before = tts_cache.hits if tts_cache else 0
+
+    results: list[list[bytes | None]] = [[None] * len(chunks) for _, chunks in turns]
+    remaining = [len(chunks) for _, chunks in turns]
+    pending: list[tuple[int, int]] = []
+
+    def _chunk_done(ti: int) -> None:
+        remaining[ti] -= 1
+        if remaining[ti] == 0 and on_turn_complete is not None:
+            on_turn_complete(ti, results[ti])
+
+    # Phase 1: capture each speaker's seed from their first successful chunk
+    for ti, (speaker, chunks) in enumerate(turns):
+        if not chunks and on_turn_complete is not None:
+            on_turn_complete(ti, results[ti])
         for ci, chunk_text in enumerate(chunks):
-            audio_bytes: bytes | None = None
-
-            if speaker not in speaker_state:
+            if speaker in speaker_state:
+                pending.append((ti, ci))
+                continue
+            audio_bytes = digest = None
+            if tts_cache is not None:
+                digest = chunk_digest(
+                    speaker_voice(speaker),
+                    chunk_text,
+                    language,
+                    getattr(session, "model", None),
+                )
+                audio_bytes = tts_cache.get(digest)
+            if not audio_bytes:
                 audio_bytes = session.smart_voice(
                     chunk_text, system_prompt=system_prompt
                 )
-                if audio_bytes:
-                    speaker_state[speaker] = {
-                        "seed_audio": audio_bytes,
-                        "seed_text": chunk_text,
-                    }
+                if audio_bytes and digest:
+                    tts_cache.put(digest, audio_bytes)
+            if audio_bytes:
+                speaker_state[speaker] = {
+                    "seed_audio": audio_bytes,
+                    "seed_text": chunk_text,
+                }
             else:
-                seed = speaker_state[speaker]
-                audio_bytes = session.voice_clone(
-                    seed.get("seed_audio", b""), seed.get("seed_text", ""), chunk_text
-                )
-                if not audio_bytes:
-                    audio_bytes = session.smart_voice(
-                        chunk_text, system_prompt=system_prompt
-                    )
-
-            if not audio_bytes:
                 audio_bytes = _openai_tts(chunk_text)
+            results[ti][ci] = audio_bytes
+            _chunk_done(ti)
+
+    # Phase 2: seeds are fixed now, so the remaining chunks are independent
+    def _run(ti: int, ci: int) -> bytes | None:
+        speaker, chunks = turns[ti]
+        return _synthesize_chunk(
+            session,
+            chunks[ci],
+            speaker_state.get(speaker),
+            system_prompt,
+            tts_cache=tts_cache,
+            language=language,
+        )
 
-            if not audio_bytes:
-                logger.warning(
-                    f"Failed to generate audio for chunk {ci} of segment {segment_index} ({speaker})"
-                )
-                # Abort the whole segment on first failure to avoid broken audio
-                for f in chunk_files:
-                    try:
-                        f.unlink()
-                    except Exception:
-                        pass
-                return None
-
-            temp_chunk_name = f"segment_{segment_index:03d}_{speaker}_{ci:02d}.wav"
-            temp_chunk_path = audio_output_dir / temp_chunk_name
-            os.makedirs(os.path.dirname(temp_chunk_path), exist_ok=True)
-            with open(temp_chunk_path, "wb") as f:
-                f.write(audio_bytes)
-            if temp_chunk_path.exists() and os.path.getsize(temp_chunk_path) > 0:
-                chunk_files.append(temp_chunk_path)
-            else:
-                logger.warning(f"Invalid chunk file: {temp_chunk_path}")
-                for f in chunk_files:
-                    try:
-                        f.unlink()
-                    except Exception:
-                        pass
-                return None
-
-        # Concatenate chunk files into final segment file
-        temp_filename = f"segment_{segment_index:03d}_{speaker}.wav"
-        temp_file_path = audio_output_dir / temp_filename
-        success = concatenate_audio_segments(
-            chunk_files, temp_file_path, audio_output_dir
+    if pending:
+        logger.info(
+            f"Synthesizing {len(pending)} TTS chunks with up to {max_workers} workers"
+        )
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(_run, ti, ci): (ti, ci) for ti, ci in pending}
+            for future in as_completed(futures):
+                ti, ci = futures[future]
+                try:
+                    results[ti][ci] = future.result()
+                except Exception as e:
+                    logger.error(f"TTS failed for chunk {ci} of turn {ti}: {e}")
+                _chunk_done(ti)
+
+    if tts_cache is not None:
+        total = sum(len(chunks) for _, chunks in turns)
+        logger.info(
+            f"TTS cache served {tts_cache.hits - hits_before} of {total} chunks "
+            f"(process hit rate {tts_cache.hit_rate:.0%})"
         )
+    return results
 
-        # Cleanup chunk files
-        for f in chunk_files:
-            try:
-                f.unlink()
-            except Exception:
-                pass
 
-        if success and temp_file_path.exists() and os.path.getsize(temp_file_path) > 0:
-            return temp_file_path
+def _turn_complete(
+    chunk_audio: list[bytes | None], speaker: str, segment_index: int
+) -> bool:
+    """Whether every chunk of a turn was synthesized (else the turn is skipped)."""
+    for ci, audio_bytes in enumerate(chunk_audio):
+        if not audio_bytes:
+            logger.warning(
+                f"Failed to generate audio for chunk {ci} of segment {segment_index} ({speaker})"
+            )
+            return False
+    return bool(chunk_audio)
+
 
-        logger.warning(f"Generated segment but concatenation failed: {temp_file_path}")
+def _merge_turn_audio(
+    chunk_audio: list[bytes | None],
+    speaker: str,
+    segment_index: int,
+    audio_output_dir: Path,
+) -> Path | None:
+    """Assemble a turn's synthesized chunks in memory into one segment WAV."""
+    if not _turn_complete(chunk_audio, speaker, segment_index):
         return None
+
+    try:
+        assembler = AudioAssembler()
+        assembler.add_turn(chunk_audio)
+        os.makedirs(audio_output_dir, exist_ok=True)
+        return assembler.write_wav(
+            audio_output_dir / f"segment_{segment_index:03d}_{speaker}.wav"
+        )
+    except Exception as e:
+        logger.warning(f"Failed to assemble segment {segment_index} ({speaker}): {e}")
+        return None
+
+
+def _synthesize_and_merge_turn_chunks(
+    chunks: list[str],
+    speaker: str,
+    segment_index: int,
+    audio_output_dir: Path,
+    speaker_state: dict[str, dict[str, Any]],
+    higgs_session: HiggsTTSSession | None = None,
+    language: str = "en",
+) -> Path | None:
+    """
+    Given pre-chunked text for a single speaker turn, synthesize each chunk to audio,
+    then concatenate into a single segment file. Manages per-speaker cloning seed.
+    Chunks already in the TTS chunk cache are not synthesized again.
+    """
+    try:
+        if not chunks:
+            return None
+
+        [chunk_audio] = synthesize_turn_chunks(
+            [(speaker, chunks)],
+            speaker_state,
+            higgs_session=higgs_session,
+            language=language,
+        )
+        return _merge_turn_audio(chunk_audio, speaker, segment_index, audio_output_dir)
     except Exception as e:
         logger.error(f"Error synthesizing/merging chunks for {speaker}: {e}")
         return None
 
 
+def _prepare_turn_chunks(content: str) -> list[str]:
+    """Normalize a turn's text and split it into TTS-sized chunks."""
+    content = normalize_tts_text(content)
+    return _chunk_text_by_length(content, max_chars=250) or [content]
+
+
 def generate_audio_segment(
     content: str,
     speaker: str,
@@ -636,11 +773,8 @@ def generate_audio_segment(
             f"generate_audio_segment called: speaker='{speaker}', segment_index={segment_index}"
         )
 
-        # Normalize content prior to TTS
-        content = normalize_tts_text(content)
-
-        # Split the single speaker's turn into chunks by length (uniformly)
-        chunks: list[str] = _chunk_text_by_length(content, max_chars=250) or [content]
+        # Normalize and split the single speaker's turn into chunks by length
+        chunks = _prepare_turn_chunks(content)
 
         return _synthesize_and_merge_turn_chunks(
             chunks=chunks,
@@ -661,17 +795,23 @@ def generate_conversation_audio_optimized(
     conversation_turns: list[dict[str, str]],
     audio_output_dir: Path,
     language: str = "en",
+    on_segment: Callable[[int, bytes, float], None] | None = None,
 ) -> Path | None:
     """
     Generate audio file from conversation turns using optimized approach:
-    1. Group content by speaker
-    2. Generate audio for each speaker's content in bulk
-    3. Create individual segments and concatenate in original order
+    1. Seed each speaker's voice from their first chunk (sequential)
+    2. Synthesize all remaining chunks of all turns concurrently
+    3. Decode chunks to PCM and assemble turns in script order in memory,
+       as soon as each turn and all turns before it are synthesized
 
     Args:
         conversation_turns: List of conversation turns with speaker and content
         audio_output_dir: Directory for audio output
         language: Language for the podcast (en or zh), default 'en'
+        on_segment: Optional progressive-streaming hook, called in script
+            order with (segment index, AAC/MPEG-TS segment bytes, duration
+            seconds)
+            for every assembled turn while later turns are still synthesizing
 
     Returns:
         Path to generated audio file or None if failed
@@ -682,169 +822,73 @@ def generate_conversation_audio_optimized(
         # Initialize one Higgs client/model session for the whole job
         higgs_session = HiggsTTSSession()
 
-        # Generate per-turn segments in order, grouping by speaker implicitly
-        audio_segments: list[Path] = []
+        turns: list[tuple[int, str, list[str]]] = []
         for i, turn in enumerate(conversation_turns):
             speaker = turn.get("speaker", "").strip()
             content = (turn.get("content") or "").strip()
             if not speaker or not content:
                 continue
-            segment_file = generate_audio_segment(
-                content=content,
-                speaker=speaker,
-                segment_index=i,
-                audio_output_dir=audio_output_dir,
-                speaker_state=speaker_state,
-                higgs_session=higgs_session,
-                language=language,
-            )
-            if segment_file and segment_file.exists():
-                audio_segments.append(segment_file)
-
-        # Generate final audio file (WAV)
-        if audio_segments:
-            audio_filename = f"panel_podcast_optimized_{uuid.uuid4().hex[:8]}.wav"
-            final_audio_path = audio_output_dir / audio_filename
-
-            success = concatenate_audio_segments(
-                audio_segments, final_audio_path, audio_output_dir
-            )
-
-            # Clean up temporary files
-            for segment in audio_segments:
+            turns.append((i, speaker, _prepare_turn_chunks(content)))
+
+        assembler = AudioAssembler()
+        finished: dict[int, list[bytes | None]] = {}
+        next_turn = 0
+
+        def _assemble_ready_turns(ti: int, chunk_audio: list[bytes | None]) -> None:
+            # Turns finish out of order; assemble the contiguous prefix
+            nonlocal next_turn
+            finished[ti] = chunk_audio
+            while next_turn in finished:
+                i, speaker, _ = turns[next_turn]
+                chunk_audio = finished.pop(next_turn)
+                next_turn += 1
+                if not _turn_complete(chunk_audio, speaker, i):
+                    continue
                 try:
-                    segment.unlink()
-                except Exception:
-                    pass
-
-            if success and final_audio_path.exists():
-                return final_audio_path
-
-        logger.error("No audio segments generated in optimized approach")
-        return None
-
-    except Exception as e:
-        logger.error(f"Optimized audio generation failed: {e}")
-        return None
-
-
-def concatenate_audio_segments(
-    segments: list[Path], output_file: Path, audio_output_dir: Path
-) -> bool:
-    """
-    Concatenate multiple audio segments into a single file.
-
-    Args:
-        segments: List of audio segment file paths
-        output_file: Final output file path
-        audio_output_dir: Directory for temporary files
-
-    Returns:
-        True if successful, False otherwise
-    """
-    if not segments:
-        return False
-
-    try:
-        # Create a temporary file list for ffmpeg
-        concat_list_file = audio_output_dir / f"concat_list_{uuid.uuid4().hex[:8]}.txt"
-
-        with open(concat_list_file, "w") as f:
-            for segment in segments:
-                f.write(f"file '{segment.absolute()}'\n")
-
-        try:
-            # Try ffmpeg concatenation with stream copy (fast, requires same codec/params)
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_list_file),
-                    "-c",
-                    "copy",
-                    str(output_file),
-                ],
-                check=True,
-                capture_output=True,
-                timeout=300,
-            )
-
-            concat_list_file.unlink()
-            return True
-
-        except (
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-            subprocess.TimeoutExpired,
-        ):
-            # Retry with re-encode to a common PCM WAV to handle mismatched params
-            try:
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-f",
-                        "concat",
-                        "-safe",
-                        "0",
-                        "-i",
-                        str(concat_list_file),
-                        "-c:a",
-                        "pcm_s16le",
-                        "-ar",
-                        "24000",
-                        "-ac",
-                        "1",
-                        str(output_file),
-                    ],
-                    check=True,
-                    capture_output=True,
-                    timeout=300,
-                )
-
-                concat_list_file.unlink()
-                return True
-            except Exception:
-                # Fallbacks
-                if len(segments) == 1:
-                    import shutil
-
-                    shutil.copy2(segments[0], output_file)
-                    return True
-                else:
-                    logger.warning(
-                        "ffmpeg failed; using simple concatenation as last resort"
-                    )
-                    return _simple_audio_concatenation(segments, output_file)
-
-        finally:
-            # Clean up concat list file if it exists
-            if concat_list_file.exists():
+                    parts = assembler.add_turn(chunk_audio)
+                except AudioDecodeError as e:
+                    logger.warning(f"Skipping undecodable segment {i} ({speaker}): {e}")
+                    continue
+                if on_segment is None:
+                    continue
                 try:
-                    concat_list_file.unlink()
-                except:
-                    pass
+                    duration = assembler.parts_duration(parts)
+                    on_segment(
+                        assembler.turn_count - 1,
+                        assembler.encode_segment(
+                            parts, start_time=assembler.duration - duration
+                        ),
+                        duration,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to publish segment {i} ({speaker}): {e}")
 
-    except Exception as e:
-        logger.error(f"Error concatenating audio segments: {e}")
-        return False
+        synthesize_turn_chunks(
+            [(speaker, chunks) for _, speaker, chunks in turns],
+            speaker_state,
+            higgs_session=higgs_session,
+            language=language,
+            on_turn_complete=_assemble_ready_turns,
+        )
 
+        if not assembler.turn_count:
+            logger.error("No audio segments generated in optimized approach")
+            return None
 
-def _simple_audio_concatenation(segments: list[Path], output_file: Path) -> bool:
-    """
-    Simple fallback concatenation by combining binary data.
+        # Write the final file in one pass (WAV, or MP3/Opus via one encode)
+        audio_format = getattr(settings, "PODCAST_AUDIO_FORMAT", "wav")
+        audio_filename = (
+            f"panel_podcast_optimized_{uuid.uuid4().hex[:8]}.{audio_format}"
+        )
+        final_audio_path = assembler.write(
+            audio_output_dir / audio_filename, audio_format=audio_format
+        )
+        logger.info(
+            f"Assembled {assembler.turn_count} segments "
+            f"({assembler.duration:.1f}s) into {final_audio_path.name}"
+        )
+        return final_audio_path
 
-    Note: This is a basic approach and may not work well with all audio formats.
-    """
-    try:
-        with open(output_file, "wb") as outfile:
-            for segment in segments:
-                with open(segment, "rb") as infile:
-                    outfile.write(infile.read())
-        return True
     except Exception as e:
-        logger.error(f"Simple concatenation failed: {e}")
-        return False
+        logger.error(f"Optimized audio generation failed: {e}")
+        return None
@@ -1,8 +1,9 @@
 import logging
 
-from django.http import StreamingHttpResponse
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from notebooks.models import Notebook
+from notebooks.utils.view_mixins import IMMUTABLE_MAX_AGE, ETagCacheMixin
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -13,6 +14,14 @@ from .serializers import (
     PodcastListSerializer,
     PodcastSerializer,
 )
+from .storage import (
+    AUDIO_CONTENT_TYPES,
+    SEGMENT_CONTENT_TYPE,
+    PodcastStorageService,
+    audio_format_for,
+    delete_job_segments,
+)
+from .streaming import PLAYLIST_CONTENT_TYPE, render_playlist
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +168,8 @@ class PodcastJobDetailView(generics.RetrieveDestroyAPIView):
                         f"Error deleting podcast audio file for job {instance.id}: {e}"
                     )
 
+            delete_job_segments(instance)
+
             previous_status = instance.status
             instance_id = str(instance.id)
             instance.delete()
@@ -237,6 +248,7 @@ class PodcastJobCancelView(APIView):
             job.status = "cancelled"
             job.error_message = "Job cancelled by user"
             job.save(update_fields=["status", "error_message", "updated_at"])
+            delete_job_segments(job)
 
             # Log cancellation with details
             logger.info(
@@ -286,12 +298,14 @@ class PodcastCancelView(PodcastJobCancelView):
         return super().post(request, job_id=podcast_id)
 
 
-class PodcastAudioRedirectView(APIView):
+class PodcastAudioRedirectView(ETagCacheMixin, APIView):
     """Stream podcast audio file through Django (avoids CORS and presigned URL issues).
 
     - GET /api/v1/podcasts/{podcast_id}/audio/
       Streams audio file from MinIO through Django.
       Optional query param: download=1 to trigger download instead of inline playback.
+      Honours Range requests (206) so players can seek without a full download,
+      and answers conditional requests with 304 from object metadata.
     """
 
     permission_classes = [permissions.IsAuthenticated]
@@ -307,50 +321,50 @@ class PodcastAudioRedirectView(APIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            # Stream file from MinIO through Django
-            from notebooks.utils.storage import get_minio_backend
-
-            minio_backend = get_minio_backend()
-
-            file_iter, content_length, content_type = minio_backend.stream_file(
+            etag_value, last_modified, size = self.stat_storage_object(
                 job.audio_object_key
             )
-
-            if not file_iter:
+            if size is None:
                 return Response(
                     {"error": "Audio file not accessible"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            # Determine content disposition based on download parameter
-            if request.GET.get("download"):
+            response = self.not_modified_response(
+                request, etag=etag_value, last_modified=last_modified, max_age=3600
+            )
+            if response is None:
+                # Determine content disposition based on download parameter
                 safe_title = "".join(
                     c
                     for c in (job.title or "podcast")
                     if c.isalnum() or c in (" ", "-", "_")
                 ).rstrip()
+                audio_format = audio_format_for(job.audio_object_key)
                 filename = (
-                    f"{safe_title}.wav" if safe_title else f"podcast-{job.id}.wav"
+                    f"{safe_title}.{audio_format}"
+                    if safe_title
+                    else f"podcast-{job.id}.{audio_format}"
+                )
+                response = self.build_streaming_file_response(
+                    request,
+                    object_key=job.audio_object_key,
+                    size=size,
+                    filename=filename,
+                    content_type=AUDIO_CONTENT_TYPES[audio_format],
+                    etag=etag_value,
+                    last_modified=last_modified,
+                    max_age=3600,
+                    disposition=(
+                        "attachment" if request.GET.get("download") else "inline"
+                    ),
                 )
-                disposition = f'attachment; filename="{filename}"'
-            else:
-                disposition = "inline"
-
-            # Create streaming response
-            response = StreamingHttpResponse(
-                file_iter, content_type=content_type or "audio/wav"
-            )
-            response["Content-Disposition"] = disposition
-
-            if content_length:
-                response["Content-Length"] = content_length
 
             # Add CORS headers for audio playback
             response["Access-Control-Allow-Origin"] = request.META.get(
                 "HTTP_ORIGIN", "*"
             )
             response["Access-Control-Allow-Credentials"] = "true"
-            response["Accept-Ranges"] = "bytes"
 
             return response
 
@@ -362,6 +376,97 @@ class PodcastAudioRedirectView(APIView):
             )
 
 
+def _podcast_segments(job: Podcast) -> list[dict]:
+    """Segments saved on a completed podcast, else those published so far."""
+    segments = (job.file_metadata or {}).get("segments")
+    if segments or job.status != "generating":
+        return segments or []
+    return PodcastStorageService().load_segment_manifest(
+        job.user_id, str(job.id), job.notebook_id
+    )
+
+
+class PodcastPlaylistView(APIView):
+    """HLS playlist of progressively generated podcast segments.
+
+    - GET /api/v1/podcasts/{podcast_id}/playlist.m3u8
+      Lists the segments uploaded so far. While the podcast is generating the
+      playlist has no end tag and must not be cached, so players keep polling;
+      a SEGMENT_READY notebook event is published whenever a segment is added.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, podcast_id):
+        job = get_object_or_404(
+            Podcast.objects.filter(user=request.user), id=podcast_id
+        )
+        segments = _podcast_segments(job)
+        complete = job.status not in ("pending", "generating")
+        if not segments and complete:
+            return Response(
+                {"error": "No streamable segments for this podcast"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        response = HttpResponse(
+            render_playlist(str(job.id), segments, complete=complete),
+            content_type=PLAYLIST_CONTENT_TYPE,
+        )
+        response["Cache-Control"] = (
+            "private, max-age=3600" if complete else "no-cache, must-revalidate"
+        )
+        return response
+
+
+class PodcastSegmentView(ETagCacheMixin, APIView):
+    """Stream one progressively generated podcast segment.
+
+    - GET /api/v1/podcasts/{podcast_id}/segments/{index}/
+      Segments never change once published, so they are cached as immutable.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, podcast_id, index):
+        job = get_object_or_404(
+            Podcast.objects.filter(user=request.user), id=podcast_id
+        )
+        segment = next(
+            (s for s in _podcast_segments(job) if s.get("index") == index), None
+        )
+        if segment is None:
+            return Response(
+                {"error": "Segment not available"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        etag_value, last_modified, size = self.stat_storage_object(
+            segment["object_key"]
+        )
+        if size is None:
+            return Response(
+                {"error": "Segment not accessible"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        cache_control = f"private, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        response = self.not_modified_response(
+            request, etag=etag_value, last_modified=last_modified, max_age=3600
+        )
+        if response is not None:
+            response["Cache-Control"] = cache_control
+            return response
+        return self.build_streaming_file_response(
+            request,
+            object_key=segment["object_key"],
+            size=size,
+            filename=f"podcast-{job.id}-{index:03d}.ts",
+            content_type=SEGMENT_CONTENT_TYPE,
+            etag=etag_value,
+            last_modified=last_modified,
+            cache_control=cache_control,
+        )
+
+
 class PodcastFilesView(APIView):
     """Return stable gateway URLs for podcast files (two-step pattern).
 
@@ -396,8 +501,11 @@ class PodcastFilesView(APIView):
                         for c in (job.title or "podcast")
                         if c.isalnum() or c in (" ", "-", "_")
                     ).rstrip()
+                    audio_format = audio_format_for(job.audio_object_key)
                     filename = (
-                        f"{safe_title}.wav" if safe_title else f"podcast-{job.id}.wav"
+                        f"{safe_title}.{audio_format}"
+                        if safe_title
+                        else f"podcast-{job.id}.{audio_format}"
                     )
 
                 files.append(
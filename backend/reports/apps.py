@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class ReportsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reports"
+
+    def ready(self):
+        """Connect signal handlers that mirror report status into Redis."""
+        try:
+            from . import signals  # noqa: F401  (import for side effects)
+        except Exception as e:
+            import logging
+
+            logging.getLogger(__name__).exception(
+                f"Failed to load reports signal handlers: {e}"
+            )
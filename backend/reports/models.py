@@ -225,6 +225,14 @@ class Report(models.Model):
     processing_logs = models.JSONField(
         default=list, blank=True, help_text="Processing log messages"
     )
+    generation_checkpoints = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Completed generation stages with durations and artifact keys",
+    )
+    generation_attempts = models.PositiveIntegerField(
+        default=0, help_text="Deliveries of the generation task so far"
+    )
 
     # Celery task tracking (optional – used for cancellation of background task)
     celery_task_id = models.CharField(max_length=255, null=True, blank=True)
@@ -368,6 +376,11 @@ class ReportImage(models.Model):
             models.Index(fields=["report", "created_at"]),
             models.Index(fields=["report_figure_minio_object_key"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["report", "figure_id"], name="unique_report_figure"
+            ),
+        ]
 
     def __str__(self):
         return f"Image {self.figure_id} for Report {self.report.article_title}"
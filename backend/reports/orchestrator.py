@@ -118,6 +118,10 @@ class ReportOrchestrator:
         """Clean up old jobs"""
         self.job_service.cleanup_old_jobs(days)
 
+    def reconcile_running_jobs(self, batch_size: int = 200) -> dict[str, int]:
+        """Fail or cancel active jobs whose Celery task has crashed or been revoked"""
+        return self.job_service.reconcile_running_jobs(batch_size)
+
     def cleanup_failed_job(self, report_id: str):
         """Clean up temp directories and resources for a failed job"""
         try:
@@ -0,0 +1,137 @@
+"""
+Checkpoints for the staged report generation pipeline.
+
+``ReportGenerationService.generate_report`` runs as a sequence of stages
+(see ``STAGES``). When a stage finishes, its output is written to MinIO as
+JSON:
+
+    {report prefix}/checkpoints/{stage}.json
+
+and the stage is recorded in ``Report.generation_checkpoints`` together with
+its duration and completion time. If the worker crashes or the task is
+retried, completed stages are loaded from their artifacts instead of being
+run again, so a retry resumes after the last completed stage rather than
+repeating every LLM call. Re-running a stage invalidates the checkpoints of
+the stages after it.
+
+Stage durations are kept on the report (and observed in
+``deepsight_report_stage_duration_seconds``) after the artifacts have been
+discarded, for profiling.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from core.instrumentation import metrics
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("inputs", "generation", "images", "storage")
+
+
+def report_prefix(report) -> str:
+    notebook_part = report.notebooks_id or "standalone"
+    return f"{report.user_id}/notebook/{notebook_part}/report/{report.id}"
+
+
+def checkpoint_key(report, stage: str) -> str:
+    return f"{report_prefix(report)}/checkpoints/{stage}.json"
+
+
+class GenerationCheckpoints:
+    """Run report generation stages, resuming from persisted artifacts."""
+
+    def __init__(self, report, backend=None):
+        self.report = report
+        self._backend = backend
+        if self.report.generation_checkpoints is None:
+            self.report.generation_checkpoints = {}
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            from notebooks.utils.storage import get_minio_backend
+
+            self._backend = get_minio_backend()
+        return self._backend
+
+    @property
+    def durations(self) -> dict[str, float]:
+        return {
+            stage: entry["duration"]
+            for stage, entry in self.report.generation_checkpoints.items()
+            if "duration" in entry
+        }
+
+    def completed(self, stage: str) -> bool:
+        return stage in self.report.generation_checkpoints
+
+    def load(self, stage: str) -> dict[str, Any] | None:
+        """Return a completed stage's artifact, or None if it is unavailable."""
+        if not self.completed(stage):
+            return None
+        try:
+            data = self.backend.get_file(checkpoint_key(self.report, stage))
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.warning(
+                f"Could not load {stage} checkpoint for report {self.report.id}: {e}"
+            )
+            return None
+
+    def run(self, stage: str, func: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return the stage's checkpointed artifact, or run it and checkpoint it."""
+        artifact = self.load(stage)
+        if artifact is not None:
+            logger.info(f"Resuming report {self.report.id} after {stage} stage")
+            metrics.inc("deepsight_report_stage_resumed_total", stage=stage)
+            return artifact
+
+        self._invalidate_from(stage)
+        start = time.perf_counter()
+        artifact = func()
+        duration = time.perf_counter() - start
+        metrics.observe(
+            "deepsight_report_stage_duration_seconds", duration, stage=stage
+        )
+        logger.info(
+            f"Report {self.report.id} {stage} stage completed in {duration:.2f}s"
+        )
+        self.save(stage, artifact, duration)
+        return artifact
+
+    def save(self, stage: str, artifact: dict[str, Any], duration: float) -> None:
+        """Persist a stage's artifact and mark it completed on the report."""
+        key = checkpoint_key(self.report, stage)
+        payload = json.dumps(artifact, cls=DjangoJSONEncoder).encode("utf-8")
+        if not self.backend.store_file(key, payload, content_type="application/json"):
+            # Without its artifact the stage cannot be resumed; keep going
+            logger.warning(f"Could not store {stage} checkpoint for {self.report.id}")
+            return
+
+        self.report.generation_checkpoints[stage] = {
+            "duration": round(duration, 3),
+            "completed_at": timezone.now().isoformat(),
+            "artifact_key": key,
+        }
+        self.report.save(update_fields=["generation_checkpoints", "updated_at"])
+
+    def _invalidate_from(self, stage: str) -> None:
+        later = STAGES[STAGES.index(stage) :]
+        stale = [s for s in later if s in self.report.generation_checkpoints]
+        for s in stale:
+            del self.report.generation_checkpoints[s]
+        if stale:
+            self.report.save(update_fields=["generation_checkpoints", "updated_at"])
+
+    def discard_artifacts(self) -> None:
+        """Delete stored artifacts once the report is complete (durations stay)."""
+        self.backend.delete_folder(f"{report_prefix(self.report)}/checkpoints/")
+        for entry in self.report.generation_checkpoints.values():
+            entry.pop("artifact_key", None)
+        self.report.save(update_fields=["generation_checkpoints", "updated_at"])
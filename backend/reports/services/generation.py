@@ -10,6 +10,7 @@ from typing import Any
 
 from ..models import Report
 from ..storage import StorageFactory
+from .checkpoints import GenerationCheckpoints, report_prefix
 from .config import (
     get_free_retrievers,
     get_model_provider_config,
@@ -32,6 +33,13 @@ class ReportGenerationService:
         self._temp_dirs = []
 
     def generate_report(self, report_id: int) -> dict[str, Any]:
+        """
+        Run the checkpointed generation pipeline for a report.
+
+        Stages (see ``checkpoints.STAGES``) whose artifacts survive from an
+        earlier, interrupted attempt are loaded instead of being run again.
+        """
+        report = None
         try:
             try:
                 report = Report.objects.get(id=report_id)
@@ -41,71 +49,127 @@ class ReportGenerationService:
                 raise Exception(error_msg)
 
             logger.info(f"Starting report generation for report {report_id}")
+            checkpoints = GenerationCheckpoints(report)
 
-            if report.include_image:
-                try:
-                    from .job import JobService
-
-                    job_service = JobService()
-                    if not job_service.prepare_report_images(report):
-                        logger.warning(
-                            f"Failed to prepare ReportImage records for report {report_id}, continuing anyway"
-                        )
-                except Exception as e:
+            inputs = checkpoints.run("inputs", lambda: self._process_inputs(report))
+            generation = checkpoints.run(
+                "generation", lambda: self._run_generation(report, inputs)
+            )
+            images = checkpoints.run(
+                "images",
+                lambda: self._insert_images(report, generation["report_content"]),
+            )
+            storage = checkpoints.run(
+                "storage",
+                lambda: self._store_outputs(
+                    report, generation["generated_files"], images["report_content"]
+                ),
+            )
+
+            final_result = {
+                "success": True,
+                "report_id": report.id,
+                "article_title": generation.get("article_title")
+                or report.article_title,
+                "output_directory": generation.get("output_directory", ""),
+                "generated_files": storage["generated_files"],
+                "main_report_file": storage["main_report_file"],
+                "processing_logs": generation.get("processing_logs", []),
+                "report_content": images["report_content"],
+                "created_at": generation.get("created_at", ""),
+                "generated_topic": generation.get("generated_topic", ""),
+                "files_stored": True,
+                "images_inserted": True,
+                "stage_durations": checkpoints.durations,
+            }
+
+            logger.info(
+                f"Report generation completed successfully for report {report_id} "
+                f"(stage durations: {checkpoints.durations})"
+            )
+            return final_result
+        except Exception as e:
+            logger.error(f"Error in report generation for report {report_id}: {e}")
+            try:
+                self.cancel_generation(str(report_id) if report else "unknown")
+            except Exception as cleanup_error:
+                logger.warning(
+                    f"Failed to cleanup temp directories after error: {cleanup_error}"
+                )
+            raise
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    def _process_inputs(self, report: Report) -> dict[str, Any]:
+        """Stage 1: prepare images, consolidate source content, parse requirements."""
+        if report.include_image:
+            try:
+                from .job import JobService
+
+                job_service = JobService()
+                if not job_service.prepare_report_images(report):
                     logger.warning(
-                        f"Image preparation error for report {report_id}: {e}"
+                        f"Failed to prepare ReportImage records for report {report.id}, continuing anyway"
                     )
+            except Exception as e:
+                logger.warning(f"Image preparation error for report {report.id}: {e}")
 
-            output_dir = self.file_storage.create_output_directory(
-                user_id=report.user.pk,
-                report_id=str(report.id),
-                notebook_id=report.notebooks.pk if report.notebooks else None,
+        content_data = {}
+        if report.source_ids:
+            processed_data = self.input_processor.process_selected_files(
+                report.source_ids, user_id=report.user.pk
             )
-            logger.info(f"Output directory for report {report_id}: {output_dir}")
+            content_data = self.input_processor.get_content_data(processed_data)
+
+            if report.include_image:
+                from .image import ImageService
+
+                selected_file_ids = content_data.get("selected_file_ids", [])
+                if selected_file_ids:
+                    image_service = ImageService()
+                    image_service.create_combined_figure_data(report, selected_file_ids)
+
+        figure_data = []
+        if report.include_image and hasattr(report, "_cached_figure_data"):
+            figure_data = report._cached_figure_data
+
+        # Parse custom requirements if provided
+        if report.custom_requirements and not report.parsed_requirements:
+            try:
+                from .requirements_parser import RequirementsParser
+
+                parser = RequirementsParser(model_provider=report.model_provider)
+                parsed = parser.parse(report.custom_requirements)
 
-            content_data = {}
-            if report.source_ids:
-                processed_data = self.input_processor.process_selected_files(
-                    report.source_ids, user_id=report.user.pk
+                if parsed:
+                    report.parsed_requirements = parsed
+                    report.save(update_fields=["parsed_requirements"])
+                    logger.info(f"Parsed custom requirements for report {report.id}")
+
+            except Exception as e:
+                logger.warning(
+                    f"Failed to parse custom requirements: {e}. Continuing without parsing."
                 )
-                content_data = self.input_processor.get_content_data(processed_data)
-
-                if report.include_image:
-                    from .image import ImageService
-
-                    selected_file_ids = content_data.get("selected_file_ids", [])
-                    if selected_file_ids:
-                        image_service = ImageService()
-                        image_service.create_combined_figure_data(
-                            report, selected_file_ids
-                        )
-
-            figure_data = []
-            if report.include_image and hasattr(report, "_cached_figure_data"):
-                figure_data = report._cached_figure_data
-
-            # Parse custom requirements if provided
-            if report.custom_requirements and not report.parsed_requirements:
-                try:
-                    from .requirements_parser import RequirementsParser
-
-                    parser = RequirementsParser(model_provider=report.model_provider)
-                    parsed = parser.parse(report.custom_requirements)
-
-                    if parsed:
-                        report.parsed_requirements = parsed
-                        report.save(update_fields=["parsed_requirements"])
-                        logger.info(
-                            f"Parsed custom requirements for report {report_id}"
-                        )
-                        # Reload the report object to get the updated parsed_requirements
-                        report.refresh_from_db()
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to parse custom requirements: {e}. Continuing without parsing."
-                    )
 
+        return {"content_data": content_data, "figure_data": figure_data}
+
+    def _run_generation(self, report: Report, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Stage 2: research and writing.
+
+        Both happen inside the single generator call; its files are uploaded
+        to MinIO before the checkpoint so they outlive the temp directory.
+        """
+        output_dir = self.file_storage.create_output_directory(
+            user_id=report.user.pk,
+            report_id=str(report.id),
+            notebook_id=report.notebooks.pk if report.notebooks else None,
+        )
+        logger.info(f"Output directory for report {report.id}: {output_dir}")
+
+        try:
             config_dict = report.get_configuration_dict()
             config_dict.update(
                 {
@@ -113,9 +177,9 @@ class ReportGenerationService:
                     "old_outline": report.old_outline,
                     "report_id": str(report.id),
                     "user_id": str(report.user.pk),
-                    "figure_data": figure_data,
+                    "figure_data": inputs.get("figure_data", []),
                     "parsed_requirements": report.parsed_requirements,  # Ensure parsed requirements are included
-                    **content_data,
+                    **inputs.get("content_data", {}),
                 }
             )
 
@@ -127,36 +191,61 @@ class ReportGenerationService:
                 error_msg = result.get("error_message", "Report generation failed")
                 raise Exception(error_msg)
 
-            generated_files = result.get("generated_files", [])
-            stored_files = generated_files
-            main_report_file = self.file_storage.get_main_report_file(stored_files)
+            generated_files = self.file_storage.store_generated_files(
+                result.get("generated_files", []),
+                report.user.pk,
+                str(report.id),
+                report.notebooks.pk if report.notebooks else None,
+            )
+        finally:
+            self._cleanup_temp_directory(str(output_dir))
 
-            final_result = {
-                "success": True,
-                "report_id": report.id,
-                "article_title": result.get("article_title", report.article_title),
-                "output_directory": str(output_dir),
-                "generated_files": stored_files,
-                "main_report_file": main_report_file,
-                "processing_logs": result.get("processing_logs", []),
-                "report_content": result.get("report_content", ""),
-                "created_at": result.get("created_at", ""),
-                "generated_topic": result.get("generated_topic", ""),
-            }
+        return {
+            "article_title": result.get("article_title", report.article_title),
+            "output_directory": str(output_dir),
+            "generated_files": generated_files,
+            "processing_logs": result.get("processing_logs", []),
+            "report_content": result.get("report_content", ""),
+            "created_at": result.get("created_at", ""),
+            "generated_topic": result.get("generated_topic", ""),
+        }
 
-            logger.info(
-                f"Report generation completed successfully for report {report_id}"
-            )
-            return final_result
-        except Exception as e:
-            logger.error(f"Error in report generation for report {report_id}: {e}")
+    def _insert_images(self, report: Report, content: str) -> dict[str, Any]:
+        """Stage 3: replace figure placeholders with the report's images."""
+        if content and report.include_image:
             try:
-                self.cancel_generation(str(report_id) if report else "unknown")
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to cleanup temp directories after error: {cleanup_error}"
-                )
-            raise
+                from ..models import ReportImage
+                from .image import ImageService
+
+                report_images = list(ReportImage.objects.filter(report=report))
+                if report_images:
+                    content = ImageService().insert_figure_images(
+                        content, report_images, report.id
+                    )
+                    logger.info(
+                        f"Inserted {len(report_images)} images into report {report.id}"
+                    )
+            except Exception as e:
+                logger.error(f"Error inserting images into report {report.id}: {e}")
+
+        return {"report_content": content}
+
+    def _store_outputs(
+        self, report: Report, generated_files: list[str], content: str
+    ) -> dict[str, Any]:
+        """Stage 4: make sure the main report is in MinIO and identify it."""
+        object_keys = list(generated_files)
+        if not object_keys and content:
+            object_key = f"{report_prefix(report)}/report_{report.id}.md"
+            if self.file_storage.minio_backend.store_file(
+                object_key, content.encode("utf-8"), content_type="text/markdown"
+            ):
+                object_keys.append(object_key)
+
+        return {
+            "generated_files": object_keys,
+            "main_report_file": self.file_storage.get_main_report_file(object_keys),
+        }
 
     def validate_configuration(self, config: dict[str, Any]) -> bool:
         """Validate report generation configuration."""
@@ -5,7 +5,9 @@ Implements image handling by consolidating logic used for report images.
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+from django.conf import settings
 from django.db import transaction
 from notebooks.models import KnowledgeBaseImage
 from notebooks.utils.storage import get_minio_backend
@@ -46,60 +48,98 @@ class ImageService:
             knowledge_base_item__notebook__user_id=user_id,
         ).select_related("knowledge_base_item__notebook__user")
 
-        logger.info(f"Found {images.count()} images for {len(figure_ids)} figure IDs")
-        return list(images)
+        images = list(images)
+        logger.info(f"Found {len(images)} images for {len(figure_ids)} figure IDs")
+        return images
 
     def copy_images_to_report(
         self, report: Report, kb_images: list[KnowledgeBaseImage]
     ) -> list[ReportImage]:
-        """Copy selected images from knowledge base to report folder and create ReportImage records."""
+        """Copy selected images from knowledge base to report folder and create ReportImage records.
+
+        Figures already attached to the report are found with one query and
+        not copied again. The remaining objects are copied server-side in
+        parallel (REPORT_IMAGE_COPY_WORKERS) and their rows are created with a
+        single bulk insert.
+        """
         if not kb_images:
             logger.info("No images to copy")
             return []
 
-        report_images: list[ReportImage] = []
-
         notebook_part = report.notebooks.id if report.notebooks else "standalone"
         report_image_folder = (
             f"{report.user.id}/notebook/{notebook_part}/report/{report.id}/images"
         )
 
-        with transaction.atomic():
-            for kb_image in kb_images:
-                try:
-                    source_key = kb_image.minio_object_key
-                    file_extension = os.path.splitext(source_key)[1] or ".jpg"
-                    dest_key = (
-                        f"{report_image_folder}/{kb_image.figure_id}{file_extension}"
-                    )
+        # One image per figure, in the given order
+        kb_by_figure = {}
+        for kb_image in kb_images:
+            kb_by_figure.setdefault(kb_image.figure_id, kb_image)
+        figure_ids = list(kb_by_figure)
 
-                    success = self._get_minio_backend().copy_file(source_key, dest_key)
-                    if not success:
-                        logger.error(f"Failed to copy image {source_key} to {dest_key}")
-                        continue
+        existing = set(
+            ReportImage.objects.filter(
+                report=report, figure_id__in=figure_ids
+            ).values_list("figure_id", flat=True)
+        )
 
-                    report_image, created = ReportImage.objects.get_or_create(
+        copies = []
+        for figure_id, kb_image in kb_by_figure.items():
+            if figure_id in existing:
+                continue
+            source_key = kb_image.minio_object_key
+            file_extension = os.path.splitext(source_key)[1] or ".jpg"
+            dest_key = f"{report_image_folder}/{figure_id}{file_extension}"
+            copies.append((kb_image, source_key, dest_key))
+
+        new_images = []
+        if copies:
+            backend = self._get_minio_backend()
+
+            def _copy(copy):
+                _, source_key, dest_key = copy
+                try:
+                    return backend.copy_file(source_key, dest_key)
+                except Exception as e:
+                    logger.error(f"Error copying image {source_key}: {e}")
+                    return False
+
+            workers = getattr(settings, "REPORT_IMAGE_COPY_WORKERS", 8)
+            with ThreadPoolExecutor(max_workers=min(workers, len(copies))) as pool:
+                results = list(pool.map(_copy, copies))
+
+            for (kb_image, source_key, dest_key), success in zip(
+                copies, results, strict=True
+            ):
+                if not success:
+                    logger.error(f"Failed to copy image {source_key} to {dest_key}")
+                    continue
+                new_images.append(
+                    ReportImage(
                         figure_id=kb_image.figure_id,
                         report=report,
-                        defaults={
-                            "image_caption": kb_image.image_caption,
-                            "report_figure_minio_object_key": dest_key,
-                            "image_metadata": kb_image.image_metadata,
-                            "content_type": kb_image.content_type,
-                            "file_size": kb_image.file_size,
-                        },
+                        image_caption=kb_image.image_caption,
+                        report_figure_minio_object_key=dest_key,
+                        image_metadata=kb_image.image_metadata,
+                        content_type=kb_image.content_type,
+                        file_size=kb_image.file_size,
                     )
+                )
 
-                    report_images.append(report_image)
-                    logger.debug(
-                        f"{'Created' if created else 'Found existing'} ReportImage for figure_id: {kb_image.figure_id}"
-                    )
-                except Exception as e:
-                    logger.error(f"Error copying image {kb_image.figure_id}: {e}")
-                    continue
+        with transaction.atomic():
+            # A concurrent run may have attached the same figure meanwhile
+            ReportImage.objects.bulk_create(new_images, ignore_conflicts=True)
+            rows = {
+                image.figure_id: image
+                for image in ReportImage.objects.filter(
+                    report=report, figure_id__in=figure_ids
+                )
+            }
 
+        report_images = [rows[fid] for fid in figure_ids if fid in rows]
         logger.info(
-            f"Successfully copied {len(report_images)} images to report {report.id}"
+            f"Successfully copied {len(new_images)} images to report {report.id} "
+            f"({len(existing)} already present)"
         )
         return report_images
 
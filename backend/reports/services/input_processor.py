@@ -21,72 +21,73 @@ class KnowledgeBaseInputProcessor:
     def process_selected_files(
         self, file_paths: list[str], user_id: int = None
     ) -> dict[str, Any]:
-        """Process selected files from knowledge base and extract content"""
+        """Process selected files from knowledge base and extract content.
+
+        All selected items are fetched together, with each item's content cut
+        to its share of REPORT_INPUT_TOKEN_BUDGET in the database.
+        """
         input_data = {"text_files": [], "selected_file_ids": []}
 
         try:
-            from notebooks.models import KnowledgeBaseItem
+            from django.conf import settings
+            from notebooks.services.input_assembly import KnowledgeInputAssembler
 
+            file_ids = []
             for file_id in file_paths:
-                try:
-                    if isinstance(file_id, str):
-                        try:
-                            uuid.UUID(file_id)
-                        except ValueError:
-                            logger.warning(f"Invalid UUID file ID: {file_id}")
-                            continue
-                    elif hasattr(file_id, "hex"):
-                        file_id = str(file_id)
-                    else:
-                        logger.warning(
-                            f"Unsupported file ID type: {type(file_id)} for {file_id}"
-                        )
+                if isinstance(file_id, str):
+                    try:
+                        uuid.UUID(file_id)
+                    except ValueError:
+                        logger.warning(f"Invalid UUID file ID: {file_id}")
                         continue
+                elif hasattr(file_id, "hex"):
+                    file_id = str(file_id)
+                else:
+                    logger.warning(
+                        f"Unsupported file ID type: {type(file_id)} for {file_id}"
+                    )
+                    continue
+                file_ids.append(file_id)
+                input_data["selected_file_ids"].append(f"f_{file_id}")
 
-                    input_data["selected_file_ids"].append(f"f_{file_id}")
+            if user_id is None:
+                # Ownership cannot be checked, so no content is loaded
+                logger.warning("No user given; skipping knowledge base content")
+                return input_data
 
-                    kb_item = KnowledgeBaseItem.objects.select_related("notebook").get(
-                        id=file_id, notebook__user_id=user_id
-                    )
-                    content = (
-                        kb_item.content
-                        if kb_item.content and kb_item.content.strip()
-                        else None
+            assembler = KnowledgeInputAssembler(
+                token_budget=getattr(settings, "REPORT_INPUT_TOKEN_BUDGET", 200_000)
+            )
+            loaded = set()
+            for item in assembler.iter_items(file_ids, user_id=user_id):
+                loaded.add(item.id)
+                raw_extension = None
+                raw_mime = None
+                if item.original_file_object_key:
+                    original_filename = (
+                        item.metadata.get("original_filename") or item.title
                     )
-
-                    if content:
-                        filename = kb_item.title or f"file_{file_id}"
-                        content_type = getattr(kb_item, "content_type", "unknown")
-                        raw_extension = None
-                        raw_mime = None
-                        if kb_item.original_file_object_key:
-                            original_filename = (kb_item.metadata or {}).get(
-                                "original_filename"
-                            ) or kb_item.title
-                            raw_extension = os.path.splitext(original_filename)[
-                                1
-                            ].lower()
-                            raw_mime, _ = mimetypes.guess_type(original_filename)
-                        file_data = {
-                            "content": content,
-                            "filename": filename,
-                            "file_path": f"kb_item_{file_id}",
-                            "content_type": content_type,
-                            "raw_extension": raw_extension,
-                            "raw_mime": raw_mime,
-                            "metadata": kb_item.metadata or {},
-                        }
-                        input_data["text_files"].append(file_data)
-                        logger.info(f"Loaded text file: {filename} (ID: {file_id})")
-                    else:
-                        logger.warning(f"No content found for file ID: {file_id}")
-
-                except KnowledgeBaseItem.DoesNotExist:
-                    logger.warning(f"Knowledge base item not found for ID: {file_id}")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Failed to process file ID {file_id}: {e}")
-                    continue
+                    raw_extension = os.path.splitext(original_filename)[1].lower()
+                    raw_mime, _ = mimetypes.guess_type(original_filename)
+                input_data["text_files"].append(
+                    {
+                        "content": item.content,
+                        "filename": item.title,
+                        "file_path": f"kb_item_{item.id}",
+                        "content_type": item.content_type,
+                        "raw_extension": raw_extension,
+                        "raw_mime": raw_mime,
+                        "metadata": item.metadata,
+                    }
+                )
+                logger.info(
+                    f"Loaded text file: {item.title} (ID: {item.id}"
+                    f"{', truncated' if item.truncated else ''})"
+                )
+
+            for file_id in file_ids:
+                if str(uuid.UUID(str(file_id))) not in loaded:
+                    logger.warning(f"No content found for file ID: {file_id}")
 
             logger.info(
                 f"Processed input data: {len(input_data['text_files'])} text files, "
@@ -4,6 +4,7 @@ Job management service following SOLID principles.
 
 import logging
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -12,10 +13,28 @@ from django.conf import settings
 from django.core.cache import cache
 
 from ..models import Report
+from .status_store import report_status_store
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CeleryTaskState:
+    """Task state fetched in bulk; quacks like the AsyncResult fields used here."""
+
+    state: str
+    info: Any = None
+    traceback: str | None = None
+
+    @classmethod
+    def from_meta(cls, meta: dict[str, Any]) -> "CeleryTaskState":
+        return cls(
+            state=meta.get("status", "PENDING"),
+            info=meta.get("result"),
+            traceback=meta.get("traceback"),
+        )
+
+
 class CriticalErrorDetector:
     """Detects critical error patterns that should cause task failure"""
 
@@ -151,38 +170,41 @@ class JobService:
             raise
 
     def get_job_status(self, report_id: str) -> dict[str, Any] | None:
-        """Get the status of a report generation job"""
+        """
+        Get the status of a report generation job.
+
+        Served from the Redis status snapshot while the job is in flight;
+        completed jobs (whose results live on the model) and snapshot misses
+        read the database. Celery is never queried here: crashed or revoked
+        tasks are detected by ``reconcile_running_jobs``.
+        """
         try:
-            # First try to get from Django model
+            snapshot = report_status_store.get(report_id)
+            if snapshot and snapshot.get("status") != Report.STATUS_COMPLETED:
+                return {
+                    "report_id": snapshot["report_id"],
+                    "user_id": snapshot["user_id"],
+                    "status": snapshot["status"],
+                    "created_at": snapshot["created_at"],
+                    "updated_at": snapshot["updated_at"],
+                    "error": snapshot.get("error") or None,
+                }
+
             try:
                 report = Report.objects.get(id=report_id)
+            except Report.DoesNotExist:
+                report = None
 
-                # Always try to synchronise the database status with the underlying Celery task
-                # so that errors such as `FAILURE`, `REVOKED`, or worker crashes are surfaced to
-                # API consumers immediately instead of waiting for the periodic 30-minute
-                # stale-check in `_check_worker_crash`.
-                self._sync_report_status_with_celery_state(report)
-
-                # Check for worker crashes if job is running
-                if report.status == Report.STATUS_RUNNING:
-                    crash_info = self._check_worker_crash(report)
-                    if crash_info["crashed"]:
-                        # Update report status to failed with actual error message
-                        error_msg = crash_info.get(
-                            "error_message",
-                            "Celery worker crashed (SIGSEGV or similar fatal error)",
-                        )
-                        report.update_status(Report.STATUS_FAILED, error=error_msg)
-                        logger.error(
-                            f"Detected worker crash for report {report_id}: {error_msg}"
-                        )
+            if report is not None:
+                if snapshot is None:
+                    report_status_store.record(report)
 
                 job_data = {
                     "report_id": str(
                         report.id
                     ),  # Convert UUID to string for JSON serialization
                     "user_id": str(
-                        report.user.pk
+                        report.user_id
                     ),  # Convert UUID to string for JSON serialization
                     "status": report.status,
                     "created_at": report.created_at.isoformat(),
@@ -193,8 +215,6 @@ class JobService:
                 if result:
                     job_data.update(result)
                 return job_data
-            except Report.DoesNotExist:
-                pass
 
             # Fallback to cache
             cache_key = f"report_job:{report_id}"
@@ -205,6 +225,99 @@ class JobService:
             logger.error(f"Error getting job status for {report_id}: {e}")
             return None
 
+    def reconcile_running_jobs(self, batch_size: int = 200) -> dict[str, int]:
+        """
+        Fail or cancel active jobs whose Celery task has died.
+
+        Scans pending/running reports in batches and fetches their task
+        states with one result-backend round-trip per batch, applying the
+        same rules status polls used to apply one report at a time.
+        """
+        counts = {"checked": 0, "failed": 0, "cancelled": 0}
+        active = (
+            Report.objects.filter(
+                status__in=[Report.STATUS_PENDING, Report.STATUS_RUNNING]
+            )
+            .exclude(celery_task_id__isnull=True, status=Report.STATUS_PENDING)
+            .order_by("created_at")
+        )
+
+        batch: list[Report] = []
+        for report in active.iterator(chunk_size=batch_size):
+            batch.append(report)
+            if len(batch) >= batch_size:
+                self._reconcile_batch(batch, counts)
+                batch = []
+        if batch:
+            self._reconcile_batch(batch, counts)
+
+        if counts["failed"] or counts["cancelled"]:
+            logger.info(
+                f"Reconciled {counts['checked']} active report jobs: "
+                f"{counts['failed']} failed, {counts['cancelled']} cancelled"
+            )
+        return counts
+
+    def _reconcile_batch(self, reports: list[Report], counts: dict[str, int]) -> None:
+        task_states = self._celery_task_states(
+            [report.celery_task_id for report in reports if report.celery_task_id]
+        )
+        for report in reports:
+            counts["checked"] += 1
+            task_state = task_states.get(report.celery_task_id)
+            try:
+                self._sync_report_status_with_celery_state(report, task_state)
+                if report.status == Report.STATUS_RUNNING:
+                    crash_info = self._check_worker_crash(report, task_state)
+                    if crash_info["crashed"]:
+                        error_msg = crash_info.get(
+                            "error_message",
+                            "Celery worker crashed (SIGSEGV or similar fatal error)",
+                        )
+                        report.update_status(Report.STATUS_FAILED, error=error_msg)
+                        self.discard_checkpoints(report)
+                        logger.error(
+                            f"Detected worker crash for report {report.id}: {error_msg}"
+                        )
+            except Exception as e:
+                logger.error(f"Error reconciling report {report.id}: {e}")
+                continue
+
+            if report.status == Report.STATUS_FAILED:
+                counts["failed"] += 1
+            elif report.status == Report.STATUS_CANCELLED:
+                counts["cancelled"] += 1
+
+    def _celery_task_states(self, task_ids: list[str]) -> dict[str, CeleryTaskState]:
+        """Fetch task states, batched into one MGET on key-value result backends."""
+        if not task_ids:
+            return {}
+
+        from backend.celery import app as celery_app
+
+        backend = celery_app.backend
+        if hasattr(backend, "mget") and hasattr(backend, "get_key_for_task"):
+            try:
+                values = backend.mget(
+                    [backend.get_key_for_task(task_id) for task_id in task_ids]
+                )
+                states = {}
+                for task_id, value in zip(task_ids, values, strict=False):
+                    meta = (
+                        backend.decode_result(value)
+                        if value
+                        else {"status": "PENDING", "result": None}
+                    )
+                    states[task_id] = CeleryTaskState.from_meta(meta)
+                return states
+            except Exception as e:
+                logger.warning(f"Batched Celery state lookup failed: {e}")
+
+        return {
+            task_id: CeleryTaskState.from_meta(backend.get_task_meta(task_id))
+            for task_id in task_ids
+        }
+
     def update_job_progress(
         self, report_id: str, progress: str, status: str | None = None
     ):
@@ -272,9 +385,10 @@ class JobService:
                 # Use the processed content from the report generator
                 content = result["report_content"]
 
-                # Update image URLs in content if include_image is enabled
+                # Update image URLs in content if include_image is enabled (unless the
+                # generation pipeline's images stage already did)
                 # Note: ReportImage records should already exist from prepare_report_images
-                if report.include_image:
+                if report.include_image and not result.get("images_inserted"):
                     try:
                         from ..services.image import ImageService
 
@@ -307,8 +421,9 @@ class JobService:
             # Handle file storage - upload generated files to MinIO if using MinIO storage
             generated_files = result.get("generated_files", [])
 
-            # Upload files to MinIO if there are generated files
-            if generated_files:
+            # Upload files to MinIO if there are generated files (the generation
+            # pipeline's storage stage returns MinIO keys that are already stored)
+            if generated_files and not result.get("files_stored"):
                 try:
                     from ..storage import StorageFactory
 
@@ -508,6 +623,10 @@ class JobService:
             # Update status after saving content and metadata
             report.update_status(status)
 
+            # Intermediate stage artifacts are no longer needed for resuming
+            if status == Report.STATUS_COMPLETED:
+                self.discard_checkpoints(report)
+
             # Update cache
             cache_key = f"report_job:{report_id}"
             job_data = cache.get(cache_key, {})
@@ -531,6 +650,20 @@ class JobService:
         except Exception as e:
             logger.error(f"Error updating job result for {report_id}: {e}")
 
+    @staticmethod
+    def discard_checkpoints(report: Report) -> None:
+        """Delete a finished report's stage artifacts; it will not be resumed."""
+        if not report.generation_checkpoints:
+            return
+        try:
+            from .checkpoints import GenerationCheckpoints
+
+            GenerationCheckpoints(report).discard_artifacts()
+        except Exception as e:
+            logger.warning(
+                f"Failed to discard generation checkpoints for {report.id}: {e}"
+            )
+
     def update_job_error(self, report_id: str, error: str):
         """Update job with error information"""
         try:
@@ -543,6 +676,7 @@ class JobService:
             self._cleanup_report_images_on_failure(report)
 
             report.update_status(Report.STATUS_FAILED, error=error)
+            self.discard_checkpoints(report)
 
             # Also terminate the celery task if it's still running
             if report.celery_task_id:
@@ -824,9 +958,11 @@ class JobService:
                         "progress": report.progress,
                         "created_at": report.created_at.isoformat(),
                         "updated_at": report.updated_at.isoformat(),
-                        "result": self._format_result(report)
-                        if report.status == Report.STATUS_COMPLETED
-                        else None,
+                        "result": (
+                            self._format_result(report)
+                            if report.status == Report.STATUS_COMPLETED
+                            else None
+                        ),
                         "error": report.error_message or None,
                     }
                 )
@@ -893,7 +1029,9 @@ class JobService:
 
         return result if result else None
 
-    def _check_worker_crash(self, report: Report) -> dict[str, Any]:
+    def _check_worker_crash(
+        self, report: Report, task_state: CeleryTaskState | None = None
+    ) -> dict[str, Any]:
         """Check if a Celery worker has crashed for a running job"""
         try:
             # Check if job has been running for too long without updates
@@ -907,7 +1045,9 @@ class JobService:
 
                     # If we have a celery_task_id, check the actual task state
                     if report.celery_task_id:
-                        return self._check_celery_task_state(report.celery_task_id)
+                        return self._check_celery_task_state(
+                            report.celery_task_id, task_state
+                        )
                     else:
                         # No celery_task_id, assume crashed if stale for too long
                         return {
@@ -922,10 +1062,12 @@ class JobService:
             logger.error(f"Error checking worker crash for job {report.id}: {e}")
             return {"crashed": False}
 
-    def _check_celery_task_state(self, celery_task_id: str) -> dict[str, Any]:
+    def _check_celery_task_state(
+        self, celery_task_id: str, task_state: CeleryTaskState | None = None
+    ) -> dict[str, Any]:
         """Check if a Celery task has failed or is in an unknown state"""
         try:
-            task_result = AsyncResult(celery_task_id)
+            task_result = task_state or AsyncResult(celery_task_id)
 
             # Check task state
             if task_result.state == "FAILURE":
@@ -986,21 +1128,23 @@ class JobService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _sync_report_status_with_celery_state(self, report: "Report") -> None:
+    def _sync_report_status_with_celery_state(
+        self, report: "Report", task_state: CeleryTaskState | None = None
+    ) -> None:
         """Synchronise the Report object's status/progress with the actual Celery task state.
 
         This method checks the task state unconditionally (if ``report.celery_task_id`` is set)
         and updates the report (and the associated cache entry) if the task has **already**
-        failed or been revoked.  By doing this check every time a client polls the
-        ``/report-jobs/{report_id}`` endpoint we can surface errors as soon as they happen instead
-        of waiting for the 30-minute stale check performed by ``_check_worker_crash``.
+        failed or been revoked. ``reconcile_running_jobs`` runs it periodically for every
+        active job with a pre-fetched ``task_state``, so errors surface within one
+        reconcile interval instead of waiting for the stale check in ``_check_worker_crash``.
         """
 
         if not report.celery_task_id:
             return  # Nothing to synchronise
 
         try:
-            task_result = AsyncResult(report.celery_task_id)
+            task_result = task_state or AsyncResult(report.celery_task_id)
 
             # Map Celery states to our Report status constants where appropriate
             if task_result.state == "FAILURE":
@@ -8,16 +8,25 @@ It converts remote images to base64 data URLs which work reliably with PDF conve
 Features:
 - Converts Markdown to PDF with embedded remote images
 - Converts remote images to base64 data URLs for reliable embedding
+- Reads images from our own MinIO bucket directly, fetches others concurrently
 - No temporary files or external dependencies required
 - Professional PDF styling with CSS
 """
 
 import base64
 import logging
+import mimetypes
+import posixpath
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote, urlsplit
 
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 try:
     from markdown_pdf import MarkdownPdf, Section
@@ -27,6 +36,76 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# <img ... src="..." ...> and Markdown ![alt](src "title"), matched in one pass
+IMAGE_REF_PATTERN = re.compile(
+    r"(?P<html><img(?P<before>[^>]*?)src=[\"'](?P<html_src>[^\"']+)[\"']"
+    r"(?P<after>[^>]*?)>)"
+    r"|(?P<md>!\[(?P<alt>[^\]]*)\]"
+    r"\((?P<md_src>[^)\s]+)(?P<title>\s+\"[^\"]*\")?\))"
+)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _http_session() -> requests.Session:
+    """Process-wide pooled session for fetching remote report images."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                workers = getattr(settings, "PDF_IMAGE_FETCH_WORKERS", 8)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+class DataURICache:
+    """Byte-bounded LRU of image data URIs, shared across PDF exports."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: str) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+image_data_uri_cache = DataURICache(
+    getattr(settings, "PDF_IMAGE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+)
+
+
+def _data_uri(data: bytes, content_type: str) -> str:
+    return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
 
 class PdfService:
     """Service for converting markdown reports to PDF with automatic image handling"""
@@ -38,50 +117,141 @@ class PdfService:
                 "Please install it using: pip install markdown-pdf"
             )
 
-    def _convert_remote_images_to_base64(self, content: str) -> str:
+    # ==========================================================================
+    # IMAGE EMBEDDING
+    # ==========================================================================
+
+    def _minio_object_key(self, src: str) -> str | None:
+        """Object key of a (presigned) URL pointing at our own MinIO bucket."""
+        parts = urlsplit(src)
+        hosts = set()
+        for endpoint in (
+            getattr(settings, "MINIO_ENDPOINT", None),
+            getattr(settings, "MINIO_PUBLIC_ENDPOINT", None),
+        ):
+            if endpoint:
+                if "//" not in endpoint:
+                    endpoint = f"//{endpoint}"
+                hosts.add(urlsplit(endpoint).netloc)
+        if parts.netloc not in hosts:
+            return None
+
+        bucket = getattr(settings, "MINIO_BUCKET_NAME", "deepsight-users")
+        prefix = f"/{bucket}/"
+        if not parts.path.startswith(prefix):
+            return None
+        return unquote(parts.path[len(prefix) :]) or None
+
+    def _resolve_image_ref(
+        self, src: str, image_object_prefix: str | None
+    ) -> tuple[str, str] | None:
         """
-        Convert remote image URLs to base64 data URLs.
-
-        Args:
-            content: HTML/markdown content with remote image URLs
-
-        Returns:
-            str: Content with remote images converted to base64 data URLs
+        Classify an image reference as ("minio", object_key) or ("http", url).
+
+        Relative references are resolved against image_object_prefix and must
+        stay inside it. URLs into our bucket are only read directly when they
+        point inside the report owner's prefix (the first segment of
+        image_object_prefix); anything else is fetched over HTTP, so MinIO
+        still checks the URL's signature. Data URIs and unresolvable paths
+        are left alone.
         """
-        # Find all img tags with remote URLs
-        img_pattern = r'<img([^>]*?)src=["\']([^"\']*https?://[^"\']*)["\']([^>]*?)>'
-
-        def replace_img(match):
-            before_src = match.group(1)
-            img_url = match.group(2)
-            after_src = match.group(3)
-
-            try:
-                response = requests.get(img_url, timeout=30)
+        if src.startswith("data:"):
+            return None
+        if src.startswith(("http://", "https://")):
+            object_key = self._minio_object_key(src)
+            owner = image_object_prefix.split("/", 1)[0] if image_object_prefix else ""
+            if owner and object_key and object_key.startswith(f"{owner}/"):
+                return ("minio", object_key)
+            return ("http", src)
+        if image_object_prefix and "://" not in src:
+            prefix = image_object_prefix.rstrip("/")
+            object_key = posixpath.normpath(posixpath.join(prefix, unquote(src)))
+            if object_key.startswith(f"{prefix}/"):
+                return ("minio", object_key)
+        return None
+
+    def _load_image(self, ref: tuple[str, str]) -> str | None:
+        """Fetch one image and return it as a data URI (cached)."""
+        cached = image_data_uri_cache.get(ref)
+        if cached is not None:
+            return cached
+
+        kind, target = ref
+        try:
+            if kind == "minio":
+                from notebooks.utils.storage import get_minio_backend
+
+                data = get_minio_backend().get_file(target)
+                if not data:
+                    logger.warning(f"Report image not found in storage: {target}")
+                    return None
+                content_type = mimetypes.guess_type(target)[0] or "image/jpeg"
+            else:
+                response = _http_session().get(
+                    target, timeout=getattr(settings, "PDF_IMAGE_FETCH_TIMEOUT", 30)
+                )
                 response.raise_for_status()
-
-                # Get image data and content type
-                img_data = response.content
+                data = response.content
                 content_type = response.headers.get("content-type", "image/jpeg")
+        except Exception as e:
+            logger.warning(f"Failed to convert image {target}: {e}")
+            return None
 
-                # Convert to base64
-                img_base64 = base64.b64encode(img_data).decode("utf-8")
+        data_uri = _data_uri(data, content_type)
+        image_data_uri_cache.set(ref, data_uri)
+        return data_uri
 
-                # Create data URL
-                data_url = f"data:{content_type};base64,{img_base64}"
+    def _convert_remote_images_to_base64(
+        self, content: str, image_object_prefix: str | None = None
+    ) -> str:
+        """
+        Convert image references to base64 data URLs.
 
-                # Return the updated img tag
-                return f'<img{before_src}src="{data_url}"{after_src}>'
+        All references (HTML <img> tags and Markdown images) are collected
+        first. Images in our MinIO bucket, whether linked by (presigned) URL or
+        relative to image_object_prefix, are read straight from storage. Other
+        remote images are fetched concurrently over a pooled session. The
+        content is then rewritten in a single pass.
 
-            except Exception as e:
-                logger.warning(f"Failed to convert image {img_url}: {e}")
-                # Return original img tag if conversion fails
-                return match.group(0)
+        Args:
+            content: HTML/markdown content with image references
+            image_object_prefix: Storage prefix for relative image paths
+                (e.g. the report folder containing ``images/``)
 
-        # Replace all remote images with base64 data URLs
-        updated_content = re.sub(img_pattern, replace_img, content)
+        Returns:
+            str: Content with images converted to base64 data URLs
+        """
+        refs: dict[str, tuple[str, str]] = {}
+        for match in IMAGE_REF_PATTERN.finditer(content):
+            src = match.group("html_src") or match.group("md_src")
+            if src not in refs:
+                ref = self._resolve_image_ref(src, image_object_prefix)
+                if ref:
+                    refs[src] = ref
+        if not refs:
+            return content
+
+        workers = max(1, getattr(settings, "PDF_IMAGE_FETCH_WORKERS", 8))
+        unique_refs = list(dict.fromkeys(refs.values()))
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique_refs))) as pool:
+            loaded = dict(
+                zip(unique_refs, pool.map(self._load_image, unique_refs), strict=True)
+            )
+        data_uris = {src: loaded[ref] for src, ref in refs.items() if loaded[ref]}
+        logger.info(f"Embedded {len(data_uris)} of {len(refs)} report images")
+
+        def replace_img(match):
+            src = match.group("html_src") or match.group("md_src")
+            data_uri = data_uris.get(src)
+            if data_uri is None:
+                # Leave the original reference if conversion failed
+                return match.group(0)
+            if match.group("html"):
+                before, after = match.group("before"), match.group("after")
+                return f'<img{before}src="{data_uri}"{after}>'
+            return f"![{match.group('alt')}]({data_uri}{match.group('title') or ''})"
 
-        return updated_content
+        return IMAGE_REF_PATTERN.sub(replace_img, content)
 
     def convert_markdown_to_pdf(
         self,
@@ -91,6 +261,7 @@ class PdfService:
         paper_size: str = "A4",
         image_root: str | None = None,
         input_file_path: str | None = None,
+        image_object_prefix: str | None = None,
     ) -> str:
         """
         Convert markdown content to PDF with automatic remote image handling.
@@ -102,6 +273,8 @@ class PdfService:
             paper_size: Paper size (A4, Letter, etc.)
             image_root: Root directory for resolving image paths (optional)
             input_file_path: Path to the original markdown file (for image resolution)
+            image_object_prefix: Storage prefix that relative image paths
+                (``images/...``) are read from
 
         Returns:
             str: Path to the generated PDF file
@@ -119,7 +292,7 @@ class PdfService:
 
             # Convert remote images to base64 data URLs
             content_with_base64_images = self._convert_remote_images_to_base64(
-                markdown_content
+                markdown_content, image_object_prefix=image_object_prefix
             )
 
             # Create PDF converter with no TOC and optimization enabled
@@ -0,0 +1,121 @@
+"""
+Compact report job status snapshots stored in Redis.
+
+Clients poll report jobs every few seconds while they run. Each report has
+one Redis hash, ``report_status:{report_id}``, that mirrors the fields the
+status endpoint needs:
+
+- ``report_id``, ``user_id``, ``celery_task_id``
+- ``status``, ``progress`` and ``error``
+- ``article_title``, ``has_files`` and ``has_content`` ("1" or "")
+- ``created_at`` and ``updated_at`` (ISO 8601)
+
+A ``post_save`` signal on ``Report`` rewrites the hash after every commit, so
+each status transition made by the generation task, the cancel view or the
+reconciler is reflected immediately, and a poll of an in-flight report is a
+single HGETALL with no database query.
+Detecting crashed or revoked Celery tasks is left to the periodic
+``reconcile_report_job_statuses`` task instead of every poll.
+"""
+
+import logging
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "report_status"
+
+# Snapshots outlive any realistic job; finished reports fall back to the DB
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def status_key(report_id) -> str:
+    return f"{KEY_PREFIX}:{report_id}"
+
+
+class ReportStatusStore:
+    """Write and read the Redis status snapshots behind report job polling."""
+
+    def __init__(self):
+        self._client = None
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "REPORT_STATUS_STORE_ENABLED", True)
+
+    @property
+    def ttl(self) -> int:
+        return getattr(settings, "REPORT_STATUS_TTL", DEFAULT_TTL_SECONDS)
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            url = getattr(settings, "REPORT_STATUS_REDIS_URL", None) or (
+                settings.CELERY_BROKER_URL
+            )
+            self._client = redis.Redis.from_url(url, decode_responses=True)
+        return self._client
+
+    @staticmethod
+    def snapshot(report) -> dict[str, str]:
+        return {
+            "report_id": str(report.id),
+            "user_id": str(report.user_id),
+            "celery_task_id": report.celery_task_id or "",
+            "status": report.status,
+            "progress": report.progress or "",
+            "error": report.error_message or "",
+            "article_title": report.article_title or "",
+            "has_files": "1" if report.main_report_object_key else "",
+            "has_content": "1" if report.result_content else "",
+            "created_at": report.created_at.isoformat() if report.created_at else "",
+            "updated_at": report.updated_at.isoformat() if report.updated_at else "",
+        }
+
+    def record(self, report) -> None:
+        """Store a report's current status once the current transaction commits."""
+        if not self.enabled:
+            return
+
+        key = status_key(report.id)
+        mapping = self.snapshot(report)
+
+        def _do_record():
+            try:
+                pipe = self.client.pipeline(transaction=True)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to store report status {key}: {e}")
+
+        transaction.on_commit(_do_record)
+
+    def discard(self, report_id) -> None:
+        """Drop a report's snapshot (e.g. after the report is deleted)."""
+        if not self.enabled:
+            return
+
+        def _do_discard():
+            try:
+                self.client.delete(status_key(report_id))
+            except Exception as e:
+                logger.warning(f"Failed to delete report status {report_id}: {e}")
+
+        transaction.on_commit(_do_discard)
+
+    def get(self, report_id) -> dict[str, str] | None:
+        """Return a report's status snapshot, or None if unknown/unavailable."""
+        if not self.enabled:
+            return None
+        try:
+            return self.client.hgetall(status_key(report_id)) or None
+        except redis.RedisError as e:
+            logger.warning(f"Report status unavailable from Redis: {e}")
+            return None
+
+
+report_status_store = ReportStatusStore()
@@ -0,0 +1,22 @@
+"""
+Signal handlers for the reports app.
+
+Keeps the Redis report status snapshots (services.status_store) in step with
+every saved status transition.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Report
+from .services.status_store import report_status_store
+
+
+@receiver(post_save, sender=Report)
+def record_report_status(sender, instance, **kwargs):
+    report_status_store.record(instance)
+
+
+@receiver(post_delete, sender=Report)
+def discard_report_status(sender, instance, **kwargs):
+    report_status_store.discard(instance.id)
@@ -3,17 +3,58 @@ Unified storage module with implementations and factory.
 Moved from factories/storage_factory.py.
 """
 
-import io
 import logging
 import os
 import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from core.instrumentation import metrics
+from django.conf import settings
+
 logger = logging.getLogger(__name__)
 
+# S3 multipart uploads need parts of at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+
+CONTENT_TYPES = {
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".pdf": "application/pdf",
+    ".json": "application/json",
+    ".jsonl": "application/jsonl",
+    ".txt": "text/plain",
+}
+
+_upload_pool: ThreadPoolExecutor | None = None
+_upload_pool_lock = threading.Lock()
+
+
+def _get_upload_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for concurrent report file uploads."""
+    global _upload_pool
+    if _upload_pool is None:
+        with _upload_pool_lock:
+            if _upload_pool is None:
+                workers = max(1, getattr(settings, "REPORT_UPLOAD_WORKERS", 8))
+                _upload_pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="report-upload"
+                )
+    return _upload_pool
+
+
+def report_object_prefix(
+    user_id: int, report_id: str, notebook_id: int | None = None
+) -> str:
+    """MinIO prefix holding every object stored for a report."""
+    return f"{user_id}/notebook/{notebook_id or 'standalone'}/report/{report_id}/"
+
 
 class FileStorageInterface(ABC):
     """Interface for file storage implementations"""
@@ -218,6 +259,25 @@ class MinIOFileStorage(FileStorageInterface):
         )
         return Path(temp_dir)
 
+    @property
+    def part_size(self) -> int:
+        part_size = getattr(settings, "REPORT_UPLOAD_PART_SIZE", DEFAULT_PART_SIZE)
+        return max(MIN_PART_SIZE, part_size)
+
+    def _upload_file(self, source_path: Path, object_key: str) -> int:
+        """Stream one file to MinIO (multipart above the part size); returns bytes."""
+        content_type = CONTENT_TYPES.get(
+            source_path.suffix.lower(), "application/octet-stream"
+        )
+        self.minio_backend.client.fput_object(
+            bucket_name=self.minio_backend.bucket_name,
+            object_name=object_key,
+            file_path=str(source_path),
+            content_type=content_type,
+            part_size=self.part_size,
+        )
+        return source_path.stat().st_size
+
     def store_generated_files(
         self,
         source_files: list[str],
@@ -225,49 +285,51 @@ class MinIOFileStorage(FileStorageInterface):
         report_id: str,
         notebook_id: int | None = None,
     ) -> list[str]:
+        """
+        Upload a report's generated files concurrently.
+
+        Files are streamed through a shared thread pool; the returned object
+        keys keep the order of ``source_files``.
+        """
+        prefix = report_object_prefix(user_id, report_id, notebook_id)
+        uploads: list[tuple[Path, str]] = []
+        for file_path in source_files:
+            source_path = Path(file_path)
+            if not source_path.exists() or not source_path.is_file():
+                continue
+            minio_key = f"{prefix}{source_path.name}"
+            uploads.append((source_path, minio_key))
+        if not uploads:
+            return []
+
+        start = time.perf_counter()
+        pool = _get_upload_pool()
+        futures = [
+            (minio_key, pool.submit(self._upload_file, source_path, minio_key))
+            for source_path, minio_key in uploads
+        ]
+
         stored_object_keys: list[str] = []
-        try:
-            notebook_part = notebook_id or "standalone"
-            for file_path in source_files:
-                try:
-                    source_path = Path(file_path)
-                    if not source_path.exists() or not source_path.is_file():
-                        continue
-                    filename = source_path.name
-                    minio_key = f"{user_id}/notebook/{notebook_part}/report/{report_id}/{filename}"
-                    with open(source_path, "rb") as f:
-                        file_content = f.read()
-                    content_stream = io.BytesIO(file_content)
-                    file_size = len(file_content)
-                    content_type = "application/octet-stream"
-                    if filename.endswith(".md"):
-                        content_type = "text/markdown"
-                    elif filename.endswith(".html"):
-                        content_type = "text/html"
-                    elif filename.endswith(".pdf"):
-                        content_type = "application/pdf"
-                    elif filename.endswith(".json"):
-                        content_type = "application/json"
-                    elif filename.endswith(".jsonl"):
-                        content_type = "application/jsonl"
-                    elif filename.endswith(".txt"):
-                        content_type = "text/plain"
-                    self.minio_backend.client.put_object(
-                        bucket_name=self.minio_backend.bucket_name,
-                        object_name=minio_key,
-                        data=content_stream,
-                        length=file_size,
-                        content_type=content_type,
-                    )
-                    stored_object_keys.append(minio_key)
-                    logger.info(f"Stored file in MinIO: {minio_key}")
-                except Exception as e:
-                    logger.warning(f"Failed to store file {file_path} in MinIO: {e}")
-                    continue
-            return stored_object_keys
-        except Exception as e:
-            logger.error(f"Error storing generated files in MinIO: {e}")
-            return stored_object_keys
+        total_bytes = 0
+        for minio_key, future in futures:
+            try:
+                total_bytes += future.result()
+                stored_object_keys.append(minio_key)
+            except Exception as e:
+                logger.warning(f"Failed to store file {minio_key} in MinIO: {e}")
+
+        elapsed = time.perf_counter() - start
+        metrics.observe(
+            "deepsight_report_storage_duration_seconds", elapsed, operation="store"
+        )
+        metrics.inc(
+            "deepsight_report_storage_bytes_total", total_bytes, operation="store"
+        )
+        logger.info(
+            f"Stored {len(stored_object_keys)}/{len(uploads)} files "
+            f"({total_bytes} bytes) for report {report_id} in {elapsed:.2f}s"
+        )
+        return stored_object_keys
 
     def get_main_report_file(self, file_list: list[str]) -> str | None:
         for object_key in file_list:
@@ -312,6 +374,23 @@ class MinIOFileStorage(FileStorageInterface):
                 f"Failed to clean up failed generation temp directory {temp_dir}: {e}"
             )
 
+    def _remove_objects(self, object_names: list[str]) -> int:
+        """Delete objects in batched requests; returns how many were deleted."""
+        from minio.deleteobjects import DeleteObject
+
+        if not object_names:
+            return 0
+        errors = self.minio_backend.client.remove_objects(
+            bucket_name=self.minio_backend.bucket_name,
+            delete_object_list=[DeleteObject(name) for name in object_names],
+        )
+        # The result is lazy: deletion happens while errors are iterated
+        failed = 0
+        for error in errors:
+            failed += 1
+            logger.warning(f"Failed to delete MinIO object {error.name}: {error}")
+        return len(object_names) - failed
+
     def clean_output_directory(self, directory: Path) -> bool:
         try:
             prefix = str(directory).replace("minio://", "") + "/"
@@ -320,39 +399,36 @@ class MinIOFileStorage(FileStorageInterface):
                 prefix=prefix,
                 recursive=True,
             )
-            for obj in objects:
-                self.minio_backend.client.remove_object(
-                    bucket_name=self.minio_backend.bucket_name,
-                    object_name=obj.object_name,
-                )
-                logger.info(f"Deleted MinIO object: {obj.object_name}")
+            deleted = self._remove_objects([obj.object_name for obj in objects])
+            logger.info(f"Deleted {deleted} MinIO objects under {prefix}")
             return True
         except Exception as e:
             logger.warning(f"Failed to clean MinIO directory {directory}: {e}")
             return False
 
-    def delete_report_files(self, report_id: str, user_id: int) -> bool:
+    def delete_report_files(
+        self, report_id: str, user_id: int, notebook_id: int | None = None
+    ) -> bool:
         try:
-            prefix = f"{user_id}/"
+            start = time.perf_counter()
             objects = self.minio_backend.client.list_objects(
                 bucket_name=self.minio_backend.bucket_name,
-                prefix=prefix,
+                prefix=report_object_prefix(user_id, report_id, notebook_id),
                 recursive=True,
             )
-            deleted_count = 0
-            for obj in objects:
-                if f"/report/{report_id}/" in obj.object_name:
-                    try:
-                        self.minio_backend.client.remove_object(
-                            bucket_name=self.minio_backend.bucket_name,
-                            object_name=obj.object_name,
-                        )
-                        deleted_count += 1
-                        logger.info(f"Deleted MinIO object: {obj.object_name}")
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to delete MinIO object {obj.object_name}: {e}"
-                        )
+            object_names = [obj.object_name for obj in objects]
+            deleted_count = self._remove_objects(object_names)
+
+            elapsed = time.perf_counter() - start
+            metrics.observe(
+                "deepsight_report_storage_duration_seconds",
+                elapsed,
+                operation="delete",
+            )
+            logger.info(
+                f"Deleted {deleted_count}/{len(object_names)} MinIO objects "
+                f"for report {report_id} in {elapsed:.2f}s"
+            )
             return deleted_count > 0
         except Exception as e:
             logger.error(
@@ -370,9 +446,9 @@ class MinIOFileStorage(FileStorageInterface):
                 "filename": filename,
                 "size": stat.size,
                 "type": Path(filename).suffix.lower(),
-                "modified": stat.last_modified.isoformat()
-                if stat.last_modified
-                else None,
+                "modified": (
+                    stat.last_modified.isoformat() if stat.last_modified else None
+                ),
                 "content_type": stat.content_type,
                 "object_key": object_key,
             }
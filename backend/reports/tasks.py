@@ -7,15 +7,26 @@ from typing import Any
 
 from celery import shared_task
 from core.utils.sse import publish_notebook_event
+from django.conf import settings
+from django.db.models import F
 
 from .orchestrator import report_orchestrator
 
 logger = logging.getLogger(__name__)
 
+# Deliveries before a report whose worker keeps dying is failed
+DEFAULT_MAX_GENERATION_ATTEMPTS = 3
 
-@shared_task(bind=True)
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
 def process_report_generation(self, report_id: int):
-    """Process report generation job - this runs in the background worker"""
+    """Process report generation job - this runs in the background worker
+
+    Acknowledged late so a crashed worker's job is redelivered; generation
+    then resumes after its last checkpointed stage. Deliveries are counted on
+    the report, and a report that keeps crashing its worker is failed after
+    REPORT_MAX_GENERATION_ATTEMPTS instead of being redelivered forever.
+    """
     try:
         logger.info(f"Starting report generation task for report {report_id}")
 
@@ -33,6 +44,39 @@ def process_report_generation(self, report_id: int):
             logger.info(f"Report {report_id} was cancelled before processing started")
             return {"status": "cancelled", "message": "Report was cancelled"}
 
+        # A redelivered task may find its report already finished, or failed
+        # by the reconciler after the worker crashed
+        if report.status in (Report.STATUS_COMPLETED, Report.STATUS_FAILED):
+            logger.info(f"Report {report_id} is already {report.status}, skipping")
+            return {
+                "status": report.status,
+                "message": f"Report was already {report.status}",
+            }
+
+        Report.objects.filter(id=report_id).update(
+            generation_attempts=F("generation_attempts") + 1
+        )
+        report.refresh_from_db(fields=["generation_attempts"])
+        max_attempts = getattr(
+            settings, "REPORT_MAX_GENERATION_ATTEMPTS", DEFAULT_MAX_GENERATION_ATTEMPTS
+        )
+        if report.generation_attempts > max_attempts:
+            error_msg = (
+                f"Report generation was interrupted {max_attempts} times "
+                "(worker crashed); giving up"
+            )
+            logger.error(f"Report {report_id}: {error_msg}")
+            report_orchestrator.update_job_error(str(report_id), error_msg)
+            if report.notebooks:
+                publish_notebook_event(
+                    notebook_id=str(report.notebooks.id),
+                    entity="report",
+                    entity_id=str(report.id),
+                    status="FAILURE",
+                    payload={"error": error_msg},
+                )
+            return {"status": "failed", "message": error_msg}
+
         # Check if task was revoked by Celery
         if self.request.called_directly is False:  # Only check if running in worker
             from celery.result import AsyncResult
@@ -145,6 +189,22 @@ def cleanup_old_reports():
         raise
 
 
+@shared_task
+def reconcile_report_job_statuses(batch_size: int = 200):
+    """
+    Detect crashed or revoked Celery tasks behind active report jobs.
+
+    Status polls are served from the Redis status snapshot and no longer ask
+    Celery about the task; this periodic pass checks every pending/running
+    job in batches and marks dead ones failed or cancelled.
+    """
+    try:
+        return report_orchestrator.reconcile_running_jobs(batch_size)
+    except Exception as e:
+        logger.error(f"Error reconciling report job statuses: {e}")
+        raise
+
+
 @shared_task(bind=True)
 def delete_report_and_cleanup(self, report_id: int):
     """Delete a report and perform all associated cleanup operations."""
@@ -0,0 +1,130 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class _FakeBackend:
+    def __init__(self):
+        self.objects = {}
+
+    def store_file(self, object_key, file_content, content_type=None):
+        self.objects[object_key] = file_content
+        return True
+
+    def get_file(self, object_key):
+        return self.objects.get(object_key)
+
+    def delete_folder(self, folder_prefix):
+        for key in [k for k in self.objects if k.startswith(folder_prefix)]:
+            del self.objects[key]
+        return True
+
+
+class TestGenerationCheckpoints(TestCase):
+    def setUp(self):
+        from reports.models import Report
+
+        user = get_user_model().objects.create_user(username="u", password="p")
+        self.report = Report.objects.create(user=user)
+        self.backend = _FakeBackend()
+
+    def _checkpoints(self):
+        from reports.models import Report
+        from reports.services.checkpoints import GenerationCheckpoints
+
+        report = Report.objects.get(id=self.report.id)
+        return GenerationCheckpoints(report, backend=self.backend)
+
+    def test_retry_resumes_after_last_completed_stage(self):
+        calls = []
+
+        def stage(name):
+            def run():
+                calls.append(name)
+                if name == "images":
+                    raise RuntimeError("worker died")
+                return {"stage": name}
+
+            return run
+
+        checkpoints = self._checkpoints()
+        checkpoints.run("inputs", stage("inputs"))
+        checkpoints.run("generation", stage("generation"))
+        with self.assertRaises(RuntimeError):
+            checkpoints.run("images", stage("images"))
+
+        # A fresh attempt (new service, report reloaded from the DB)
+        calls.clear()
+        retry = self._checkpoints()
+        self.assertEqual(retry.run("inputs", stage("inputs")), {"stage": "inputs"})
+        retry.run("generation", stage("generation"))
+        self.assertEqual(calls, [])
+        self.assertEqual(set(retry.durations), {"inputs", "generation"})
+
+    def test_rerunning_a_stage_invalidates_later_stages(self):
+        checkpoints = self._checkpoints()
+        for name in ("inputs", "generation", "images"):
+            checkpoints.run(name, lambda name=name: {"stage": name})
+
+        # Lose the generation artifact: it and everything after it rerun
+        del self.backend.objects[
+            checkpoints.report.generation_checkpoints["generation"]["artifact_key"]
+        ]
+        retry = self._checkpoints()
+        retry.run("inputs", lambda: self.fail("inputs should be resumed"))
+        retry.run("generation", lambda: {"stage": "generation-2"})
+        self.assertFalse(retry.completed("images"))
+
+    def test_discard_artifacts_keeps_durations(self):
+        checkpoints = self._checkpoints()
+        checkpoints.run("inputs", lambda: {"stage": "inputs"})
+        checkpoints.discard_artifacts()
+
+        self.assertEqual(self.backend.objects, {})
+        self.assertIn("inputs", self._checkpoints().durations)
+
+    def test_redelivered_task_skips_completed_report(self):
+        from unittest.mock import patch
+
+        from reports.models import Report
+
+        # The module-level orchestrator connects to MinIO on import
+        with patch("notebooks.utils.storage.get_minio_backend"):
+            from reports.tasks import process_report_generation
+
+        self.report.update_status(Report.STATUS_COMPLETED)
+        with patch("reports.tasks.report_orchestrator") as orchestrator:
+            result = process_report_generation.apply(args=[self.report.id]).get()
+
+        orchestrator.generate_report.assert_not_called()
+        self.assertEqual(result["status"], "completed")
+
+    def test_task_fails_report_after_max_attempts(self):
+        from unittest.mock import patch
+
+        from reports.models import Report
+
+        with patch("notebooks.utils.storage.get_minio_backend"):
+            from reports.tasks import process_report_generation
+
+        Report.objects.filter(id=self.report.id).update(generation_attempts=3)
+        with patch("reports.tasks.report_orchestrator") as orchestrator:
+            result = process_report_generation.apply(args=[self.report.id]).get()
+
+        orchestrator.generate_report.assert_not_called()
+        orchestrator.update_job_error.assert_called_once()
+        self.assertEqual(result["status"], "failed")
+
+    def test_failed_report_discards_artifacts(self):
+        from unittest.mock import patch
+
+        from reports.services.job import JobService
+
+        checkpoints = self._checkpoints()
+        checkpoints.run("inputs", lambda: {"a": 1})
+
+        with patch(
+            "notebooks.utils.storage.get_minio_backend", return_value=self.backend
+        ):
+            JobService().update_job_error(str(self.report.id), "boom")
+
+        self.assertEqual(self.backend.objects, {})
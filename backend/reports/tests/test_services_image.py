@@ -1,5 +1,10 @@
 import unittest
-from unittest.mock import patch
+import uuid
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
 
 
 class TestImageServiceInsertion(unittest.TestCase):
@@ -37,3 +42,46 @@ class TestImageServiceInsertion(unittest.TestCase):
         self.assertIn('<img src="https://cdn.example/img.png"', updated)
         self.assertNotIn(f"<{figure_id}>", updated)
         self.assertIn("Figure 1: Example", updated)
+
+
+class TestImageServiceCopy(TestCase):
+    def setUp(self):
+        from reports.models import Report
+
+        user = get_user_model().objects.create_user(username="u", password="p")
+        self.report = Report.objects.create(user=user)
+
+    def _kb_image(self, figure_id):
+        return SimpleNamespace(
+            figure_id=figure_id,
+            minio_object_key=f"kb/{figure_id}.png",
+            image_caption="caption",
+            image_metadata={},
+            content_type="image/png",
+            file_size=3,
+        )
+
+    def test_copies_new_figures_and_skips_existing(self):
+        from reports.models import ReportImage
+        from reports.services.image import ImageService
+
+        existing, new, failed = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        ReportImage.objects.create(
+            figure_id=existing,
+            report=self.report,
+            report_figure_minio_object_key="old.png",
+        )
+        backend = Mock()
+        backend.copy_file.side_effect = lambda src, dest: str(failed) not in src
+
+        svc = ImageService()
+        svc._minio_backend = backend
+        images = svc.copy_images_to_report(
+            self.report,
+            [self._kb_image(new), self._kb_image(existing), self._kb_image(failed)],
+        )
+
+        self.assertEqual([img.figure_id for img in images], [new, existing])
+        copied = sorted(call.args[0] for call in backend.copy_file.call_args_list)
+        self.assertEqual(copied, sorted([f"kb/{new}.png", f"kb/{failed}.png"]))
+        self.assertEqual(ReportImage.objects.filter(report=self.report).count(), 2)
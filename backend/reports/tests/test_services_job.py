@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+
+class TestJobStatusReads(TestCase):
+    def setUp(self):
+        from reports.models import Report
+
+        user = get_user_model().objects.create_user(username="u", password="p")
+        self.report = Report.objects.create(
+            user=user, status=Report.STATUS_RUNNING, celery_task_id="task-1"
+        )
+
+    def test_status_poll_does_not_query_celery(self):
+        from reports.services.job import JobService
+
+        with patch("reports.services.job.AsyncResult") as async_result:
+            job_data = JobService().get_job_status(str(self.report.id))
+
+        async_result.assert_not_called()
+        self.assertEqual(job_data["status"], self.report.status)
+        self.assertEqual(job_data["report_id"], str(self.report.id))
+
+    def test_status_poll_served_from_snapshot(self):
+        from reports.services.job import JobService
+
+        snapshot = {
+            "report_id": str(self.report.id),
+            "user_id": str(self.report.user_id),
+            "celery_task_id": "task-1",
+            "status": "running",
+            "error": "",
+            "created_at": "2025-01-01T00:00:00+00:00",
+            "updated_at": "2025-01-01T00:00:05+00:00",
+        }
+        with (
+            patch(
+                "reports.services.job.report_status_store.get", return_value=snapshot
+            ),
+            self.assertNumQueries(0),
+        ):
+            job_data = JobService().get_job_status(str(self.report.id))
+
+        self.assertEqual(job_data["status"], "running")
+        self.assertIsNone(job_data["error"])
+        self.assertNotIn("celery_task_id", job_data)
+
+    def test_reconcile_fails_jobs_with_failed_tasks(self):
+        from reports.models import Report
+        from reports.services.job import CeleryTaskState, JobService
+
+        service = JobService()
+        with (
+            patch.object(
+                service,
+                "_celery_task_states",
+                return_value={"task-1": CeleryTaskState("FAILURE", info="boom")},
+            ) as task_states,
+            patch.object(service, "_terminate_celery_task_robust"),
+        ):
+            counts = service.reconcile_running_jobs()
+
+        task_states.assert_called_once_with(["task-1"])
+        self.assertEqual(counts, {"checked": 1, "failed": 1, "cancelled": 0})
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, Report.STATUS_FAILED)
+        self.assertEqual(self.report.error_message, "boom")
+
+
+class TestReportDetailPolling(TestCase):
+    def setUp(self):
+        from reports.models import Report
+
+        self.user = get_user_model().objects.create_user(username="u", password="p")
+        self.report = Report.objects.create(
+            user=self.user, status=Report.STATUS_RUNNING, progress="Researching"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _url(self):
+        from django.urls import reverse
+
+        # Loading the URLconf imports the orchestrator, which connects to MinIO
+        with patch("notebooks.utils.storage.get_minio_backend"):
+            return reverse("reports:report-detail", args=[self.report.id])
+
+    def _snapshot(self, **overrides):
+        from reports.services.status_store import ReportStatusStore
+
+        return {**ReportStatusStore.snapshot(self.report), **overrides}
+
+    def test_in_flight_poll_is_served_from_snapshot(self):
+        url = self._url()
+        with (
+            patch(
+                "reports.views.report_status_store.get", return_value=self._snapshot()
+            ),
+            self.assertNumQueries(0),
+        ):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "running")
+        self.assertEqual(response.data["progress"], "Researching")
+
+    def test_other_users_snapshot_is_not_served(self):
+        url = self._url()
+        other = get_user_model().objects.create_user(username="o", password="p")
+        self.client.force_authenticate(other)
+        with patch(
+            "reports.views.report_status_store.get", return_value=self._snapshot()
+        ):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
@@ -2,6 +2,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from django.test import override_settings
+
 
 class FakeMarkdownPdf:
     def __init__(self, toc_level=0, optimize=True):
@@ -26,16 +28,21 @@ class FakeSection:
 
 
 class TestPdfService(unittest.TestCase):
-    @patch("reports.services.pdf.requests.get")
+    def setUp(self):
+        from reports.services.pdf import image_data_uri_cache
+
+        image_data_uri_cache.clear()
+
+    @patch("reports.services.pdf._http_session")
     @patch("reports.services.pdf.Section", new=FakeSection)
     @patch("reports.services.pdf.MarkdownPdf", new=FakeMarkdownPdf)
-    def test_convert_markdown_to_pdf_with_remote_image(self, mock_get):
-        # Mock requests.get to return an image payload
+    def test_convert_markdown_to_pdf_with_remote_image(self, mock_session):
+        # Mock the pooled session to return an image payload
         resp = Mock()
         resp.content = b"img-bytes"
         resp.headers = {"content-type": "image/png"}
         resp.raise_for_status = Mock()
-        mock_get.return_value = resp
+        mock_session.return_value.get.return_value = resp
 
         from reports.services.pdf import PdfService
 
@@ -50,3 +57,56 @@ class TestPdfService(unittest.TestCase):
         finally:
             if out.exists():
                 out.unlink()
+
+    @patch("reports.services.pdf._http_session")
+    @patch("notebooks.utils.storage.get_minio_backend")
+    @patch("reports.services.pdf.MarkdownPdf", new=FakeMarkdownPdf)
+    def test_minio_images_are_read_from_storage(self, mock_backend, mock_session):
+        mock_backend.return_value.get_file.return_value = b"png-bytes"
+
+        from reports.services.pdf import PdfService
+
+        with override_settings(
+            MINIO_PUBLIC_ENDPOINT="http://minio.local:9000",
+            MINIO_BUCKET_NAME="bucket",
+        ):
+            content = PdfService()._convert_remote_images_to_base64(
+                '<img src="http://minio.local:9000/bucket/1/a.png?X-Amz-Signature=x">'
+                "\n![fig](images/b.png)\n![fig again](images/b.png)"
+                "\n![escape](../../secret.png)",
+                image_object_prefix="1/notebook/2/report/3",
+            )
+
+        self.assertEqual(content.count("data:image/png;base64,"), 3)
+        self.assertIn("![escape](../../secret.png)", content)
+        get_file = mock_backend.return_value.get_file
+        fetched = sorted(call.args[0] for call in get_file.call_args_list)
+        self.assertEqual(fetched, ["1/a.png", "1/notebook/2/report/3/images/b.png"])
+        mock_session.return_value.get.assert_not_called()
+
+    @patch("reports.services.pdf._http_session")
+    @patch("notebooks.utils.storage.get_minio_backend")
+    def test_other_users_minio_urls_are_not_read_directly(
+        self, mock_backend, mock_session
+    ):
+        resp = Mock()
+        resp.raise_for_status.side_effect = Exception("403 SignatureDoesNotMatch")
+        mock_session.return_value.get.return_value = resp
+
+        from reports.services.pdf import PdfService
+
+        with override_settings(
+            MINIO_PUBLIC_ENDPOINT="http://minio.local:9000",
+            MINIO_BUCKET_NAME="bucket",
+        ):
+            svc = PdfService.__new__(PdfService)
+            content = svc._convert_remote_images_to_base64(
+                "![x](http://minio.local:9000/bucket/2/kb/secret.png)",
+                image_object_prefix="1/notebook/2/report/3",
+            )
+
+        self.assertEqual(
+            content, "![x](http://minio.local:9000/bucket/2/kb/secret.png)"
+        )
+        mock_backend.return_value.get_file.assert_not_called()
+        mock_session.return_value.get.assert_called_once()
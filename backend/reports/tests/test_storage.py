@@ -0,0 +1,73 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+
+class TestMinIOFileStorage(SimpleTestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        backend = SimpleNamespace(client=self.client, bucket_name="bucket")
+        with patch("notebooks.utils.storage.get_minio_backend", return_value=backend):
+            from reports.storage import MinIOFileStorage
+
+            self.storage = MinIOFileStorage()
+
+    @override_settings(REPORT_UPLOAD_PART_SIZE=1024)
+    def test_store_generated_files_uploads_all_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("report_1.md", "notes.json", "figure.pdf"):
+                path = Path(tmp) / name
+                path.write_bytes(b"x" * 10)
+                paths.append(str(path))
+
+            keys = self.storage.store_generated_files(
+                paths + [str(Path(tmp) / "missing.md")], 7, "r1", notebook_id=3
+            )
+
+        self.assertEqual(
+            keys,
+            [
+                "7/notebook/3/report/r1/report_1.md",
+                "7/notebook/3/report/r1/notes.json",
+                "7/notebook/3/report/r1/figure.pdf",
+            ],
+        )
+        calls = self.client.fput_object.call_args_list
+        self.assertEqual(len(calls), 3)
+        # Part size is clamped to the S3 minimum
+        self.assertTrue(all(c.kwargs["part_size"] == 5 * 1024 * 1024 for c in calls))
+        content_types = {
+            c.kwargs["object_name"]: c.kwargs["content_type"] for c in calls
+        }
+        self.assertEqual(
+            content_types["7/notebook/3/report/r1/notes.json"], "application/json"
+        )
+
+    def test_delete_report_files_removes_in_one_batch(self):
+        self.client.list_objects.return_value = [
+            SimpleNamespace(object_name="7/notebook/3/report/r1/report_1.md"),
+            SimpleNamespace(object_name="7/notebook/3/report/r1/images/a.png"),
+        ]
+        self.client.remove_objects.return_value = iter(())
+
+        self.assertTrue(self.storage.delete_report_files("r1", 7, notebook_id=3))
+
+        # Only the report's own prefix is listed, not the user's whole tree
+        self.client.list_objects.assert_called_once_with(
+            bucket_name="bucket", prefix="7/notebook/3/report/r1/", recursive=True
+        )
+        self.client.remove_objects.assert_called_once()
+        batch = self.client.remove_objects.call_args.kwargs["delete_object_list"]
+        deleted = [obj.name for obj in batch]
+        self.assertEqual(
+            deleted,
+            [
+                "7/notebook/3/report/r1/report_1.md",
+                "7/notebook/3/report/r1/images/a.png",
+            ],
+        )
+        self.client.remove_object.assert_not_called()
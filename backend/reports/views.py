@@ -10,6 +10,7 @@ from django.db import models
 from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from notebooks.models import Notebook
+from notebooks.utils.view_mixins import ETagCacheMixin
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,6 +19,7 @@ from .models import Report
 from .orchestrator import report_orchestrator
 from .serializers import ReportGenerationRequestSerializer
 from .services import JobService, PdfService
+from .services.status_store import report_status_store
 from .tasks import process_report_generation
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,21 @@ class ReportViewHelper:
             "has_content": bool(report.result_content),
         }
 
+    @staticmethod
+    def format_snapshot_data(snapshot: dict[str, str]) -> dict:
+        """Format a Redis status snapshot like ``format_report_data``."""
+        return {
+            "report_id": snapshot["report_id"],
+            "status": snapshot["status"],
+            "title": snapshot.get("article_title", ""),
+            "article_title": snapshot.get("article_title", ""),
+            "created_at": snapshot["created_at"],
+            "updated_at": snapshot["updated_at"],
+            "error": snapshot.get("error", ""),
+            "has_files": bool(snapshot.get("has_files")),
+            "has_content": bool(snapshot.get("has_content")),
+        }
+
 
 class ReportJobListCreateView(APIView):
     """Canonical: List and create report jobs without notebook in the path.
@@ -180,24 +197,33 @@ class ReportJobDetailView(APIView):
     """Canonical: Get or update a report job by report_id (no notebook in path)."""
 
     permission_classes = [permissions.IsAuthenticated]
+    IN_FLIGHT_STATUSES = (Report.STATUS_PENDING, Report.STATUS_RUNNING)
 
     def _get_report(self, report_id):
         return ReportViewHelper.get_user_report(report_id, self.request.user)
 
     def get(self, request, report_id):
         try:
+            # In-flight polls are answered from the Redis status snapshot
+            snapshot = report_status_store.get(report_id)
+            if (
+                snapshot
+                and snapshot.get("status") in self.IN_FLIGHT_STATUSES
+                and snapshot.get("user_id") == str(request.user.pk)
+            ):
+                response_data = ReportViewHelper.format_snapshot_data(snapshot)
+                response_data["result"] = None
+                response_data["progress"] = snapshot.get("progress", "")
+                return Response(response_data)
+
+            # Finished reports and snapshot misses read the database
             report = self._get_report(report_id)
-            job_data = report_orchestrator.get_job_status(report_id)
-            if not job_data:
-                return Response(
-                    {"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND
-                )
-
-            # Use format_report_data for consistent response format
+            if snapshot is None:
+                report_status_store.record(report)
             response_data = ReportViewHelper.format_report_data(report)
-            # Add job-specific data
-            response_data["result"] = job_data.get("result")
-            response_data["progress"] = job_data.get("progress", "")
+            # Full results are served by the content and files endpoints
+            response_data["result"] = None
+            response_data["progress"] = report.progress
 
             return Response(response_data)
         except Http404:
@@ -440,11 +466,17 @@ class ReportJobPdfDownloadView(APIView):
             pdf_path = temp_dir / filename
             try:
                 logger.info("Converting markdown to PDF with automatic image handling")
+                # Relative figure paths (images/...) live under the report folder
+                notebook_part = report.notebooks_id or "standalone"
                 pdf_file_path = pdf_service.convert_markdown_to_pdf(
                     markdown_content=markdown_content,
                     output_path=str(pdf_path),
                     title=report_title,
                     input_file_path=None,
+                    image_object_prefix=(
+                        f"{report.user_id}/notebook/{notebook_part}"
+                        f"/report/{report.id}"
+                    ),
                 )
                 response = FileResponse(
                     open(pdf_file_path, "rb"),
@@ -678,8 +710,11 @@ class ReportJobContentView(APIView):
             )
 
 
-class ReportJobImageInlineView(APIView):
-    """Serve a report image via API as an inline response (MinIO proxy)."""
+class ReportJobImageInlineView(ETagCacheMixin, APIView):
+    """Serve a report image via API as an inline response (MinIO proxy).
+
+    ``?size=thumb|small|medium`` serves a resized WebP/JPEG derivative.
+    """
 
     permission_classes = [permissions.IsAuthenticated]
 
@@ -701,6 +736,18 @@ class ReportJobImageInlineView(APIView):
             # Get the image and verify it belongs to this report
             image = get_object_or_404(ReportImage, id=image_id, report=report)
 
+            filename = "image"
+            if image.image_metadata and isinstance(image.image_metadata, dict):
+                filename = image.image_metadata.get("original_filename", "image")
+
+            derivative = self.image_derivative_response(
+                request,
+                object_key=image.report_figure_minio_object_key,
+                filename=filename,
+            )
+            if derivative is not None:
+                return derivative
+
             # Compute ETag from storage metadata or fallback to a hash of identifiers
             storage = get_storage_backend()
             etag_value = None
@@ -757,11 +804,6 @@ class ReportJobImageInlineView(APIView):
                 content, content_type=image.content_type or "application/octet-stream"
             )
 
-            # Set filename from metadata if available
-            filename = "image"
-            if image.image_metadata and isinstance(image.image_metadata, dict):
-                filename = image.image_metadata.get("original_filename", "image")
-
             resp["Content-Disposition"] = f'inline; filename="{filename}"'
             resp["X-Content-Type-Options"] = "nosniff"
 
@@ -835,6 +877,7 @@ class ReportJobCancelView(APIView):
             # Step 2: Update Report status to CANCELLED
             report.status = Report.STATUS_CANCELLED
             report.save(update_fields=["status", "updated_at"])
+            JobService.discard_checkpoints(report)
 
             # Log cancellation with details
             logger.info(
@@ -0,0 +1,116 @@
+"""
+Benchmark for chat history windowing.
+
+Simulates a long chat session and measures the per-turn cost of
+get_chat_history_window, comparing a fresh window per turn (memoized token
+counts only) with a ChatHistoryWindow reused across turns (incremental
+prefix sum), against the previous re-tokenize-everything baseline.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.bench_history_window --messages 1000
+"""
+
+import argparse
+import logging
+import random
+import time
+
+import tiktoken
+from agents.rag_agent.utils import (
+    ChatHistoryWindow,
+    _count_tokens,
+    get_chat_history_window,
+)
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+WORDS = (
+    "retrieval augmented generation notebook dataset chunk embedding answer "
+    "question context token window budget paper method result figure table"
+).split()
+
+
+def _make_message(i: int, rng: random.Random):
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 200)))
+    cls = HumanMessage if i % 2 == 0 else AIMessage
+    return cls(content=text, id=f"msg-{i}")
+
+
+def _baseline_window(messages, max_tokens, model_name):
+    """The original implementation: re-encodes every message on every turn."""
+    encoding = tiktoken.encoding_for_model(model_name)
+    system_msgs = [m for m in messages if isinstance(m, SystemMessage)]
+    other_msgs = [m for m in messages if not isinstance(m, SystemMessage)]
+    last_msg = other_msgs[-1]
+    required = sum(len(encoding.encode(str(m.content))) for m in system_msgs)
+    required += len(encoding.encode(str(last_msg.content)))
+    budget = max_tokens - required
+    windowed = []
+    for msg in reversed(other_msgs[:-1]):
+        tokens = len(encoding.encode(str(msg.content)))
+        if tokens > budget:
+            break
+        windowed.insert(0, msg)
+        budget -= tokens
+    return system_msgs + windowed + [last_msg]
+
+
+def _run(label, turns, select):
+    start = time.perf_counter()
+    for history in turns:
+        select(history)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} total {elapsed * 1000:9.1f} ms   "
+        f"per turn {elapsed * 1000 / len(turns):7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--max-tokens", type=int, default=4000)
+    parser.add_argument("--model", default="gpt-4")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    system = SystemMessage(content="You are a helpful research assistant.")
+    history = [_make_message(i, rng) for i in range(args.messages)]
+    # One turn per user message: the graph sees the history up to that point
+    turns = [[system, *history[: i + 1]] for i in range(0, args.messages, 2)]
+
+    print(f"{args.messages} messages, {len(turns)} turns, budget {args.max_tokens}")
+
+    _run(
+        "baseline (re-tokenize)",
+        turns,
+        lambda msgs: _baseline_window(msgs, args.max_tokens, args.model),
+    )
+
+    _count_tokens.cache_clear()
+    _run(
+        "fresh window, memoized",
+        turns,
+        lambda msgs: get_chat_history_window(msgs, args.max_tokens, args.model),
+    )
+
+    _count_tokens.cache_clear()
+    window = ChatHistoryWindow(args.model)
+    _run(
+        "reused window, incremental",
+        turns,
+        lambda msgs: get_chat_history_window(
+            msgs, args.max_tokens, args.model, window=window
+        ),
+    )
+
+    # Sanity check: all strategies select the same window
+    final = turns[-1]
+    expected = _baseline_window(final, args.max_tokens, args.model)
+    actual = get_chat_history_window(final, args.max_tokens, args.model)
+    assert [m.id for m in expected] == [m.id for m in actual], "window mismatch"
+
+
+if __name__ == "__main__":
+    main()